@@ -2,6 +2,9 @@
 Agent module - Represents the player's character (the football agent)
 """
 
+from registry import ClientList
+from timers import TimerWheel
+
 class Agent:
     """Represents the football agent controlled by the player"""
     
@@ -9,7 +12,7 @@ class Agent:
         self.name = name
         self.money = 50000  # Starting money
         self.reputation = "Unknown"  # e.g., "Unknown", "Local", "National", "International", "World Class"
-        self.clients = []  # List of Player objects
+        self.clients = ClientList()  # Player objects by ID, in signing order
         self.week = 1
         self.actions_per_week = 5  # Number of actions player can take per week
         self.actions_remaining = 5
@@ -28,6 +31,9 @@ class Agent:
         # Reports and opportunities
         self.available_reports = []  # List of player reports to review
         self.pending_offers = []  # Contract offers for clients
+
+        # Deadlines (offers, promises, contracts) fire when their week is reached
+        self.timers = TimerWheel()
         
     def _apply_agent_type_modifiers(self):
         """Apply stat modifiers based on agent type"""
@@ -77,16 +83,14 @@ class Agent:
         
     def add_client(self, player):
         """Add a player as a client"""
-        if player not in self.clients:
-            self.clients.append(player)
+        if self.clients.add(player):
             player.sign_with_agent()
             return True
         return False
     
     def remove_client(self, player):
         """Remove a player from client list"""
-        if player in self.clients:
-            self.clients.remove(player)
+        if self.clients.discard(player):
             player.agent_signed = False
             return True
         return False
@@ -116,6 +120,9 @@ class Agent:
             if client.signed and client.weekly_wage > 0:
                 commission = int(client.weekly_wage * self.commission_rate)
                 self.earn_commission(commission)
+
+        # Only the deadlines due this week are touched
+        self.timers.advance(self.week)
     
     def use_action(self):
         """Use one action point"""
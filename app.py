@@ -6,15 +6,21 @@ Deploy to Streamlit Cloud for free sharing
 import streamlit as st
 from game import FootballAgentGame
 from agent import Agent
-from game_data import (
-    create_initial_players,
-    create_player_reports,
-    get_default_clubs,
-    get_international_clubs,
-)
+from impact_config import get_service
+from playoff_bracket import ROUND_NAMES, simulate_bracket
+from season_archive import format_season
+from leaderboards import BOARD_LABELS
+from match_engine import FIDELITY_MODES
+from game_data import PLAYER_POSITIONS
+from world_db import PlayerProxy
+import json
 import time
 import random
 
+WORLD_SORT_KEYS = {"Overall": 'overall', "Potencial": 'potential', "Edad": 'age', "Valor": 'value'}
+
+REPORTS_PER_PAGE = 10
+
 # Page config
 st.set_page_config(
     page_title="Football Agent Simulator",
@@ -83,21 +89,22 @@ def init_game(agent_name, agent_type_display):
     game = FootballAgentGame()
     game.agent = Agent(agent_name, agent_type)
 
-    # Initialize core game data (mirrors start_game, but headless)
-    game.all_players = create_initial_players()
-    game.available_reports = create_player_reports()
-    game.clubs = get_default_clubs()
-    game.international_clubs = get_international_clubs()
-    game.schedule = game._build_season_schedule()
-    game.total_weeks = len(game.schedule)
-    game._init_league_table()
-    game.club_index = {c.name: c for c in game.clubs}
-    game._init_club_rosters()
+    # Initialize core game data (same as start_game, but headless)
+    game.init_world()
 
     # Persist game in session
     st.session_state.game = game
     st.session_state.game_started = True
 
+def select_player(label, players, key=None, blank=True, describe=None):
+    """Selectbox over players by ID (names can repeat); returns the chosen player or None"""
+    by_id = {p.uid: p for p in players}
+    options = ([None] if blank else []) + list(by_id)
+    describe = describe or (lambda p: p.name)
+    uid = st.selectbox(label, options, key=key,
+                       format_func=lambda uid: "" if uid is None else describe(by_id[uid]))
+    return by_id.get(uid)
+
 def render_sidebar():
     """Render sidebar with navigation and game info"""
     with st.sidebar:
@@ -155,9 +162,39 @@ def render_sidebar():
             if st.button("💾 Guardar", use_container_width=True):
                 # TODO: Implement save
                 st.success("Juego guardado!")
+            
+            render_debug_panel(game)
         else:
             st.info("👈 Inicia un nuevo juego para comenzar")
 
+def render_debug_panel(game):
+    """Sidebar panel to profile the weekly step and export the results"""
+    with st.expander("🛠️ Depuración"):
+        game.set_sim_fidelity(st.selectbox(
+            "Detalle de simulación", FIDELITY_MODES, index=FIDELITY_MODES.index(game.sim_fidelity),
+            format_func={'clients': "Detallado para mis clientes", 'fast': "Rápido (todo)", 'detailed': "Detallado (todo)"}.get,
+        ))
+        active = game.profiler is not None
+        use_cprofile = st.checkbox("cProfile por semana", value=active and game.profiler.use_cprofile, disabled=active)
+        use_tracemalloc = st.checkbox("Memoria (tracemalloc)", value=active and game.profiler.use_tracemalloc, disabled=active)
+        profiling_on = st.checkbox("⏱️ Perfilar semanas", value=active)
+        
+        if profiling_on and not active:
+            game.enable_profiling(use_cprofile=use_cprofile, use_tracemalloc=use_tracemalloc)
+        elif not profiling_on and active:
+            st.session_state.last_profile = game.disable_profiling()
+        
+        profiler = game.profiler or st.session_state.get('last_profile')
+        if profiler is not None and profiler.weeks:
+            st.code(profiler.format_report())
+            st.download_button(
+                "⬇️ Exportar JSON",
+                data=json.dumps(profiler.to_dict(), indent=2),
+                file_name="week_profile.json",
+                mime="application/json",
+                use_container_width=True,
+            )
+
 def render_home():
     """Render home page"""
     st.title("🏠 Panel Principal")
@@ -326,12 +363,15 @@ def render_clients():
                 - ⚽ Goles: {client.season_goals}
                 - 🅰️ Asistencias: {client.season_assists}
                 - 📊 Partidos: {client.season_appearances}
-                - 📈 Promedio: {client.season_goals/max(1, client.season_appearances):.2f} G/partido
+                - 📈 Promedio: {client.season_goals_per_match:.2f} G/partido
+                - ⭐ Rating: {client.season_avg_rating:.2f}/10
                 """)
                 
-                if client.weekly_stats:
-                    st.markdown("**Últimos 5 partidos:**")
-                    for stat in client.weekly_stats[-5:]:
+                if client.stats.recent:
+                    form = game.form.player(client.uid)
+                    form_rating = form.average_rating if form is not None else 0.0
+                    st.markdown(f"**Últimos {len(client.stats.recent)} partidos** (forma ⭐{form_rating:.1f}):")
+                    for stat in client.stats.recent:
                         cards = ""
                         if stat.get('yellow_card'): cards += "🟨"
                         if stat.get('red_card'): cards += "🟥"
@@ -345,18 +385,16 @@ def render_stats():
     
     if not game.agent.clients:
         st.warning("No tienes clientes para mostrar estadísticas")
-        return
     
     # Tabs for different views
-    tab1, tab2, tab3 = st.tabs(["🎯 Top Scorers", "🅰️ Top Assists", "⭐ Best Ratings"])
+    tab1, tab2, tab3, tab4 = st.tabs(["🎯 Top Scorers", "🅰️ Top Assists", "⭐ Best Ratings", "🏆 Liga"])
     
     with tab1:
         st.subheader("🎯 Máximos Goleadores")
         scorers = sorted(game.agent.clients, key=lambda x: x.season_goals, reverse=True)
         for i, player in enumerate(scorers[:10], 1):
             if player.season_appearances > 0:
-                avg = player.season_goals / player.season_appearances
-                st.markdown(f"{i}. **{player.name}** - {player.season_goals} goles en {player.season_appearances} partidos ({avg:.2f} G/partido)")
+                st.markdown(f"{i}. **{player.name}** - {player.season_goals} goles en {player.season_appearances} partidos ({player.season_goals_per_match:.2f} G/partido)")
     
     with tab2:
         st.subheader("🅰️ Máximos Asistidores")
@@ -368,16 +406,32 @@ def render_stats():
     with tab3:
         st.subheader("⭐ Mejores Ratings")
         # Calculate average ratings
-        players_with_ratings = []
-        for player in game.agent.clients:
-            if player.weekly_stats:
-                avg_rating = sum(s['rating'] for s in player.weekly_stats) / len(player.weekly_stats)
-                players_with_ratings.append((player, avg_rating))
+        players_with_ratings = [
+            (player, player.season_avg_rating) for player in game.agent.clients if player.season_appearances > 0
+        ]
         
         players_with_ratings.sort(key=lambda x: x[1], reverse=True)
         for i, (player, rating) in enumerate(players_with_ratings[:10], 1):
             st.markdown(f"{i}. **{player.name}** - {rating:.2f}/10 promedio")
 
+    with tab4:
+        st.subheader("🏆 Clasificaciones de la Liga")
+        client_ids = game.agent.clients.ids
+        board = st.radio("Tabla", list(BOARD_LABELS), format_func=BOARD_LABELS.get, horizontal=True)
+        rows = game.leaderboards.top(board, 20)
+        if rows:
+            st.table([
+                {
+                    "#": row['rank'],
+                    "Jugador": ("⭐ " if row['id'] in client_ids else "") + row['name'],
+                    "Club": row['club'],
+                    BOARD_LABELS[board]: row['value'],
+                }
+                for row in rows
+            ])
+        else:
+            st.info("Todavía no se jugaron partidos de liga esta temporada")
+
 def render_reports():
     """Render weekly reports"""
     st.title("📝 Reporte Semanal")
@@ -391,8 +445,8 @@ def render_reports():
     
     performances = []
     for client in game.agent.clients:
-        if client.weekly_stats and len(client.weekly_stats) > 0:
-            last = client.weekly_stats[-1]
+        last = client.stats.last_match
+        if last:
             if last['week'] == game.agent.week - 1:
                 performances.append((client, last))
     
@@ -468,7 +522,7 @@ def render_contracts():
                     - 💵 Salario: ${offer['wage']:,}/sem
                     - 📅 Contrato: {offer['contract_weeks']} semanas
                     - 💰 Fee transfer: ${offer['fee']:,}
-                    - ⏰ Expira en: {offer.get('expires_in_weeks', 2)} semanas
+                    - ⏰ Expira en: {game.offer_weeks_left(offer)} semanas
                     """)
                 
                 with col2:
@@ -479,14 +533,14 @@ def render_contracts():
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    if st.button(f"✅ Aceptar", key=f"accept_{player.name}_{offer['club']}"):
+                    if st.button(f"✅ Aceptar", key=f"accept_{player.uid}_{offer['club']}"):
                         game._accept_transfer_offer(offer)
                         st.success(f"¡{player.name} firmó con {offer['club']}!")
                         time.sleep(1)
                         st.rerun()
                 
                 with col2:
-                    if st.button(f"❌ Rechazar", key=f"reject_{player.name}_{offer['club']}"):
+                    if st.button(f"❌ Rechazar", key=f"reject_{player.uid}_{offer['club']}"):
                         game.agent.pending_offers.remove(offer)
                         st.warning("Oferta rechazada")
                         time.sleep(1)
@@ -506,9 +560,8 @@ def render_contracts():
     # Proactively offer player to clubs
     st.subheader("📣 Ofrecer Jugador a Clubes")
     if game.agent.clients:
-        player_choice = st.selectbox("Seleccionar cliente:", [""] + [c.name for c in game.agent.clients], key="offer_client")
-        if player_choice:
-            player = next(c for c in game.agent.clients if c.name == player_choice)
+        player = select_player("Seleccionar cliente:", game.agent.clients, key="offer_client")
+        if player:
             if st.button("📣 Ofrecer a Clubes", type="primary"):
                 # Improve relationships with all clubs (as in CLI)
                 for club in game.clubs:
@@ -519,27 +572,24 @@ def render_contracts():
                         game.agent.club_relationships[club.name] = "Excellent"
                 
                 player_overall = player.current_overall_score or int(player.current_rating * 100)
+                interest = game.evaluate_club_interest([player], game.clubs)
                 created = 0
-                for club in game.clubs:
-                    if player.club == club.name:
-                        continue
-                    decision = game._club_evaluate_offer(club, player, player_overall)
-                    if decision["interested"]:
-                        role = game._get_player_role(player_overall, club.team_average)
-                        offer = {
-                            "club": club.name,
-                            "player": player,
-                            "player_name": player.name,
-                            "fee": 0 if not player.club else int(player.transfer_value or player_overall * 500),
-                            "wage": max(1200, int(player_overall * 150)),
-                            "contract_weeks": random.randint(52, 156),
-                            "expires_in_weeks": 2,
-                            "status": "pending",
-                            "role": role,
-                        }
-                        game.agent.pending_offers.append(offer)
-                        game.transfer_log.append({**offer, "status": "created_player_offer", "week": game.agent.week})
-                        created += 1
+                for club in interest.interested_clubs(player):
+                    role = game._get_player_role(player_overall, club.team_average)
+                    offer = {
+                        "club": club.name,
+                        "player": player,
+                        "player_name": player.name,
+                        "fee": 0 if not player.club else int(player.transfer_value or player_overall * 500),
+                        "wage": max(1200, int(player_overall * 150)),
+                        "contract_weeks": random.randint(52, 156),
+                        "expires_in_weeks": 2,
+                        "status": "pending",
+                        "role": role,
+                    }
+                    game._post_offer(offer)
+                    game.transfer_log.append({**offer, "status": "created_player_offer", "week": game.agent.week})
+                    created += 1
                 if created:
                     st.success(f"Se crearon {created} ofertas para {player.name}")
                 else:
@@ -555,14 +605,9 @@ def render_contracts():
     signed_clients = [c for c in game.agent.clients if c.signed and c.club]
     
     if signed_clients:
-        client_choice = st.selectbox(
-            "Seleccionar cliente:",
-            [""] + [f"{c.name} ({c.club})" for c in signed_clients]
-        )
+        client = select_player("Seleccionar cliente:", signed_clients, describe=lambda c: f"{c.name} ({c.club})")
         
-        if client_choice:
-            idx = [f"{c.name} ({c.club})" for c in signed_clients].index(client_choice)
-            client = signed_clients[idx]
+        if client:
             fee = client.calculate_termination_fee()
             
             st.warning(f"""
@@ -601,39 +646,57 @@ def render_search_players():
         st.error("No te quedan acciones esta semana!")
         return
     
-    available = [p for p in game.all_players if not p.agent_signed]
+    world = game.world_db
+    source = "Jugadores conocidos"
+    if world is not None:
+        source = st.radio("Buscar en:", ["Jugadores conocidos", f"Base de datos mundial ({len(world):,})"],
+                          horizontal=True)
+    use_world = world is not None and source != "Jugadores conocidos"
+
+    available = [] if use_world else [p for p in game.all_players if not p.agent_signed]
     
-    if not available:
+    if not use_world and not available:
         st.warning("No hay jugadores disponibles en este momento")
         return
     
-    st.markdown(f"**Jugadores disponibles: {len(available)}**")
+    if use_world:
+        st.markdown(f"**Jugadores disponibles: {int((~world.taken).sum()):,}**")
+    else:
+        st.markdown(f"**Jugadores disponibles: {len(available)}**")
     
     # Filters
+    positions = PLAYER_POSITIONS if use_world else list(set(p.position for p in available))
     col1, col2, col3 = st.columns(3)
     with col1:
-        filter_pos = st.selectbox("Posición:", ["Todos"] + list(set(p.position for p in available)))
+        filter_pos = st.selectbox("Posición:", ["Todos"] + list(positions))
     with col2:
         filter_potential = st.selectbox("Potencial:", ["Todos", "Elite", "World Class", "High", "Medium"])
     with col3:
         sort_by = st.selectbox("Ordenar por:", ["Overall", "Potencial", "Edad", "Valor"])
     
-    # Filter
-    filtered = available
-    if filter_pos != "Todos":
-        filtered = [p for p in filtered if p.position == filter_pos]
-    if filter_potential != "Todos":
-        filtered = [p for p in filtered if p.potential_level == filter_potential]
-    
-    # Sort
-    if sort_by == "Overall":
-        filtered = sorted(filtered, key=lambda x: x.current_overall_score or x.current_rating*100, reverse=True)
-    elif sort_by == "Potencial":
-        filtered = sorted(filtered, key=lambda x: x.potential_overall_score or x.potential_rating*100, reverse=True)
-    elif sort_by == "Edad":
-        filtered = sorted(filtered, key=lambda x: x.age)
-    elif sort_by == "Valor":
-        filtered = sorted(filtered, key=lambda x: x.transfer_value, reverse=True)
+    if use_world:
+        # Vectorized search over the memory-mapped pool; only the 20 shown rows become (lazy) proxies
+        rows = world.search(position=None if filter_pos == "Todos" else filter_pos,
+                            potential=None if filter_potential == "Todos" else filter_potential,
+                            sort_by=WORLD_SORT_KEYS[sort_by], limit=20)
+        filtered = world.proxies(rows)
+    else:
+        # Filter
+        filtered = available
+        if filter_pos != "Todos":
+            filtered = [p for p in filtered if p.position == filter_pos]
+        if filter_potential != "Todos":
+            filtered = [p for p in filtered if p.potential_level == filter_potential]
+        
+        # Sort
+        if sort_by == "Overall":
+            filtered = sorted(filtered, key=lambda x: x.current_overall_score or x.current_rating*100, reverse=True)
+        elif sort_by == "Potencial":
+            filtered = sorted(filtered, key=lambda x: x.potential_overall_score or x.potential_rating*100, reverse=True)
+        elif sort_by == "Edad":
+            filtered = sorted(filtered, key=lambda x: x.age)
+        elif sort_by == "Valor":
+            filtered = sorted(filtered, key=lambda x: x.transfer_value, reverse=True)
     
     st.markdown("---")
     
@@ -660,8 +723,11 @@ def render_search_players():
             """)
         
         with col3:
-            if st.button("✍️ Fichar", key=f"sign_{player.name}"):
+            is_proxy = isinstance(player, PlayerProxy)
+            if st.button("✍️ Fichar", key=f"sign_{player.key if is_proxy else player.uid}"):
                 if game.agent.spend_money(signing_bonus):
+                    if is_proxy:
+                        player = game.adopt_world_player(player.row)  # hydrated only now
                     game.agent.add_client(player)
                     game.agent.use_action()
                     st.success(f"¡{player.name} es ahora tu cliente!")
@@ -687,13 +753,9 @@ def render_interactions():
         return
     
     # Select client
-    client_choice = st.selectbox(
-        "Seleccionar cliente:",
-        [""] + [c.name for c in game.agent.clients]
-    )
+    client = select_player("Seleccionar cliente:", game.agent.clients)
     
-    if client_choice:
-        client = next(c for c in game.agent.clients if c.name == client_choice)
+    if client:
         
         st.markdown(f"### Interactuando con {client.name}")
         
@@ -783,6 +845,20 @@ def render_league():
             st.markdown(f"GA: {stats.get('ga', 0)}")
         
         st.markdown("---")
+    
+    # Exact forecasts for this week's fixtures
+    week_index = game.agent.week - 1
+    if 0 <= week_index < len(game.schedule) and game.schedule[week_index]['fixtures']:
+        st.subheader("🔮 Pronóstico de la jornada")
+        for home, away in game.schedule[week_index]['fixtures']:
+            fc = game.forecast_fixture(home, away)
+            if not fc:
+                continue
+            h, a = fc['most_likely']
+            st.markdown(
+                f"**{home}** vs **{away}** — 1: {fc['home_win']:.0%} · X: {fc['draw']:.0%} · 2: {fc['away_win']:.0%}"
+                f" | Pts esperados {fc['home_points']:.2f} - {fc['away_points']:.2f} | Más probable {h}-{a}"
+            )
 
 def render_actions():
     """Render special actions page"""
@@ -800,10 +876,9 @@ def render_actions():
         elif not game.agent.clients:
             st.warning("Necesitas clientes para plantar rumores")
         else:
-            client_choice = st.selectbox("Cliente objetivo:", [c.name for c in game.agent.clients])
+            client = select_player("Cliente objetivo:", game.agent.clients, blank=False)
             
-            if client_choice:
-                client = next(c for c in game.agent.clients if c.name == client_choice)
+            if client:
                 
                 rumor_type = st.radio(
                     "Tipo de rumor:",
@@ -833,10 +908,9 @@ def render_actions():
         elif not game.agent.clients:
             st.warning("Necesitas clientes para hacer promesas")
         else:
-            client_choice = st.selectbox("Cliente objetivo:", [c.name for c in game.agent.clients], key="promise_client")
+            client = select_player("Cliente objetivo:", game.agent.clients, key="promise_client", blank=False)
             
-            if client_choice:
-                client = next(c for c in game.agent.clients if c.name == client_choice)
+            if client:
                 
                 promise_type = st.selectbox(
                     "Tipo de promesa:",
@@ -860,7 +934,7 @@ def render_actions():
                     
                     plazo = 10 if "salario" in promise_type else 20
                     
-                    game.active_promises.append({
+                    game.register_promise({
                         "jugador": client,
                         "nombre": client.name,
                         "tipo": tipo_map[promise_type],
@@ -874,757 +948,6 @@ def render_actions():
                     time.sleep(1)
                     st.rerun()
 
-def render_situations():
-    """Render random situations/events page"""
-    st.title("🎲 Situación Semanal")
-    
-    game = st.session_state.game
-    
-    if not st.session_state.pending_event or not st.session_state.event_player:
-        st.info("No hay situaciones pendientes esta semana")
-        if st.button("🔙 Volver"):
-            st.session_state.selected_page = "🏠 Inicio"
-            st.rerun()
-        return
-    
-    event = st.session_state.pending_event
-    player = st.session_state.event_player
-    
-    # Display event header
-    st.markdown(f"""
-    <div class="player-card">
-        <h3>{event['title']}</h3>
-        <p><strong>Jugador:</strong> {player.name} ({player.position})</p>
-        <p><strong>Club:</strong> {player.club or 'Libre'}</p>
-        <p><strong>Morale:</strong> {player.morale} | <strong>Trust:</strong> {player.trust_in_agent}</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    st.markdown("---")
-    
-    event_type = event["type"]
-    
-    # Handle each event type
-    if event_type == "needs_money":
-        amount = random.randint(2000, 8000)
-        st.markdown(f"💰 **{player.name} necesita un adelanto urgente de ${amount:,}.**")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("💵 Darle adelanto personal", use_container_width=True):
-                if game.agent.spend_money(amount):
-                    player.trust_in_agent = "Good" if player.trust_in_agent == "Neutral" else "Excellent"
-                    st.success(f"✓ {player.name} está muy agradecido. Trust mejorado.")
-                else:
-                    st.error("✗ No tienes suficiente dinero.")
-                    player.trust_in_agent = "Low"
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("🤝 Negociar con club", use_container_width=True):
-                if player.club:
-                    st.success(f"✓ Negociaste un bonus con {player.club}. {player.name} está satisfecho.")
-                else:
-                    st.warning(f"✗ {player.name} está libre, no hay club.")
-                    player.morale = "Unhappy"
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("❌ Negarle adelanto", use_container_width=True):
-                player.trust_in_agent = "Low"
-                player.morale = "Unhappy"
-                st.warning(f"✗ {player.name} está decepcionado.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "demotivated":
-        st.markdown(f"😔 **{player.name} se siente desmotivado y sin objetivos claros.**")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("💬 Sesión motivacional intensa", use_container_width=True):
-                player.morale = "Happy"
-                player.trust_in_agent = "Good" if player.trust_in_agent != "Low" else "Neutral"
-                st.success(f"✓ {player.name} recuperó su motivación.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("🏖️ Darle tiempo libre", use_container_width=True):
-                player.morale = "Content"
-                st.info(f"↷ {player.name} tomó un descanso.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("💪 Presionarlo a entrenar", use_container_width=True):
-                player.morale = "Unhappy"
-                player.trust_in_agent = "Low"
-                st.warning(f"✗ {player.name} se siente presionado.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "press_rumor":
-        rumor_positive = random.random() > 0.5
-        if rumor_positive:
-            st.markdown(f"📰 **La prensa habla positivamente de {player.name}.**")
-            player.morale = "Happy"
-            st.success("✓ Morale mejorado.")
-            if st.button("Continuar"):
-                st.session_state.pending_event = None
-                st.rerun()
-        else:
-            st.markdown(f"📰 **La prensa publicó rumores negativos sobre {player.name}.**")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                if st.button("📄 Comunicado oficial", use_container_width=True):
-                    player.morale = "Content"
-                    st.success("✓ El comunicado calmó la situación.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-            
-            with col2:
-                if st.button("🤐 Ignorar rumor", use_container_width=True):
-                    player.morale = "Unhappy"
-                    st.warning("↷ El rumor persiste.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-            
-            with col3:
-                if st.button("⚔️ Confrontar periodista", use_container_width=True):
-                    player.morale = "Content"
-                    player.trust_in_agent = "Good"
-                    st.success(f"✓ {player.name} apreció tu defensa.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-    
-    elif event_type == "nightclub_scandal":
-        st.markdown(f"""
-        🚨 **CRISIS: {player.name} fue visto en un boliche a las 4 AM antes de un partido importante.**
-        
-        La prensa ya tiene fotos. El club está furioso.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("🤫 Encubrir ($8,000)", use_container_width=True):
-                cost = 8000
-                if game.agent.spend_money(cost):
-                    game.agent.change_press_reputation(-15)
-                    st.success(f"✓ Pagaste ${cost:,} para encubrir. No salió en medios.")
-                    st.warning(f"⚠️ Prensa: {game.agent.press_reputation}/100")
-                else:
-                    st.error("✗ No tienes dinero. Escándalo explotó.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-25)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("😠 Regañarlo públicamente", use_container_width=True):
-                player.morale = "Unhappy"
-                player.trust_in_agent = "Low"
-                st.success("✓ El club apreció tu postura firme.")
-                st.warning(f"✗ {player.name} está molesto contigo.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("🛡️ Decir que tú lo manejas", use_container_width=True):
-                player.trust_in_agent = "Good"
-                game.agent.change_press_reputation(-10)
-                st.success(f"✓ {player.name} valoró tu apoyo.")
-                st.warning(f"⚠️ Prensa: {game.agent.press_reputation}/100")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "social_media_disaster":
-        st.markdown(f"""
-        🚨 **CRISIS: {player.name} publicó un tweet polémico insultando al entrenador.**
-        
-        Está viralizándose. El club exige acción inmediata.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("🗑️ Borrar y disculparse", use_container_width=True):
-                player.morale = "Content"
-                game.agent.change_press_reputation(+10)
-                st.success("✓ Tweet borrado. Crisis controlada.")
-                st.info(f"Prensa: {game.agent.press_reputation}/100")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("🛡️ Defenderlo", use_container_width=True):
-                player.trust_in_agent = "Excellent"
-                game.agent.change_press_reputation(-15)
-                st.success(f"✓ {player.name} agradece tu lealtad.")
-                st.warning(f"⚠️ Prensa: {game.agent.press_reputation}/100")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("🤖 Fingir hackeo ($5,000)", use_container_width=True):
-                cost = 5000
-                if game.agent.spend_money(cost):
-                    st.success(f"✓ Historia creíble. Crisis neutralizada (${cost:,}).")
-                else:
-                    st.error("✗ No tienes dinero. Desastre total.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-20)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "gambling_scandal":
-        st.markdown(f"""
-        🚨 **CRISIS: {player.name} fue fotografiado en un casino apostando grandes sumas.**
-        
-        El club está preocupado por adicción al juego. La prensa pide explicaciones.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("🏥 Clínica ($15,000 + 2 acc)", use_container_width=True):
-                cost = 15000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 2:
-                    game.agent.actions_remaining -= 2
-                    player.trust_in_agent = "Excellent"
-                    game.agent.change_press_reputation(+15)
-                    st.success(f"✓ Tratamiento iniciado (${cost:,}, -2 acc). Prensa elogia.")
-                else:
-                    st.error("✗ Recursos insuficientes. Escándalo explota.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-25)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("⚖️ Negar ($8,000 + 1 acc)", use_container_width=True):
-                cost = 8000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 1:
-                    game.agent.actions_remaining -= 1
-                    game.agent.change_press_reputation(-20)
-                    st.warning(f"✓ Demandas presentadas (${cost:,}, -1 acc).")
-                else:
-                    st.error("✗ Recursos insuficientes.")
-                    game.agent.change_press_reputation(-30)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("🤝 Admitir y supervisar", use_container_width=True):
-                player.trust_in_agent = "Good"
-                player.morale = "Content"
-                st.info("↷ Crisis parcialmente controlada.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "coach_conflict":
-        if not player.club:
-            st.warning(f"✗ {player.name} está libre, no hay entrenador.")
-            if st.button("Continuar"):
-                st.session_state.pending_event = None
-                st.rerun()
-        else:
-            st.markdown(f"⚔️ **{player.name} tuvo un conflicto con el entrenador de {player.club}.**")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                if st.button("🤝 Mediar entre ambos", use_container_width=True):
-                    player.morale = "Content"
-                    player.trust_in_agent = "Good"
-                    st.success("✓ Mediaste exitosamente. Relación restaurada.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-            
-            with col2:
-                if st.button("😔 Exigir disculpa", use_container_width=True):
-                    player.trust_in_agent = "Low"
-                    st.warning(f"↷ {player.name} se disculpó pero está resentido.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-            
-            with col3:
-                if st.button("🚪 Buscar transferencia", use_container_width=True):
-                    player.morale = "Unhappy"
-                    st.warning(f"⚠️ {player.name} quiere irse. Busca ofertas.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-    
-    elif event_type == "rival_agent":
-        st.markdown(f"🕴️ **Otro agente está intentando seducir a {player.name}.**")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            cost = random.randint(1000, 3000)
-            if st.button(f"💼 Renovar compromiso (${cost:,})", use_container_width=True):
-                if game.agent.spend_money(cost):
-                    player.trust_in_agent = "Excellent"
-                    st.success(f"✓ {player.name} rechazó al otro agente.")
-                else:
-                    st.error(f"✗ No tienes dinero. {player.name} está dudando.")
-                    player.trust_in_agent = "Low"
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("🤞 Confiar en lealtad", use_container_width=True):
-                if random.random() > 0.3:
-                    player.trust_in_agent = "Good"
-                    st.success(f"✓ {player.name} se mantuvo leal.")
-                else:
-                    game.agent.remove_client(player)
-                    st.error(f"✗ {player.name} cambió de agente.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("⚖️ Amenazar legalmente", use_container_width=True):
-                player.trust_in_agent = "Very Low"
-                st.error(f"✗ {player.name} se sintió amenazado.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "family_issue":
-        st.markdown(f"👨‍👩‍👧 **{player.name} tiene un problema familiar grave.**")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("❤️ Apoyo emocional", use_container_width=True):
-                player.trust_in_agent = "Excellent"
-                player.morale = "Happy"
-                st.success(f"✓ {player.name} agradece tu comprensión.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("⚽ Enfocarse en fútbol", use_container_width=True):
-                player.trust_in_agent = "Low"
-                player.morale = "Unhappy"
-                st.error(f"✗ {player.name} se sintió ignorado.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            cost = random.randint(3000, 7000)
-            if st.button(f"💰 Ayuda financiera (${cost:,})", use_container_width=True):
-                if game.agent.spend_money(cost):
-                    player.trust_in_agent = "Excellent"
-                    st.success(f"✓ Tu ayuda fue invaluable.")
-                else:
-                    st.warning("✗ No tienes dinero suficiente.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "injury_scare":
-        st.markdown(f"🩹 **{player.name} sufrió una molestia física que lo tiene preocupado.**")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            cost = random.randint(1500, 3500)
-            if st.button(f"🏥 Médicos (${cost:,})", use_container_width=True):
-                if game.agent.spend_money(cost):
-                    player.morale = "Happy"
-                    player.trust_in_agent = "Good"
-                    st.success(f"✓ Consulta exitosa (${cost:,}). {player.name} está tranquilo.")
-                else:
-                    st.error(f"✗ No tienes dinero. {player.name} está nervioso.")
-                    player.morale = "Unhappy"
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("😴 Descanso preventivo", use_container_width=True):
-                player.morale = "Content"
-                st.info("↷ Situación estable.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("💪 Ignorar y continuar", use_container_width=True):
-                if random.random() < 0.3:
-                    player.morale = "Unhappy"
-                    st.error("✗ La molestia empeoró.")
-                else:
-                    st.success("✓ La molestia pasó.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "dressing_room_issue":
-        if not player.club:
-            st.warning(f"✗ {player.name} está libre, no hay vestuario.")
-            if st.button("Continuar"):
-                st.session_state.pending_event = None
-                st.rerun()
-        else:
-            st.markdown(f"🚪 **{player.name} tiene un conflicto con compañeros en {player.club}.**")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                if st.button("👥 Reunión de equipo", use_container_width=True):
-                    player.morale = "Content"
-                    player.trust_in_agent = "Good"
-                    st.success("✓ Reunión ayudó a resolver tensiones.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-            
-            with col2:
-                if st.button("📢 Apoyar públicamente", use_container_width=True):
-                    player.trust_in_agent = "Excellent"
-                    player.morale = "Happy"
-                    st.success(f"✓ {player.name} apreció tu apoyo incondicional.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-            
-            with col3:
-                if st.button("😔 Pedir disculpa al equipo", use_container_width=True):
-                    player.morale = "Unhappy"
-                    player.trust_in_agent = "Low"
-                    st.warning(f"✗ {player.name} se sintió traicionado.")
-                    st.session_state.pending_event = None
-                    time.sleep(2)
-                    st.rerun()
-    
-    elif event_type == "not_training":
-        st.markdown(f"🏃 **{player.name} no está asistiendo a entrenamientos.**")
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("🤝 Hablar en privado", use_container_width=True):
-                player.trust_in_agent = "Good"
-                st.success(f"✓ {player.name} apreció tu apoyo. Volverá a entrenar.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("📞 Alertar al club", use_container_width=True):
-                if player.club:
-                    player.morale = "Content"
-                    st.info(f"↷ {player.club} está al tanto.")
-                else:
-                    st.warning(f"✗ {player.name} está libre, no hay club.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("⚠️ Darle ultimátum", use_container_width=True):
-                player.trust_in_agent = "Low"
-                player.morale = "Unhappy"
-                st.error(f"✗ {player.name} se molestó con el ultimátum.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "doping_accusation":
-        st.markdown(f"""
-        🚨 **CRISIS: {player.name} fue acusado de doping por un medio amarillista.**
-        
-        No hay pruebas, pero el rumor se expande rápido.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("⚖️ Abogados ($12,000)", use_container_width=True):
-                cost = 12000
-                if game.agent.spend_money(cost):
-                    game.agent.change_press_reputation(+20)
-                    player.trust_in_agent = "Excellent"
-                    st.success(f"✓ Demanda exitosa. Medio retractado.")
-                    st.info(f"Prensa: {game.agent.press_reputation}/100")
-                else:
-                    st.error("✗ No tienes dinero. Rumor sigue vivo.")
-                    game.agent.change_press_reputation(-15)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("📄 Desmentida rápida", use_container_width=True):
-                game.agent.change_press_reputation(+5)
-                player.trust_in_agent = "Good"
-                st.info("↷ Daño parcialmente controlado.")
-                st.info(f"Prensa: {game.agent.press_reputation}/100")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("🤐 No hacer nada", use_container_width=True):
-                game.agent.change_press_reputation(-20)
-                player.trust_in_agent = "Low"
-                player.morale = "Unhappy"
-                st.error(f"✗ {player.name} está furioso. La prensa te odia.")
-                st.info(f"⚠️ Prensa: {game.agent.press_reputation}/100")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "contract_rebellion":
-        st.markdown(f"""
-        🚨 **CRISIS: {player.name} está exigiendo renovación YA o amenaza con irse libre.**
-        
-        Club: {player.club or 'Libre'}
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("💼 Negociar mejora ahora", use_container_width=True):
-                player.trust_in_agent = "Excellent"
-                player.morale = "Happy"
-                st.success(f"✓ {player.name} está feliz. Presionarás al club.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("⏳ Esperar fin de temporada", use_container_width=True):
-                player.trust_in_agent = "Neutral"
-                player.morale = "Content"
-                st.warning(f"↷ {player.name} aceptó esperar, pero no está contento.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("📰 Filtrar a prensa", use_container_width=True):
-                game.agent.change_press_reputation(-15)
-                player.transfer_value = int(player.transfer_value * 1.2) if player.transfer_value else 0
-                st.success("✓ Rumor plantado. Valor +20%.")
-                st.warning(f"⚠️ Prensa: {game.agent.press_reputation}/100")
-                st.info(f"💰 Nuevo valor: ${player.transfer_value:,}")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "tax_evasion":
-        amount = random.randint(50000, 200000)
-        st.markdown(f"""
-        🚨 **CRISIS: Hacienda acusa a {player.name} de evadir impuestos por ${amount:,}.**
-        
-        Juicio inminente. El jugador te culpa por malos consejos fiscales.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("⚖️ Élite legal ($25k + 2 acc)", use_container_width=True):
-                cost = 25000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 2:
-                    game.agent.actions_remaining -= 2
-                    if random.random() < 0.70:
-                        player.trust_in_agent = "Excellent"
-                        game.agent.change_press_reputation(+20)
-                        st.success(f"✓ ¡Absuelto! (${cost:,}, -2 acc)")
-                    else:
-                        player.trust_in_agent = "Neutral"
-                        game.agent.change_press_reputation(-10)
-                        st.error(f"✗ Condenado (${cost:,}, -2 acc)")
-                else:
-                    st.error("✗ Recursos insuficientes. Condenado.")
-                    player.trust_in_agent = "Low"
-                    game.agent.change_press_reputation(-30)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("🤝 Acuerdo ($18k + 1 acc)", use_container_width=True):
-                cost = 18000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 1:
-                    game.agent.actions_remaining -= 1
-                    player.trust_in_agent = "Good"
-                    game.agent.change_press_reputation(-5)
-                    st.success(f"✓ Acuerdo firmado (${cost:,}, -1 acc)")
-                else:
-                    st.error("✗ Recursos insuficientes.")
-                    player.trust_in_agent = "Low"
-                    game.agent.change_press_reputation(-20)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("🚫 Dejar solo", use_container_width=True):
-                player.trust_in_agent = "Very Low"
-                player.morale = "Unhappy"
-                game.agent.change_press_reputation(-35)
-                st.error(f"✗ {player.name} fue condenado. Te odia.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "assault_allegations":
-        st.markdown(f"""
-        🚨 **CRISIS: Una persona acusa a {player.name} de agresión en un bar.**
-        
-        Hay testigos, pero versiones contradictorias. Policía investiga.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("🔍 Investigador ($20k + 2 acc)", use_container_width=True):
-                cost = 20000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 2:
-                    game.agent.actions_remaining -= 2
-                    if random.random() < 0.60:
-                        player.trust_in_agent = "Excellent"
-                        game.agent.change_press_reputation(+15)
-                        st.success(f"✓ Evidencia de inocencia (${cost:,}, -2 acc). Caso cerrado.")
-                    else:
-                        player.morale = "Unhappy"
-                        game.agent.change_press_reputation(-15)
-                        st.warning(f"✗ Sin evidencia concluyente (${cost:,}, -2 acc)")
-                else:
-                    st.error("✗ Recursos insuficientes.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-20)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("💰 Compensación ($30k + 1 acc)", use_container_width=True):
-                cost = 30000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 1:
-                    game.agent.actions_remaining -= 1
-                    player.trust_in_agent = "Good"
-                    game.agent.change_press_reputation(-10)
-                    st.success(f"✓ Cargos retirados (${cost:,}, -1 acc). Prensa sospecha.")
-                else:
-                    st.error("✗ Recursos insuficientes. Juicio se avecina.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-25)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("⏳ Esperar proceso legal", use_container_width=True):
-                if random.random() < 0.40:
-                    player.morale = "Content"
-                    st.success(f"✓ {player.name} fue absuelto. Suerte.")
-                else:
-                    player.trust_in_agent = "Very Low"
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-40)
-                    st.error(f"✗ {player.name} fue condenado. Te culpa.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    elif event_type == "leaked_video":
-        st.markdown(f"""
-        🚨 **CRISIS: Un video íntimo de {player.name} fue filtrado en redes sociales.**
-        
-        Se viraliza rápidamente. El jugador está devastado emocionalmente.
-        
-        💡 Tu energía: {game.agent.actions_remaining}/{game.agent.actions_per_week}
-        """)
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            if st.button("💻 Ciberseguridad ($12k + 2 acc)", use_container_width=True):
-                cost = 12000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 2:
-                    game.agent.actions_remaining -= 2
-                    player.trust_in_agent = "Excellent"
-                    player.morale = "Content"
-                    game.agent.change_press_reputation(+10)
-                    st.success(f"✓ Video eliminado (${cost:,}, -2 acc). {player.name} agradecido.")
-                else:
-                    st.error("✗ Recursos insuficientes. Video persiste.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-20)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col2:
-            if st.button("📢 Víctima ($5k + 1 acc)", use_container_width=True):
-                cost = 5000
-                if game.agent.spend_money(cost) and game.agent.actions_remaining >= 1:
-                    game.agent.actions_remaining -= 1
-                    player.trust_in_agent = "Good"
-                    player.morale = "Happy"
-                    game.agent.change_press_reputation(+15)
-                    st.success(f"✓ Declaración emitida (${cost:,}, -1 acc). Prensa apoya.")
-                else:
-                    st.error("✗ Recursos insuficientes.")
-                    player.morale = "Unhappy"
-                    game.agent.change_press_reputation(-15)
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-        
-        with col3:
-            if st.button("🤐 Ignorar y esperar", use_container_width=True):
-                player.trust_in_agent = "Low"
-                player.morale = "Unhappy"
-                game.agent.change_press_reputation(-25)
-                st.error(f"✗ {player.name} está devastado. Te culpa por no ayudar.")
-                st.session_state.pending_event = None
-                time.sleep(2)
-                st.rerun()
-    
-    # Add skip button for testing
-    st.markdown("---")
-    if st.button("⏭️ Omitir Evento (Testing)", type="secondary"):
-        st.session_state.pending_event = None
-        st.session_state.event_player = None
-        st.session_state.selected_page = "🏠 Inicio"
-        st.rerun()
-
 def render_agent_status():
     """Render agent status page with confidence bars"""
     st.title("🎖️ Estado del Agente")
@@ -1725,9 +1048,14 @@ def render_scout_reports():
     st.markdown(f"**Reportes disponibles:** {len(game.available_reports)}")
     st.markdown("---")
     
-    for i, report in enumerate(game.available_reports):
-        with st.expander(f"📄 {report['preview']}", expanded=(i == 0)):
-            st.markdown(report['full_report'])
+    # Only the visible page is rendered; reports format their text on first access
+    pages = max(1, -(-len(game.available_reports) // REPORTS_PER_PAGE))
+    page = st.number_input("Página:", min_value=1, max_value=pages, value=1) if pages > 1 else 1
+    start = (page - 1) * REPORTS_PER_PAGE
+    
+    for i, report in enumerate(game.available_reports[start:start + REPORTS_PER_PAGE], start):
+        with st.expander(f"📄 {report.preview}", expanded=(i == start)):
+            st.markdown(report.full_report)
             
             if st.button(f"📌 Marcar como leído", key=f"report_{i}"):
                 game.available_reports.pop(i)
@@ -1748,11 +1076,12 @@ def render_contact_clubs():
     
     st.markdown("**Selecciona un club para contactar:**")
     
-    club_options = [f"{club.name} (🏅 {club.reputation})" for club in game.clubs]
-    selected = st.selectbox("Club:", club_options)
+    clubs_by_id = {club.uid: club for club in game.clubs}
+    selected = st.selectbox("Club:", list(clubs_by_id),
+                            format_func=lambda uid: f"{clubs_by_id[uid].name} (🏅 {clubs_by_id[uid].reputation})")
     
     if selected:
-        club = next(c for c in game.clubs if c.name == selected.split(" (")[0])
+        club = clubs_by_id[selected]
         
         with st.expander("📋 Información del Club"):
             col1, col2 = st.columns(2)
@@ -1795,11 +1124,15 @@ def render_contact_clubs():
         
         with col2:
             if st.button("ℹ️ Ver Plantilla", use_container_width=True):
-                st.info("Jugadores del club:")
-                for player in club.players[:10]:
-                    st.caption(f"⚽ {player.name} ({player.position}) - Overall {int(player.current_overall_score or player.current_rating*100)}")
-                if len(club.players) > 10:
-                    st.caption(f"... y {len(club.players)-10} más")
+                roster = sorted(game.club_rosters.get(club.name, []), key=lambda p: p['skill_rating'], reverse=True)
+                if not roster:
+                    st.info("No hay datos de la plantilla de este club.")
+                else:
+                    st.info(f"Jugadores del club (media del XI: {club.team_average}):")
+                    for player in roster[:10]:
+                        st.caption(f"⚽ {player['name']} ({player['position']}) - Overall {player['skill_rating']:.1f}")
+                    if len(roster) > 10:
+                        st.caption(f"... y {len(roster)-10} más")
         with col2:
             if st.button("ℹ️ Ver Información", use_container_width=True):
                 st.info(f"**Plantilla:** {club.players_count} jugadores")
@@ -1822,49 +1155,51 @@ def render_international_playoff():
         st.info("El playoff se activa solo si al menos uno de tus representados juega en un club internacional.")
         return
     
-    if game.agent.actions_remaining <= 0:
-        st.error("❌ No te quedan acciones esta semana!")
-        return
-    
     st.success(f"✅ Clientes en clubes internacionales:")
     for client in game.agent.clients:
         if client.club in client_club_names:
             st.markdown(f"- ⚽ **{client.name}** ({client.club})")
     
+    # Exact odds for the stored bracket, before spending the action
     st.markdown("---")
+    st.subheader("📊 Probabilidades del cuadro")
+    st.table([
+        {
+            "Club": ("⭐ " if row['club'] in client_club_names else "") + row['club'],
+            "Semifinal": f"{row['reach']['Semifinal']:.1%}",
+            "Final": f"{row['reach']['Final']:.1%}",
+            "Campeón": f"{row['champion']:.1%}",
+        }
+        for row in game.international_playoff_odds()
+    ])
+    
+    season_odds = game.season_playoff_odds()
+    if season_odds:
+        with st.expander("🗓️ Playoff de la temporada (16 clubes)"):
+            st.table([
+                {"Club": row['club'], **{k: f"{v:.1%}" for k, v in row['reach'].items()}, "Campeón": f"{row['champion']:.1%}"}
+                for row in season_odds
+            ])
+    
+    st.markdown("---")
+    
+    if game.agent.actions_remaining <= 0:
+        st.error("❌ No te quedan acciones esta semana!")
+        return
     
     if st.button("🎯 Ejecutar Playoff Internacional", type="primary", use_container_width=True):
         if game.agent.use_action():
             with st.spinner("Simulando playoff..."):
-                # Select 8 clubs for bracket
-                pool_sorted = sorted(game.international_clubs, key=lambda c: c.reputation, reverse=True)
-                participants = pool_sorted[:8]
-                random.shuffle(participants)
-                
-                round_names = ["Cuartos de Final", "Semifinal", "Final"]
-                current_round = participants
+                rounds = simulate_bracket(game.prepare_international_playoff())
+                game.playoff_bracket = None  # the next playoff draws a new bracket
                 
                 results = []
-                
-                for round_name in round_names:
+                for round_name, ties in zip(ROUND_NAMES, rounds):
                     results.append(f"\n### {round_name}")
-                    winners = []
-                    
-                    for i in range(0, len(current_round), 2):
-                        home = current_round[i]
-                        away = current_round[i+1]
-                        home_prob = home.get_win_probability(away)
-                        away_prob = away.get_win_probability(home)
-                        total_prob = home_prob + away_prob
-                        outcome = random.random() * total_prob
-                        winner = home if outcome <= home_prob else away
-                        
-                        results.append(f"- {home.name} ({home_prob:.0%}) vs {away.name} ({away_prob:.0%}) → **{winner.name}**")
-                        winners.append(winner)
-                    
-                    current_round = winners
+                    for tie in ties:
+                        results.append(f"- {tie['home'].name} ({tie['home_prob']:.0%}) vs {tie['away'].name} ({tie['away_prob']:.0%}) → **{tie['winner'].name}**")
                 
-                champion = current_round[0]
+                champion = rounds[-1][0]['winner']
                 
                 # Display results
                 st.markdown("\n".join(results))
@@ -1887,63 +1222,77 @@ def render_advance_week():
     
     game = st.session_state.game
     
-    st.markdown(f"### Semana Actual: {game.agent.week}")
+    st.markdown(f"### Temporada {game.season} - Semana Actual: {game.agent.week}/{game.total_weeks}")
     st.markdown(f"**Acciones restantes:** {game.agent.actions_remaining}/{game.agent.actions_per_week}")
     
     if game.agent.actions_remaining > 0:
         st.warning(f"⚠️ Tienes {game.agent.actions_remaining} acciones sin usar")
+
+    if game.season_archive:
+        with st.expander(f"📚 Temporadas anteriores ({len(game.season_archive)})"):
+            for summary in reversed(game.season_archive):
+                st.text(format_season(summary))
     
     if st.button("⏭️ Avanzar a la Siguiente Semana", type="primary", use_container_width=True):
         with st.spinner("Procesando semana..."):
             # Headless advance without input prompts
             current_week_index = game.agent.week - 1
-            game._simulate_week_fixtures(current_week_index)
-            game._simulate_client_match_participation(current_week_index)
-            game._process_weekly_player_growth(current_week_index)
-            # Generar ofertas de la semana (ventana de traspasos y agentes libres)
-            game._generate_transfer_offers_for_clients(current_week_index)
-            game.event_occurred_this_week = False
-            game.agent.advance_week()
-            
-            # Generate random weekly event
-            if game.agent.clients and not game.event_occurred_this_week:
-                event_catalog = [
-                    {"type": "needs_money", "weight": 10, "title": "💰 Necesita dinero"},
-                    {"type": "demotivated", "weight": 12, "title": "😔 Desmotivado"},
-                    {"type": "not_training", "weight": 8, "title": "🏃 No entrena"},
-                    {"type": "press_rumor", "weight": 15, "title": "📰 Rumor de prensa"},
-                    {"type": "coach_conflict", "weight": 10, "title": "⚔️ Conflicto con entrenador"},
-                    {"type": "rival_agent", "weight": 8, "title": "🕴️ Tentación de otro agente"},
-                    {"type": "family_issue", "weight": 7, "title": "👨‍👩‍👧 Problema familiar"},
-                    {"type": "injury_scare", "weight": 10, "title": "🩹 Susto de lesión"},
-                    {"type": "dressing_room_issue", "weight": 12, "title": "🚪 Problema de vestuario"},
-                    {"type": "nightclub_scandal", "weight": 6, "title": "🍾 CRISIS: Escándalo nocturno"},
-                    {"type": "doping_accusation", "weight": 4, "title": "💊 CRISIS: Acusación de doping"},
-                    {"type": "social_media_disaster", "weight": 7, "title": "📱 CRISIS: Desastre en redes"},
-                    {"type": "contract_rebellion", "weight": 5, "title": "📄 CRISIS: Rebelión contractual"},
-                    {"type": "gambling_scandal", "weight": 5, "title": "🎰 CRISIS: Escándalo de apuestas"},
-                    {"type": "tax_evasion", "weight": 4, "title": "💸 CRISIS: Evasión fiscal"},
-                    {"type": "assault_allegations", "weight": 3, "title": "⚖️ CRISIS: Denuncia por agresión"},
-                    {"type": "leaked_video", "weight": 6, "title": "📹 CRISIS: Video comprometedor filtrado"},
-                ]
+            with game.profile_week():
+                # Generar ofertas de la semana (ventana de traspasos y agentes libres)
+                game.simulate_week(current_week_index, generate_offers=True)
+                game.event_occurred_this_week = False
+                game.agent.advance_week()
+
+                # Season over: archive it and start the next one
+                if game.agent.week > game.total_weeks:
+                    with game.profile_stage('season_rollover'):
+                        game.rollover_season()
                 
-                total_weight = sum(e["weight"] for e in event_catalog)
-                rand = random.random() * total_weight
-                cumulative = 0
-                selected_event = event_catalog[0]
+                # Generate random weekly event
+                with game.profile_stage('events'):
+                    if game.agent.clients and not game.event_occurred_this_week:
+                        event_catalog = [
+                            {"type": "needs_money", "weight": 10, "title": "💰 Necesita dinero"},
+                            {"type": "demotivated", "weight": 12, "title": "😔 Desmotivado"},
+                            {"type": "not_training", "weight": 8, "title": "🏃 No entrena"},
+                            {"type": "press_rumor", "weight": 15, "title": "📰 Rumor de prensa"},
+                            {"type": "coach_conflict", "weight": 10, "title": "⚔️ Conflicto con entrenador"},
+                            {"type": "rival_agent", "weight": 8, "title": "🕴️ Tentación de otro agente"},
+                            {"type": "family_issue", "weight": 7, "title": "👨‍👩‍👧 Problema familiar"},
+                            {"type": "injury_scare", "weight": 10, "title": "🩹 Susto de lesión"},
+                            {"type": "dressing_room_issue", "weight": 12, "title": "🚪 Problema de vestuario"},
+                            {"type": "nightclub_scandal", "weight": 6, "title": "🍾 CRISIS: Escándalo nocturno"},
+                            {"type": "doping_accusation", "weight": 4, "title": "💊 CRISIS: Acusación de doping"},
+                            {"type": "social_media_disaster", "weight": 7, "title": "📱 CRISIS: Desastre en redes"},
+                            {"type": "contract_rebellion", "weight": 5, "title": "📄 CRISIS: Rebelión contractual"},
+                            {"type": "gambling_scandal", "weight": 5, "title": "🎰 CRISIS: Escándalo de apuestas"},
+                            {"type": "tax_evasion", "weight": 4, "title": "💸 CRISIS: Evasión fiscal"},
+                            {"type": "assault_allegations", "weight": 3, "title": "⚖️ CRISIS: Denuncia por agresión"},
+                            {"type": "leaked_video", "weight": 6, "title": "📹 CRISIS: Video comprometedor filtrado"},
+                        ]
                 
-                for event in event_catalog:
-                    cumulative += event["weight"]
-                    if rand < cumulative:
-                        selected_event = event
-                        break
+                        total_weight = sum(e["weight"] for e in event_catalog)
+                        rand = random.random() * total_weight
+                        cumulative = 0
+                        selected_event = event_catalog[0]
                 
-                affected_client = random.choice(game.agent.clients)
-                st.session_state.pending_event = selected_event
-                st.session_state.event_player = affected_client
-                game.event_occurred_this_week = True
+                        for event in event_catalog:
+                            cumulative += event["weight"]
+                            if rand < cumulative:
+                                selected_event = event
+                                break
+                
+                        affected_client = random.choice(game.agent.clients)
+                        st.session_state.pending_event = selected_event
+                        st.session_state.event_player = affected_client
+                        game.event_occurred_this_week = True
+            
+            if get_service().last_error is not None:
+                st.warning(f"⚠️ Configuración de personalidad inválida, se mantiene v{game.impact_config.version}: {get_service().last_error}")
 
         st.success("¡Semana avanzada!")
+        if game.agent.week == 1 and game.season_archive:
+            st.success(f"🏆 Temporada {game.season_archive[-1]['season']} finalizada. Comienza la temporada {game.season}.")
         time.sleep(1)
         
         # If event was generated, go to situations page
@@ -1981,6 +1330,7 @@ def main():
     elif page == "⚙️ Acciones":
         render_actions()
     elif page == "🎲 Situaciones":
+        from app_situations import render_situations
         render_situations()
     elif page == "⏭️ Avanzar":
         render_advance_week()
@@ -0,0 +1,302 @@
+"""
+Hot path benchmark - Microbenchmarks for the simulation with stored baselines.
+
+Each benchmark runs with a fixed seed and reports the best time per item
+(one player, one club, one week, one season...). Times are divided by a short
+pure-Python calibration loop, so the baselines in data/bench_baseline.json can
+be compared across machines. The script exits with status 1 when a benchmark
+is slower than its baseline by more than the threshold.
+
+Usage:
+    python bench_hotpaths.py                  # compare against the baseline
+    python bench_hotpaths.py --update         # record a new baseline
+    python bench_hotpaths.py --only season --threshold 1.5
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+
+from agent import Agent
+from game import FootballAgentGame
+from game_data import get_default_clubs, PLAYER_POSITIONS
+from player_generator import generate_player
+import personality_impact as pi
+
+SEED = 2024
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'bench_baseline.json')
+DEFAULT_THRESHOLD = 1.30  # fail when more than 30% slower than the baseline
+QUALITIES = ['poor', 'average', 'good', 'excellent']
+
+
+# ========== FIXTURES ==========
+
+def _players(n, seed=SEED):
+    random.seed(seed)
+    return [
+        generate_player(f"Bench {i}", random.randint(17, 33), random.choice(PLAYER_POSITIONS), random.choice(QUALITIES))
+        for i in range(n)
+    ]
+
+
+def _game(seed=SEED, clients=0):
+    """Headless game with the default world (same setup as a new game)."""
+    random.seed(seed)
+    game = FootballAgentGame()
+    game.agent = Agent("Bench", "Balanced")
+    with _quiet():
+        game.init_world()
+    for player in _players(clients, seed):
+        game.agent.clients.append(player)
+    return game
+
+
+class _Discard:
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def _quiet():
+    """Silence the game's console output while timing."""
+    return contextlib.redirect_stdout(_Discard())
+
+
+def _weeks(game, predicate):
+    return [i for i, week in enumerate(game.schedule) if predicate(game, i, week)]
+
+
+# ========== BENCHMARKS ==========
+# Each setup(seed) returns (op, items). op() is timed; results are per item.
+
+def bench_calculate_ratings(seed):
+    players = _players(1000, seed)
+
+    def op():
+        for p in players:
+            p.calculate_ratings()
+    return op, len(players)
+
+
+def bench_update_ratings(seed):
+    players = _players(1000, seed)
+
+    def op():
+        for p in players:
+            p.passing += 0.1  # a weekly growth nudge
+            p.update_ratings()
+    return op, len(players)
+
+
+def bench_calculate_personality(seed):
+    players = _players(1000, seed)
+
+    def op():
+        for p in players:
+            p.calculate_personality()
+    return op, len(players)
+
+
+def bench_get_quick_profile(seed):
+    random.seed(seed)
+    clubs = get_default_clubs() * 200
+
+    def op():
+        for club in clubs:
+            club.get_quick_profile()
+    return op, len(clubs)
+
+
+def bench_simulate_week_fixtures(seed):
+    game = _game(seed)
+    weeks = _weeks(game, lambda g, i, w: w['fixtures'])
+
+    def op():
+        random.seed(seed)
+        for week in weeks:
+            game._simulate_week_fixtures(week)
+    return op, len(weeks)
+
+
+def bench_transfer_offers(seed):
+    game = _game(seed, clients=50)
+    week = _weeks(game, lambda g, i, w: g._is_transfer_window(i))[0]
+
+    def op():
+        random.seed(seed)
+        game.agent.pending_offers = []
+        game.agent.timers.clear()
+        with _quiet():
+            game._generate_transfer_offers_for_clients(week)
+    return op, len(game.agent.clients)
+
+
+def bench_personality_impact(seed):
+    names = list(pi._load_config()['personalities']) + ['Model Citizen', 'Unknown']
+    categories = ['Best', 'Good', 'Neutral', 'Bad', 'Worst']
+    cases = [(n, c) for n in names for c in categories]
+
+    def op():
+        random.seed(seed)
+        for name, category in cases:
+            pi.performance_multiplier(name, category)
+            pi.weekly_conflict_probability(name, category)
+            pi.skill_growth_chance(name, category, rating_vs_team_avg=5, training_quality=14)
+            pi.renewal_intent_probability(name, category, cohesion_index=65, meets_objective=True)
+    return op, len(cases)
+
+
+def bench_full_season(seed):
+    def op():
+        game = _game(seed, clients=5)
+        with _quiet():
+            for week_index in range(game.total_weeks):
+                game.simulate_week(week_index, generate_offers=True)
+                game.agent.advance_week()
+            game._process_season_end_renewals()
+    return op, 1
+
+
+def bench_full_season_fast(seed):
+    def op():
+        game = _game(seed, clients=5)
+        game.set_sim_fidelity('fast')
+        with _quiet():
+            for week_index in range(game.total_weeks):
+                game.simulate_week(week_index, generate_offers=True)
+                game.agent.advance_week()
+            game._process_season_end_renewals()
+    return op, 1
+
+
+# (name, setup, repeats)
+BENCHMARKS = [
+    ('player.calculate_ratings', bench_calculate_ratings, 9),
+    ('player.update_ratings', bench_update_ratings, 9),
+    ('player.calculate_personality', bench_calculate_personality, 9),
+    ('club.get_quick_profile', bench_get_quick_profile, 9),
+    ('game.simulate_week_fixtures', bench_simulate_week_fixtures, 9),
+    ('game.transfer_offers', bench_transfer_offers, 9),
+    ('personality_impact', bench_personality_impact, 50),
+    ('game.full_season', bench_full_season, 9),
+    ('game.full_season_fast', bench_full_season_fast, 9),
+]
+
+
+# ========== RUNNER ==========
+
+def calibrate(repeats=5):
+    """Best time of a fixed pure-Python loop, used to normalize results across machines."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        total = 0
+        for i in range(200_000):
+            total += i * i % 7
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(setup, repeats, seed=SEED):
+    """Best seconds per item over `repeats` runs (after one warm-up run)."""
+    op, items = setup(seed)
+    op()
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        op()
+        best = min(best, time.perf_counter() - start)
+    return best / items
+
+
+def run(only=None, repeats=None):
+    """Run the benchmarks; returns {'calibration': s, 'results': {name: {...}}}."""
+    calibration = calibrate()
+    results = {}
+    for name, setup, default_repeats in BENCHMARKS:
+        if only and not any(key in name for key in only):
+            continue
+        per_item = measure(setup, repeats or default_repeats)
+        results[name] = {
+            'us_per_item': round(per_item * 1e6, 3),
+            'normalized': round(per_item / calibration, 6),
+        }
+    return {'calibration': calibration, 'results': results}
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Return [(name, ratio, regressed)] for every benchmark that has a baseline."""
+    rows = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result['normalized'] / base['normalized']
+        rows.append((name, ratio, ratio > threshold))
+    return rows
+
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('results', {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'seed': SEED, 'python': sys.version.split()[0], 'results': results}, f, indent=2)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulation hot path benchmarks")
+    parser.add_argument("--update", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"fail when slower than baseline x threshold (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--only", nargs="*", help="run benchmarks whose name contains any of these")
+    parser.add_argument("--repeats", type=int, help="override repeats per benchmark")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    args = parser.parse_args(argv)
+
+    run_data = run(args.only, args.repeats)
+    results = run_data['results']
+    baseline = load_baseline(args.baseline)
+    ratios = {name: (ratio, regressed) for name, ratio, regressed in compare(results, baseline, args.threshold)}
+
+    print(f"Calibration loop: {run_data['calibration'] * 1000:.1f} ms")
+    print("=" * 80)
+    print(f"{'benchmark':<32} {'µs/item':>12} {'vs baseline':>14}")
+    print("-" * 80)
+    for name, result in results.items():
+        if name in ratios:
+            ratio, regressed = ratios[name]
+            mark = "❌" if regressed else "✅"
+            vs = f"{ratio:6.2f}x {mark}"
+        else:
+            vs = "(no baseline)"
+        print(f"{name:<32} {result['us_per_item']:>12,.1f} {vs:>14}")
+
+    if args.update:
+        merged = dict(baseline)
+        merged.update(results)
+        save_baseline(merged, args.baseline)
+        print(f"\nBaseline written to {args.baseline}")
+        return 0
+
+    regressions = [name for name, (_, regressed) in ratios.items() if regressed]
+    if regressions:
+        print(f"\nRegressions over {args.threshold:.2f}x: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
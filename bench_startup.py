@@ -0,0 +1,99 @@
+"""
+Startup benchmark - Cold-start timings for the CLI game and the Streamlit app.
+
+Each check runs in a fresh interpreter, so module imports and config loading are
+measured cold. The reported time is the median of several runs, minus the cost of
+starting an empty interpreter. The script exits with status 1 when a check goes
+over its budget.
+
+Usage:
+    python bench_startup.py [--runs N] [--no-budget]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (name, code run in a fresh interpreter, budget in seconds)
+CHECKS = [
+    ("import main (python main.py up to the intro)", "import main", 0.30),
+    ("new game world (headless)",
+     "from game import FootballAgentGame\n"
+     "from agent import Agent\n"
+     "g = FootballAgentGame()\n"
+     "g.agent = Agent('Bench', 'Balanced')\n"
+     "g.init_world()",
+     0.40),
+    ("first impact lookup (config load)",
+     "import personality_impact as pi\n"
+     "pi.get_profile('Leader')",
+     0.30),
+]
+
+STREAMLIT_CHECK = (
+    "streamlit app first render",
+    "from streamlit.testing.v1 import AppTest\n"
+    "AppTest.from_file('app.py', default_timeout=60).run()",
+    3.00,
+)
+
+
+def _run(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                   stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def measure(code, runs):
+    """Median wall time of `code` in a fresh interpreter."""
+    return statistics.median(_run(code) for _ in range(runs))
+
+
+def _streamlit_available():
+    try:
+        import streamlit  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start times against budgets")
+    parser.add_argument("--runs", type=int, default=5, help="runs per check (median is reported)")
+    parser.add_argument("--no-budget", action="store_true", help="report only, never fail")
+    args = parser.parse_args(argv)
+
+    checks = list(CHECKS)
+    if _streamlit_available():
+        checks.append(STREAMLIT_CHECK)
+
+    baseline = measure("pass", args.runs)
+    print(f"Interpreter start: {baseline * 1000:.0f} ms (subtracted below)")
+    print("=" * 80)
+
+    over_budget = []
+    for name, code, budget in checks:
+        elapsed = max(0.0, measure(code, args.runs) - baseline)
+        ok = elapsed <= budget
+        mark = "✅" if ok else "❌"
+        print(f"{mark} {name:<48} {elapsed * 1000:7.0f} ms  (budget {budget * 1000:.0f} ms)")
+        if not ok:
+            over_budget.append(name)
+
+    if not _streamlit_available():
+        print(f"⏭️  {STREAMLIT_CHECK[0]} skipped (streamlit not installed)")
+
+    if over_budget and not args.no_budget:
+        print(f"\nOver budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Bulk generator module - Generate large scouting worlds as NumPy columns.
+
+Attributes, ratings and personalities for N players are sampled and computed
+in a handful of array operations. Player objects are only materialized when a
+caller asks for a specific row.
+"""
+
+import numpy as np
+
+from player import Player
+from player_generator import POSITION_PROFILES, QUALITY_BASES, TECHNICAL_ATTRIBUTES
+from game_data import FIRST_NAMES, LAST_NAMES, PLAYER_POSITIONS, MENTAL_ATTRIBUTE_PROFILE
+from personality_rules import (
+    MENTAL_ATTRIBUTES,
+    PERSONALITY_NAMES,
+    MEDIA_HANDLING_NAMES,
+    classify_personalities,
+    classify_media_handling,
+)
+
+# Rating matrix columns, in Player.POSITION_WEIGHTS order (9 positions + AVG)
+POSITION_KEYS = list(Player.POSITION_WEIGHTS.keys())
+
+# (9 attributes, 10 positions) weight matrix
+WEIGHT_MATRIX = np.array(
+    [[Player.POSITION_WEIGHTS[pos][attr] for pos in POSITION_KEYS] for attr in TECHNICAL_ATTRIBUTES],
+    dtype=np.float32,
+)
+THEORETICAL_MAX = 20 * WEIGHT_MATRIX.sum(axis=0)
+
+# Rating column used as current rating for each entry of PLAYER_POSITIONS
+_POSITION_COLUMN = np.array(
+    [POSITION_KEYS.index(Player.POSITION_MAP.get(pos, 'AVG')) for pos in PLAYER_POSITIONS],
+    dtype=np.int8,
+)
+
+
+def _profile_offset(position, attr):
+    """Mean offset used by generate_position_specialist: high +2, medium 0, low -3."""
+    profile = POSITION_PROFILES.get(Player.POSITION_MAP.get(position), POSITION_PROFILES['CM'])
+    if attr in profile['high']:
+        return 2
+    if attr in profile['medium']:
+        return 0
+    return -3
+
+
+# (positions, attributes) mean offsets for each entry of PLAYER_POSITIONS
+_PROFILE_OFFSETS = np.array(
+    [[_profile_offset(pos, attr) for attr in TECHNICAL_ATTRIBUTES] for pos in PLAYER_POSITIONS],
+    dtype=np.float32,
+)
+
+_MENTAL_MEANS = np.array([MENTAL_ATTRIBUTE_PROFILE[a][0] for a in MENTAL_ATTRIBUTES], dtype=np.float32)
+_MENTAL_SPREADS = np.array([MENTAL_ATTRIBUTE_PROFILE[a][1] for a in MENTAL_ATTRIBUTES], dtype=np.float32)
+
+
+def _sample_attributes(rng, means, spreads):
+    """Normal draws truncated like int(random.gauss()) and clamped to 1-20."""
+    values = rng.standard_normal(means.shape, dtype=np.float32)
+    values *= spreads
+    values += means
+    np.trunc(values, out=values)
+    np.clip(values, 1, 20, out=values)
+    return values.astype(np.int8)
+
+
+class PlayerBatch:
+    """Columnar set of generated players. Use player(i) to get a Player object."""
+
+    def __init__(self, technical, mental, ages, position_codes, first_name_codes, last_name_codes,
+                 ratings, potential_rating, potential_overall, is_regen):
+        self.technical = technical                  # (n, 9) int8, TECHNICAL_ATTRIBUTES order
+        self.mental = mental                        # (n, 9) int8, MENTAL_ATTRIBUTES order
+        self.ages = ages                            # (n,) int8
+        self.position_codes = position_codes        # (n,) uint8 index into PLAYER_POSITIONS
+        self.first_name_codes = first_name_codes    # (n,) uint8 index into FIRST_NAMES
+        self.last_name_codes = last_name_codes      # (n,) uint8 index into LAST_NAMES
+        self.ratings = ratings                      # (n, 10) float32, POSITION_KEYS order
+        self.is_regen = is_regen                    # (n,) bool
+
+        rows = np.arange(len(ages))
+        self.current_rating = ratings[rows, _POSITION_COLUMN[position_codes]]
+        self.potential_rating = potential_rating
+        self.current_overall = np.rint(self.current_rating * 100).astype(np.int16)
+        self.potential_overall = potential_overall
+        self.transfer_value = np.maximum(10000, self.current_overall.astype(np.int32) * 500)
+
+        self.personality_codes = classify_personalities(mental, ages, is_regen)
+        self.media_handling_codes = classify_media_handling(mental)
+
+        self._materialized = {}
+
+    def __len__(self):
+        return len(self.ages)
+
+    def name(self, i):
+        return f"{FIRST_NAMES[self.first_name_codes[i]]} {LAST_NAMES[self.last_name_codes[i]]}"
+
+    def personality(self, i):
+        return PERSONALITY_NAMES[self.personality_codes[i]]
+
+    def personality_counts(self):
+        """Return {personality: count} for the whole batch."""
+        counts = np.bincount(self.personality_codes, minlength=len(PERSONALITY_NAMES))
+        return {PERSONALITY_NAMES[code]: int(c) for code, c in enumerate(counts) if c}
+
+    def player(self, i):
+        """Materialize row i as a Player (the same object is returned on later calls)."""
+        i = int(i)
+        player = self._materialized.get(i)
+        if player is None:
+            player = self._build_player(i)
+            self._materialized[i] = player
+        return player
+
+    def players(self, indices=None):
+        """Yield materialized players for the given rows (all rows if None)."""
+        for i in (range(len(self)) if indices is None else indices):
+            yield self.player(i)
+
+    def _build_player(self, i):
+        return player_from_columns(self, i)
+
+
+def player_from_columns(columns, i):
+    """
+    Build a Player from row i of a columnar player set (PlayerBatch, world_db.WorldDB).
+
+    `columns` provides name(i) and the PlayerBatch column attributes; attributes are
+    assigned directly because ratings and personality are already computed.
+    """
+    player = Player(columns.name(i), int(columns.ages[i]), PLAYER_POSITIONS[columns.position_codes[i]])
+
+    for attr, value in zip(TECHNICAL_ATTRIBUTES, columns.technical[i].tolist()):
+        setattr(player, attr, value)
+    for attr, value in zip(MENTAL_ATTRIBUTES, columns.mental[i].tolist()):
+        setattr(player, attr, value)
+
+    row = columns.ratings[i].tolist()
+    player.position_rating = {pos: round(r, 2) for pos, r in zip(POSITION_KEYS, row) if pos != 'AVG'}
+    player.current_rating = round(float(columns.current_rating[i]), 2)
+    player.potential_rating = round(float(columns.potential_rating[i]), 2)
+    player.current_overall_score = int(columns.current_overall[i])
+    player.potential_overall_score = int(columns.potential_overall[i])
+    player.transfer_value = int(columns.transfer_value[i])
+    player.personality = PERSONALITY_NAMES[columns.personality_codes[i]]
+    player.media_handling = MEDIA_HANDLING_NAMES[columns.media_handling_codes[i]]
+    return player
+
+
+def generate_player_batch(n, quality='average', regen_fraction=0.0, seed=None):
+    """
+    Generate n players as NumPy columns.
+
+    Args:
+        n: Number of players
+        quality: Quality level ('poor' .. 'world_class') or a list of levels to mix uniformly
+        regen_fraction: Share of players flagged as regens (enables bad/worst personalities)
+        seed: Seed for reproducible batches
+
+    Returns:
+        PlayerBatch: Columnar batch with ratings and personalities already computed
+    """
+    rng = np.random.default_rng(seed)
+
+    position_codes = rng.integers(0, len(PLAYER_POSITIONS), n, dtype=np.uint8)
+    ages = rng.integers(17, 30, n, dtype=np.int8)
+    first_name_codes = rng.integers(0, len(FIRST_NAMES), n, dtype=np.uint8)
+    last_name_codes = rng.integers(0, len(LAST_NAMES), n, dtype=np.uint8)
+
+    # Technical attributes from the position profiles
+    qualities = [quality] if isinstance(quality, str) else list(quality)
+    bases = np.array([QUALITY_BASES.get(q, (12, 3)) for q in qualities], dtype=np.float32)
+    quality_codes = rng.integers(0, len(qualities), n) if len(qualities) > 1 else np.zeros(n, dtype=np.intp)
+    means = bases[quality_codes, 0][:, None] + _PROFILE_OFFSETS[position_codes]
+    np.maximum(means, 1, out=means)
+    spreads = bases[quality_codes, 1][:, None]
+    technical = _sample_attributes(rng, means, spreads)
+
+    # Mental attributes from the default profile
+    mental = _sample_attributes(rng, np.broadcast_to(_MENTAL_MEANS, (n, len(MENTAL_ATTRIBUTES))), _MENTAL_SPREADS)
+
+    # Position ratings for every position in one matrix product
+    ratings = np.round(technical.astype(np.float32) @ WEIGHT_MATRIX, 2)
+
+    # Potential rating, same ranges as Player.calculate_ratings
+    current = ratings[np.arange(n), _POSITION_COLUMN[position_codes]]
+    low = current + 0.01
+    high = np.minimum(THEORETICAL_MAX[_POSITION_COLUMN[position_codes]],
+                      current * 1.5 + rng.uniform(0.05, 0.15, n).astype(np.float32))
+    potential_rating = np.round(low + (high - low) * rng.random(n, dtype=np.float32), 2)
+
+    current_overall = np.rint(current * 100).astype(np.int16)
+    potential_overall = rng.integers(np.minimum(100, current_overall + 1), 101, dtype=np.int16)
+
+    is_regen = rng.random(n) < regen_fraction if regen_fraction else np.zeros(n, dtype=bool)
+
+    return PlayerBatch(technical, mental, ages, position_codes, first_name_codes, last_name_codes,
+                       ratings, potential_rating, potential_overall, is_regen)
+
+
+if __name__ == '__main__':
+    import time
+
+    start = time.perf_counter()
+    batch = generate_player_batch(1_000_000, quality=['poor', 'average', 'good', 'excellent', 'world_class'], seed=1)
+    elapsed = time.perf_counter() - start
+    print(f"Generated {len(batch):,} players in {elapsed:.2f}s")
+    print(batch.player(0).describe())
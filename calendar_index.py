@@ -0,0 +1,119 @@
+"""
+Calendar index module - The season schedule compiled once for O(1) lookups.
+
+The schedule (a list of {'phase', 'fixtures'} dicts with club names) is
+compiled when it is built into:
+- a Phase per week, plus transfer-window flags and window starts
+- integer club IDs, and each week's fixtures as club objects
+- per-club arrays (clubs x weeks) of opponent ID and home flag
+
+so "who does club X play in week w" and "is week w a transfer window" are
+array lookups, whatever the size of the league.
+"""
+
+from enum import IntEnum
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+NO_MATCH = -1  # opponent ID for a week without a match
+
+
+class Phase(IntEnum):
+    PRESEASON = 0
+    LEAGUE = 1
+    BREAK = 2
+    PLAYOFF = 3
+
+
+PHASE_PREFIXES = (
+    ("Pretemporada", Phase.PRESEASON),
+    ("Liga Nacional", Phase.LEAGUE),
+    ("Descanso", Phase.BREAK),
+    ("Playoff", Phase.PLAYOFF),
+)
+TRANSFER_WINDOW_PHASES = frozenset({Phase.PRESEASON, Phase.BREAK})
+
+
+def phase_of(label: str) -> Optional[Phase]:
+    """Phase for a schedule label (None if it is not recognised)."""
+    for prefix, phase in PHASE_PREFIXES:
+        if label.startswith(prefix):
+            return phase
+    return None
+
+
+class CalendarIndex:
+    """Compiled season schedule."""
+
+    def __init__(self, schedule: List[Dict], clubs: Iterable):
+        """
+        Args:
+            schedule: Weeks as {'phase': label, 'fixtures': [(home name, away name)]}
+            clubs: Club objects that can appear in fixtures (IDs follow this order)
+        """
+        self.clubs = list(clubs)
+        self.club_ids: Dict[str, int] = {club.name: i for i, club in enumerate(self.clubs)}
+        weeks = len(schedule)
+
+        self.phases: Tuple[Optional[Phase], ...] = tuple(phase_of(week.get("phase", "")) for week in schedule)
+        self.transfer_window = tuple(phase in TRANSFER_WINDOW_PHASES for phase in self.phases)
+        window_start, start = [], None
+        for week, open_window in enumerate(self.transfer_window):
+            start = (start if start is not None else week) if open_window else None
+            window_start.append(start)
+        self._window_start = tuple(window_start)
+
+        self.opponent = np.full((len(self.clubs), weeks), NO_MATCH, dtype=np.int32)
+        self.home = np.zeros((len(self.clubs), weeks), dtype=bool)
+        fixtures = []
+        for week, entry in enumerate(schedule):
+            week_fixtures = []
+            for home_name, away_name in entry.get("fixtures", ()):
+                h, a = self.club_ids.get(home_name), self.club_ids.get(away_name)
+                if h is None or a is None:
+                    continue  # unknown club: not playable
+                self.opponent[h, week], self.opponent[a, week] = a, h
+                self.home[h, week] = True
+                week_fixtures.append((self.clubs[h], self.clubs[a]))
+            fixtures.append(tuple(week_fixtures))
+        self._fixtures = tuple(fixtures)
+
+    def __len__(self):
+        return len(self.phases)
+
+    def phase(self, week: int) -> Optional[Phase]:
+        """Phase of a week index (None outside the season)."""
+        return self.phases[week] if 0 <= week < len(self.phases) else None
+
+    def is_league_week(self, week: int) -> bool:
+        return self.phase(week) == Phase.LEAGUE
+
+    def is_transfer_window(self, week: int) -> bool:
+        return 0 <= week < len(self.transfer_window) and self.transfer_window[week]
+
+    def window_start(self, week: int) -> Optional[int]:
+        """First week index of the transfer window containing `week` (None outside a window)."""
+        return self._window_start[week] if 0 <= week < len(self._window_start) else None
+
+    def weeks_in(self, phase: Phase) -> List[int]:
+        return [week for week, p in enumerate(self.phases) if p == phase]
+
+    def fixtures(self, week: int) -> Tuple:
+        """(home club, away club) pairs for a week, unknown clubs left out."""
+        return self._fixtures[week] if 0 <= week < len(self._fixtures) else ()
+
+    def fixture_for(self, club_name: str, week: int) -> Optional[Tuple[object, bool]]:
+        """
+        A club's match in a week.
+
+        Returns:
+            tuple: (opponent club, is_home), or None if it does not play
+        """
+        i = self.club_ids.get(club_name)
+        if i is None or not 0 <= week < self.opponent.shape[1]:
+            return None
+        j = int(self.opponent[i, week])
+        if j == NO_MATCH:
+            return None
+        return self.clubs[j], bool(self.home[i, week])
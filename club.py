@@ -4,11 +4,33 @@ Club module - Represents a football club in the league
 
 import random
 
+from registry import next_id
+
+# Outfield slots per formation, as Player.POSITION_MAP keys (the goalkeeper is implied)
+FORMATION_SLOTS = {
+    "4-3-3": {'CB': 2, 'FB': 2, 'DM': 1, 'CM': 2, 'WF': 2, 'FW': 1},
+    "4-2-3-1": {'CB': 2, 'FB': 2, 'DM': 2, 'AM': 1, 'WF': 2, 'FW': 1},
+    "4-3-1-2": {'CB': 2, 'FB': 2, 'DM': 1, 'CM': 2, 'AM': 1, 'FW': 2},
+    "4-4-2": {'CB': 2, 'FB': 2, 'CM': 2, 'SM': 2, 'FW': 2},
+    "4-4-1-1": {'CB': 2, 'FB': 2, 'CM': 2, 'SM': 2, 'AM': 1, 'FW': 1},
+    "4-1-4-1": {'CB': 2, 'FB': 2, 'DM': 1, 'CM': 2, 'SM': 2, 'FW': 1},
+    "4-5-1": {'CB': 2, 'FB': 2, 'DM': 1, 'CM': 2, 'SM': 2, 'FW': 1},
+    "3-5-2": {'CB': 3, 'WB': 2, 'DM': 1, 'CM': 2, 'FW': 2},
+    "5-3-2": {'CB': 3, 'WB': 2, 'CM': 3, 'FW': 2},
+    "5-4-1": {'CB': 3, 'WB': 2, 'CM': 2, 'SM': 2, 'FW': 1},
+}
+DEFAULT_FORMATION_SLOTS = FORMATION_SLOTS["4-4-2"]
+SQUAD_STRENGTH_WEIGHT = 1.5  # strength points per point of XI average above the reputation level
+COHESION_STRENGTH_WEIGHT = 0.2  # strength points per point of squad cohesion above neutral
+NEUTRAL_COHESION = 60.0  # starting cohesion of a squad and of each roster player (see team_dynamics)
+FORMATION_POSITIONS = {name: frozenset(slots) for name, slots in FORMATION_SLOTS.items()}
+
 
 class Club:
     """Represents a football club with reputation, tactics, and performance metrics"""
 
     def __init__(self, name, objective, formation, tactic, manager, is_international=False, country=None, reputation=None):
+        self.uid = next_id()  # stable ID (see registry)
         self.name = name
         self.objective = objective  # Campeón/Top 3, Libertadores, Sudamericana, Mitad de Tabla, No Descender
         self.formation = formation  # e.g., "4-3-3"
@@ -28,8 +50,11 @@ class Club:
         self.players_count = random.randint(20, 25)  # Players in squad
         self.academy_rating = random.randint(1, 20)  # Youth development (1-20)
         
-        # Team average rating (based on reputation)
-        self.team_average = self._calculate_team_average()
+        # Team average rating: from reputation until a roster is attached (see attach_squad)
+        self.base_average = self._calculate_team_average()
+        self.squad = None
+        self._profile_key = None
+        self._profile = None
 
         # Financial
         self.budget = self._calculate_budget()
@@ -49,6 +74,7 @@ class Club:
 
         # Relations
         self.player_morale = 75  # 0-100
+        self.cohesion = NEUTRAL_COHESION  # squad cohesion 0-100 (see team_dynamics)
         self.fan_satisfaction = 75  # 0-100
         self.training_quality = self._calculate_training_quality()
 
@@ -90,30 +116,69 @@ class Club:
         else:
             return random.randint(50, 60)
 
+    # ========== SQUAD STRENGTH ==========
+
+    def attach_squad(self, squad):
+        """Derive team_average and strength from a SquadStrength (see club_strength)"""
+        self.squad = squad
+
+    @property
+    def team_average(self):
+        """Mean effective rating of the best XI, or the reputation-based estimate without a roster"""
+        if self.squad is None:
+            return self.base_average
+        return round(self.squad.average, 1)
+
+    @team_average.setter
+    def team_average(self, value):
+        self.base_average = value
+        self.squad = None
+
+    @property
+    def strength(self):
+        """
+        Reputation adjusted by the squad (1-100).
+
+        Each point the XI is above (below) the level its reputation implies
+        is worth SQUAD_STRENGTH_WEIGHT points, so odds follow squad development;
+        cohesion above (below) neutral adds (removes) COHESION_STRENGTH_WEIGHT per point.
+        """
+        edge = COHESION_STRENGTH_WEIGHT * (self.cohesion - NEUTRAL_COHESION)
+        if self.squad is not None:
+            edge += SQUAD_STRENGTH_WEIGHT * (self.squad.average - self.base_average)
+        if not edge:
+            return self.reputation
+        return max(1.0, min(100.0, self.reputation + edge))
+
     # Quick base probabilities for fast simulations (vs average opponent)
     def get_quick_profile(self):
-        """Return baseline probabilities and xG/xGA for fast match sims"""
+        """Return baseline probabilities and xG/xGA for fast match sims (cached until strength, morale or tactic change)"""
+        key = (self.strength, self.player_morale, self.tactic)
+        if key == self._profile_key:
+            return self._profile
         win = self.get_win_probability()
         draw = self.get_draw_probability()
         loss = max(0.0, 100 - win - draw)
         xg = self.get_goals_scored_probability()
         xga = self.get_goals_conceded_probability()
-        return {
+        self._profile_key = key
+        self._profile = {
             "win_prob": round(win, 2),
             "draw_prob": round(draw, 2),
             "loss_prob": round(loss, 2),
             "xg": round(xg, 2),
             "xga": round(xga, 2),
         }
+        return self._profile
 
     # ========== PROBABILITY CALCULATIONS ==========
 
     def get_win_probability(self, opponent=None):
         """Calculate probability of winning a match (0-100)"""
-        base_prob = (self.reputation / 100) * 100
+        base_prob = (self.strength / 100) * 100
         
         if opponent:
-            opponent_factor = (100 - opponent.reputation) / 100
+            opponent_factor = (100 - opponent.strength) / 100
             base_prob += opponent_factor * 20
         
         # Home advantage (simulated average)
@@ -129,8 +194,8 @@ class Club:
         """Calculate expected goals to score (float: 0-3+)"""
         base_xg = 1.2
         
-        # Reputation factor
-        base_xg += (self.reputation / 100) * 1.5
+        # Strength factor
+        base_xg += (self.strength / 100) * 1.5
         
         # Tactic influence
         tactic_xg = {
@@ -144,7 +209,7 @@ class Club:
         
         if opponent:
             # Opponent defense affects this
-            opponent_defense = (100 - opponent.reputation) / 100
+            opponent_defense = (100 - opponent.strength) / 100
             base_xg *= (0.8 + opponent_defense * 0.4)
         
         return max(0.5, min(4.0, base_xg))
@@ -153,8 +218,8 @@ class Club:
         """Calculate expected goals to concede (float: 0-3+)"""
         base_xga = 1.3
         
-        # Reputation factor (higher rep = better defense)
-        base_xga -= (self.reputation / 100) * 0.8
+        # Strength factor (stronger squad = better defense)
+        base_xga -= (self.strength / 100) * 0.8
         
         # Tactic influence
         tactic_xga = {
@@ -168,19 +233,37 @@ class Club:
         
         if opponent:
             # Opponent attack power
-            opponent_attack = (opponent.reputation / 100)
+            opponent_attack = (opponent.strength / 100)
             base_xga *= (0.7 + opponent_attack * 0.6)
         
         return max(0.4, min(3.5, base_xga))
 
     def get_draw_probability(self):
         """Calculate probability of a draw (0-100)"""
-        # Teams with similar reputation are more likely to draw
-        base_prob = 25 - abs(self.reputation - 50) / 10
+        # Teams of middling strength are more likely to draw
+        base_prob = 25 - abs(self.strength - 50) / 10
         return max(10, min(35, base_prob))
 
     # ========== PERFORMANCE TRACKING ==========
 
+    def start_new_season(self):
+        """Reset season results. Returns the finished season's record."""
+        record = {
+            'wins': self.current_season_wins,
+            'draws': self.current_season_draws,
+            'losses': self.current_season_losses,
+            'goals_for': self.current_season_goals_for,
+            'goals_against': self.current_season_goals_against,
+            'points': self.current_season_points,
+        }
+        self.current_season_wins = 0
+        self.current_season_draws = 0
+        self.current_season_losses = 0
+        self.current_season_goals_for = 0
+        self.current_season_goals_against = 0
+        self.current_season_points = 0
+        return record
+
     def add_match_result(self, goals_for, goals_against, result):
         """Record a match result"""
         self.current_season_goals_for += goals_for
@@ -292,6 +375,15 @@ class Club:
         symbol = status_symbols.get(self.objective, "")
         return f"{symbol} {self.name} | Rep: {self.reputation}/100 | Points: {self.current_season_points} | W-D-L: {self.current_season_wins}-{self.current_season_draws}-{self.current_season_losses}"
 
+    def formation_slots(self):
+        """Outfield slots per position key for the club's formation"""
+        return FORMATION_SLOTS.get(self.formation, DEFAULT_FORMATION_SLOTS)
+
+    @property
+    def formation_positions(self):
+        """Position keys (Player.POSITION_MAP values) used by the formation"""
+        return FORMATION_POSITIONS.get(self.formation) or frozenset(DEFAULT_FORMATION_SLOTS)
+
     def get_formation_info(self):
         """Return information about formation"""
         formations = {
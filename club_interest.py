@@ -0,0 +1,147 @@
+"""
+Club interest module - Batched evaluation of which clubs want which players.
+
+A single call evaluates every club against every player and returns a
+clubs x players matrix of reason flags (one bit per objection). The checks
+(rating, budget, position fit, personality) are done on whole arrays, so a
+window's market scan costs one call instead of one evaluation per club and player.
+A club is interested while fewer than two objections apply, and never in its own player.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from club import FORMATION_POSITIONS, DEFAULT_FORMATION_SLOTS
+from player import Player
+from transfer_market import MIN_OVERALL, position_key, player_overall
+
+# ========== REASON FLAGS ==========
+
+NOT_GOOD_ENOUGH = 1
+LOW_BUDGET = 2
+POSITION_MISMATCH = 4
+PERSONALITY = 8
+OWN_CLUB = 16              # the player already plays there (never interested)
+OBJECTIONS = (NOT_GOOD_ENOUGH, LOW_BUDGET, POSITION_MISMATCH, PERSONALITY)
+
+DEFAULT_BUDGET = 500000    # assumed when a club has no budget set
+WAGE_PER_OVERALL = 150     # expected weekly wage per overall point
+BUDGET_WAGE_MULTIPLE = 2   # budget must cover this many expected wages
+MAX_OBJECTIONS = 1         # a second objection turns the club away
+CONCERNING_PERSONALITIES = frozenset({'Slack', 'Temperamental', 'Spineless', 'Mercenary'})
+
+# One bit per position key, so a formation is an integer mask
+POSITION_BITS = {key: 1 << i for i, key in enumerate(sorted(set(Player.POSITION_MAP.values())))}
+_FORMATION_MASKS = {
+    name: sum(POSITION_BITS[key] for key in keys) for name, keys in FORMATION_POSITIONS.items()
+}
+_DEFAULT_MASK = sum(POSITION_BITS[key] for key in DEFAULT_FORMATION_SLOTS)
+
+# Objection count for every combination of the four objection bits
+_OBJECTION_COUNT = np.array([bin(flags & 15).count('1') for flags in range(32)], dtype=np.uint8)
+
+
+def formation_mask(formation: str) -> int:
+    """Position bits used by a formation (the default formation's when unknown)."""
+    return _FORMATION_MASKS.get(formation, _DEFAULT_MASK)
+
+
+class InterestMatrix:
+    """Result of evaluate_interest: reason flags per (club, player) plus lookups."""
+
+    def __init__(self, clubs: Sequence, players: Sequence, flags: np.ndarray, overalls: np.ndarray):
+        self.clubs = list(clubs)
+        self.players = list(players)
+        self.flags = flags                  # uint8, clubs x players
+        self.overalls = overalls            # float, per player
+        self.interested = (_OBJECTION_COUNT[flags] <= MAX_OBJECTIONS) & ((flags & OWN_CLUB) == 0)
+        self._club_rows = {club.name: i for i, club in enumerate(self.clubs)}
+        self._player_cols = {id(player): j for j, player in enumerate(self.players)}
+
+    @property
+    def shape(self):
+        return self.flags.shape
+
+    def club_row(self, club) -> Optional[int]:
+        return self._club_rows.get(getattr(club, 'name', club))
+
+    def player_col(self, player) -> Optional[int]:
+        return self._player_cols.get(id(player))
+
+    def is_interested(self, club, player) -> bool:
+        i, j = self.club_row(club), self.player_col(player)
+        return i is not None and j is not None and bool(self.interested[i, j])
+
+    def interested_clubs(self, player) -> List:
+        """Clubs interested in a player, in club order."""
+        j = self.player_col(player)
+        if j is None:
+            return []
+        return [self.clubs[i] for i in np.flatnonzero(self.interested[:, j])]
+
+    def interested_players(self, club) -> List:
+        i = self.club_row(club)
+        if i is None:
+            return []
+        return [self.players[j] for j in np.flatnonzero(self.interested[i])]
+
+    def reasons(self, club, player) -> List[str]:
+        """Readable objections for one pair (same wording as Game._club_evaluate_offer)."""
+        i, j = self.club_row(club), self.player_col(player)
+        flags = int(self.flags[i, j])
+        club, player = self.clubs[i], self.players[j]
+        texts = []
+        if flags & OWN_CLUB:
+            texts.append("already at the club")
+        if flags & NOT_GOOD_ENOUGH:
+            texts.append("not good enough")
+        if flags & LOW_BUDGET:
+            texts.append("insufficient budget")
+        if flags & POSITION_MISMATCH:
+            texts.append(f"position mismatch ({player.position} not in {club.formation})")
+        if flags & PERSONALITY:
+            texts.append(f"personality concerns ({getattr(player, 'personality', 'Neutral')})")
+        return texts
+
+    def decision(self, club, player) -> Dict:
+        """{'interested', 'reason'} for one pair."""
+        if self.is_interested(club, player):
+            return {"interested": True, "reason": "suitable profile"}
+        return {"interested": False, "reason": " + ".join(self.reasons(club, player))}
+
+
+def evaluate_interest(clubs: Sequence, players: Sequence, overalls: Iterable[float] = None) -> InterestMatrix:
+    """
+    Evaluate every club against every player in one vectorized pass.
+
+    Args:
+        clubs: Clubs (national and international alike)
+        players: Players to evaluate
+        overalls: Overall per player (default: current overall, or rating x 100)
+
+    Returns:
+        InterestMatrix: clubs x players reason flags and interest
+    """
+    clubs, players = list(clubs), list(players)
+    if overalls is None:
+        overall = np.array([player_overall(p) for p in players], dtype=np.float64)
+    else:
+        overall = np.asarray(list(overalls), dtype=np.float64)
+    budget = np.array([club.budget or DEFAULT_BUDGET for club in clubs], dtype=np.float64)
+    club_masks = np.array([formation_mask(club.formation) for club in clubs], dtype=np.int64)
+    player_bits = np.array([POSITION_BITS[position_key(p)] for p in players], dtype=np.int64)
+    concerning = np.array([getattr(p, 'personality', 'Neutral') in CONCERNING_PERSONALITIES for p in players])
+
+    club_index = {club.name: i for i, club in enumerate(clubs)}
+    flags = np.zeros((len(clubs), len(players)), dtype=np.uint8)
+    flags |= np.where(overall < MIN_OVERALL, NOT_GOOD_ENOUGH, 0).astype(np.uint8)[None, :]
+    flags |= np.where(budget[:, None] < overall[None, :] * (WAGE_PER_OVERALL * BUDGET_WAGE_MULTIPLE),
+                      LOW_BUDGET, 0).astype(np.uint8)
+    flags |= np.where((club_masks[:, None] & player_bits[None, :]) == 0, POSITION_MISMATCH, 0).astype(np.uint8)
+    flags |= np.where(concerning, PERSONALITY, 0).astype(np.uint8)[None, :]
+    for j, player in enumerate(players):
+        i = club_index.get(player.club)
+        if i is not None:
+            flags[i, j] |= OWN_CLUB
+    return InterestMatrix(clubs, players, flags, overall)
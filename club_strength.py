@@ -0,0 +1,101 @@
+"""
+Club strength module - A club's level derived from its roster, kept up to date incrementally.
+
+The level is the mean effective rating of the best XI: the goalkeeper plus, per
+formation position, the best `slots` players there, where
+
+    effective rating = skill_rating * personality performance multiplier
+
+SquadStrength keeps one XI sum per position, so when a player's rating changes
+or a player is replaced only that position is touched: O(1) when a starter
+improves, a re-pick of the few players at the position otherwise. Nothing is
+recomputed per match.
+"""
+
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional
+
+from personality_impact import expected_performance_multiplier
+
+GK_SLOTS = {'GK': 1}
+
+
+class SquadStrength:
+    """Best-XI strength of one roster (lists of dicts with 'id', 'position', 'skill_rating', ...)"""
+
+    def __init__(self, roster: Iterable[Dict], slots: Dict[str, int],
+                 multiplier: Optional[Callable[[str, Optional[str]], float]] = None):
+        """
+        Args:
+            roster: Roster player dicts
+            slots: Outfield slots per position key (Club.formation_slots()); the goalkeeper is added
+            multiplier: (personality, category) -> performance multiplier (default: expected value
+                        from the impact config)
+        """
+        self._multiplier = multiplier or expected_performance_multiplier
+        self._slots = {**GK_SLOTS, **slots}
+        self._players: Dict[object, List[Dict]] = defaultdict(list)  # position -> players
+        self._weight: Dict[int, float] = {}  # player id -> multiplier
+        self._xi: Dict[object, frozenset] = {}  # position -> ids of its starters
+        self._xi_sum: Dict[object, float] = {}
+        self.total = 0.0
+        self.size = 0
+        for player in roster:
+            self._weight[player['id']] = self._multiplier(player['personality'], player.get('category'))
+            self._players[player['position']].append(player)
+        for position in self._players:
+            self._pick(position)
+
+    @property
+    def average(self) -> float:
+        """Mean effective rating of the XI (0 for an empty roster)."""
+        return self.total / self.size if self.size else 0.0
+
+    def effective(self, player: Dict) -> float:
+        return player['skill_rating'] * self._weight[player['id']]
+
+    def starters(self) -> List[Dict]:
+        """Players currently in the best XI."""
+        return [p for position, players in self._players.items() for p in players if p['id'] in self._xi[position]]
+
+    def _pick(self, position):
+        """Re-pick the starters at one position and update the running totals."""
+        players = self._players[position]
+        slots = self._slots.get(position, 0)
+        best = sorted(players, key=self.effective, reverse=True)[:slots]
+        xi_sum = sum(self.effective(p) for p in best)
+        self.total += xi_sum - self._xi_sum.get(position, 0.0)
+        self.size += len(best) - len(self._xi.get(position, ()))
+        self._xi[position] = frozenset(p['id'] for p in best)
+        self._xi_sum[position] = xi_sum
+
+    def rating_changed(self, player: Dict, old_rating: float):
+        """
+        Account for a change of player['skill_rating'] (already applied).
+
+        Args:
+            player: Roster dict that changed
+            old_rating: Its skill_rating before the change
+        """
+        position = player['position']
+        if player['id'] in self._xi[position] and player['skill_rating'] >= old_rating:
+            # A starter who improves stays a starter: adjust the sums
+            delta = (player['skill_rating'] - old_rating) * self._weight[player['id']]
+            self._xi_sum[position] += delta
+            self.total += delta
+        else:
+            self._pick(position)
+
+    def replace(self, old: Dict, new: Dict):
+        """Swap a player who left for his replacement."""
+        players = self._players[old['position']]
+        for i, player in enumerate(players):
+            if player is old:
+                del players[i]
+                break
+        self._weight.pop(old['id'], None)
+        self._weight[new['id']] = self._multiplier(new['personality'], new.get('category'))
+        self._players[new['position']].append(new)
+        self._pick(old['position'])
+        if new['position'] != old['position']:
+            self._pick(new['position'])
@@ -0,0 +1,115 @@
+"""
+Event sampler module - Skip-ahead sampling for rare weekly Bernoulli events.
+
+A player with weekly event probability p (skill growth, conflicts: 0.05-2%)
+would need one random draw per week to decide. Instead the sampler draws the
+waiting time until the next event from the geometric distribution, keeps the
+due weeks in a heap and, each week, pops only the events that are due. The
+distribution is memoryless, so a key is re-sampled only when its probability
+changes or its event fires. Weekly cost follows the number of events, not the
+number of keys.
+"""
+
+import heapq
+import math
+import random
+from itertools import count
+from typing import Dict, Hashable, List
+
+
+def geometric_wait(p: float, rng=random) -> float:
+    """
+    Weeks until the next success of a weekly Bernoulli(p) event (>= 1).
+
+    Returns:
+        float: Number of weeks, or math.inf if p <= 0
+    """
+    if p <= 0.0:
+        return math.inf
+    if p >= 1.0:
+        return 1
+    return 1 + int(math.log(1.0 - rng.random()) / math.log(1.0 - p))
+
+
+class EventSampler:
+    """Due weeks of per-key weekly events, in a heap with lazy invalidation."""
+
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng: Source of random() (default: the random module, so seeding it reproduces runs)
+        """
+        self.rng = rng
+        self.week = 0
+        self._heap = []  # (due week, token, key)
+        self._due: Dict[Hashable, tuple] = {}  # key -> (due week, token) of its live entry
+        self._prob: Dict[Hashable, float] = {}
+        self._tokens = count()
+
+    def __len__(self):
+        """Keys with a pending event."""
+        return len(self._due)
+
+    def __contains__(self, key):
+        return key in self._prob
+
+    def probability(self, key, default: float = 0.0) -> float:
+        return self._prob.get(key, default)
+
+    def due_week(self, key):
+        """Week of the key's next event (None if it has none)."""
+        due = self._due.get(key)
+        return due[0] if due else None
+
+    def set_probability(self, key, p: float):
+        """Set a key's weekly probability; its next event is re-drawn only if p changed."""
+        if self._prob.get(key) == p:
+            return
+        self._prob[key] = p
+        self._schedule(key, self.week)
+
+    def remove(self, key):
+        self._prob.pop(key, None)
+        self._due.pop(key, None)  # its heap entry goes stale
+
+    def clear(self):
+        self._heap.clear()
+        self._due.clear()
+        self._prob.clear()
+
+    def _schedule(self, key, from_week):
+        wait = geometric_wait(self._prob[key], self.rng)
+        if wait == math.inf:
+            self._due.pop(key, None)
+            return
+        entry = (from_week + wait, next(self._tokens))
+        self._due[key] = entry
+        heapq.heappush(self._heap, (*entry, key))
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._compact()
+
+    def _compact(self):
+        """Drop stale heap entries (left by re-sampled or removed keys)."""
+        self._heap[:] = [(week, token, key) for key, (week, token) in self._due.items()]
+        heapq.heapify(self._heap)
+
+    def advance(self, weeks: int = 1) -> List:
+        """
+        Move the clock forward and collect the events that fall due.
+
+        Args:
+            weeks: Weeks to advance
+
+        Returns:
+            list: Keys whose event happened (a key appears once per event)
+        """
+        self.week += weeks
+        fired = []
+        heap, due = self._heap, self._due
+        while heap and heap[0][0] <= self.week:
+            week, token, key = heapq.heappop(heap)
+            if due.get(key) != (week, token):
+                continue  # stale
+            fired.append(key)
+            self._schedule(key, week)
+        return fired
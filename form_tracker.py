@@ -0,0 +1,217 @@
+"""
+Form tracker module - Rolling form of clubs and players over their last matches.
+
+Season aggregates (league table goals, season goals per match) say little
+about how a club or player is doing *now*. Each club and player keeps
+fixed-size ring buffers of the last FORM_WINDOW matches (points, goals, xG,
+match ratings) with running sums, so recording a match is O(1) and the
+metrics read by growth, offers, morale and the client card are:
+- points per game, goal and xG difference per game over the window
+- trends: mean of the newer half of the window minus the older half
+"""
+
+from typing import Dict, Hashable, Optional
+
+FORM_WINDOW = 5            # matches kept per club / player
+NEUTRAL_PPG = 1.35         # league-average points per game (draws ~27%)
+GOOD_FORM_PPG = 2.0        # from here a club counts as in good form
+POOR_FORM_PPG = 0.8        # ... and from here down as in poor form
+FORM_RATING_DIFF = 5       # rating_vs_team_avg stand-in for good/poor form (skill_growth_chance)
+
+
+def _trend(values) -> float:
+    """Mean of the newer half of `values` (oldest first) minus the older half (0 with fewer than 2)."""
+    half = len(values) // 2
+    if not half:
+        return 0.0
+    return (sum(values[-half:]) - sum(values[:half])) / half
+
+
+class RingBuffer:
+    """Last `size` values with a running sum."""
+
+    __slots__ = ('_values', '_head', '_size', 'count', 'total')
+
+    def __init__(self, size: int = FORM_WINDOW):
+        self._values = [0.0] * size
+        self._head = 0      # slot the next value goes to
+        self._size = size
+        self.count = 0
+        self.total = 0.0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, value: float):
+        """Add a value, dropping the oldest once full (O(1))."""
+        values, head = self._values, self._head
+        if self.count == self._size:
+            self.total += value - values[head]
+        else:
+            self.count += 1
+            self.total += value
+        values[head] = value
+        head += 1
+        self._head = head if head < self._size else 0
+
+    def values(self):
+        """Stored values, oldest first."""
+        size = self._size
+        start = (self._head - self.count) % size
+        return [self._values[(start + i) % size] for i in range(self.count)]
+
+    def mean(self, default: float = 0.0) -> float:
+        return self.total / self.count if self.count else default
+
+    def trend(self) -> float:
+        """Mean of the newer half minus mean of the older half (0 with fewer than 2 values)."""
+        return _trend(self.values())
+
+    def clear(self):
+        self._head = self.count = 0
+        self.total = 0.0
+
+
+class ClubForm:
+    """A club's last matches: points, goals and expected goals."""
+
+    __slots__ = ('points', 'goals_for', 'goals_against', 'xg_for', 'xg_against')
+
+    def __init__(self, size: int = FORM_WINDOW):
+        self.points = RingBuffer(size)
+        self.goals_for = RingBuffer(size)
+        self.goals_against = RingBuffer(size)
+        self.xg_for = RingBuffer(size)
+        self.xg_against = RingBuffer(size)
+
+    @property
+    def matches(self) -> int:
+        return self.points.count
+
+    def record(self, goals_for: int, goals_against: int, xg_for: float = 0.0, xg_against: float = 0.0):
+        self.points.push(3 if goals_for > goals_against else 1 if goals_for == goals_against else 0)
+        self.goals_for.push(goals_for)
+        self.goals_against.push(goals_against)
+        self.xg_for.push(xg_for)
+        self.xg_against.push(xg_against)
+
+    @property
+    def points_per_game(self) -> float:
+        return self.points.mean(NEUTRAL_PPG)
+
+    @property
+    def goal_diff_per_game(self) -> float:
+        return self.goals_for.mean() - self.goals_against.mean()
+
+    @property
+    def xg_diff_per_game(self) -> float:
+        return self.xg_for.mean() - self.xg_against.mean()
+
+    @property
+    def xg_trend(self) -> float:
+        """Change of xG difference per game, newer half of the window vs older half."""
+        return self.xg_for.trend() - self.xg_against.trend()
+
+    def rating_diff(self) -> int:
+        """Form band as skill_growth_chance's rating_vs_team_avg: +5 good, -5 poor, 0 otherwise."""
+        if not self.matches:
+            return 0
+        ppg = self.points_per_game
+        return FORM_RATING_DIFF if ppg >= GOOD_FORM_PPG else -FORM_RATING_DIFF if ppg <= POOR_FORM_PPG else 0
+
+
+class PlayerForm:
+    """A player's last matches: match ratings and goals."""
+
+    __slots__ = ('ratings', 'goals')
+
+    def __init__(self, size: int = FORM_WINDOW):
+        self.ratings = RingBuffer(size)
+        self.goals = RingBuffer(size)
+
+    @property
+    def matches(self) -> int:
+        return self.ratings.count
+
+    def record(self, rating: float, goals: int = 0):
+        """Add a match, dropping the oldest once the window is full (O(1))."""
+        self.ratings.push(rating)
+        self.goals.push(goals)
+
+    def recent_ratings(self):
+        """Match ratings, oldest first."""
+        return self.ratings.values()
+
+    @property
+    def average_rating(self) -> float:
+        return self.ratings.mean()
+
+    @property
+    def rating_trend(self) -> float:
+        """Mean rating of the newer half of the window minus the older half."""
+        return self.ratings.trend()
+
+    @property
+    def goals_per_match(self) -> float:
+        return self.goals.mean()
+
+
+class FormTracker:
+    """Rolling form of every club (by name) and player (by ID)."""
+
+    def __init__(self, size: int = FORM_WINDOW):
+        """
+        Args:
+            size: Matches kept per club / player
+        """
+        self.size = size
+        self.clubs: Dict[str, ClubForm] = {}
+        self.players: Dict[Hashable, PlayerForm] = {}
+
+    def record_club(self, club_name: str, goals_for: int, goals_against: int,
+                    xg_for: float = 0.0, xg_against: float = 0.0):
+        form = self.clubs.get(club_name)
+        if form is None:
+            form = self.clubs[club_name] = ClubForm(self.size)
+        form.record(goals_for, goals_against, xg_for, xg_against)
+
+    def record_player(self, player_id, rating: float, goals: int = 0):
+        form = self.players.get(player_id)
+        if form is None:
+            form = self.players[player_id] = PlayerForm(self.size)
+        form.record(rating, goals)
+
+    def record_lineup(self, player_ids, ratings, goals=None):
+        """
+        Record one match for many players at once (record_player per player), e.g. a whole matchday.
+
+        Args:
+            player_ids: Player IDs
+            ratings: Match rating per player (parallel to player_ids)
+            goals: Goals per player (parallel to player_ids; default none)
+        """
+        players, size = self.players, self.size
+        if goals is None:
+            goals = [0] * len(player_ids)
+        for player_id, rating, scored in zip(player_ids, ratings, goals):
+            form = players.get(player_id)
+            if form is None:
+                form = players[player_id] = PlayerForm(size)
+            form.record(rating, scored)
+
+    def club(self, club_name: str) -> Optional[ClubForm]:
+        return self.clubs.get(club_name)
+
+    def player(self, player_id) -> Optional[PlayerForm]:
+        return self.players.get(player_id)
+
+    def points_per_game(self) -> Dict[str, float]:
+        """{club name: points per game} for clubs with at least one match."""
+        return {name: form.points_per_game for name, form in self.clubs.items() if form.matches}
+
+    def remove_player(self, player_id):
+        self.players.pop(player_id, None)
+
+    def clear(self):
+        self.clubs.clear()
+        self.players.clear()
@@ -2,8 +2,13 @@
 Main game module - Contains the game loop and core mechanics
 """
 
+import os
 import sys
+import time
 import random
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+import numpy as np
 from agent import Agent
 from player import Player
 from game_data import (
@@ -13,20 +18,53 @@ from game_data import (
     get_international_clubs,
 )
 from personality_impact import (
+    pin_config,
     skill_growth_chance,
     renewal_intent_probability,
 )
+from impact_config import get_service
+from match_model import expected_goals, forecast
+from playoff_bracket import ROUND_NAMES, odds_table, simulate_bracket
+from season_archive import summarize_season, format_season
+from leaderboards import BOARD_LABELS, Leaderboards
+from match_engine import (
+    FIDELITY_CLIENTS,
+    FIDELITY_FAST,
+    detailed_scoreline,
+    fast_scorelines,
+    plan_fixtures,
+    player_match_line,
+    validate_fidelity,
+)
+from club_interest import evaluate_interest
+from calendar_index import CalendarIndex, Phase
+from registry import Registry, next_id
+from club_strength import SquadStrength
+from team_dynamics import TeamDynamics, meets_objective
+from event_sampler import EventSampler
+from form_tracker import FormTracker
+from world_db import DEFAULT_PATH as WORLD_DB_PATH, PlayerProxy, open_world_db
+from match_stats import MatchStatsStore, MatchdayLineups, draw_matchday, record_matchday
+from transfer_market import TransferMarket, club_needs, group_needs, position_key
+
+CONTRACT_WARNING_WEEKS = 4  # warn about client contracts this close to their end
+ROSTER_LEVEL_SPREAD = 8.0  # roster ratings are drawn within this of the club level
+WORLD_SEARCH_LIMIT = 20  # world database rows listed when signing from the console
+FORM_TREND_BONUS = 0.5  # match-rating trend (last matches) that moves a transfer offer by 3%
 
 class FootballAgentGame:
     """Main game class that manages the game state and flow"""
     
     def __init__(self):
         self.agent = None
+        self.registry = Registry()  # Every player, roster player and club by ID
         self.all_players = []
         self.available_reports = []
         self.clubs = []
         self.international_clubs = []
         self.schedule = []  # List of dicts {phase, fixtures}
+        self._calendar = None  # CalendarIndex compiled from schedule (see calendar)
+        self._calendar_source = None
         self.total_weeks = 0
         self.league_table = {}
         self.club_index = {}
@@ -38,7 +76,56 @@ class FootballAgentGame:
         self.event_occurred_this_week = False  # Only one event per week
         self.running = True
         self.active_promises = []  # Lista de promesas activas
-        
+        self.impact_config = None  # Personality impact config pinned for the current week
+        self._team_dynamics = None  # roster columns for the weekly dynamics stage (built lazily)
+        self._growth_events = EventSampler()  # roster player ID -> next league week with skill growth
+        self._growth_bands = {}  # club name -> inputs its players' growth chances were drawn with
+        self._growth_club = {}  # roster player ID -> Club
+        self.week_results = {}  # {club name: (goals for, goals against)} of the last simulated week
+        self.form = FormTracker()  # Last few matches of every club and player (see form_tracker)
+        self.match_stats = MatchStatsStore()  # Season match stats of every roster player and client (see match_stats)
+        self._matchday_lineups = None  # roster columns for the matchday stats draw (built lazily)
+        self.profiler = None  # WeekProfiler when profiling is switched on
+        self.playoff_bracket = None  # Clubs (bracket order) for the next international playoff
+        self.season_playoff_clubs = []  # Clubs (bracket order) of the calendar's 16-club playoff
+        self.season = 1
+        self.season_archive = []  # One compact summary per finished season (see season_archive)
+        self.leaderboards = Leaderboards()  # League-wide season rankings (roster players and clients)
+        self.sim_fidelity = FIDELITY_CLIENTS  # Match detail tier, see set_sim_fidelity
+        self.week_client_matches = {}  # {client ID: match line} from the last fixtures stage
+        self._club_needs_cache = (None, {})  # (window key, club needs) for the transfer market
+        self.expiring_contracts = {}  # {client.uid: client} in their last CONTRACT_WARNING_WEEKS (set by timers)
+        self._open_promises = []  # Active promises not yet fulfilled or failed
+        self.world_db = None  # WorldDB of generated players for scouting at scale (see world_db)
+        
+    def init_world(self):
+        """Create players, reports, clubs, schedule and rosters for a new game (no prompts)"""
+        self.all_players = create_initial_players()
+        self.available_reports = create_player_reports()
+        self.clubs = get_default_clubs()
+        self.international_clubs = get_international_clubs()
+        self.schedule = self._build_season_schedule()
+        self.total_weeks = len(self.schedule)
+        self._init_league_table()
+        self.club_index = {c.name: c for c in self.clubs}
+        self._init_club_rosters()
+        self.registry.register_all(self.all_players + self.clubs + self.international_clubs)
+        self.load_world_db()
+        
+    def load_world_db(self, path=WORLD_DB_PATH):
+        """Open the world player database if it exists (memory-mapped: instant whatever its size)"""
+        self.world_db = open_world_db(path) if os.path.exists(path) else None
+        return self.world_db
+
+    def adopt_world_player(self, row):
+        """Hydrate a world database row into a Player of this game (registered, listed, no longer searchable)"""
+        player = self.world_db.hydrate(row)
+        if player.uid not in self.registry:
+            self.world_db.mark_taken(row)
+            self.registry.register(player)
+            self.all_players.append(player)
+        return player
+
     def start_game(self):
         """Initialize and start the game"""
         self.show_intro()
@@ -50,15 +137,7 @@ class FootballAgentGame:
         agent_type = self._choose_agent_type()
         
         self.agent = Agent(agent_name, agent_type)
-        self.all_players = create_initial_players()
-        self.available_reports = create_player_reports()
-        self.clubs = get_default_clubs()
-        self.international_clubs = get_international_clubs()
-        self.schedule = self._build_season_schedule()
-        self.total_weeks = len(self.schedule)
-        self._init_league_table()
-        self.club_index = {c.name: c for c in self.clubs}
-        self._init_club_rosters()
+        self.init_world()
         
         print(f"\nWelcome, {agent_name}! Your journey as a {agent_type} agent begins now.")
         print(f"Starting money: ${self.agent.money:,}")
@@ -162,7 +241,7 @@ Trust your judgment and instinct!
             if current['fixtures']:
                 print("Fixtures this week:")
                 for home, away in current['fixtures']:
-                    print(f"  - {home} vs {away}")
+                    print(f"  - {home} vs {away}{self._fixture_odds_label(home, away)}")
             else:
                 print("No scheduled matches this week.")
         else:
@@ -172,6 +251,20 @@ Trust your judgment and instinct!
         if self.agent.week > 1:
             self.process_weekly_events()
     
+    def forecast_fixture(self, home_name, away_name):
+        """Exact W/D/L probabilities and expected points for a fixture (None if a club is unknown)"""
+        home = self.club_index.get(home_name)
+        away = self.club_index.get(away_name)
+        if not home or not away:
+            return None
+        return forecast(home, away)
+    
+    def _fixture_odds_label(self, home_name, away_name):
+        fc = self.forecast_fixture(home_name, away_name)
+        if not fc:
+            return ""
+        return f"  [1: {fc['home_win']:.0%}  X: {fc['draw']:.0%}  2: {fc['away_win']:.0%}]"
+    
     def process_weekly_events(self):
         """Process events that happen each week"""
         current_week_index = max(0, self.agent.week - 1)
@@ -187,58 +280,117 @@ Trust your judgment and instinct!
             print(f"✓ Weekly commissions earned: ${total_commission:,}")
         
         # Check for contract expirations
-        for client in self.agent.clients:
-            if client.signed and client.contract_length <= 4 and client.contract_length > 0:
-                print(f"⚠ {client.name}'s contract expires in {client.contract_length} weeks!")
+        for client in self.expiring_clients():
+            print(f"⚠ {client.name}'s contract expires in {client.contract_length} weeks!")
 
         # Transfer window logic: generate and review offers for clients
         if self._is_transfer_window(current_week_index):
-            self._generate_transfer_offers_for_clients(current_week_index)
+            with self.profile_stage('transfer_offers'):
+                self._generate_transfer_offers_for_clients(current_week_index)
             self._handle_transfer_offers_prompt()
         
         # Weekly random situation (only one per week, 40% chance)
         if not self.event_occurred_this_week and self.agent.clients and random.random() < 0.40:
             self._generate_weekly_situation()
 
+    # ========== CALENDAR ==========
+
+    @property
+    def calendar(self):
+        """Season schedule compiled for O(1) phase and fixture lookups (rebuilt when the schedule is replaced)"""
+        source = (self.schedule, self.clubs, self.international_clubs)
+        if self._calendar_source is None or any(a is not b for a, b in zip(source, self._calendar_source)):
+            self._calendar = CalendarIndex(self.schedule, self.clubs + self.international_clubs)
+            self._calendar_source = source
+        return self._calendar
+
+    def client_fixtures(self, week_index: int):
+        """
+        This week's match for each signed client.
+
+        Returns:
+            list: (client, opponent club, is_home) for clients whose club plays
+        """
+        calendar = self.calendar
+        matches = []
+        for client in self.agent.clients:
+            if client.club and client.signed:
+                fixture = calendar.fixture_for(client.club, week_index)
+                if fixture:
+                    matches.append((client, *fixture))
+        return matches
+
     # ========== TRANSFER WINDOW HELPERS ==========
 
     def _is_transfer_window(self, week_index: int) -> bool:
         """Return True if the current phase is a transfer window."""
-        if week_index < 0 or week_index >= len(self.schedule):
-            return False
-        phase = self.schedule[week_index].get("phase", "")
-        return phase.startswith("Pretemporada") or phase.startswith("Descanso")
-
-    def _advance_offer_deadlines(self):
-        """Reduce offer deadlines and drop expired ones."""
-        kept = []
-        for offer in self.agent.pending_offers:
-            offer["expires_in_weeks"] -= 1
-            if offer["expires_in_weeks"] > 0:
-                kept.append(offer)
-            else:
+        return self.calendar.is_transfer_window(week_index)
+
+    def _window_start(self, week_index: int) -> int:
+        """First week index of the transfer window containing week_index"""
+        start = self.calendar.window_start(week_index)
+        return week_index if start is None else start
+
+    def _post_offer(self, offer: dict):
+        """Add an offer to the pending list and register its deadline on the agent's timers."""
+        offer["expires_week"] = self.agent.week + offer["expires_in_weeks"]
+        offer["player_id"] = offer["player"].uid
+        self.agent.pending_offers.append(offer)
+        self.agent.timers.schedule(offer["expires_week"], self._expire_offer, offer)
+
+    def _expire_offer(self, offer: dict):
+        """Deadline reached: drop the offer if it is still pending."""
+        pending = self.agent.pending_offers
+        for i, o in enumerate(pending):
+            if o is offer:
+                del pending[i]
                 self.transfer_log.append({**offer, "status": "expired", "week": self.agent.week})
-        self.agent.pending_offers = kept
+                return
+
+    def offer_weeks_left(self, offer: dict) -> int:
+        """Weeks until a pending offer expires."""
+        return offer.get("expires_week", self.agent.week + offer["expires_in_weeks"]) - self.agent.week
 
-    def _create_transfer_offer(self, player: Player) -> dict:
-        """Build a single transfer offer for a player."""
-        candidates = [c for c in self.clubs if c.name != player.club]
-        if not candidates:
-            return {}
+    def _watch_contract(self, player: Player):
+        """Contract timer: the client enters the expiring list for its last weeks."""
+        if player.signed and player.contract_length > 0:
+            self.expiring_contracts[player.uid] = player
 
-        club = random.choice(candidates)
+    def expiring_clients(self):
+        """Clients in the last CONTRACT_WARNING_WEEKS of their contract (entered by their contract timer)."""
+        for key, client in list(self.expiring_contracts.items()):
+            if not (client.signed and 0 < client.contract_length <= CONTRACT_WARNING_WEEKS and client in self.agent.clients):
+                del self.expiring_contracts[key]  # ended, terminated or no longer a client
+        return list(self.expiring_contracts.values())
+
+    def _form_adjusted_overall(self, player: Player) -> int:
+        """The overall clubs see in a player: current overall adjusted by recent form (last few matches)."""
         overall = player.current_overall_score or int(player.current_rating * 100)
-        
-        # Adjust overall based on season performance
-        if player.season_appearances > 0:
+        form = self.form.player(player.uid)
+        if form is not None and form.matches:
             # Bonus/penalty based on goals per match
-            goals_per_match = player.season_goals / player.season_appearances
+            goals_per_match = form.goals_per_match
             if goals_per_match > 0.3:
                 overall = int(overall * 1.10)  # +10% for high goal-scoring rate
             elif goals_per_match > 0.2:
                 overall = int(overall * 1.05)  # +5% for good goal-scoring rate
             elif goals_per_match < 0.05:
                 overall = int(overall * 0.95)  # -5% for very low productivity
+            # Ratings on the way up (or down) move scouts' opinion too
+            if form.rating_trend >= FORM_TREND_BONUS:
+                overall = int(overall * 1.03)
+            elif form.rating_trend <= -FORM_TREND_BONUS:
+                overall = int(overall * 0.97)
+        return overall
+
+    def _create_transfer_offer(self, player: Player, club=None) -> dict:
+        """Build a single transfer offer for a player (from `club`, or a random other club)."""
+        if club is None:
+            candidates = [c for c in self.clubs if c.name != player.club]
+            if not candidates:
+                return {}
+            club = random.choice(candidates)
+        overall = self._form_adjusted_overall(player)
         
         base_fee = max(10000, player.transfer_value or overall * 500)
         is_free = not bool(player.club)
@@ -259,6 +411,21 @@ Trust your judgment and instinct!
         }
         return offer
     
+    def _match_transfer_market(self, players, week_index):
+        """Match players against the clubs' published needs (see transfer_market)"""
+        if not players:
+            return []
+        # Needs are published when a window opens (and once for the league weeks), not every week
+        in_window = self._is_transfer_window(week_index)
+        key = (self.season, self._window_start(week_index) if in_window else None)
+        cached_key, needs = self._club_needs_cache
+        if cached_key != key:
+            needs = group_needs(n for club in self.clubs for n in club_needs(club, self.club_rosters.get(club.name, ())))
+            self._club_needs_cache = (key, needs)
+        market = TransferMarket(needs=needs)
+        market.list_players(players)
+        return market.match()
+
     def _get_player_role(self, player_overall, team_average):
         """Determine player role based on overall vs team average"""
         diff = player_overall - team_average
@@ -278,33 +445,33 @@ Trust your judgment and instinct!
 
     def _generate_transfer_offers_for_clients(self, week_index: int):
         """Create transfer offers for agent-managed players during window or free agents anytime."""
-        self._advance_offer_deadlines()
 
         new_offers = []
         is_transfer_window = self._is_transfer_window(week_index)
         
         # First: guarantee offers for free agents (no club) - ANY TIME
+        free_agents = [c for c in self.agent.clients if not c.contract_accepted and not c.club]
+        free_agent_bids = {}
+        offer_counts = Counter(o["player"].uid for o in self.agent.pending_offers)  # pending offers per client
+        top_clubs = sorted(self.clubs, key=lambda c: c.reputation, reverse=True)
+        top_fits = {}  # position -> best-reputation clubs that play it
+        for need, player in self._match_transfer_market(free_agents, week_index):
+            free_agent_bids.setdefault(player.uid, need.club)
         for client in self.agent.clients:
             if client.contract_accepted:  # Skip players who accepted a contract (they're no longer available)
                 continue
             if not client.club:  # Free agent (removed "and not client.signed" to allow any free agent)
                 # Free agents get offers even outside transfer window
-                existing_offers = [o for o in self.agent.pending_offers if o.get("player") is client]
-                if not existing_offers:
-                    # Create guaranteed offer with better terms from top club
-                    candidates = sorted(self.clubs, key=lambda c: c.reputation, reverse=True)[:5]
-                    club = random.choice(candidates)
-                    overall = client.current_overall_score or int(client.current_rating * 100)
-                    
-                    # Adjust overall based on season performance
-                    if client.season_appearances > 0:
-                        goals_per_match = client.season_goals / client.season_appearances
-                        if goals_per_match > 0.3:
-                            overall = int(overall * 1.10)
-                        elif goals_per_match > 0.2:
-                            overall = int(overall * 1.05)
-                        elif goals_per_match < 0.05:
-                            overall = int(overall * 0.95)
+                if not offer_counts[client.uid]:
+                    # Create guaranteed offer: a club that needs the position, else a top club that plays it
+                    club = free_agent_bids.get(client.uid)
+                    if club is None:
+                        position = position_key(client)
+                        fits = top_fits.get(position)
+                        if fits is None:
+                            fits = top_fits[position] = [c for c in top_clubs if position in c.formation_positions][:5]
+                        club = random.choice(fits or top_clubs[:5])
+                    overall = self._form_adjusted_overall(client)
                     
                     player_role = self._get_player_role(overall, club.team_average)
                     
@@ -319,19 +486,20 @@ Trust your judgment and instinct!
                         "status": "pending",
                         "role": player_role,
                     }
-                    self.agent.pending_offers.append(offer)
+                    self._post_offer(offer)
+                    offer_counts[client.uid] += 1
                     new_offers.append(offer)
                     self.transfer_log.append({**offer, "status": "created_free_agent", "week": self.agent.week})
                     print(f"\n📩 Oferta garantizada para agente libre {client.name}: {offer['club']} (Rol: {player_role}) - ${offer['wage']:,}/sem")
         
         # Then: regular offers for other clients (only during transfer window)
         if is_transfer_window:
+            on_market = []
             for client in self.agent.clients:
                 if client.contract_accepted:  # Skip players who accepted a contract
                     continue
                 # Skip if already has two active offers
-                existing = [o for o in self.agent.pending_offers if o.get("player") is client]
-                if len(existing) >= 2:
+                if offer_counts[client.uid] >= 2:
                     continue
 
                 rating = client.current_overall_score or int(client.current_rating * 100)
@@ -344,10 +512,31 @@ Trust your judgment and instinct!
 
                 if random.random() > prob:
                     continue
-
-                offer = self._create_transfer_offer(client)
+                on_market.append(client)
+
+            # Clubs bid where their formation needs the player (best need first) and they are interested
+            bids = {}
+            interest = self.evaluate_club_interest(on_market) if on_market else None
+            for need, player in self._match_transfer_market(on_market, week_index):
+                if player.uid not in bids and interest.is_interested(need.club, player):
+                    bids[player.uid] = need
+            national = {club.name for club in self.clubs}
+            for client in on_market:
+                need = bids.get(client.uid)
+                if need is not None:
+                    club = need.club
+                else:
+                    # No need matched (e.g. below the market's MIN_OVERALL): an interested club that
+                    # plays the position may still bid, as in the free-agent branch
+                    position = position_key(client)
+                    fallback = [c for c in interest.interested_clubs(client)
+                                if c.name in national and position in c.formation_positions]
+                    if not fallback:
+                        continue
+                    club = random.choice(fallback)
+                offer = self._create_transfer_offer(client, club)
                 if offer:
-                    self.agent.pending_offers.append(offer)
+                    self._post_offer(offer)
                     new_offers.append(offer)
                     self.transfer_log.append({**offer, "status": "created", "week": self.agent.week})
 
@@ -365,7 +554,7 @@ Trust your judgment and instinct!
             role = offer.get("role", "🟢 Regular")  # Default if not present
             club_obj = self.club_index.get(offer['club'])
             team_avg = club_obj.team_average if club_obj else 65
-            print(f"{idx}. {player.name} → {offer['club']} (Media: {team_avg}) | Rol: {role} | Fee ${offer['fee']:,} | Wage ${offer['wage']:,}/sem | {offer['contract_weeks']} sem | expira en {offer['expires_in_weeks']} sem")
+            print(f"{idx}. {player.name} → {offer['club']} (Media: {team_avg}) | Rol: {role} | Fee ${offer['fee']:,} | Wage ${offer['wage']:,}/sem | {offer['contract_weeks']} sem | expira en {self.offer_weeks_left(offer)} sem")
 
         for idx, offer in list(enumerate(list(self.agent.pending_offers), 1)):
             player = offer["player"]
@@ -383,6 +572,8 @@ Trust your judgment and instinct!
         """Accept an offer and update agent finances and player contract."""
         player = offer["player"]
         player.sign_with_club(offer["club"], offer["wage"], offer["contract_weeks"])
+        self.agent.timers.schedule(self.agent.week + offer["contract_weeks"] - CONTRACT_WARNING_WEEKS,
+                                   self._watch_contract, player)
 
         # Agent commission: 5% of fee + 2 weeks of wage as bonus proxy
         commission = int(offer["fee"] * 0.05 + offer["wage"] * 2 * 0.05)
@@ -1036,6 +1227,7 @@ Trust your judgment and instinct!
         """Log event with player, type, resolution and effects."""
         self.weekly_event_log.append({
             "week": self.agent.week,
+            "player_id": player.uid,
             "player": player.name,
             "event_type": event_type,
             "resolution": resolution,
@@ -1145,64 +1337,76 @@ Trust your judgment and instinct!
             "cumplida": False,
             "fallida": False
         }
-        self.active_promises.append(promesa)
+        self.register_promise(promesa)
         print(f"\nPromesa registrada: {tipos[promesa_tipo]} a {player.name}. Plazo: {promesa['plazo']} semanas.")
         self._log_event(player, "promesa", "hecha", {"tipo": tipos[promesa_tipo], "plazo": promesa['plazo']})
         input("Presiona Enter para continuar...")
     
+    def register_promise(self, promesa: dict):
+        """Record a promise and register its deadline on the agent's timers."""
+        self.active_promises.append(promesa)
+        self._open_promises.append(promesa)
+        # Fails once more than `plazo` weeks have passed since it was made
+        self.agent.timers.schedule(promesa["semana_hecha"] + promesa["plazo"] + 1, self._fail_promise, promesa)
+
+    def _fail_promise(self, promesa: dict):
+        """Promise deadline reached without fulfilling it."""
+        if promesa["cumplida"] or promesa["fallida"]:
+            return
+        promesa["fallida"] = True
+        self._open_promises = [p for p in self._open_promises if p is not promesa]
+        jugador = promesa["jugador"]
+        jugador.trust_in_agent = "Low"
+        jugador.morale = "Unhappy"
+        self.agent.change_press_reputation(-10)
+        print(f"\n✗ No cumpliste la promesa a {jugador.name} ({promesa['tipo']}). Confianza y moral reducidas. Prensa -10.")
+        self._log_event(jugador, "promesa", "fallida", {"tipo": promesa["tipo"], "consecuencia": "confianza--, moral--, prensa-10"})
+
     def _check_promises(self):
-        """Chequea semanalmente el estado de las promesas y aplica consecuencias."""
-        for promesa in self.active_promises:
-            if promesa["cumplida"] or promesa["fallida"]:
-                continue
-            semanas = self.agent.week - promesa["semana_hecha"]
-            if semanas > promesa["plazo"]:
-                promesa["fallida"] = True
-                jugador = promesa["jugador"]
-                jugador.trust_in_agent = "Low"
-                jugador.morale = "Unhappy"
-                self.agent.change_press_reputation(-10)
-                print(f"\n✗ No cumpliste la promesa a {jugador.name} ({promesa['tipo']}). Confianza y moral reducidas. Prensa -10.")
-                self._log_event(jugador, "promesa", "fallida", {"tipo": promesa["tipo"], "consecuencia": "confianza--, moral--, prensa-10"})
-            else:
-                jugador = promesa["jugador"]
-                if promesa["tipo"] == "club_grande":
-                    if jugador.club:
-                        club = self.club_index.get(jugador.club)
-                        if club and getattr(club, "reputation", 0) >= 80:
-                            promesa["cumplida"] = True
-                            jugador.trust_in_agent = "Excellent"
-                            jugador.morale = "Happy"
-                            self.agent.change_press_reputation(+10)
-                            print(f"\n✓ ¡Promesa cumplida! {jugador.name} firmó con club grande. Confianza y moral mejoradas. Prensa +10.")
-                            self._log_event(jugador, "promesa", "cumplida", {"tipo": promesa["tipo"], "consecuencia": "confianza++, moral++, prensa+10"})
-                elif promesa["tipo"] == "mejorar_salario":
-                    if hasattr(jugador, "weekly_wage") and jugador.weekly_wage > 0:
-                        if not promesa.get("salario_inicial"):
-                            promesa["salario_inicial"] = jugador.weekly_wage
-                        elif jugador.weekly_wage > promesa["salario_inicial"]:
-                            promesa["cumplida"] = True
-                            jugador.trust_in_agent = "Excellent"
-                            jugador.morale = "Happy"
-                            self.agent.change_press_reputation(+10)
-                            print(f"\n✓ ¡Promesa cumplida! {jugador.name} mejoró su salario. Confianza y moral mejoradas. Prensa +10.")
-                            self._log_event(jugador, "promesa", "cumplida", {"tipo": promesa["tipo"], "consecuencia": "confianza++, moral++, prensa+10"})
-                elif promesa["tipo"] == "titularidad":
-                    if hasattr(jugador, "is_starter") and jugador.is_starter:
+        """Chequea semanalmente si se cumplieron las promesas abiertas (los plazos vencen por timer)."""
+        for promesa in list(self._open_promises):
+            jugador = promesa["jugador"]
+            if promesa["tipo"] == "club_grande":
+                if jugador.club:
+                    club = self.club_index.get(jugador.club)
+                    if club and getattr(club, "reputation", 0) >= 80:
                         promesa["cumplida"] = True
+                        self._open_promises.remove(promesa)
                         jugador.trust_in_agent = "Excellent"
                         jugador.morale = "Happy"
                         self.agent.change_press_reputation(+10)
-                        print(f"\n✓ ¡Promesa cumplida! {jugador.name} es titular. Confianza y moral mejoradas. Prensa +10.")
+                        print(f"\n✓ ¡Promesa cumplida! {jugador.name} firmó con club grande. Confianza y moral mejoradas. Prensa +10.")
                         self._log_event(jugador, "promesa", "cumplida", {"tipo": promesa["tipo"], "consecuencia": "confianza++, moral++, prensa+10"})
-                elif promesa["tipo"] == "seleccion_nacional":
-                    if hasattr(jugador, "is_national_team") and jugador.is_national_team:
+            elif promesa["tipo"] == "mejorar_salario":
+                if hasattr(jugador, "weekly_wage") and jugador.weekly_wage > 0:
+                    if not promesa.get("salario_inicial"):
+                        promesa["salario_inicial"] = jugador.weekly_wage
+                    elif jugador.weekly_wage > promesa["salario_inicial"]:
                         promesa["cumplida"] = True
+                        self._open_promises.remove(promesa)
                         jugador.trust_in_agent = "Excellent"
                         jugador.morale = "Happy"
                         self.agent.change_press_reputation(+10)
-                        print(f"\n✓ ¡Promesa cumplida! {jugador.name} fue convocado a selección. Confianza y moral mejoradas. Prensa +10.")
+                        print(f"\n✓ ¡Promesa cumplida! {jugador.name} mejoró su salario. Confianza y moral mejoradas. Prensa +10.")
                         self._log_event(jugador, "promesa", "cumplida", {"tipo": promesa["tipo"], "consecuencia": "confianza++, moral++, prensa+10"})
+            elif promesa["tipo"] == "titularidad":
+                if hasattr(jugador, "is_starter") and jugador.is_starter:
+                    promesa["cumplida"] = True
+                    self._open_promises.remove(promesa)
+                    jugador.trust_in_agent = "Excellent"
+                    jugador.morale = "Happy"
+                    self.agent.change_press_reputation(+10)
+                    print(f"\n✓ ¡Promesa cumplida! {jugador.name} es titular. Confianza y moral mejoradas. Prensa +10.")
+                    self._log_event(jugador, "promesa", "cumplida", {"tipo": promesa["tipo"], "consecuencia": "confianza++, moral++, prensa+10"})
+            elif promesa["tipo"] == "seleccion_nacional":
+                if hasattr(jugador, "is_national_team") and jugador.is_national_team:
+                    promesa["cumplida"] = True
+                    self._open_promises.remove(promesa)
+                    jugador.trust_in_agent = "Excellent"
+                    jugador.morale = "Happy"
+                    self.agent.change_press_reputation(+10)
+                    print(f"\n✓ ¡Promesa cumplida! {jugador.name} fue convocado a selección. Confianza y moral mejoradas. Prensa +10.")
+                    self._log_event(jugador, "promesa", "cumplida", {"tipo": promesa["tipo"], "consecuencia": "confianza++, moral++, prensa+10"})
     
     def plantar_rumor_prensa(self):
         """Permite al agente plantar un rumor en la prensa sobre un cliente."""
@@ -1308,9 +1512,11 @@ Trust your judgment and instinct!
             print(f"Goles: {client.season_goals}")
             print(f"Asistencias: {client.season_assists}")
             
-            if client.weekly_stats:
-                print(f"\nÚltimos 5 partidos:")
-                for stat in client.weekly_stats[-5:]:
+            if client.stats.recent:
+                form = self.form.player(client.uid)  # the same rolling form offers and growth read
+                form_rating = form.average_rating if form is not None else 0.0
+                print(f"\nÚltimos {len(client.stats.recent)} partidos (forma {form_rating:.1f}/10):")
+                for stat in client.stats.recent:
                     print(f"  Semana {stat['week']}: vs {stat['opponent']} | Goles: {stat['goals']} | Asistencias: {stat['assists']} | Rating: {stat['rating']}/10")
             else:
                 print(f"\nSin estadísticas de partidos aún.")
@@ -1331,13 +1537,13 @@ Trust your judgment and instinct!
         
         print("\nAVAILABLE SCOUTING REPORTS:")
         for i, report in enumerate(self.available_reports, 1):
-            print(f"{i}. {report['preview']}")
+            print(f"{i}. {report.preview}")
         
         choice = input("\nEnter number to read full report (or 0 to go back): ").strip()
         if choice.isdigit() and 0 < int(choice) <= len(self.available_reports):
             report = self.available_reports[int(choice) - 1]
             print("\n" + "="*60)
-            print(report['full_report'])
+            print(report.full_report)
             print("="*60)
             input("\nPress Enter to continue...")
     
@@ -1348,8 +1554,13 @@ Trust your judgment and instinct!
             input("Press Enter to continue...")
             return
         
-        # Show available players
+        # Show available players (known players, or the best of the world database)
         available = [p for p in self.all_players if not p.agent_signed]
+        if self.world_db is not None:
+            print(f"\n1. Known players ({len(available)})")
+            print(f"2. World database ({len(self.world_db):,} players)")
+            if input("Search in (1/2): ").strip() == '2':
+                available = self.world_db.proxies(self.world_db.search(limit=WORLD_SEARCH_LIMIT))
         
         if not available:
             print("\nNo players available to sign right now!")
@@ -1373,6 +1584,8 @@ Trust your judgment and instinct!
             confirm = input("Proceed with signing? (yes/no): ").strip().lower()
             if confirm in ['yes', 'y']:
                 if self.agent.spend_money(signing_bonus):
+                    if isinstance(player, PlayerProxy):
+                        player = self.adopt_world_player(player.row)  # only now becomes a full Player
                     self.agent.add_client(player)
                     print(f"\n✓ {player.name} is now your client!")
                     print(f"Signing bonus paid: ${signing_bonus:,}")
@@ -1492,6 +1705,7 @@ Trust your judgment and instinct!
         
         player_overall = player.current_overall_score or int(player.current_rating * 100)
         has_interest = False
+        interest = evaluate_interest(self.clubs, [player], [player_overall])
         
         for club in self.clubs:
             # Skip if player already there
@@ -1499,7 +1713,7 @@ Trust your judgment and instinct!
                 continue
             
             # Evaluate if club is interested
-            decision = self._club_evaluate_offer(club, player, player_overall)
+            decision = interest.decision(club, player)
             
             if decision["interested"]:
                 has_interest = True
@@ -1520,7 +1734,7 @@ Trust your judgment and instinct!
                     "status": "pending",
                     "role": player_role,
                 }
-                self.agent.pending_offers.append(offer)
+                self._post_offer(offer)
                 self.transfer_log.append({**offer, "status": "created_player_offer", "week": self.agent.week})
             else:
                 print(f"\n✗ {club.name} declined: {decision['reason']}")
@@ -1533,43 +1747,23 @@ Trust your judgment and instinct!
         input("Press Enter to continue...")
     
     def _club_evaluate_offer(self, club, player, player_overall):
-        """Evaluate if a club is interested in offering for the player."""
-        reasons = []
-        
-        # Check 1: Overall rating too low
-        if player_overall < 50:
-            reasons.append("not good enough")
-        
-        # Check 2: Club has enough budget
-        budget = club.budget or 500000
-        avg_wage = player_overall * 150
-        if budget < avg_wage * 2:
-            reasons.append("insufficient budget")
-        
-        # Check 3: Position fit (club's formation needs)
-        position = player.position.lower()
-        # Basic check: club prefers certain positions
-        formation_positions = getattr(club, 'formation_positions', [])
-        if formation_positions and position not in formation_positions:
-            reasons.append(f"position mismatch ({position} not in formation)")
-        
-        # Check 4: Personality compatibility
-        player_personality = getattr(player, 'personality', 'Neutral')
-        if player_personality in ['Slack', 'Temperamental', 'Spineless', 'Mercenary']:
-            reasons.append(f"personality concerns ({player_personality})")
-        
-        # Decision: if 2+ reasons, reject
-        if len(reasons) >= 2:
-            return {
-                "interested": False,
-                "reason": " + ".join(reasons)
-            }
-        
-        # Otherwise interested
-        return {
-            "interested": True,
-            "reason": "suitable profile"
-        }
+        """Evaluate if a club is interested in offering for the player (one cell of evaluate_club_interest)."""
+        return evaluate_interest([club], [player], [player_overall]).decision(club, player)
+
+    def evaluate_club_interest(self, players=None, clubs=None):
+        """
+        Interest of every club in every player, in one batched call (see club_interest).
+
+        Args:
+            players: Players to evaluate (default: the agent's clients)
+            clubs: Clubs to evaluate (default: national and international clubs)
+
+        Returns:
+            InterestMatrix
+        """
+        players = self.agent.clients if players is None else players
+        clubs = self.clubs + self.international_clubs if clubs is None else clubs
+        return evaluate_interest(clubs, players)
 
     def rescindir_contrato(self):
         """Rescindir el contrato de un cliente con su club actual."""
@@ -1649,8 +1843,8 @@ Trust your judgment and instinct!
         # Calcular estadísticas de clientes
         stats = []
         for client in self.agent.clients:
-            if client.weekly_stats and len(client.weekly_stats) > 0:
-                last_week = client.weekly_stats[-1]
+            last_week = client.stats.last_match
+            if last_week:
                 if last_week["week"] == self.agent.week - 1:  # Participated this week
                     stats.append({
                         "client": client,
@@ -1674,7 +1868,7 @@ Trust your judgment and instinct!
                 if week['red_card']:
                     print(" 🟥", end="")
                 print()
-                print(f"  Temporada: {s['season_goals']}G {s['season_assists']}A en {s['season_apps']} partidos | Prom: {s['season_goals']/max(1, s['season_apps']):.2f}G/partido")
+                print(f"  Temporada: {s['season_goals']}G {s['season_assists']}A en {s['season_apps']} partidos | Prom: {client.season_goals_per_match:.2f}G/partido")
                 pending_for_client = [o for o in self.agent.pending_offers if o.get("player") is client]
                 if len(pending_for_client) > 0:
                     print(f"  Ofertas pendientes: {len(pending_for_client)}")
@@ -1763,18 +1957,11 @@ Trust your judgment and instinct!
 
     def international_playoff(self):
         """Run an international playoff if any client belongs to an international club"""
-        if not self.agent.use_action():
-            print("\nNo actions remaining this week!")
-            input("Press Enter to continue...")
-            return
-
         client_club_names = {client.club for client in self.agent.clients if client.club}
         participating = [c for c in self.international_clubs if c.name in client_club_names]
 
         if not participating:
             print("\nNo tienes clientes en clubes internacionales. El playoff se activa solo si al menos uno de tus representados juega allí.")
-            # Refund action since nothing happened
-            self.agent.actions_remaining += 1
             input("Press Enter to continue...")
             return
 
@@ -1786,44 +1973,64 @@ Trust your judgment and instinct!
             if client.club in client_club_names:
                 print(f"- {client.name} ({client.club})")
 
-        # Seleccionar 8 clubes para el bracket, priorizando el/los clubes de clientes
-        pool_sorted = sorted(self.international_clubs, key=lambda c: c.reputation, reverse=True)
-        participants = pool_sorted[:8]
-        participant_names = {c.name for c in participants}
-
-        # Asegurar inclusión de los clubes de clientes
-        for club in pool_sorted:
-            if club.name in client_club_names and club.name not in participant_names:
-                participants[-1] = club
-                participant_names = {c.name for c in participants}
-
-        random.shuffle(participants)
+        # Exact odds for the stored bracket, shown before the action is spent
+        participants = self.prepare_international_playoff()
+        print("\nPROBABILIDADES (exactas)")
+        print("-"*60)
+        print(f"{'Club':<30}{'Semifinal':>10}{'Final':>8}{'Campeón':>10}")
+        for row in self.international_playoff_odds():
+            mark = " *" if row['club'] in client_club_names else ""
+            print(f"{row['club'] + mark:<30}{row['reach']['Semifinal']:>10.1%}{row['reach']['Final']:>8.1%}{row['champion']:>10.1%}")
+        print("(* club de un cliente)")
 
-        round_names = ["Cuartos de Final", "Semifinal", "Final"]
-        current_round = participants
+        if self.agent.actions_remaining <= 0:
+            print("\nNo actions remaining this week!")
+            input("Press Enter to continue...")
+            return
+        confirm = input("\n¿Jugar el playoff? (1 acción) (s/n): ").strip().lower()
+        if confirm not in ['s', 'si', 'sí', 'y', 'yes'] or not self.agent.use_action():
+            return
 
-        for round_name in round_names:
+        rounds = simulate_bracket(participants)
+        self.playoff_bracket = None  # the next playoff draws a new bracket
+        for round_name, ties in zip(ROUND_NAMES, rounds):
             print(f"\n{round_name.upper()}")
             print("-"*60)
-            winners = []
-            for i in range(0, len(current_round), 2):
-                home = current_round[i]
-                away = current_round[i+1]
-                home_prob = home.get_win_probability(away)
-                away_prob = away.get_win_probability(home)
-                total_prob = home_prob + away_prob
-                outcome = random.random() * total_prob
-                winner = home if outcome <= home_prob else away
-                print(f"{home.name} ({home_prob:.1f}%) vs {away.name} ({away_prob:.1f}%) → Gana {winner.name}")
-                winners.append(winner)
-            current_round = winners
-
-        champion = current_round[0]
+            for tie in ties:
+                print(f"{tie['home'].name} ({tie['home_prob']:.0%}) vs {tie['away'].name} ({tie['away_prob']:.0%}) → Gana {tie['winner'].name}")
+
+        champion = rounds[-1][0]['winner']
         print("\n" + "="*60)
         print(f"CAMPEÓN INTERNACIONAL: {champion.name}")
         print("="*60)
         input("\nPress Enter to continue...")
 
+    def prepare_international_playoff(self):
+        """Return the 8-club bracket for the next playoff, drawing and storing it if needed"""
+        client_club_names = {client.club for client in self.agent.clients if client.club}
+        needed = client_club_names & {c.name for c in self.international_clubs}
+        if self.playoff_bracket and needed <= {c.name for c in self.playoff_bracket}:
+            return self.playoff_bracket
+
+        # Seleccionar 8 clubes para el bracket, priorizando el/los clubes de clientes
+        pool_sorted = sorted(self.international_clubs, key=lambda c: c.reputation, reverse=True)
+        participants = [c for c in pool_sorted if c.name in needed][:8]
+        participants += [c for c in pool_sorted if c.name not in needed][:8 - len(participants)]
+
+        random.shuffle(participants)
+        self.playoff_bracket = participants
+        return participants
+
+    def international_playoff_odds(self):
+        """Exact odds of every club in the stored bracket reaching each round and winning"""
+        return odds_table(self.prepare_international_playoff(), ROUND_NAMES)
+
+    def season_playoff_odds(self):
+        """Exact odds for the 16-club playoff in the season calendar (empty before it is drawn)"""
+        if not self.season_playoff_clubs:
+            return []
+        return odds_table(self.season_playoff_clubs, ["Octavos de Final"] + ROUND_NAMES)
+
     # ========== SCHEDULING HELPERS ==========
 
     def _build_season_schedule(self):
@@ -1893,6 +2100,7 @@ Trust your judgment and instinct!
 
         participants = national_top + international
         random.shuffle(participants)
+        self.season_playoff_clubs = participants  # bracket order, used for exact odds
 
         # Round of 16 pairings
         r16 = []
@@ -1926,58 +2134,58 @@ Trust your judgment and instinct!
             }
 
     def _simulate_week_fixtures(self, week_index):
-        if week_index < 0 or week_index >= len(self.schedule):
-            return
-        fixtures = self.schedule[week_index].get("fixtures", [])
-        phase = self.schedule[week_index].get("phase", "")
+        """Play the week's league fixtures at the configured fidelity (see match_engine)"""
+        self.week_client_matches = {}
+        self.week_results = {}
+        calendar = self.calendar
 
         # Only update league table for national league phase
-        if not phase.startswith("Liga Nacional"):
+        if calendar.phase(week_index) != Phase.LEAGUE:
             return
 
-        for home_name, away_name in fixtures:
-            home = self.club_index.get(home_name)
-            away = self.club_index.get(away_name)
-            if not home or not away:
-                continue
-
-            home_prof = home.get_quick_profile()
-            away_prof = away.get_quick_profile()
-
-            # Combine probabilities (simplified): average win prob adjusted
-            home_win = (home_prof["win_prob"] + (100 - away_prof["win_prob"])) / 2
-            away_win = (away_prof["win_prob"] + (100 - home_prof["win_prob"])) / 2
-            draw_prob = (home_prof["draw_prob"] + away_prof["draw_prob"]) / 2
-            total = home_win + away_win + draw_prob
-            if total == 0:
-                continue
-            home_win /= total
-            draw_prob /= total
-            away_win /= total
-
-            outcome = random.random()
-            if outcome < home_win:
-                result = "home_win"
-            elif outcome < home_win + draw_prob:
-                result = "draw"
-            else:
-                result = "away_win"
-
-            def sample_goals(xg):
-                return max(0, int(round(random.gauss(xg, 0.9))))
-
-            home_goals = sample_goals(home_prof["xg"])
-            away_goals = sample_goals(away_prof["xg"])
-
-            # Align goals with outcome
-            if result == "home_win" and home_goals <= away_goals:
-                home_goals = away_goals + 1
-            if result == "away_win" and away_goals <= home_goals:
-                away_goals = home_goals + 1
-            if result == "draw":
-                away_goals = home_goals
-
-            self._update_league_table(home_name, away_name, home_goals, away_goals)
+        client_clubs = {}
+        for client, opponent, is_home in self.client_fixtures(week_index):
+            client_clubs.setdefault(client.club, []).append(client)
+        # Fixtures come compiled as club objects, so no name lookups here
+        detailed, fast = plan_fixtures(calendar.fixtures(week_index), client_clubs, self.sim_fidelity,
+                                       key=lambda club: club.name)
+
+        results = []
+        for home, away in detailed:
+            # Scoreline drawn from the matchup's Poisson grid (cached per xG pair)
+            home_goals, away_goals = detailed_scoreline(home.get_quick_profile(), away.get_quick_profile())
+            results.append((home, away, home_goals, away_goals))
+        rng = np.random.default_rng(random.getrandbits(64))  # one generator for the matchday's vectorized draws
+        profile_pairs = [(home.get_quick_profile(), away.get_quick_profile()) for home, away in fast]
+        for (home, away), (home_goals, away_goals) in zip(fast, fast_scorelines(profile_pairs, rng)):
+            results.append((home, away, home_goals, away_goals))
+
+        is_detailed = set(detailed)
+        form = self.form
+        for home, away, home_goals, away_goals in results:
+            self._update_league_table(home.name, away.name, home_goals, away_goals)
+            home_xg, away_xg = expected_goals(home.get_quick_profile(), away.get_quick_profile())
+            form.record_club(home.name, home_goals, away_goals, home_xg, away_xg)
+            form.record_club(away.name, away_goals, home_goals, away_xg, home_xg)
+            self.week_results[home.name] = (home_goals, away_goals)
+            self.week_results[away.name] = (away_goals, home_goals)
+            detail = (home, away) in is_detailed
+            for club, opponent, gf, ga in ((home, away, home_goals, away_goals), (away, home, away_goals, home_goals)):
+                for client in client_clubs.get(club.name, ()):
+                    line = player_match_line(client, club.team_average, gf, ga, detailed=detail)
+                    if line is None:
+                        continue  # stayed on the bench
+                    self.match_stats.record_line(client.uid, line)
+                    self.week_client_matches[client.uid] = {
+                        'week': self.agent.week,
+                        'opponent': opponent.name,
+                        'club': club.name,
+                        'home': club is home,
+                        'score': f"{gf}-{ga}",
+                        **line,
+                    }
+        if self.sim_fidelity != FIDELITY_FAST:  # bulk runs keep no player stats
+            self._credit_roster_matchday(self.week_results, rng)
 
     def _update_league_table(self, home, away, hg, ag):
         for name in [home, away]:
@@ -2021,7 +2229,20 @@ Trust your judgment and instinct!
         print(f"{'Pos':<4}{'Club':<28}{'Pts':>5}{'P':>4}{'W':>4}{'D':>4}{'L':>4}{'GF':>5}{'GA':>5}{'GD':>5}")
         for i, (name, stats) in enumerate(table, 1):
             print(f"{i:<4}{name:<28}{stats['points']:>5}{stats['played']:>4}{stats['wins']:>4}{stats['draws']:>4}{stats['losses']:>4}{stats['gf']:>5}{stats['ga']:>5}{stats['gd']:>5}")
+        self.show_leaderboards(k=5)
         input("\nPress Enter to continue...")
+
+    def show_leaderboards(self, k=10):
+        """Print the league-wide season leaderboards"""
+        client_ids = self.agent.clients.ids
+        for board, label in BOARD_LABELS.items():
+            rows = self.leaderboards.top(board, k)
+            if not rows:
+                continue
+            print(f"\n{label.upper()}")
+            for row in rows:
+                mark = " ⭐" if row['id'] in client_ids else ""
+                print(f"  {row['rank']:>2}. {row['name']:<34} {row['club'] or '':<26} {row['value']:>6g}{mark}")
     
     def advance_week(self):
         """Move to the next week and simulate scheduled fixtures"""
@@ -2033,29 +2254,195 @@ Trust your judgment and instinct!
 
         # Simulate fixtures for the current week before moving forward
         current_week_index = self.agent.week - 1
-        self._simulate_week_fixtures(current_week_index)
-        
-        # Simulate client participation in their club matches
-        self._simulate_client_match_participation(current_week_index)
-        
-        # Process player growth and contract countdown
-        self._process_weekly_player_growth(current_week_index)
-        
-        # Reset weekly event flag for next week
-        self.event_occurred_this_week = False
+        with self.profile_week():
+            self.simulate_week(current_week_index)
+            
+            # Reset weekly event flag for next week
+            self.event_occurred_this_week = False
 
-        self.agent.advance_week()
-        print(f"\n{'='*60}")
-        print(f"Advancing to Week {self.agent.week}...")
-        print(f"{'='*60}")
-        
-        if self.agent.week > self.total_weeks:
-            print("\nSeason complete. Thanks for playing!")
-            self._process_season_end_renewals()
-            self.running = False
-            sys.exit(0)
+            self.agent.advance_week()
+            print(f"\n{'='*60}")
+            print(f"Advancing to Week {self.agent.week}...")
+            print(f"{'='*60}")
+            
+            season_over = self.agent.week > self.total_weeks
+            if season_over:
+                print(f"\nSeason {self.season} complete!")
+                with self.profile_stage('season_end_renewals'):
+                    renewals = self._process_season_end_renewals()
+        
+        if season_over:
+            again = input("\nPlay another season? (yes/no): ").strip().lower()
+            if again not in ['yes', 'y']:
+                print("\nThanks for playing!")
+                self.running = False
+                sys.exit(0)
+            with self.profile_stage('season_rollover'):
+                summary = self.rollover_season(renewals)
+            print("\n" + format_season(summary))
         input("\nPress Enter to continue...")
     
+    def simulate_week(self, week_index, generate_offers=False):
+        """Run the weekly simulation stages without prompts (shared by the CLI and the app)"""
+        with self.profile_stage('config'):
+            self.pin_impact_config()
+        with self.profile_stage('fixtures'):
+            self._simulate_week_fixtures(week_index)
+        with self.profile_stage('team_dynamics'):
+            self._process_team_dynamics()
+        with self.profile_stage('client_participation'):
+            self._simulate_client_match_participation(week_index)
+        with self.profile_stage('player_growth'):
+            # Also counts down contracts
+            self._process_weekly_player_growth(week_index)
+        if generate_offers:
+            with self.profile_stage('transfer_offers'):
+                self._generate_transfer_offers_for_clients(week_index)
+    
+    # ========== SEASON ROLLOVER ==========
+    
+    def rollover_season(self, renewals=None):
+        """
+        Close the finished season and set up the next one.
+
+        The season's logs are folded into a compact summary in season_archive and
+        then cleared, so memory does not grow with the number of weeks played.
+
+        Args:
+            renewals: Candidates from _process_season_end_renewals (computed if None)
+
+        Returns:
+            dict: The archived season summary (includes 'rollover_ms')
+        """
+        start = time.perf_counter()
+        if renewals is None:
+            renewals = self._process_season_end_renewals()
+        self._apply_season_renewals(renewals)
+
+        resolved = [p for p in self.active_promises if p['cumplida'] or p['fallida']]
+        client_lines = [client.start_new_season(self.season) for client in self.agent.clients]
+        # Every other listed player ages too (including adopted world database players)
+        client_ids = {client.uid for client in self.agent.clients}
+        for player in self.all_players:
+            if player.uid not in client_ids:
+                player.start_new_season(self.season)
+        summary = summarize_season(
+            self.season, self.league_table, client_lines,
+            self.growth_log, self.transfer_log, self.weekly_event_log,
+            renewals, resolved, self.total_weeks,
+        )
+        summary['leaders'] = self.leaderboards.snapshot()
+        self.leaderboards.reset()
+        # Rows only for players still in the league: departed roster players are dropped
+        self.match_stats.reset(keep=[p['id'] for roster in self.club_rosters.values() for p in roster]
+                               + [client.uid for client in self.agent.clients])
+        self._matchday_lineups = None
+        for club in self.clubs + self.international_clubs:
+            club.start_new_season()
+
+        # Keep only what the new season still needs
+        self.growth_log = []
+        self.renewal_log = []
+        self.transfer_log = []
+        self.weekly_event_log = []
+        self.active_promises = [p for p in self.active_promises if not (p['cumplida'] or p['fallida'])]
+        self._open_promises = list(self.active_promises)
+        for promesa in self.active_promises:
+            promesa['semana_hecha'] -= self.total_weeks  # weeks restart at 1
+        self.agent.timers.shift(-self.total_weeks)  # pending deadlines follow the week counter
+
+        self.season += 1
+        self.schedule = self._build_season_schedule()
+        self.total_weeks = len(self.schedule)
+        self._init_league_table()
+        self.playoff_bracket = None
+        self.event_occurred_this_week = False
+        self.agent.week = 1
+
+        summary['rollover_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        self.season_archive.append(summary)
+        return summary
+
+    def _apply_season_renewals(self, renewals):
+        """Extend contracts of players who renew; replace the ones who leave"""
+        decisions = {c['player_id']: c['wants_renewal'] for c in renewals}
+        self._team_dynamics = None  # replacements change the roster columns
+        self._matchday_lineups = None
+        for club_name, roster in self.club_rosters.items():
+            for i, player in enumerate(roster):
+                wants_renewal = decisions.get(player['id'])
+                if wants_renewal is None:
+                    continue
+                if wants_renewal:
+                    player['contract_weeks_remaining'] += random.randint(52, 156)
+                else:
+                    club = self.club_index.get(club_name)
+                    self.registry.remove(player)
+                    roster[i] = self._new_roster_player(
+                        f"{club_name}_Player_S{self.season + 1}_{i+1}", player['personality'], player['category'],
+                        player['position'], level=club.base_average if club else None,
+                    )
+                    if club is not None and club.squad is not None:
+                        club.squad.replace(player, roster[i])
+                    self._growth_events.remove(player['id'])
+                    self._growth_club.pop(player['id'], None)
+                    self.form.remove_player(player['id'])
+                    self._growth_bands.pop(club_name, None)  # draw the newcomer's growth next week
+
+    # ========== SIMULATION SETTINGS & PROFILING ==========
+
+    def set_sim_fidelity(self, mode):
+        """
+        Choose how much detail each fixture gets.
+
+        Args:
+            mode: 'clients' (detail for client fixtures), 'fast' (all cheap) or 'detailed'
+        """
+        self.sim_fidelity = validate_fidelity(mode)
+
+    def enable_profiling(self, use_cprofile=False, use_tracemalloc=False):
+        """Switch on per-stage timing and call counters for the weekly step"""
+        from profiling import WeekProfiler
+        self.disable_profiling()
+        self.profiler = WeekProfiler(use_cprofile=use_cprofile, use_tracemalloc=use_tracemalloc)
+        self.profiler.install()
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Switch profiling off; returns the profiler with everything recorded so far"""
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.close()
+        return profiler
+    
+    def profile_stage(self, name):
+        """Time a block as one stage of the weekly profile (no-op when profiling is off)"""
+        return self.profiler.stage(name) if self.profiler else nullcontext()
+    
+    @contextmanager
+    def profile_week(self):
+        """Record everything inside the block as one week of the profile"""
+        if self.profiler is None:
+            yield
+            return
+        self.profiler.start_week(self.agent.week)
+        try:
+            yield
+        finally:
+            if self.profiler is not None:
+                self.profiler.end_week()
+    
+    def pin_impact_config(self):
+        """Pick up personality impact config changes and keep that version for the whole week"""
+        previous = self.impact_config
+        self.impact_config = pin_config()
+        if previous is not None and previous.version != self.impact_config.version:
+            print(f"🔄 Personality impact config reloaded (v{previous.version} → v{self.impact_config.version})")
+        error = get_service().last_error
+        if error is not None:
+            print(f"⚠️ Personality impact config not reloaded, keeping v{self.impact_config.version}: {error}")
+        return self.impact_config
+    
     def quit_game(self):
         """Exit the game"""
         print("\nThank you for playing Football Agent Simulator!")
@@ -2069,106 +2456,30 @@ Trust your judgment and instinct!
     # ========== CLIENT MATCH PARTICIPATION ==========
     
     def _simulate_client_match_participation(self, week_index: int):
-        """Simulate agent clients playing in their club matches this week."""
-        if week_index < 0 or week_index >= len(self.schedule):
+        """Register this week's client matches (lines come from the fixtures stage, see match_engine)."""
+        if self.calendar.phase(week_index) != Phase.LEAGUE:
             return
         
-        phase = self.schedule[week_index].get('phase', '')
-        if not phase.startswith('Liga Nacional'):
-            return
-        
-        fixtures = self.schedule[week_index].get('fixtures', [])
-        
-        # Find which clients played this week
+        credited = []  # clients who played, put on the boards in one batch
         for client in self.agent.clients:
-            if not client.club or not client.signed:
+            match = self.week_client_matches.get(client.uid)
+            if match is None:
                 continue
             
-            # Check if client's club played this week
-            client_played = False
-            client_home = False
-            opponent_name = None
+            goals = match['goals']
+            assists = match['assists']
+            yellow_card = match['yellow_card']
+            red_card = match['red_card']
+            match_rating = match['rating']
+            opponent_name = match['opponent']
             
-            for home_name, away_name in fixtures:
-                if client.club == home_name:
-                    client_played = True
-                    client_home = True
-                    opponent_name = away_name
-                    break
-                elif client.club == away_name:
-                    client_played = True
-                    client_home = False
-                    opponent_name = home_name
-                    break
-            
-            if not client_played:
-                continue
-            
-            # Simulate match performance
-            client.appearances += 1
-            
-            # Base performance based on position
-            position_goal_prob = {
-                'Forward': 0.35, 'Striker': 0.35, 'FW': 0.35, 'ST': 0.35,
-                'Winger': 0.25, 'Wing Forward': 0.25, 'WF': 0.25,
-                'Attacking Midfielder': 0.20, 'AM': 0.20,
-                'Midfielder': 0.10, 'Central Midfielder': 0.10, 'CM': 0.10,
-                'Defensive Midfielder': 0.05, 'DM': 0.05,
-            }
-            
-            goal_prob = position_goal_prob.get(client.position, 0.08)
-            assist_prob = goal_prob * 1.2  # Slightly higher chance of assist
-            
-            # Goals
-            if random.random() < goal_prob:
-                goals = 1
-                if random.random() < 0.15:  # 15% chance of brace
-                    goals = 2
-                client.goals += goals
-            else:
-                goals = 0
-            
-            # Assists
-            if random.random() < assist_prob:
-                assists = 1
-                if random.random() < 0.10:  # 10% chance of double assist
-                    assists = 2
-                client.assists += assists
-            else:
-                assists = 0
-            
-            # Cards (yellow/red)
-            yellow_card = random.random() < 0.12  # 12% chance
-            red_card = random.random() < 0.02 if not yellow_card else False  # 2% chance if no yellow
-            
-            # Match rating (1-10)
-            base_rating = 6.0
-            rating_bonus = goals * 1.5 + assists * 1.0
-            if yellow_card:
-                rating_bonus -= 0.3
-            if red_card:
-                rating_bonus -= 1.5
-            
-            match_rating = max(1.0, min(10.0, base_rating + rating_bonus + random.uniform(-0.5, 0.5)))
-            
-            # Register weekly statistics
-            client.weekly_stats.append({
-                "week": self.agent.week,
-                "goals": goals,
-                "assists": assists,
-                "rating": round(match_rating, 1),
-                "opponent": opponent_name,
-                "club": client.club,
-                "yellow_card": yellow_card,
-                "red_card": red_card,
-            })
-            client.season_appearances += 1
-            client.season_goals += goals
-            client.season_assists += assists
+            # Register weekly statistics: running aggregates on the player, rolling form in the tracker
+            client.record_match(match)
+            self.form.record_player(client.uid, match_rating, goals)
             
             # Performance-based overall growth
-            # High performers grow faster
-            goals_per_match = client.season_goals / client.season_appearances if client.season_appearances > 0 else 0
+            # High performers grow faster (scoring rate over the last few matches)
+            goals_per_match = self.form.player(client.uid).goals_per_match
             if goals_per_match > 0.3:  # Excellent scorer
                 growth = random.uniform(0.4, 0.8)  # +0.4 to +0.8 overall
             elif goals_per_match > 0.2:  # Good scorer
@@ -2202,7 +2513,10 @@ Trust your judgment and instinct!
                 client.physical += growth
                 client.shooting += growth
             
-            client.calculate_ratings()  # Recalculate overall
+            client.update_ratings()  # Apply the attribute deltas to the ratings
+            if self.sim_fidelity != FIDELITY_FAST:  # boards are not kept in bulk runs
+                credited.append(client)
+                self.leaderboards.record_growth(client.uid, client.club, growth, client.name)
             
             # Show match performance if something noteworthy happened
             if goals > 0 or assists > 0 or yellow_card or red_card:
@@ -2228,6 +2542,16 @@ Trust your judgment and instinct!
                 elif red_card:
                     client.morale = "Unhappy"
                     print(f"   ✗ {client.name} está molesto por la expulsión.")
+
+        if credited:  # season averages from the match_stats columns, like the rosters
+            keys = [client.uid for client in credited]
+            averages, appearances = self.match_stats.season_ratings(self.match_stats.rows(keys))
+            matches = self.week_client_matches
+            self.leaderboards.record_averages(
+                keys, [client.club for client in credited], averages.tolist(), appearances.tolist(),
+                {key: matches[key]['goals'] for key in keys if matches[key]['goals']},
+                {key: matches[key]['assists'] for key in keys if matches[key]['assists']},
+                names=[client.name for client in credited])
     
     # ========== PLAYER ROSTER & GROWTH TRACKING ==========
 
@@ -2241,126 +2565,181 @@ Trust your judgment and instinct!
         ]
         
         for club in self.clubs:
-            # Create 11 players per club
+            # Create 11 players per club: goalkeeper plus the formation's outfield slots
+            positions = ['GK'] + [pos for pos, n in club.formation_slots().items() for _ in range(n)]
             roster = []
             for i in range(11):
                 pers, cat = personalities[i % len(personalities)]
-                player = {
-                    'name': f'{club.name}_Player_{i+1}',
-                    'personality': pers,
-                    'category': cat,
-                    'skill_rating': round(random.uniform(60.0, 85.0), 1),
-                    'contract_weeks_remaining': random.randint(20, 80),
-                    'cohesion_index': 60.0,
-                    'morale': 60.0,
-                }
-                roster.append(player)
+                roster.append(self._new_roster_player(f'{club.name}_Player_{i+1}', pers, cat, positions[i % len(positions)],
+                                                      level=club.base_average))
             self.club_rosters[club.name] = roster
+            club.attach_squad(SquadStrength(roster, club.formation_slots()))
+        self._team_dynamics = None
+        self._matchday_lineups = None
+        self._growth_events.clear()
+        self._growth_bands.clear()
+        self._growth_club.clear()
+        self.form.clear()
+
+    @property
+    def team_dynamics(self):
+        """Roster columns for the dynamics stage, rebuilt after roster or config changes"""
+        config = self.impact_config or pin_config()
+        dynamics = self._team_dynamics
+        if dynamics is None or dynamics.config is not config:
+            dynamics = TeamDynamics(self.clubs, self.club_rosters, config, seed=random.getrandbits(32))
+            self._team_dynamics = dynamics
+        return dynamics
+
+    def _process_team_dynamics(self):
+        """Weekly cohesion, morale and conflicts for every roster (see team_dynamics)"""
+        if not self.club_rosters:
+            return None
+        table = self.league_table
+        standings = sorted(table, key=lambda name: (table[name]['points'], table[name]['gd']), reverse=True)
+        met = [name for position, name in enumerate(standings, 1)
+               if name in self.club_index and meets_objective(self.club_index[name].objective, position, len(standings))]
+        return self.team_dynamics.step(self.week_results, met, form=self.form.points_per_game())
+
+    @property
+    def matchday_lineups(self):
+        """Roster columns for the matchday stats draw, rebuilt after roster changes"""
+        if self._matchday_lineups is None:
+            self._matchday_lineups = MatchdayLineups(self.clubs, self.club_rosters, self.match_stats)
+        return self._matchday_lineups
+
+    def _credit_roster_matchday(self, scores, rng):
+        """Credit the matchday to every roster: goals, assists, cards and ratings in one draw (see match_stats)"""
+        if not self.club_rosters:
+            return
+        lineups = self.matchday_lineups
+        lines = draw_matchday(lineups, scores, rng)
+        stats = self.match_stats
+        record_matchday(stats, lineups, lines)
+
+        # Boards: season averages straight from the stats columns, one batch for the whole matchday
+        played = np.flatnonzero(lines['played'])
+        averages, appearances = stats.season_ratings(lineups.rows[played])
+        ids, names, club_names = lineups.ids, lineups.names, lineups.club_names
+        goals, assists = lines['goals'], lines['assists']
+        ratings, scored = lines['ratings'][played].tolist(), goals[played].tolist()
+        played = played.tolist()
+        played_ids = [ids[i] for i in played]
+        self.leaderboards.record_averages(
+            played_ids, [club_names[i] for i in played], averages.tolist(), appearances.tolist(),
+            {ids[i]: int(goals[i]) for i in np.flatnonzero(goals).tolist()},
+            {ids[i]: int(assists[i]) for i in np.flatnonzero(assists).tolist()},
+            names=[names[i] for i in played])
+
+        # Rolling form: the whole matchday in one batch too
+        self.form.record_lineup(played_ids, ratings, scored)
+
+    def _new_roster_player(self, name, personality, category, position, level=None):
+        """
+        Roster entry for growth and renewal tracking (registered under a new ID)
+
+        Args:
+            level: Club level the rating is drawn around (None: any 60-85 player)
+        """
+        if level is None:
+            skill = random.uniform(60.0, 85.0)
+        else:
+            skill = max(40.0, min(95.0, random.uniform(level - ROSTER_LEVEL_SPREAD, level + ROSTER_LEVEL_SPREAD)))
+        player = {
+            'id': next_id(),
+            'name': name,
+            'position': position,
+            'personality': personality,
+            'category': category,
+            'skill_rating': round(skill, 1),
+            'contract_weeks_remaining': random.randint(20, 80),
+            'cohesion_index': 60.0,
+            'morale': 60.0,
+        }
+        self.registry.register(player)
+        return player
 
     def _process_weekly_player_growth(self, week_index):
-        """Process skill growth for all players based on match performance"""
-        if week_index < 0 or week_index >= len(self.schedule):
+        """Process skill growth for all players based on match performance (growth events drawn ahead, see event_sampler)"""
+        calendar = self.calendar
+        if calendar.phase(week_index) != Phase.LEAGUE:
             return
             
-        phase = self.schedule[week_index].get('phase', '')
-        if not phase.startswith('Liga Nacional'):
-            return
-            
-        fixtures = self.schedule[week_index].get('fixtures', [])
         week_growth_count = 0
         
-        # Get client names for filtering output
-        client_names = {client.name for client in self.agent.clients}
+        # Client IDs for filtering output
+        client_ids = self.agent.clients.ids
         
         print("\n" + "="*60)
         print(f"CRECIMIENTO SEMANAL - Semana {self.agent.week}")
         print("="*60)
         
-        for home_name, away_name in fixtures:
-            home_result = self.league_table.get(home_name, {})
-            away_result = self.league_table.get(away_name, {})
-            
-            # Determinar resultado aproximado para rating_vs_avg
-            home_last_gf = home_result.get('gf', 0)
-            home_last_ga = home_result.get('ga', 0)
-            away_last_gf = away_result.get('gf', 0)
-            away_last_ga = away_result.get('ga', 0)
-            
-            # Simplificación: si GF > GA en histórico reciente, rating positivo
-            home_rating_diff = +5 if home_last_gf > home_last_ga else -5 if home_last_gf < home_last_ga else 0
-            away_rating_diff = +5 if away_last_gf > away_last_ga else -5 if away_last_gf < away_last_ga else 0
-            
-            # Process home club roster
-            if home_name in self.club_rosters:
-                club = self.club_index[home_name]
-                for player in self.club_rosters[home_name]:
-                    growth_prob = skill_growth_chance(
-                        player['personality'],
-                        player['category'],
-                        rating_vs_team_avg=home_rating_diff,
-                        training_quality=club.training_quality
-                    )
-                    
-                    if random.random() < growth_prob:
-                        old_rating = player['skill_rating']
-                        improvement = round(random.uniform(0.1, 0.3), 1)
-                        player['skill_rating'] = min(99.0, player['skill_rating'] + improvement)
-                        week_growth_count += 1
-                        
-                        self.growth_log.append({
-                            'week': self.agent.week,
-                            'club': home_name,
-                            'player': player['name'],
-                            'personality': player['personality'],
-                            'old_rating': old_rating,
-                            'new_rating': player['skill_rating'],
-                            'improvement': improvement,
-                            'growth_prob': growth_prob,
-                        })
-                        
-                        # Show only if it's an agent client
-                        if player['name'] in client_names:
-                            print(f"✓ {player['name']} ({player['personality']}): {old_rating} → {player['skill_rating']} (+{improvement}) [prob: {growth_prob:.3f}]")
-                    
-                    # Countdown contract
-                    player['contract_weeks_remaining'] -= 1
-            
-            # Process away club roster
-            if away_name in self.club_rosters:
-                club = self.club_index[away_name]
-                for player in self.club_rosters[away_name]:
-                    growth_prob = skill_growth_chance(
+        playing = {}
+        for home_club, away_club in calendar.fixtures(week_index):
+            playing[home_club.name] = home_club
+            playing[away_club.name] = away_club
+
+        sampler = self._growth_events
+        config_version = getattr(self.impact_config, 'version', None)
+        for club_name, club in playing.items():
+            roster = self.club_rosters.get(club_name)
+            if not roster:
+                continue
+            # Forma reciente (últimos partidos): buena racha +5, mala racha -5
+            club_form = self.form.club(club_name)
+            rating_diff = club_form.rating_diff() if club_form else 0
+
+            # Growth chances only change with the club's form band: re-sample its players then
+            band = (rating_diff, club.training_quality, config_version)
+            if self._growth_bands.get(club_name) != band:
+                self._growth_bands[club_name] = band
+                for player in roster:
+                    self._growth_club[player['id']] = club
+                    sampler.set_probability(player['id'], skill_growth_chance(
                         player['personality'],
                         player['category'],
-                        rating_vs_team_avg=away_rating_diff,
-                        training_quality=club.training_quality
-                    )
-                    
-                    if random.random() < growth_prob:
-                        old_rating = player['skill_rating']
-                        improvement = round(random.uniform(0.1, 0.3), 1)
-                        player['skill_rating'] = min(99.0, player['skill_rating'] + improvement)
-                        week_growth_count += 1
-                        
-                        self.growth_log.append({
-                            'week': self.agent.week,
-                            'club': away_name,
-                            'player': player['name'],
-                            'personality': player['personality'],
-                            'old_rating': old_rating,
-                            'new_rating': player['skill_rating'],
-                            'improvement': improvement,
-                            'growth_prob': growth_prob,
-                        })
-                        
-                        # Show only if it's an agent client
-                        if player['name'] in client_names:
-                            print(f"✓ {player['name']} ({player['personality']}): {old_rating} → {player['skill_rating']} (+{improvement}) [prob: {growth_prob:.3f}]")
-                    
-                    # Countdown contract
-                    player['contract_weeks_remaining'] -= 1
+                        rating_vs_team_avg=rating_diff,
+                        training_quality=club.training_quality,
+                        config=self.impact_config
+                    ))
+
+            # Countdown contract
+            for player in roster:
+                player['contract_weeks_remaining'] -= 1
+
+        # Only the players whose growth event falls this week are touched
+        for player_id in sampler.advance():
+            club = self._growth_club.get(player_id)
+            if club is None or club.name not in playing:
+                continue  # no match this week: the next event is already drawn
+            player = self.registry[player_id]
+            growth_prob = sampler.probability(player_id)
+            old_rating = player['skill_rating']
+            improvement = round(random.uniform(0.1, 0.3), 1)
+            player['skill_rating'] = min(99.0, player['skill_rating'] + improvement)
+            week_growth_count += 1
+            if club.squad is not None:
+                club.squad.rating_changed(player, old_rating)
+
+            if self.sim_fidelity != FIDELITY_FAST:  # boards are not kept in bulk runs
+                self.leaderboards.record_growth(player_id, club.name, improvement, player['name'])
+            self.growth_log.append({
+                'week': self.agent.week,
+                'club': club.name,
+                'player_id': player_id,
+                'player': player['name'],
+                'personality': player['personality'],
+                'old_rating': old_rating,
+                'new_rating': player['skill_rating'],
+                'improvement': improvement,
+                'growth_prob': growth_prob,
+            })
+
+            # Show only if it's an agent client
+            if player_id in client_ids:
+                print(f"✓ {player['name']} ({player['personality']}): {old_rating} → {player['skill_rating']} (+{improvement}) [prob: {growth_prob:.3f}]")
         
-        client_improvements = sum(1 for log in self.growth_log if log['week'] == self.agent.week and log['player'] in client_names)
+        client_improvements = sum(1 for log in self.growth_log if log['week'] == self.agent.week and log['player_id'] in client_ids)
         if client_improvements == 0:
             print("Ninguno de tus clientes mejoraron esta semana.")
         else:
@@ -2402,13 +2781,15 @@ Trust your judgment and instinct!
                     cohesion_index=player['cohesion_index'],
                     meets_objective=meets_objective,
                     performance_diff=performance_diff,
-                    player_morale=player['morale']
+                    player_morale=player['morale'],
+                    config=self.impact_config
                 )
                 
                 wants_renewal = random.random() < renewal_prob
                 
                 renewal_candidates.append({
                     'club': club_name,
+                    'player_id': player['id'],
                     'player': player['name'],
                     'personality': player['personality'],
                     'weeks_left': player['contract_weeks_remaining'],
@@ -2429,11 +2810,13 @@ Trust your judgment and instinct!
         
         print(f"\nTotal candidatos: {len(renewal_candidates)}")
         want_renew = sum(1 for c in renewal_candidates if c['wants_renewal'])
-        print(f"Quieren renovar: {want_renew} ({want_renew/len(renewal_candidates)*100:.1f}%)")
+        if renewal_candidates:
+            print(f"Quieren renovar: {want_renew} ({want_renew/len(renewal_candidates)*100:.1f}%)")
         print("="*60)
         
         # Export logs summary
         self._export_growth_summary()
+        return renewal_candidates
 
     def _export_growth_summary(self):
         """Export growth statistics summary"""
@@ -2447,9 +2830,10 @@ Trust your judgment and instinct!
         # Top improvers
         by_player = {}
         for entry in self.growth_log:
-            key = entry['player']
+            key = entry['player_id']
             if key not in by_player:
-                by_player[key] = {'count': 0, 'total_improvement': 0.0, 'personality': entry['personality']}
+                by_player[key] = {'count': 0, 'total_improvement': 0.0, 'personality': entry['personality'],
+                                  'name': entry['player']}
             by_player[key]['count'] += 1
             by_player[key]['total_improvement'] += entry['improvement']
         
@@ -2460,8 +2844,8 @@ Trust your judgment and instinct!
         )[:10]
         
         print("\nTop 10 Jugadores con Mayor Crecimiento:")
-        for player_name, stats in top_improvers:
-            print(f"  {player_name} ({stats['personality']}): +{stats['total_improvement']:.1f} en {stats['count']} mejoras")
+        for _, stats in top_improvers:
+            print(f"  {stats['name']} ({stats['personality']}): +{stats['total_improvement']:.1f} en {stats['count']} mejoras")
         
         # By personality
         by_personality = {}
@@ -2479,10 +2863,21 @@ Trust your judgment and instinct!
         
         print("="*60)
 
-def main():
+def main(profile=False, profile_out="week_profile.json", use_cprofile=False, use_tracemalloc=False,
+         fidelity=FIDELITY_CLIENTS):
     """Main entry point"""
     game = FootballAgentGame()
-    game.start_game()
+    game.set_sim_fidelity(fidelity)
+    if profile:
+        game.enable_profiling(use_cprofile=use_cprofile, use_tracemalloc=use_tracemalloc)
+    try:
+        game.start_game()
+    finally:
+        profiler = game.disable_profiling()
+        if profiler is not None and profiler.weeks:
+            print("\n" + profiler.format_report())
+            profiler.export_json(profile_out)
+            print(f"Profile written to {profile_out}")
 
 if __name__ == "__main__":
     main()
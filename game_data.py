@@ -3,6 +3,7 @@ Game data module - Contains initial game data like players, clubs, etc.
 """
 
 import random
+from functools import lru_cache
 
 from player import Player
 from club import Club
@@ -55,6 +56,27 @@ def get_international_clubs():
     return international_clubs
 
 
+FIRST_NAMES = ["Juan", "Pedro", "Luis", "Carlos", "Miguel", "Diego", "Andrés", "Sergio"]
+LAST_NAMES = ["García", "López", "Martínez", "Rodríguez", "Pérez", "Sánchez", "Torres", "Ramírez"]
+PLAYER_POSITIONS = [
+    "Forward", "Attacking Midfielder", "Winger", "Central Midfielder",
+    "Defensive Midfielder", "Center Back", "Full Back", "Wing Back"
+]
+
+# (base, spread) used for each mental attribute of a generated player
+MENTAL_ATTRIBUTE_PROFILE = {
+    'determination': (13, 3),
+    'leadership': (12, 3),
+    'ambition': (13, 3),
+    'loyalty': (12, 3),
+    'pressure': (12, 3),
+    'professionalism': (12, 3),
+    'sportsmanship': (12, 3),
+    'temperament': (12, 3),
+    'concentration': (12, 3),
+}
+
+
 def _rand_attr(base=12, spread=4):
     """Generate a random attribute between 1-20 using a normal-like spread."""
     return max(1, min(20, int(random.gauss(base, spread))))
@@ -62,16 +84,9 @@ def _rand_attr(base=12, spread=4):
 
 def _generate_random_player():
     """Create a single random player with technical and mental attributes."""
-    first_names = ["Juan", "Pedro", "Luis", "Carlos", "Miguel", "Diego", "Andrés", "Sergio"]
-    last_names = ["García", "López", "Martínez", "Rodríguez", "Pérez", "Sánchez", "Torres", "Ramírez"]
-    positions = [
-        "Forward", "Attacking Midfielder", "Winger", "Central Midfielder",
-        "Defensive Midfielder", "Center Back", "Full Back", "Wing Back"
-    ]
-
-    name = f"{random.choice(first_names)} {random.choice(last_names)}"
+    name = f"{random.choice(FIRST_NAMES)} {random.choice(LAST_NAMES)}"
     age = random.randint(17, 29)
-    position = random.choice(positions)
+    position = random.choice(PLAYER_POSITIONS)
 
     player = Player(name, age, position)
 
@@ -90,21 +105,21 @@ def _generate_random_player():
 
     # Mental attributes (personality)
     player.set_mental_attributes(
-        determination=_rand_attr(13, 3),
-        leadership=_rand_attr(12, 3),
-        ambition=_rand_attr(13, 3),
-        loyalty=_rand_attr(12, 3),
-        pressure=_rand_attr(12, 3),
-        professionalism=_rand_attr(12, 3),
-        sportsmanship=_rand_attr(12, 3),
-        temperament=_rand_attr(12, 3),
+        determination=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['determination']),
+        leadership=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['leadership']),
+        ambition=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['ambition']),
+        loyalty=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['loyalty']),
+        pressure=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['pressure']),
+        professionalism=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['professionalism']),
+        sportsmanship=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['sportsmanship']),
+        temperament=_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['temperament']),
     )
     
     # Concentration attribute
-    player.set_concentration(_rand_attr(12, 3))
+    player.set_concentration(_rand_attr(*MENTAL_ATTRIBUTE_PROFILE['concentration']))
 
-    # Recalculate ratings now that mental attributes are set
-    player.calculate_ratings()
+    # Ratings only depend on technical attributes (already applied by set_technical_attributes)
+    player.update_ratings()
 
     # Overall scores (0-100 scale)
     overall_current = int(round(player.current_rating * 100))
@@ -129,21 +144,21 @@ def _format_report(player: Player) -> str:
     lines.append("")
     lines.append("TECHNICAL ATTRIBUTES (1-20):")
     lines.append(
-        f"DEF {player.defending:2d} | AER {player.aerial:2d} | PAS {player.passing:2d} | "
-        f"TEC {player.technical:2d} | SPD {player.speed:2d} | PHY {player.physical:2d} | "
-        f"SHO {player.shooting:2d} | MEN {player.mental:2d} | INT {player.intelligence:2d}"
+        f"DEF {player.defending:2.0f} | AER {player.aerial:2.0f} | PAS {player.passing:2.0f} | "
+        f"TEC {player.technical:2.0f} | SPD {player.speed:2.0f} | PHY {player.physical:2.0f} | "
+        f"SHO {player.shooting:2.0f} | MEN {player.mental:2.0f} | INT {player.intelligence:2.0f}"
     )
     lines.append("")
     lines.append("MENTAL ATTRIBUTES (1-20):")
     lines.append(
-        f"DET {player.determination:2d} | LDR {player.leadership:2d} | AMB {player.ambition:2d} | "
-        f"LOY {player.loyalty:2d} | PRE {player.pressure:2d} | PRO {player.professionalism:2d} | "
-        f"SPM {player.sportsmanship:2d} | TMP {player.temperament:2d}"
+        f"DET {player.determination:2.0f} | LDR {player.leadership:2.0f} | AMB {player.ambition:2.0f} | "
+        f"LOY {player.loyalty:2.0f} | PRE {player.pressure:2.0f} | PRO {player.professionalism:2.0f} | "
+        f"SPM {player.sportsmanship:2.0f} | TMP {player.temperament:2.0f}"
     )
     lines.append("")
     lines.append(f"PERSONALITY: {player.personality}")
     lines.append(f"MEDIA HANDLING: {player.media_handling}")
-    lines.append(f"CONCENTRATION: {player.concentration:2d}")
+    lines.append(f"CONCENTRATION: {player.concentration:2.0f}")
     return "\n".join(lines)
 
 
@@ -154,23 +169,62 @@ def create_initial_players():
     return list(_cached_players)
 
 
-def create_player_reports():
-    """Create scouting reports based on the current generated players."""
-    players = _cached_players if _cached_players else create_initial_players()
-    reports = []
-    for p in players:
-        preview = (
+class ScoutReport:
+    """
+    Lazy scouting report for one player.
+
+    Nothing is formatted when the report is created: the preview is built from the
+    player's fields on access and the full text is rendered on first read and kept
+    in a bounded LRU cache keyed by (player, player.version).
+    Dict-style access (report['preview']) is kept for older callers.
+    """
+
+    __slots__ = ('player',)
+
+    FIELDS = ('player_name', 'preview', 'full_report')
+
+    def __init__(self, player: Player):
+        self.player = player
+
+    @property
+    def player_name(self) -> str:
+        return self.player.name
+
+    @property
+    def preview(self) -> str:
+        p = self.player
+        return (
             f"{p.name} | {p.position} | Overall {p.current_overall_score}/100 | "
             f"Potential {p.potential_overall_score}/100"
         )
-        reports.append(
-            {
-                "player_name": p.name,
-                "preview": preview,
-                "full_report": _format_report(p),
-            }
-        )
-    return reports
+
+    @property
+    def full_report(self) -> str:
+        return _render_report(self.player, self.player.version)
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return self[key] if key in self.FIELDS else default
+
+
+REPORT_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def _render_report(player: Player, version: int) -> str:
+    """Render a report once per player version (version is only part of the cache key)."""
+    return _format_report(player)
+
+
+def create_player_reports(players=None):
+    """Create lazy scouting reports for the given players (default: the current generated players)."""
+    if players is None:
+        players = _cached_players if _cached_players else create_initial_players()
+    return [ScoutReport(p) for p in players]
 
 def get_clubs():
     """Return list of clubs in the game"""
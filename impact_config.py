@@ -0,0 +1,366 @@
+"""
+Impact config module - Validated, compiled and hot-reloadable personality impact config.
+
+data/personality_impacts.json is checked against a schema and compiled into flat
+lookup tables (CompiledConfig). The compiled tables are saved as a pickle next to
+the JSON. The pickle is stamped with the JSON's modification time and size, so it
+is rebuilt only when the JSON changes.
+
+ConfigService holds the current version. reload_if_changed() swaps in a new version
+when the file changes. An invalid file is reported and the previous version is kept.
+Simulations pin one CompiledConfig (e.g. per week) and pass it to personality_impact.
+"""
+
+import json
+import os
+import pickle
+import threading
+from numbers import Real
+from typing import Dict, List, Optional
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'personality_impacts.json')
+COMPILED_SUFFIX = '.pickle'
+COMPILED_FORMAT = 2
+
+CATEGORIES = ('Best', 'Good', 'Neutral', 'Bad', 'Worst')
+LEVEL_FIELDS = ('performance', 'cohesion', 'conflict')
+PROFILE_FIELDS = ('performance_level', 'cohesion_level', 'conflict_level')
+
+
+class ConfigError(ValueError):
+    """Raised when the impact config does not match the schema."""
+
+    def __init__(self, errors: List[str]):
+        self.errors = errors
+        super().__init__("Invalid personality impact config:\n  " + "\n  ".join(errors))
+
+
+# ========== SCHEMA VALIDATION ==========
+
+def _section(raw, key, errors) -> Dict:
+    value = raw.get(key)
+    if not isinstance(value, dict):
+        errors.append(f"'{key}' must be an object")
+        return {}
+    return value
+
+
+def _numbers(table, path, fields, errors) -> None:
+    for field in fields:
+        value = table.get(field)
+        if not isinstance(value, Real) or isinstance(value, bool):
+            errors.append(f"'{path}.{field}' must be a number")
+
+
+def _min_max(table, path, low, high, errors) -> None:
+    before = len(errors)
+    _numbers(table, path, (low, high), errors)
+    if len(errors) == before and table[low] > table[high]:
+        errors.append(f"'{path}.{low}' is greater than '{path}.{high}'")
+
+
+def validate_config(raw) -> None:
+    """
+    Check a parsed config against the schema.
+
+    Args:
+        raw: Parsed JSON
+
+    Raises:
+        ConfigError: With one message per problem found
+    """
+    if not isinstance(raw, dict):
+        raise ConfigError(["config root must be an object"])
+    errors = []
+
+    levels = _section(raw, 'levels', errors)
+    for name, values in levels.items():
+        if not isinstance(values, dict):
+            errors.append(f"'levels.{name}' must be an object")
+        else:
+            _numbers(values, f"levels.{name}", LEVEL_FIELDS, errors)
+    for required in ('Moderate', 'Medium'):
+        if levels and required not in levels:
+            errors.append(f"'levels' is missing the '{required}' fallback level")
+
+    alias = _section(raw, 'performance_alias', errors)
+    for name, target in alias.items():
+        if target not in levels:
+            errors.append(f"'performance_alias.{name}' points to unknown level '{target}'")
+
+    def check_profile(profile, path):
+        if not isinstance(profile, dict):
+            errors.append(f"'{path}' must be an object")
+            return
+        for field in PROFILE_FIELDS:
+            level = profile.get(field)
+            known = level in levels or (field == 'performance_level' and level in alias)
+            if not known:
+                errors.append(f"'{path}.{field}' has unknown level {level!r}")
+
+    defaults = _section(raw, 'defaults', errors)
+    for category in CATEGORIES:
+        if category not in defaults:
+            errors.append(f"'defaults' is missing category '{category}'")
+    for category, profile in defaults.items():
+        check_profile(profile, f"defaults.{category}")
+
+    for name, profile in _section(raw, 'personalities', errors).items():
+        check_profile(profile, f"personalities.{name}")
+
+    caps = _section(raw, 'caps', errors)
+    _numbers(caps, 'caps', ('cohesion_weekly_cap', 'conflict_base_weekly'), errors)
+    _min_max(caps, 'caps', 'performance_min', 'performance_max', errors)
+
+    dev = _section(raw, 'development', errors)
+    if dev:
+        weekly_base = _section(dev, 'weekly_base', errors)
+        _numbers(weekly_base, 'development.weekly_base', list(weekly_base), errors)
+        if 'Moderate' not in weekly_base:
+            errors.append("'development.weekly_base' is missing the 'Moderate' fallback")
+        _min_max(_section(dev, 'caps', errors), 'development.caps', 'weekly_min', 'weekly_max', errors)
+        _numbers(_section(dev, 'boosts', errors), 'development.boosts',
+                 ('positive_performance', 'negative_performance', 'training_quality_scale'), errors)
+
+    renew = _section(raw, 'renewal', errors)
+    if renew:
+        for key in ('base_by_personality', 'base_by_category'):
+            table = _section(renew, key, errors)
+            _numbers(table, f"renewal.{key}", list(table), errors)
+        _numbers(_section(renew, 'weights', errors), 'renewal.weights',
+                 ('cohesion_index', 'meets_objective', 'performance_diff', 'player_morale'), errors)
+        _min_max(_section(renew, 'caps', errors), 'renewal.caps', 'min', 'max', errors)
+
+    if errors:
+        raise ConfigError(errors)
+
+
+# ========== COMPILED TABLES ==========
+
+class CompiledConfig:
+    """
+    Flat lookup tables built from a validated config.
+
+    Level names are resolved here, so lookups are a single dict access.
+    Instances are read-only once built and may be shared between threads.
+    """
+
+    def __init__(self, raw: Dict, stamp=None, version: int = 0):
+        self.raw = raw
+        self.stamp = stamp
+        self.version = version
+
+        levels = raw['levels']
+        alias = raw['performance_alias']
+
+        def resolve_perf(level):
+            return alias.get(level, level)
+
+        def profile(entry):
+            return {
+                'performance': levels[resolve_perf(entry['performance_level'])],
+                'cohesion': levels[entry['cohesion_level']],
+                'conflict': levels[entry['conflict_level']],
+            }
+
+        personalities = raw['personalities']
+        defaults = raw['defaults']
+
+        # {personality: {'performance': level values, 'cohesion': ..., 'conflict': ...}}
+        self.profiles = {name: profile(p) for name, p in personalities.items()}
+        self.category_profiles = {cat: profile(p) for cat, p in defaults.items()}
+        # Resolved performance level names (used for development rates)
+        self.perf_levels = {name: resolve_perf(p['performance_level']) for name, p in personalities.items()}
+        self.category_perf_levels = {cat: p['performance_level'] for cat, p in defaults.items()}
+        self.unpredictable = frozenset(
+            name for name, p in personalities.items() if p['performance_level'] == 'Unpredictable'
+        )
+
+        caps = raw['caps']
+        self.caps = caps
+        self.performance_min = caps['performance_min']
+        self.performance_max = caps['performance_max']
+        self.cohesion_weekly_cap = caps['cohesion_weekly_cap']
+        self.conflict_base_weekly = caps['conflict_base_weekly']
+
+        dev = raw['development']
+        self.growth_base = dev['weekly_base']
+        self.growth_boosts = dev['boosts']
+        self.growth_min = dev['caps']['weekly_min']
+        self.growth_max = dev['caps']['weekly_max']
+
+        renew = raw['renewal']
+        self.renew_base_personality = renew['base_by_personality']
+        self.renew_base_category = renew['base_by_category']
+        self.renew_weights = renew['weights']
+        self.renew_min = renew['caps']['min']
+        self.renew_max = renew['caps']['max']
+
+    def profile(self, personality_name: str, category: Optional[str] = None) -> Dict:
+        """Impact profile for a personality, falling back to its category defaults."""
+        prof = self.profiles.get(personality_name)
+        if prof is None:
+            prof = self.category_profiles.get(category or 'Neutral', self.category_profiles['Neutral'])
+        return prof
+
+    def __repr__(self):
+        return f"<CompiledConfig v{self.version} ({len(self.profiles)} personalities)>"
+
+
+# ========== ARTIFACT ==========
+
+def compiled_path(path: str = CONFIG_PATH) -> str:
+    """Return the path of the precompiled artifact for a JSON config."""
+    return os.path.splitext(path)[0] + COMPILED_SUFFIX
+
+
+def _source_stamp(path: str):
+    st = os.stat(path)
+    return (COMPILED_FORMAT, st.st_mtime_ns, st.st_size)
+
+
+def _read_compiled(path: str, stamp) -> Optional[CompiledConfig]:
+    try:
+        with open(compiled_path(path), 'rb') as f:
+            compiled = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        return None
+    if not isinstance(compiled, CompiledConfig) or compiled.stamp != stamp:
+        return None
+    return compiled
+
+
+def _write_compiled(path: str, compiled: CompiledConfig) -> None:
+    """Write the artifact atomically; a read-only data directory is not an error."""
+    target = compiled_path(path)
+    tmp = f"{target}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def compile_config(path: str = CONFIG_PATH) -> CompiledConfig:
+    """Parse and validate the JSON config, then (re)write its precompiled artifact."""
+    stamp = _source_stamp(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            raw = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ConfigError([f"invalid JSON: {e}"]) from e
+    validate_config(raw)
+    compiled = CompiledConfig(raw, stamp)
+    _write_compiled(path, compiled)
+    return compiled
+
+
+def _load_compiled(path: str) -> CompiledConfig:
+    compiled = _read_compiled(path, _source_stamp(path))
+    return compiled if compiled is not None else compile_config(path)
+
+
+# ========== SERVICE ==========
+
+class ConfigService:
+    """Holds the current CompiledConfig for one JSON file and swaps it when the file changes."""
+
+    def __init__(self, path: str = CONFIG_PATH):
+        self.path = path
+        self.last_error = None  # ConfigError from the last failed reload, if any
+        self._current = None
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> CompiledConfig:
+        """The current config version (loaded on first access)."""
+        compiled = self._current
+        if compiled is None:
+            compiled = self._load_first()
+        return compiled
+
+    def _load_first(self) -> CompiledConfig:
+        with self._lock:
+            if self._current is None:
+                self._swap(_load_compiled(self.path))
+            return self._current
+
+    def _swap(self, compiled: CompiledConfig) -> None:
+        self._version += 1
+        compiled.version = self._version
+        # Single reference assignment: readers see either the old or the new version
+        self._current = compiled
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the config if the JSON changed since the current version was built.
+
+        Returns:
+            bool: True if a new version was swapped in. If the new file is invalid,
+            the old version is kept and the error is stored in last_error.
+        """
+        if self._current is None:
+            self._load_first()
+            return False
+        try:
+            stamp = _source_stamp(self.path)
+        except OSError as e:
+            self.last_error = e
+            return False
+        if stamp == self._current.stamp:
+            return False
+        with self._lock:
+            if stamp == self._current.stamp:
+                return False
+            try:
+                compiled = _load_compiled(self.path)
+            except (ConfigError, OSError) as e:
+                self.last_error = e
+                return False
+            self.last_error = None
+            self._swap(compiled)
+        return True
+
+
+_services = {}  # {json_path: ConfigService}
+
+
+def get_service(path: str = CONFIG_PATH) -> ConfigService:
+    """Return the shared ConfigService for a JSON config file."""
+    service = _services.get(path)
+    if service is None:
+        service = _services.setdefault(path, ConfigService(path))
+    return service
+
+
+def current_config(path: str = CONFIG_PATH) -> CompiledConfig:
+    """Return the current compiled config (no file check; see ConfigService.reload_if_changed)."""
+    return get_service(path).current
+
+
+def load_config(path: str = CONFIG_PATH) -> Dict:
+    """
+    Return the raw impact config, loading it on first use.
+
+    Args:
+        path: JSON config path
+
+    Returns:
+        dict: Parsed config (shared; callers must not mutate it)
+    """
+    return current_config(path).raw
+
+
+def clear_cache() -> None:
+    """Forget configs loaded in this process (the artifact on disk is kept)."""
+    _services.clear()
+
+
+if __name__ == '__main__':
+    compiled = compile_config()
+    print(f"Compiled {CONFIG_PATH} -> {compiled_path()} ({len(compiled.profiles)} personalities)")
@@ -0,0 +1,166 @@
+"""
+Leaderboards module - League-wide season rankings kept up to date incrementally.
+
+Each board is a RankedIndex: a sorted list of (-value, key) entries plus a value
+map. Players are keyed by their registry ID (names can repeat); names and clubs
+are kept alongside for display. Updating a player costs two binary searches and one list shift; reading the
+top k is a slice, O(k), whatever the size of the league. Average ratings change
+for every player who plays, so they are batched and applied in one pass when a
+board is read (flush); the season averages come ready-made from the
+match_stats columns (record_averages), so the boards keep no rating sums.
+Boards are updated from the matchday simulation and reset at the start of
+each season.
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+BOARDS = ('goals', 'assists', 'rating', 'growth')
+BOARD_LABELS = {
+    'goals': 'Goleadores',
+    'assists': 'Asistidores',
+    'rating': 'Rating promedio',
+    'growth': 'Crecimiento',
+}
+MIN_RATED_APPEARANCES = 3  # matches needed to enter the rating board (and match_stats rating ranking)
+DEFAULT_TOP = 20
+
+
+class RankedIndex:
+    """Order-statistics index: set/add/remove by key, top(k) in O(k), rank in O(log n)."""
+
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self):
+        self._keys: List[Tuple[float, object]] = []  # sorted ascending by (-value, key)
+        self._values: Dict[object, float] = {}
+
+    def __len__(self):
+        return len(self._values)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def get(self, key, default: float = 0.0) -> float:
+        return self._values.get(key, default)
+
+    def set(self, key, value: float):
+        old = self._values.get(key)
+        if old == value:
+            return
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, key))]
+        self._values[key] = value
+        insort(self._keys, (-value, key))
+
+    def update(self, values: Dict[object, float]):
+        """Set many values at once; re-sorts in one pass when they touch a large part of the index."""
+        if len(values) * 4 < len(self._values):
+            for key, value in values.items():
+                self.set(key, value)
+            return
+        self._values.update(values)
+        self._keys = sorted((-value, key) for key, value in self._values.items())
+
+    def add(self, key, delta: float) -> float:
+        value = self._values.get(key, 0) + delta
+        self.set(key, value)
+        return value
+
+    def remove(self, key):
+        old = self._values.pop(key, None)
+        if old is not None:
+            del self._keys[bisect_left(self._keys, (-old, key))]
+
+    def top(self, k: int = DEFAULT_TOP) -> List[Tuple[object, float]]:
+        """Best k as (key, value), highest first (ties by key)."""
+        return [(key, -neg) for neg, key in self._keys[:k]]
+
+    def rank(self, key) -> Optional[int]:
+        """1-based position of `key`, or None if it is not ranked."""
+        value = self._values.get(key)
+        if value is None:
+            return None
+        return bisect_left(self._keys, (-value, key)) + 1
+
+    def clear(self):
+        self._keys.clear()
+        self._values.clear()
+
+
+class Leaderboards:
+    """Season boards for goals, assists, average rating and growth across roster players and clients."""
+
+    def __init__(self, min_rated_appearances: int = MIN_RATED_APPEARANCES):
+        self.min_rated_appearances = min_rated_appearances
+        self.boards = {name: RankedIndex() for name in BOARDS}
+        self.clubs: Dict = {}      # player key -> club
+        self.names: Dict = {}      # player key -> display name (when it differs from the key)
+        self._pending_ratings: Dict = {}  # rating board updates not yet applied (see flush)
+
+    def record_averages(self, keys, clubs, averages, appearances, goals: Dict = None, assists: Dict = None,
+                        names=None):
+        """
+        Add a matchday for players whose rating sums are kept elsewhere (the match_stats columns).
+
+        Args:
+            keys, clubs: Parallel sequences, one entry per player who played
+            averages, appearances: Season average rating and matches per player, this matchday included
+            goals, assists: {key: count} for the players who scored or assisted
+            names: Display names parallel to keys
+        """
+        self.clubs.update(zip(keys, clubs))
+        if names is not None:
+            self.names.update(zip(keys, names))
+        minimum = self.min_rated_appearances
+        if min(appearances, default=minimum) >= minimum:  # everyone is ranked after the first few matchdays
+            self._pending_ratings.update(zip(keys, averages))
+        else:
+            self._pending_ratings.update((key, average) for key, average, matches in zip(keys, averages, appearances)
+                                         if matches >= minimum)
+        for key, n in (goals or {}).items():
+            self.boards['goals'].add(key, n)
+        for key, n in (assists or {}).items():
+            self.boards['assists'].add(key, n)
+
+    def flush(self):
+        """Apply the pending rating changes to the rating board in one batch (done before every read)."""
+        if self._pending_ratings:
+            self.boards['rating'].update(self._pending_ratings)
+            self._pending_ratings = {}
+
+    def record_growth(self, key, club: str, delta: float, name: str = None):
+        self.clubs[key] = club
+        if name is not None:
+            self.names[key] = name
+        self.boards['growth'].add(key, delta)
+
+    def top(self, board: str, k: int = DEFAULT_TOP) -> List[Dict]:
+        """
+        Top k of a board.
+
+        Returns:
+            list: [{'rank', 'id', 'name', 'club', 'value'}] highest first
+        """
+        self.flush()
+        return [
+            {'rank': i, 'id': key, 'name': self.names.get(key, key), 'club': self.clubs.get(key),
+             'value': round(value, 2)}
+            for i, (key, value) in enumerate(self.boards[board].top(k), 1)
+        ]
+
+    def rank(self, board: str, key) -> Optional[int]:
+        self.flush()
+        return self.boards[board].rank(key)
+
+    def snapshot(self, k: int = 3) -> Dict[str, List[Dict]]:
+        """Top k of every board (kept in the season archive)."""
+        return {board: self.top(board, k) for board in BOARDS}
+
+    def reset(self):
+        """Start a new season."""
+        for board in self.boards.values():
+            board.clear()
+        self.clubs.clear()
+        self.names.clear()
+        self._pending_ratings = {}
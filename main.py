@@ -4,7 +4,29 @@ Football Agent Simulator - Main Entry Point
 A text-based game where you play as a football agent
 """
 
+import argparse
+
 from game import main
+from match_engine import FIDELITY_CLIENTS, FIDELITY_MODES
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Football Agent Simulator")
+    parser.add_argument("--profile", action="store_true",
+                        help="time each weekly stage and count hot calls; report on exit")
+    parser.add_argument("--profile-out", default="week_profile.json",
+                        help="JSON file for the profile (default: week_profile.json)")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="with --profile, also record the top functions of each week with cProfile")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="with --profile, also record each week's peak memory with tracemalloc")
+    parser.add_argument("--fidelity", choices=FIDELITY_MODES, default=FIDELITY_CLIENTS,
+                        help="match detail: per-player model for client fixtures only (default), "
+                             "for every fixture, or fast results everywhere")
+    return parser.parse_args(argv)
+
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    main(profile=args.profile, profile_out=args.profile_out,
+         use_cprofile=args.cprofile, use_tracemalloc=args.tracemalloc, fidelity=args.fidelity)
@@ -0,0 +1,180 @@
+"""
+Match engine module - Tiered-fidelity simulation of a matchday.
+
+Fixtures are split into two tiers:
+- detailed: scoreline from the Dixon-Coles grid plus a per-player model for the
+  agent's clients (starting chance, minutes, share of the team's goals and
+  assists, cards, match rating)
+- fast: all remaining scorelines drawn in one vectorized Poisson call
+
+The fidelity mode decides the split:
+- 'clients'  (default) detailed only for fixtures with a client's club
+- 'fast'     everything in the fast tier (bulk Monte Carlo)
+- 'detailed' everything in the detailed tier
+"""
+
+import random
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from match_model import expected_goals, matchup_grid
+
+FIDELITY_CLIENTS = 'clients'
+FIDELITY_FAST = 'fast'
+FIDELITY_DETAILED = 'detailed'
+FIDELITY_MODES = (FIDELITY_CLIENTS, FIDELITY_FAST, FIDELITY_DETAILED)
+
+# Share of the team's goals / assists for a player on the pitch for 90 minutes
+POSITION_GOAL_SHARE = {
+    'Forward': 0.30, 'Striker': 0.30, 'FW': 0.30, 'ST': 0.30,
+    'Winger': 0.20, 'Wing Forward': 0.20, 'WF': 0.20,
+    'Attacking Midfielder': 0.16, 'AM': 0.16,
+    'Side Midfielder': 0.12, 'Wide Midfielder': 0.12, 'SM': 0.12,
+    'Midfielder': 0.08, 'Central Midfielder': 0.08, 'CM': 0.08,
+    'Defensive Midfielder': 0.04, 'DM': 0.04,
+    'Goalkeeper': 0.0, 'GK': 0.0,
+}
+POSITION_ASSIST_SHARE = {
+    'Forward': 0.14, 'Striker': 0.14, 'FW': 0.14, 'ST': 0.14,
+    'Winger': 0.22, 'Wing Forward': 0.22, 'WF': 0.22,
+    'Attacking Midfielder': 0.24, 'AM': 0.24,
+    'Side Midfielder': 0.20, 'Wide Midfielder': 0.20, 'SM': 0.20,
+    'Midfielder': 0.14, 'Central Midfielder': 0.14, 'CM': 0.14,
+    'Defensive Midfielder': 0.07, 'DM': 0.07,
+    'Goalkeeper': 0.01, 'GK': 0.01,
+}
+DEFAULT_GOAL_SHARE = 0.04
+DEFAULT_ASSIST_SHARE = 0.06
+DEFENSIVE_POSITIONS = {'Defensive Midfielder', 'DM', 'Centre Back', 'CB', 'Full Back', 'FB',
+                       'Wing Back', 'WB', 'Goalkeeper', 'GK', 'Defender'}
+ASSISTED_GOALS = 0.7       # share of goals that have an assist
+YELLOW_PER_90 = 0.08       # base card rates, raised by a low temperament
+RED_PER_90 = 0.012
+
+
+def validate_fidelity(mode: str) -> str:
+    """Return `mode` if it is a known fidelity mode, else raise ValueError."""
+    if mode not in FIDELITY_MODES:
+        raise ValueError(f"unknown fidelity mode {mode!r} (expected one of {', '.join(FIDELITY_MODES)})")
+    return mode
+
+
+def plan_fixtures(fixtures: Sequence[Tuple], client_clubs, mode: str = FIDELITY_CLIENTS, key=None):
+    """
+    Split fixtures into (detailed, fast) lists for a fidelity mode.
+
+    Args:
+        fixtures: (home, away) club names (or clubs, with `key`)
+        client_clubs: Club names with at least one client
+        mode: One of FIDELITY_MODES
+        key: Maps a fixture side to its club name (default: the side itself)
+    """
+    validate_fidelity(mode)
+    if mode == FIDELITY_FAST:
+        return [], list(fixtures)
+    if mode == FIDELITY_DETAILED:
+        return list(fixtures), []
+    detailed, fast = [], []
+    for home, away in fixtures:
+        if key is not None:
+            is_client = key(home) in client_clubs or key(away) in client_clubs
+        else:
+            is_client = home in client_clubs or away in client_clubs
+        (detailed if is_client else fast).append((home, away))
+    return detailed, fast
+
+
+# ========== FAST TIER ==========
+
+def fast_scorelines(profile_pairs: Sequence[Tuple[Dict, Dict]], rng: np.random.Generator = None) -> List[Tuple[int, int]]:
+    """
+    Scorelines for many fixtures at once (independent Poisson, no low-score correction).
+
+    Args:
+        profile_pairs: (home quick profile, away quick profile) per fixture
+        rng: NumPy generator (seeded from `random` when omitted)
+
+    Returns:
+        list: (home_goals, away_goals) per fixture
+    """
+    if not profile_pairs:
+        return []
+    rng = rng or np.random.default_rng(random.getrandbits(64))
+    lams = np.array([expected_goals(home, away) for home, away in profile_pairs], dtype=np.float64)
+    goals = rng.poisson(lams)
+    return [(int(h), int(a)) for h, a in goals]
+
+
+# ========== DETAILED TIER ==========
+
+def detailed_scoreline(home_prof: Dict, away_prof: Dict, rng=random) -> Tuple[int, int]:
+    """Scoreline from the matchup's Dixon-Coles grid."""
+    return matchup_grid(home_prof, away_prof).sample(rng)
+
+
+def _minutes(overall: float, team_average: float, rng) -> int:
+    """Minutes played: likely starters play most of the match, the rest may come on late."""
+    start_prob = max(0.1, min(0.97, 0.55 + (overall - team_average) * 0.04))
+    if rng.random() < start_prob:
+        return rng.randint(60, 85) if rng.random() < 0.25 else 90
+    if rng.random() < 0.4:
+        return rng.randint(5, 30)
+    return 0
+
+
+def player_match_line(player, team_average: float, goals_for: int, goals_against: int,
+                      rng=random, detailed: bool = True):
+    """
+    One player's contribution to a played match.
+
+    Each team goal is scored by the player with probability (position share x
+    minutes/90 x quality) and otherwise may be assisted by them. The detailed
+    model also draws minutes and cards; the quick one assumes 90 minutes and no cards.
+
+    Returns:
+        dict: {'minutes', 'goals', 'assists', 'yellow_card', 'red_card', 'rating'},
+              or None if the player did not get on the pitch
+    """
+    overall = player.current_overall_score or player.current_rating * 100
+    minutes = _minutes(overall, team_average, rng) if detailed else 90
+    if minutes == 0:
+        return None
+
+    on_pitch = minutes / 90
+    quality = max(0.7, min(1.4, overall / team_average)) if team_average else 1.0
+    p_goal = POSITION_GOAL_SHARE.get(player.position, DEFAULT_GOAL_SHARE) * on_pitch * quality
+    p_assist = POSITION_ASSIST_SHARE.get(player.position, DEFAULT_ASSIST_SHARE) * on_pitch * quality * ASSISTED_GOALS
+
+    goals = assists = 0
+    for _ in range(goals_for):
+        if rng.random() < p_goal:
+            goals += 1
+        elif rng.random() < p_assist:
+            assists += 1
+
+    yellow_card = red_card = False
+    if detailed:
+        temper = 1.0 + (20 - player.temperament) * 0.05  # 1.0 (calm) .. 1.95 (hot-headed)
+        yellow_card = rng.random() < YELLOW_PER_90 * temper * on_pitch
+        red_card = not yellow_card and rng.random() < RED_PER_90 * temper * on_pitch
+
+    rating = 6.0 + goals * 1.5 + assists * 1.0
+    rating += 0.4 if goals_for > goals_against else -0.4 if goals_for < goals_against else 0.0
+    if goals_against == 0 and player.position in DEFENSIVE_POSITIONS:
+        rating += 0.3
+    if yellow_card:
+        rating -= 0.3
+    if red_card:
+        rating -= 1.5
+    rating = 6.0 + (rating - 6.0) * (0.5 + 0.5 * on_pitch)  # short cameos move the rating less
+    rating += rng.uniform(-0.5, 0.5)
+
+    return {
+        'minutes': minutes,
+        'goals': goals,
+        'assists': assists,
+        'yellow_card': yellow_card,
+        'red_card': red_card,
+        'rating': round(max(1.0, min(10.0, rating)), 1),
+    }
@@ -0,0 +1,191 @@
+"""
+Match model module - Scoreline probabilities from a Dixon-Coles adjusted Poisson model.
+
+Each side's expected goals come from its attack (xg) and the opponent's defence (xga).
+The probability of every scoreline up to MAX_GOALS is kept in a ScoreGrid, so:
+- win/draw/loss probabilities and expected points are computed exactly from the grid
+- a scoreline is sampled in O(1) with an alias table built once per grid
+Grids are cached by (rounded) expected goals, so repeated matchups reuse them.
+"""
+
+import math
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+MAX_GOALS = 10          # grid covers 0..MAX_GOALS goals per side (the tail is renormalized away)
+DC_RHO = -0.08          # Dixon-Coles low-score dependence (negative: more 0-0 and 1-1)
+HOME_ADVANTAGE = 1.08   # multiplier on the home side's expected goals
+MIN_LAMBDA = 0.2
+MAX_LAMBDA = 5.0
+LAMBDA_DECIMALS = 2     # expected goals are rounded to this many decimals for the grid cache
+GRID_CACHE_SIZE = 4096
+
+
+def _poisson_pmf(lam: float) -> List[float]:
+    pmf = [math.exp(-lam)]
+    for k in range(1, MAX_GOALS + 1):
+        pmf.append(pmf[-1] * lam / k)
+    return pmf
+
+
+def _dixon_coles_tau(home_goals: int, away_goals: int, lam: float, mu: float, rho: float) -> float:
+    """Dixon-Coles correction for the four low-score cells (1.0 elsewhere)."""
+    if home_goals == 0 and away_goals == 0:
+        return 1.0 - lam * mu * rho
+    if home_goals == 0 and away_goals == 1:
+        return 1.0 + lam * rho
+    if home_goals == 1 and away_goals == 0:
+        return 1.0 + mu * rho
+    if home_goals == 1 and away_goals == 1:
+        return 1.0 - rho
+    return 1.0
+
+
+class ScoreGrid:
+    """Probabilities of every scoreline for one matchup, with exact summaries and O(1) sampling."""
+
+    __slots__ = ('lam_home', 'lam_away', 'rho', 'probs', '_alias', '_accept', '_summary')
+
+    def __init__(self, lam_home: float, lam_away: float, rho: float = DC_RHO):
+        self.lam_home = lam_home
+        self.lam_away = lam_away
+        self.rho = rho
+
+        home_pmf = _poisson_pmf(lam_home)
+        away_pmf = _poisson_pmf(lam_away)
+        size = MAX_GOALS + 1
+        probs = [0.0] * (size * size)
+        for h in range(size):
+            row = h * size
+            ph = home_pmf[h]
+            for a in range(size):
+                p = ph * away_pmf[a]
+                if h <= 1 and a <= 1:
+                    p *= max(0.0, _dixon_coles_tau(h, a, lam_home, lam_away, rho))
+                probs[row + a] = p
+        total = sum(probs)
+        # Flat list, index = home_goals * (MAX_GOALS + 1) + away_goals
+        self.probs = [p / total for p in probs]
+        self._alias = None
+        self._accept = None
+        self._summary = None
+
+    def prob(self, home_goals: int, away_goals: int) -> float:
+        if home_goals > MAX_GOALS or away_goals > MAX_GOALS:
+            return 0.0
+        return self.probs[home_goals * (MAX_GOALS + 1) + away_goals]
+
+    def _summarize(self) -> Dict:
+        size = MAX_GOALS + 1
+        home_win = draw = away_win = home_xg = away_xg = 0.0
+        best, best_p = (0, 0), -1.0
+        for h in range(size):
+            for a in range(size):
+                p = self.probs[h * size + a]
+                if h > a:
+                    home_win += p
+                elif h == a:
+                    draw += p
+                else:
+                    away_win += p
+                home_xg += h * p
+                away_xg += a * p
+                if p > best_p:
+                    best, best_p = (h, a), p
+        return {
+            'home_win': home_win,
+            'draw': draw,
+            'away_win': away_win,
+            'home_points': 3 * home_win + draw,
+            'away_points': 3 * away_win + draw,
+            'home_goals': home_xg,
+            'away_goals': away_xg,
+            'most_likely': best,
+        }
+
+    @property
+    def summary(self) -> Dict:
+        """Exact outcome probabilities, expected points and goals, and the most likely score."""
+        if self._summary is None:
+            self._summary = self._summarize()
+        return self._summary
+
+    def outcome_probs(self) -> Tuple[float, float, float]:
+        """(home win, draw, away win) probabilities."""
+        s = self.summary
+        return s['home_win'], s['draw'], s['away_win']
+
+    def expected_points(self) -> Tuple[float, float]:
+        """(home, away) expected league points."""
+        s = self.summary
+        return s['home_points'], s['away_points']
+
+    def _build_alias(self):
+        """Vose alias table over the grid cells."""
+        n = len(self.probs)
+        scaled = [p * n for p in self.probs]
+        accept = [0.0] * n
+        alias = [0] * n
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            accept[s] = scaled[s]
+            alias[s] = g
+            scaled[g] -= 1.0 - scaled[s]
+            (small if scaled[g] < 1.0 else large).append(g)
+        for i in large + small:
+            accept[i] = 1.0
+        self._accept = accept
+        self._alias = alias
+
+    def sample(self, rng: Optional[random.Random] = None) -> Tuple[int, int]:
+        """Draw a (home_goals, away_goals) scoreline in O(1)."""
+        if self._alias is None:
+            self._build_alias()
+        u = (rng or random).random() * len(self._accept)
+        i = int(u)
+        if u - i >= self._accept[i]:
+            i = self._alias[i]
+        return divmod(i, MAX_GOALS + 1)
+
+    def __repr__(self):
+        h, d, a = self.outcome_probs()
+        return f"<ScoreGrid λ={self.lam_home:.2f}-{self.lam_away:.2f} W/D/L={h:.2f}/{d:.2f}/{a:.2f}>"
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def score_grid(lam_home: float, lam_away: float, rho: float = DC_RHO) -> ScoreGrid:
+    """Cached grid for rounded expected goals (see expected_goals)."""
+    return ScoreGrid(lam_home, lam_away, rho)
+
+
+def _clamp_lambda(lam: float) -> float:
+    return round(max(MIN_LAMBDA, min(MAX_LAMBDA, lam)), LAMBDA_DECIMALS)
+
+
+def expected_goals(home_prof: Dict, away_prof: Dict) -> Tuple[float, float]:
+    """
+    Expected goals for both sides from Club.get_quick_profile() dicts.
+
+    Each side's rate is the geometric mean of its attack (xg) and the opponent's
+    defence (xga). The home side gets HOME_ADVANTAGE.
+
+    Returns:
+        tuple: (home λ, away λ) rounded to LAMBDA_DECIMALS
+    """
+    lam_home = math.sqrt(home_prof['xg'] * away_prof['xga']) * HOME_ADVANTAGE
+    lam_away = math.sqrt(away_prof['xg'] * home_prof['xga'])
+    return _clamp_lambda(lam_home), _clamp_lambda(lam_away)
+
+
+def matchup_grid(home_prof: Dict, away_prof: Dict) -> ScoreGrid:
+    """Scoreline grid for a home/away pair of quick profiles."""
+    return score_grid(*expected_goals(home_prof, away_prof))
+
+
+def forecast(home, away) -> Dict:
+    """Exact forecast for a fixture between two Club objects (see ScoreGrid.summary)."""
+    return matchup_grid(home.get_quick_profile(), away.get_quick_profile()).summary
@@ -0,0 +1,283 @@
+"""
+Match stats module - League-wide per-player match statistics, drawn and stored in columns.
+
+Every roster player of every played fixture gets goals, assists, cards and a
+match rating, not just the agent's clients. A matchday is one vectorized draw
+over all roster players (MatchdayLineups, compiled once per roster change):
+- goals: each team goal goes to one player of the XI, weighted by position
+  share (match_engine POSITION_GOAL_SHARE) x quality against the team average
+- assists: ASSISTED_GOALS of the goals get an assister other than the scorer,
+  weighted by POSITION_ASSIST_SHARE x quality
+- cards: per player, base rate raised for volatile personality categories
+- rating: the match_engine rating model (result, goals, assists, clean sheet,
+  cards, noise) for a 90-minute appearance
+Results are added to MatchStatsStore, NumPy columns indexed by a row per
+player ID, so season totals, averages and league-wide rankings for scouting
+are array operations.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from leaderboards import MIN_RATED_APPEARANCES
+from match_engine import (
+    ASSISTED_GOALS,
+    DEFAULT_ASSIST_SHARE,
+    DEFAULT_GOAL_SHARE,
+    DEFENSIVE_POSITIONS,
+    POSITION_ASSIST_SHARE,
+    POSITION_GOAL_SHARE,
+    RED_PER_90,
+    YELLOW_PER_90,
+)
+
+STAT_COLUMNS = ('appearances', 'minutes', 'goals', 'assists', 'yellow_cards', 'red_cards', 'rating_sum')
+# Card-rate multiplier per personality category (roster players carry no temperament)
+CATEGORY_TEMPER = {'Best': 0.8, 'Good': 0.9, 'Neutral': 1.0, 'Moderate': 1.0, 'Bad': 1.4, 'Worst': 1.7}
+
+
+class MatchStatsStore:
+    """Season match statistics of every player, one row per player ID."""
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self._rows: Dict[int, int] = {}
+        self._ids: List[int] = []
+        self._columns = {name: np.zeros(capacity) for name in STAT_COLUMNS}
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, player_id):
+        return player_id in self._rows
+
+    def rows(self, player_ids: Iterable[int]) -> np.ndarray:
+        """Row of each player ID (new IDs get a new row)."""
+        rows = self._rows
+        result = []
+        for player_id in player_ids:
+            row = rows.get(player_id)
+            if row is None:
+                row = rows[player_id] = len(self._ids)
+                self._ids.append(player_id)
+            result.append(row)
+        capacity = len(self._columns['appearances'])
+        if len(self._ids) > capacity:
+            size = max(len(self._ids), 2 * capacity)
+            for name, column in self._columns.items():
+                grown = np.zeros(size)
+                grown[:capacity] = column
+                self._columns[name] = grown
+        return np.array(result, dtype=np.intp)
+
+    def add(self, rows: np.ndarray, minutes, goals, assists, yellow_cards, red_cards, ratings):
+        """
+        Add one match for each row (rows must be unique within a call).
+
+        Args:
+            rows: Rows from rows()
+            minutes, goals, assists, yellow_cards, red_cards, ratings: Parallel arrays (or scalars)
+        """
+        columns = self._columns
+        columns['appearances'][rows] += 1
+        columns['minutes'][rows] += minutes
+        columns['goals'][rows] += goals
+        columns['assists'][rows] += assists
+        columns['yellow_cards'][rows] += yellow_cards
+        columns['red_cards'][rows] += red_cards
+        columns['rating_sum'][rows] += ratings
+
+    def record_line(self, player_id: int, line: Dict):
+        """Add a single player_match_line() dict (the agent's clients)."""
+        self.add(self.rows([player_id]), line['minutes'], line['goals'], line['assists'],
+                 line['yellow_card'], line['red_card'], line['rating'])
+
+    def column(self, name: str) -> np.ndarray:
+        """A stat column for all players, in row order (see ids)."""
+        return self._columns[name][:len(self._ids)]
+
+    @property
+    def ids(self) -> List[int]:
+        return self._ids
+
+    def season_ratings(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Season average rating and appearances of rows that have played (see rows())."""
+        appearances = self._columns['appearances'][rows]
+        return self._columns['rating_sum'][rows] / appearances, appearances
+
+    def average_ratings(self) -> np.ndarray:
+        appearances = self.column('appearances')
+        return np.divide(self.column('rating_sum'), appearances, out=np.zeros(len(appearances)),
+                         where=appearances > 0)
+
+    def player(self, player_id: int) -> Optional[Dict]:
+        """
+        Season line of one player.
+
+        Returns:
+            dict: STAT_COLUMNS as ints plus 'avg_rating', or None if the player has no row
+        """
+        row = self._rows.get(player_id)
+        if row is None:
+            return None
+        stats = {name: int(self._columns[name][row]) for name in STAT_COLUMNS if name != 'rating_sum'}
+        apps = stats['appearances']
+        stats['avg_rating'] = round(self._columns['rating_sum'][row] / apps, 2) if apps else 0.0
+        return stats
+
+    def top(self, stat: str, k: int = 10, min_appearances: int = 0) -> List[Tuple[int, float]]:
+        """
+        League-wide ranking for a stat ('avg_rating' or a STAT_COLUMNS name).
+
+        Returns:
+            list: (player ID, value), best first
+        """
+        if not self._ids:
+            return []
+        values = self.average_ratings() if stat == 'avg_rating' else self.column(stat)
+        if stat == 'avg_rating':
+            min_appearances = max(min_appearances, MIN_RATED_APPEARANCES)
+        eligible = np.flatnonzero(self.column('appearances') >= max(min_appearances, 1))
+        if not len(eligible):
+            return []
+        order = eligible[np.argsort(-values[eligible], kind='stable')[:k]]
+        return [(self._ids[row], float(values[row])) for row in order]
+
+    def reset(self, keep: Optional[Iterable[int]] = None):
+        """
+        Zero all stats for a new season.
+
+        Args:
+            keep: Player IDs that keep a row (default: all); the others are dropped and rows renumbered,
+                  so lineups compiled against the old rows must be rebuilt
+        """
+        if keep is None:
+            for column in self._columns.values():
+                column[:] = 0.0
+            return
+        self._ids = list(dict.fromkeys(keep))
+        self._rows = {player_id: row for row, player_id in enumerate(self._ids)}
+        size = max(self.capacity, len(self._ids))
+        self._columns = {name: np.zeros(size) for name in STAT_COLUMNS}
+
+
+class MatchdayLineups:
+    """Roster players of all clubs as columns, clubs contiguous, for the matchday draw."""
+
+    def __init__(self, clubs: Iterable, rosters: Dict[str, List[Dict]], store: MatchStatsStore):
+        """
+        Args:
+            clubs: Clubs with rosters (clubs without one are skipped)
+            rosters: {club name: [roster player dict]}
+            store: Store the rows are allocated in
+        """
+        self.clubs = [club for club in clubs if rosters.get(club.name)]
+        self.club_index = {club.name: i for i, club in enumerate(self.clubs)}
+        self.players = [p for club in self.clubs for p in rosters[club.name]]
+        sizes = [len(rosters[club.name]) for club in self.clubs]
+        self.club_idx = np.repeat(np.arange(len(self.clubs)), sizes)
+        self.club_range = np.arange(len(self.clubs))
+        self.sizes = np.array(sizes, dtype=float)
+        self.start = np.concatenate(([0], np.cumsum(sizes)[:-1])).astype(np.intp)
+        self.end = self.start + np.array(sizes, dtype=np.intp)
+        self.last = self.end - 1
+        positions = [p['position'] for p in self.players]
+        self.goal_share = np.array([POSITION_GOAL_SHARE.get(pos, DEFAULT_GOAL_SHARE) for pos in positions])
+        self.assist_share = np.array([POSITION_ASSIST_SHARE.get(pos, DEFAULT_ASSIST_SHARE) for pos in positions])
+        self.defensive = np.array([pos in DEFENSIVE_POSITIONS for pos in positions])
+        self.temper = np.array([CATEGORY_TEMPER.get(p['category'], 1.0) for p in self.players])
+        self.ids = [p['id'] for p in self.players]
+        self.names = [p['name'] for p in self.players]
+        self.club_names = [club.name for club, size in zip(self.clubs, sizes) for _ in range(size)]
+        self.rows = store.rows(self.ids)
+
+    def __len__(self):
+        return len(self.players)
+
+    def club_slice(self, club_name: str) -> slice:
+        i = self.club_index[club_name]
+        return slice(int(self.start[i]), int(self.end[i]))
+
+
+def _pick(weights, lineups, clubs, u, skip=None):
+    """
+    One lineup index per entry of `clubs`, with probability proportional to `weights` within the club.
+
+    Args:
+        u: Uniform [0, 1) draws, one per entry
+        skip: Optional index per entry to exclude (e.g. the scorer when picking the assister)
+    """
+    cum = np.cumsum(weights)
+    start_cum = cum[lineups.start] - weights[lineups.start]
+    span = cum[lineups.last] - start_cum
+    if skip is None:
+        target = start_cum[clubs] + u * span[clubs]
+    else:
+        skipped = weights[skip]
+        target = start_cum[clubs] + u * (span[clubs] - skipped)
+        target += (target >= cum[skip] - skipped) * skipped  # jump over the excluded player's interval
+    return np.minimum(np.searchsorted(cum, target, side='right'), lineups.last[clubs])
+
+
+def draw_matchday(lineups: MatchdayLineups, scores: Dict[str, Tuple[int, int]], rng) -> Dict[str, np.ndarray]:
+    """
+    Player lines for every roster player whose club played.
+
+    Args:
+        lineups: Compiled rosters
+        scores: {club name: (goals for, goals against)} of the matchday
+        rng: numpy Generator
+
+    Returns:
+        dict: 'played' (bool mask) plus 'goals', 'assists', 'yellow_cards', 'red_cards', 'ratings'
+              arrays over all roster players (zeros for clubs that did not play)
+    """
+    n, n_clubs = len(lineups), len(lineups.clubs)
+    goals_for = np.zeros(n_clubs, dtype=np.intp)
+    goals_against = np.zeros(n_clubs, dtype=np.intp)
+    played_clubs = np.zeros(n_clubs, dtype=bool)
+    club_index = lineups.club_index
+    for name, (gf, ga) in scores.items():
+        i = club_index.get(name)
+        if i is not None:
+            goals_for[i], goals_against[i], played_clubs[i] = gf, ga, True
+    idx = lineups.club_idx
+    played = played_clubs[idx]
+
+    skill = np.fromiter([p['skill_rating'] for p in lineups.players], float, n)
+    club_average = np.add.reduceat(skill, lineups.start) / lineups.sizes
+    quality = np.clip(skill / club_average[idx], 0.7, 1.4)
+
+    goal_clubs = np.repeat(lineups.club_range, goals_for)
+    n_goals = len(goal_clubs)
+    u = rng.random(3 * n + 2 * n_goals)  # one draw for the whole matchday
+
+    # Goals: one scorer per team goal; most goals get an assister other than the scorer
+    scorers = _pick(lineups.goal_share * quality, lineups, goal_clubs, u[3 * n:3 * n + n_goals])
+    assisted = u[3 * n + n_goals:] < ASSISTED_GOALS
+    assist_clubs, assisted_scorers = goal_clubs[assisted], scorers[assisted]
+    reuse = u[3 * n + n_goals:][assisted] / ASSISTED_GOALS  # uniform again, given that it was assisted
+    assisters = _pick(lineups.assist_share * quality, lineups, assist_clubs, reuse, skip=assisted_scorers)
+    goals = np.bincount(scorers, minlength=n)
+    assists = np.bincount(assisters[assisters != assisted_scorers], minlength=n)
+
+    # Cards
+    yellow = (u[:n] < YELLOW_PER_90 * lineups.temper) & played
+    red = (u[n:2 * n] < RED_PER_90 * lineups.temper) & played & ~yellow
+
+    # Rating (match_engine model, full 90 minutes)
+    gf, ga = goals_for[idx], goals_against[idx]
+    ratings = 5.5 + u[2 * n:3 * n] + goals * 1.5 + assists * 1.0 + 0.4 * np.sign(gf - ga)
+    ratings += 0.3 * ((ga == 0) & lineups.defensive) - 0.3 * yellow - 1.5 * red
+    ratings = np.round(np.clip(ratings, 1.0, 10.0), 1) * played
+
+    return {'played': played, 'goals': goals, 'assists': assists,
+            'yellow_cards': yellow, 'red_cards': red, 'ratings': ratings}
+
+
+def record_matchday(store: MatchStatsStore, lineups: MatchdayLineups, lines: Dict[str, np.ndarray]):
+    """Add a draw_matchday() result to the store (players who played only)."""
+    played = lines['played']
+    store.add(lineups.rows[played], 90, lines['goals'][played], lines['assists'][played],
+              lines['yellow_cards'][played], lines['red_cards'][played], lines['ratings'][played])
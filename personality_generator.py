@@ -4,6 +4,7 @@ Interactive personality generator - Generate random players with different perso
 
 import random
 from player import Player
+from personality_sampler import apply_personality
 
 def generate_random_mental_attributes():
     """Generate random mental attributes following a normal distribution"""
@@ -19,9 +20,15 @@ def generate_random_mental_attributes():
         'temperament': max(1, min(20, int(random.gauss(12, 4))))
     }
 
-def generate_player_with_personality(name, age, position, is_regen=False):
-    """Generate a player with random mental attributes and personality"""
+def generate_player_with_personality(name, age, position, is_regen=False, personality=None, media_handling=None):
+    """Generate a player with random mental attributes and personality
+
+    A requested personality/media handling is built directly by personality_sampler
+    (raises ValueError if the if-chain cannot produce it for this age/regen flag).
+    """
     player = Player(name, age, position)
+    if personality is not None:
+        return apply_personality(player, personality, media_handling, is_regen=is_regen)
     attrs = generate_random_mental_attributes()
     player.set_mental_attributes(**attrs)
     player.update_personality(is_regen=is_regen)
@@ -3,123 +3,130 @@ Personality Impact module - loads configuration and provides helper functions
 for team cohesion, conflict probability, and performance influence.
 """
 
-import json
-import os
 import random
 from typing import Dict, Optional, List
 
-CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'personality_impacts.json')
+from impact_config import CONFIG_PATH, CompiledConfig, current_config, get_service, load_config
+
+# Config sections, read on first use instead of at import time
+_SECTIONS = {
+    '_LEVELS': 'levels',
+    '_DEFAULTS': 'defaults',
+    '_PERSONALITIES': 'personalities',
+    '_ALIAS': 'performance_alias',
+    '_CAPS': 'caps',
+    '_DEV': 'development',
+    '_RENEW': 'renewal',
+}
 
 
 def _load_config() -> Dict:
-    with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return load_config(CONFIG_PATH)
+
 
+def __getattr__(name):
+    """Keep the old module-level names (_CONFIG, _LEVELS, ...) available lazily."""
+    if name == '_CONFIG':
+        return _load_config()
+    if name in _SECTIONS:
+        return _load_config()[_SECTIONS[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-_CONFIG = _load_config()
-_LEVELS = _CONFIG['levels']
-_DEFAULTS = _CONFIG['defaults']
-_PERSONALITIES = _CONFIG['personalities']
-_ALIAS = _CONFIG['performance_alias']
-_CAPS = _CONFIG['caps']
-_DEV = _CONFIG['development']
-_RENEW = _CONFIG['renewal']
 
+def pin_config(reload: bool = True) -> CompiledConfig:
+    """Return the config version a simulation step should use, picking up file changes first."""
+    if reload:
+        get_service(CONFIG_PATH).reload_if_changed()
+    return current_config(CONFIG_PATH)
 
-def get_profile(personality_name: str, category: Optional[str] = None) -> Dict:
+
+def get_profile(personality_name: str, category: Optional[str] = None,
+                config: Optional[CompiledConfig] = None) -> Dict:
     """Return impact profile (levels) for a personality, falling back to category defaults."""
-    p = _PERSONALITIES.get(personality_name)
-    if p:
-        perf_level = p.get('performance_level')
-        if perf_level in _ALIAS:
-            perf_level = _ALIAS[perf_level]
-        return {
-            'performance': _LEVELS.get(perf_level, _LEVELS['Moderate']),
-            'cohesion': _LEVELS.get(p.get('cohesion_level', 'Moderate'), _LEVELS['Moderate']),
-            'conflict': _LEVELS.get(p.get('conflict_level', 'Medium'), _LEVELS['Medium']),
-        }
-    # fallback to category defaults
-    cat = category or 'Neutral'
-    defaults = _DEFAULTS.get(cat, _DEFAULTS['Neutral'])
-    perf_level = defaults['performance_level']
-    return {
-        'performance': _LEVELS.get(perf_level, _LEVELS['Moderate']),
-        'cohesion': _LEVELS.get(defaults['cohesion_level'], _LEVELS['Moderate']),
-        'conflict': _LEVELS.get(defaults['conflict_level'], _LEVELS['Medium']),
-    }
-
-
-def performance_multiplier(personality_name: str, category: Optional[str] = None) -> float:
+    cfg = config or current_config(CONFIG_PATH)
+    return cfg.profile(personality_name, category)
+
+
+def performance_multiplier(personality_name: str, category: Optional[str] = None,
+                           config: Optional[CompiledConfig] = None) -> float:
     """Compute small performance multiplier for a match, bounded by caps."""
-    prof = _PERSONALITIES.get(personality_name)
-    level_map = get_profile(personality_name, category)
+    cfg = config or current_config(CONFIG_PATH)
     # Special handling for 'Unpredictable'
-    if prof and prof.get('performance_level') == 'Unpredictable':
+    if personality_name in cfg.unpredictable:
         # 10% spike, 10% dip, else normal around 0 within caps
         r = random.random()
         if r < 0.10:
-            delta = _CAPS['performance_max']
+            delta = cfg.performance_max
         elif r < 0.20:
-            delta = _CAPS['performance_min']
+            delta = cfg.performance_min
         else:
-            delta = max(_CAPS['performance_min'], min(_CAPS['performance_max'], random.gauss(0.0, 0.01)))
+            delta = max(cfg.performance_min, min(cfg.performance_max, random.gauss(0.0, 0.01)))
         return delta
     # Normal mapping
-    delta = level_map['performance']['performance']
-    return max(_CAPS['performance_min'], min(_CAPS['performance_max'], delta))
+    delta = cfg.profile(personality_name, category)['performance']['performance']
+    return max(cfg.performance_min, min(cfg.performance_max, delta))
+
+
+def expected_performance_multiplier(personality_name: str, category: Optional[str] = None,
+                                    config: Optional[CompiledConfig] = None) -> float:
+    """Average factor on a player's rating: 1 + expected performance_multiplier (no randomness)."""
+    cfg = config or current_config(CONFIG_PATH)
+    if personality_name in cfg.unpredictable:
+        return 1.0 + 0.10 * cfg.performance_max + 0.10 * cfg.performance_min
+    delta = cfg.profile(personality_name, category)['performance']['performance']
+    return 1.0 + max(cfg.performance_min, min(cfg.performance_max, delta))
 
 
-def weekly_cohesion_delta(starters: List[Dict]) -> float:
+def weekly_cohesion_delta(starters: List[Dict], config: Optional[CompiledConfig] = None) -> float:
     """Compute weekly cohesion delta from starters' profiles.
     starters: list of dicts with keys {'personality_name', 'category'}
     """
     if not starters:
         return 0.0
+    cfg = config or current_config(CONFIG_PATH)
     total = 0.0
     for s in starters:
-        prof = get_profile(s.get('personality_name', ''), s.get('category'))
+        prof = cfg.profile(s.get('personality_name', ''), s.get('category'))
         total += prof['cohesion']['cohesion']
     avg = total / max(1, len(starters))
     # cap weekly
-    return max(-_CAPS['cohesion_weekly_cap'], min(_CAPS['cohesion_weekly_cap'], avg))
+    return max(-cfg.cohesion_weekly_cap, min(cfg.cohesion_weekly_cap, avg))
 
 
-def weekly_conflict_probability(personality_name: str, category: Optional[str] = None) -> float:
+def weekly_conflict_probability(personality_name: str, category: Optional[str] = None,
+                                config: Optional[CompiledConfig] = None) -> float:
     """Compute probability of conflict event for a player in a given week."""
-    base = _CAPS['conflict_base_weekly']
-    prof = get_profile(personality_name, category)
-    extra = prof['conflict']['conflict']
-    return max(0.0005, min(0.010, base + extra))
+    cfg = config or current_config(CONFIG_PATH)
+    extra = cfg.profile(personality_name, category)['conflict']['conflict']
+    return max(0.0005, min(0.010, cfg.conflict_base_weekly + extra))
 
 
 def skill_growth_chance(personality_name: str,
                         category: Optional[str] = None,
                         rating_vs_team_avg: float = 0.0,
-                        training_quality: int = 12) -> float:
+                        training_quality: int = 12,
+                        config: Optional[CompiledConfig] = None) -> float:
     """Weekly probability of skill improvement.
     - Base from development weekly per level (mapped from performance level).
     - Boosts: positive performance diff (>= +5) adds small bonus; negative lowers.
     - Training quality (1-20) scaled by small factor.
     """
-    prof = _PERSONALITIES.get(personality_name)
-    perf_level = None
-    if prof:
-        perf_level = prof.get('performance_level')
-        if perf_level in _ALIAS:
-            perf_level = _ALIAS[perf_level]
+    cfg = config or current_config(CONFIG_PATH)
+    perf_level = cfg.perf_levels.get(personality_name)
     if not perf_level:
-        perf_level = _DEFAULTS.get(category or 'Neutral', _DEFAULTS['Neutral'])['performance_level']
+        perf_level = cfg.category_perf_levels.get(category or 'Neutral', cfg.category_perf_levels['Neutral'])
 
-    base = _DEV['weekly_base'].get(perf_level, _DEV['weekly_base']['Moderate'])
+    base = cfg.growth_base.get(perf_level, cfg.growth_base['Moderate'])
+    boosts = cfg.growth_boosts
     boost = 0.0
     if rating_vs_team_avg >= 5.0:
-        boost += _DEV['boosts']['positive_performance']
+        boost += boosts['positive_performance']
     elif rating_vs_team_avg <= -5.0:
-        boost += _DEV['boosts']['negative_performance']
+        boost += boosts['negative_performance']
     # training scaling
-    boost += (max(1, min(20, training_quality)) - 10) * _DEV['boosts']['training_quality_scale']
+    boost += (max(1, min(20, training_quality)) - 10) * boosts['training_quality_scale']
     prob = base + boost
-    return max(_DEV['caps']['weekly_min'], min(_DEV['caps']['weekly_max'], prob))
+    return max(cfg.growth_min, min(cfg.growth_max, prob))
 
 
 def renewal_intent_probability(personality_name: str,
@@ -127,16 +134,18 @@ def renewal_intent_probability(personality_name: str,
                                cohesion_index: float = 60.0,
                                meets_objective: bool = False,
                                performance_diff: float = 0.0,
-                               player_morale: float = 60.0) -> float:
+                               player_morale: float = 60.0,
+                               config: Optional[CompiledConfig] = None) -> float:
     """Probability the player wants to renew, based on personality and happiness metrics.
     Returns a probability in [min, max]. Intended to be evaluated near contract end.
     """
-    base = _RENEW['base_by_personality'].get(personality_name)
+    cfg = config or current_config(CONFIG_PATH)
+    base = cfg.renew_base_personality.get(personality_name)
     if base is None:
         cat = category or 'Neutral'
-        base = _RENEW['base_by_category'].get(cat, 0.06)
+        base = cfg.renew_base_category.get(cat, 0.06)
 
-    w = _RENEW['weights']
+    w = cfg.renew_weights
     delta = 0.0
     # Normalize indices
     delta += (cohesion_index - 50.0) * w['cohesion_index']  # above average adds
@@ -145,7 +154,7 @@ def renewal_intent_probability(personality_name: str,
     delta += (player_morale - 50.0) * w['player_morale']
 
     prob = base + delta
-    return max(_RENEW['caps']['min'], min(_RENEW['caps']['max'], prob))
+    return max(cfg.renew_min, min(cfg.renew_max, prob))
 
 
 def team_morale_delta(result: str, meets_objective: bool, cohesion_monthly_change: float) -> float:
@@ -0,0 +1,195 @@
+"""
+Personality rules module - The personality and media handling matrices as data,
+plus vectorized classifiers for batches of players.
+
+The rule order mirrors the if-chains in Player.calculate_personality and
+Player.calculate_media_handling: the first matching rule wins.
+"""
+
+import numpy as np
+
+# Column order used by every mental attribute matrix in the game
+MENTAL_ATTRIBUTES = [
+    'determination', 'leadership', 'ambition', 'loyalty', 'pressure',
+    'professionalism', 'sportsmanship', 'temperament', 'concentration',
+]
+MENTAL_INDEX = {attr: i for i, attr in enumerate(MENTAL_ATTRIBUTES)}
+
+# Each rule: name, inclusive attribute ranges, minimum age and regen-only flag.
+# 'favourite_name' replaces the name when the player plays for his favourite club.
+PERSONALITY_RULES = [
+    # ========== BEST PERSONALITIES ==========
+    {'name': 'Model Citizen', 'ranges': {
+        'professionalism': (15, 20), 'pressure': (14, 20), 'ambition': (12, 20), 'temperament': (15, 20),
+        'loyalty': (15, 20), 'sportsmanship': (15, 20), 'determination': (14, 20)}},
+    {'name': 'Model Professional', 'min_age': 23, 'ranges': {'professionalism': (20, 20)}},
+    # ========== GOOD PERSONALITIES ==========
+    {'name': 'Charismatic Leader', 'min_age': 23, 'ranges': {
+        'temperament': (18, 20), 'concentration': (18, 20), 'leadership': (18, 20)}},
+    {'name': 'Born Leader', 'min_age': 23, 'ranges': {
+        'determination': (20, 20), 'concentration': (20, 20), 'leadership': (20, 20)}},
+    {'name': 'Leader', 'min_age': 23, 'ranges': {'determination': (19, 20), 'leadership': (19, 20)}},
+    {'name': 'Perfectionist', 'ranges': {'professionalism': (14, 20), 'temperament': (1, 9)}},
+    {'name': 'Professional', 'ranges': {'professionalism': (18, 19)}},
+    {'name': 'Fairly Professional', 'ranges': {'professionalism': (15, 20)}},
+    {'name': 'Iron Willed', 'ranges': {'pressure': (20, 20), 'determination': (15, 17), 'concentration': (5, 20)}},
+    {'name': 'Resolute', 'ranges': {
+        'professionalism': (15, 20), 'pressure': (1, 16), 'determination': (12, 20), 'concentration': (15, 17)}},
+    {'name': 'Resilient', 'ranges': {'determination': (15, 17), 'concentration': (5, 20), 'leadership': (15, 17)}},
+    {'name': 'Spirited', 'ranges': {
+        'professionalism': (11, 17), 'pressure': (15, 20), 'loyalty': (10, 20), 'determination': (1, 14),
+        'concentration': (1, 17)}},
+    {'name': 'Driven', 'ranges': {'ambition': (12, 20), 'determination': (17, 20)}},
+    {'name': 'Determined', 'ranges': {'ambition': (1, 11), 'determination': (17, 20)}},
+    {'name': 'Fairly Determined', 'ranges': {
+        'professionalism': (1, 14), 'pressure': (1, 16), 'determination': (12, 20), 'concentration': (15, 17)}},
+    # ========== NEUTRAL PERSONALITIES ==========
+    {'name': 'Very Ambitious', 'ranges': {
+        'ambition': (20, 20), 'loyalty': (1, 10), 'determination': (1, 17), 'concentration': (1, 17)}},
+    {'name': 'Ambitious', 'ranges': {
+        'ambition': (16, 20), 'loyalty': (1, 10), 'determination': (1, 17), 'concentration': (1, 17)}},
+    {'name': 'Fairly Ambitious', 'ranges': {'professionalism': (1, 14), 'ambition': (15, 20), 'concentration': (1, 14)}},
+    {'name': 'Very Loyal', 'favourite_name': 'Devoted', 'ranges': {'ambition': (5, 8), 'concentration': (18, 20)}},
+    {'name': 'Loyal', 'ranges': {
+        'professionalism': (1, 7), 'loyalty': (17, 19), 'determination': (6, 17), 'concentration': (1, 14)}},
+    {'name': 'Fairly Loyal', 'ranges': {
+        'professionalism': (1, 14), 'ambition': (6, 14), 'loyalty': (15, 20), 'concentration': (1, 14)}},
+    {'name': 'Light-Hearted', 'ranges': {
+        'professionalism': (1, 17), 'pressure': (15, 20), 'loyalty': (10, 20), 'determination': (15, 20),
+        'concentration': (1, 17)}},
+    {'name': 'Jovial', 'ranges': {
+        'professionalism': (1, 10), 'pressure': (15, 20), 'temperament': (10, 20), 'determination': (1, 14),
+        'concentration': (1, 17)}},
+    {'name': 'Honest', 'ranges': {
+        'professionalism': (5, 20), 'sportsmanship': (20, 20), 'determination': (1, 10), 'concentration': (1, 10)}},
+    {'name': 'Sporting', 'ranges': {
+        'professionalism': (8, 20), 'loyalty': (18, 20), 'sportsmanship': (1, 10), 'determination': (1, 10),
+        'concentration': (1, 10)}},
+    {'name': 'Fairly Sporting', 'ranges': {
+        'professionalism': (1, 14), 'ambition': (1, 14), 'loyalty': (1, 14), 'sportsmanship': (15, 20),
+        'concentration': (1, 14)}},
+    {'name': 'Balanced', 'ranges': {
+        'professionalism': (1, 14), 'ambition': (1, 14), 'loyalty': (1, 14), 'sportsmanship': (1, 14),
+        'determination': (1, 14), 'concentration': (1, 14)}},
+    # ========== BAD PERSONALITIES (regen only) ==========
+    {'name': 'Fickle', 'regen_only': True, 'ranges': {
+        'professionalism': (1, 14), 'pressure': (15, 20), 'loyalty': (1, 14), 'determination': (1, 14),
+        'concentration': (1, 14)}},
+    {'name': 'Mercenary', 'regen_only': True, 'ranges': {'ambition': (16, 20), 'loyalty': (1, 6)}},
+    # ========== WORST PERSONALITIES (regen only) ==========
+    {'name': 'Slack', 'regen_only': True, 'ranges': {
+        'professionalism': (1, 1), 'temperament': (5, 20), 'determination': (1, 9)}},
+    {'name': 'Casual', 'regen_only': True, 'ranges': {
+        'professionalism': (2, 4), 'temperament': (5, 20), 'determination': (1, 9)}},
+    {'name': 'Temperamental', 'regen_only': True, 'ranges': {
+        'professionalism': (1, 10), 'temperament': (1, 4), 'concentration': (1, 17), 'leadership': (1, 1)}},
+    {'name': 'Easily Discouraged', 'regen_only': True, 'ranges': {
+        'professionalism': (5, 20), 'temperament': (1, 10), 'determination': (1, 5)}},
+    {'name': 'Low Determination', 'regen_only': True, 'ranges': {
+        'professionalism': (5, 20), 'temperament': (1, 10), 'determination': (1, 5), 'concentration': (2, 5)}},
+    {'name': 'Spineless', 'regen_only': True, 'ranges': {
+        'professionalism': (5, 20), 'pressure': (1, 1), 'determination': (1, 5), 'concentration': (1, 17),
+        'leadership': (1, 10)}},
+    {'name': 'Low Self-Belief', 'regen_only': True, 'ranges': {
+        'professionalism': (5, 20), 'pressure': (2, 3), 'determination': (1, 5), 'concentration': (1, 17),
+        'leadership': (1, 10)}},
+    {'name': 'Unambitious', 'regen_only': True, 'ranges': {
+        'professionalism': (5, 20), 'ambition': (1, 5), 'loyalty': (11, 20), 'determination': (1, 5),
+        'concentration': (1, 17)}},
+    {'name': 'Unsporting', 'regen_only': True, 'ranges': {
+        'temperament': (1, 1), 'sportsmanship': (1, 6), 'determination': (10, 17)}},
+    {'name': 'Realist', 'regen_only': True, 'ranges': {
+        'professionalism': (1, 4), 'ambition': (1, 4), 'temperament': (1, 4)}},
+]
+
+MEDIA_HANDLING_RULES = [
+    # ========== BEST MEDIA HANDLING ==========
+    {'name': 'Confrontational', 'ranges': {'ambition': (1, 4), 'temperament': (1, 4)}},
+    # ========== GOOD MEDIA HANDLING ==========
+    {'name': 'Evasive', 'ranges': {'pressure': (15, 20), 'ambition': (15, 20), 'concentration': (6, 14)}},
+    {'name': 'Level-Headed', 'ranges': {'temperament': (7, 20), 'concentration': (11, 20), 'determination': (1, 14)}},
+    {'name': 'Media-Friendly', 'ranges': {'concentration': (1, 14), 'leadership': (1, 14)}},
+    {'name': 'Outspoken', 'ranges': {'determination': (15, 20), 'sportsmanship': (15, 20)}},
+    {'name': 'Reserved', 'ranges': {'temperament': (7, 20), 'concentration': (1, 5)}},
+    {'name': 'Short-Tempered', 'ranges': {'ambition': (1, 4), 'pressure': (1, 4)}},
+    # ========== NEUTRAL MEDIA HANDLING ==========
+    {'name': 'Unflappable', 'ranges': {'pressure': (15, 20), 'temperament': (15, 20)}},
+    {'name': 'Volatile', 'ranges': {'temperament': (1, 6)}},
+]
+
+DEFAULT_PERSONALITY = 'Balanced'
+DEFAULT_MEDIA_HANDLING = 'Balanced'
+
+
+def _names(rules, default, extra=()):
+    names = []
+    for name in [r['name'] for r in rules] + [r['favourite_name'] for r in rules if 'favourite_name' in r]:
+        if name not in names:
+            names.append(name)
+    if default not in names:
+        names.append(default)
+    return names + [n for n in extra if n not in names]
+
+
+# Integer codes: PERSONALITY_NAMES[code] -> name
+PERSONALITY_NAMES = _names(PERSONALITY_RULES, DEFAULT_PERSONALITY)
+PERSONALITY_CODES = {name: code for code, name in enumerate(PERSONALITY_NAMES)}
+MEDIA_HANDLING_NAMES = _names(MEDIA_HANDLING_RULES, DEFAULT_MEDIA_HANDLING)
+MEDIA_HANDLING_CODES = {name: code for code, name in enumerate(MEDIA_HANDLING_NAMES)}
+
+
+def _rule_mask(rule, mental):
+    """Boolean mask of rows whose attributes fall inside every range of the rule."""
+    mask = np.ones(mental.shape[0], dtype=bool)
+    for attr, (lo, hi) in rule['ranges'].items():
+        col = mental[:, MENTAL_INDEX[attr]]
+        # Attributes are already clamped to 1-20, so open-ended bounds need no test
+        if lo > 1:
+            mask &= col >= lo
+        if hi < 20:
+            mask &= col <= hi
+    return mask
+
+
+def classify_personalities(mental, ages=None, is_regen=False, plays_for_favourite=False):
+    """
+    Vectorized Player.calculate_personality.
+
+    Args:
+        mental: (n, 9) array of mental attributes in MENTAL_ATTRIBUTES order
+        ages: (n,) ages; required by the 23+ rules (None means all under 23)
+        is_regen: bool or (n,) bool array enabling the bad/worst personalities
+        plays_for_favourite: bool or (n,) bool array (Very Loyal -> Devoted)
+
+    Returns:
+        np.ndarray: (n,) uint8 codes into PERSONALITY_NAMES
+    """
+    mental = np.asarray(mental)
+    n = mental.shape[0]
+    codes = np.full(n, PERSONALITY_CODES[DEFAULT_PERSONALITY], dtype=np.uint8)
+    adult = np.zeros(n, dtype=bool) if ages is None else np.asarray(ages) >= 23
+    regen = np.broadcast_to(np.asarray(is_regen, dtype=bool), (n,))
+    favourite = np.broadcast_to(np.asarray(plays_for_favourite, dtype=bool), (n,))
+
+    # Walk the chain backwards so earlier (higher precedence) rules overwrite later ones
+    for rule in reversed(PERSONALITY_RULES):
+        if rule.get('regen_only') and not regen.any():
+            continue
+        mask = _rule_mask(rule, mental)
+        if rule.get('min_age'):
+            mask &= adult
+        if rule.get('regen_only'):
+            mask &= regen
+        codes[mask] = PERSONALITY_CODES[rule['name']]
+        if 'favourite_name' in rule:
+            codes[mask & favourite] = PERSONALITY_CODES[rule['favourite_name']]
+    return codes
+
+
+def classify_media_handling(mental):
+    """Vectorized Player.calculate_media_handling. Returns (n,) uint8 codes into MEDIA_HANDLING_NAMES."""
+    mental = np.asarray(mental)
+    codes = np.full(mental.shape[0], MEDIA_HANDLING_CODES[DEFAULT_MEDIA_HANDLING], dtype=np.uint8)
+    for rule in reversed(MEDIA_HANDLING_RULES):
+        codes[_rule_mask(rule, mental)] = MEDIA_HANDLING_CODES[rule['name']]
+    return codes
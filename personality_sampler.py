@@ -0,0 +1,253 @@
+"""
+Personality sampler module - Mental attributes for a requested personality, sampled constructively.
+
+Rare personalities ("Born Leader" needs determination, leadership and
+concentration at 20) almost never come out of random attributes, so drawing
+players until calculate_personality gives the wanted type can take millions
+of tries. Instead:
+1. each attribute is drawn from its default distribution (game_data
+   MENTAL_ATTRIBUTE_PROFILE, int(gauss) clamped to 1-20) truncated to the
+   ranges of the requested personality and media handling rules
+2. candidates are classified in batches (personality_rules) and only those
+   an earlier rule of the if-chain would claim are dropped
+The result is the default distribution conditioned on the requested outcome.
+
+The frequency table (data/personality_frequencies.json) gives how common each
+personality and media handling is under the default distribution, per age
+group and regen flag. Rebuild it with `python personality_sampler.py`.
+"""
+
+import json
+import math
+import os
+from functools import lru_cache
+from typing import Dict, Optional
+
+import numpy as np
+
+from game_data import MENTAL_ATTRIBUTE_PROFILE
+from personality_rules import (
+    DEFAULT_MEDIA_HANDLING,
+    DEFAULT_PERSONALITY,
+    MEDIA_HANDLING_CODES,
+    MEDIA_HANDLING_RULES,
+    MENTAL_ATTRIBUTES,
+    MENTAL_INDEX,
+    PERSONALITY_CODES,
+    PERSONALITY_RULES,
+    classify_media_handling,
+    classify_personalities,
+)
+
+FREQUENCY_PATH = os.path.join(os.path.dirname(__file__), 'data', 'personality_frequencies.json')
+ADULT_AGE = 23          # age from which the min_age rules apply
+BATCH_SIZE = 256        # candidates classified in the first round
+MAX_BATCH_SIZE = 65536  # cap on a round once the hit rate is known
+MAX_BATCHES = 200       # rounds in a row without a hit before a request is deemed unreachable
+AGE_GROUPS = {          # frequency table group -> (age, is_regen)
+    'under_23': (20, False),
+    'under_23_regen': (20, True),
+    '23_plus': (25, False),
+    '23_plus_regen': (25, True),
+}
+
+
+def attribute_distribution(mean: float, spread: float) -> np.ndarray:
+    """
+    P(value) for values 1..20 of max(1, min(20, int(gauss(mean, spread)))).
+
+    Returns:
+        np.ndarray: (20,) probabilities
+    """
+    def cdf(x):
+        return 0.5 * (1.0 + math.erf((x - mean) / (spread * math.sqrt(2.0))))
+
+    probs = [cdf(2)]  # int() truncates towards zero: everything below 2 ends up as 1
+    probs += [cdf(v + 1) - cdf(v) for v in range(2, 20)]
+    probs.append(1.0 - cdf(20))
+    return np.array(probs)
+
+
+# (9, 20) default distribution, MENTAL_ATTRIBUTES order
+DEFAULT_DISTRIBUTION = np.array([attribute_distribution(*MENTAL_ATTRIBUTE_PROFILE[attr])
+                                 for attr in MENTAL_ATTRIBUTES])
+
+
+def _find_rule(name, rules):
+    """(rule, needs plays_for_favourite) for a personality/media name, or (None, False)."""
+    for rule in rules:
+        if rule['name'] == name:
+            return rule, False
+        if rule.get('favourite_name') == name:
+            return rule, True
+    return None, False
+
+
+def _constrain(lo, hi, rule):
+    for attr, (low, high) in rule['ranges'].items():
+        i = MENTAL_INDEX[attr]
+        lo[i], hi[i] = max(lo[i], low), min(hi[i], high)
+
+
+def _sample_box(rng, lo, hi, n, distribution=DEFAULT_DISTRIBUTION) -> np.ndarray:
+    """(n, 9) attributes drawn from the distribution truncated to [lo, hi] per attribute."""
+    mental = np.empty((n, len(MENTAL_ATTRIBUTES)), dtype=np.int8)
+    for i in range(len(MENTAL_ATTRIBUTES)):
+        cdf = np.cumsum(distribution[i, lo[i] - 1:hi[i]])
+        mental[:, i] = lo[i] + np.searchsorted(cdf, rng.random(n) * cdf[-1], side='right').clip(0, hi[i] - lo[i])
+    return mental
+
+
+def _box_probability(lo, hi, distribution=DEFAULT_DISTRIBUTION) -> float:
+    return float(np.prod([distribution[i, lo[i] - 1:hi[i]].sum() for i in range(len(MENTAL_ATTRIBUTES))]))
+
+
+def sample_mental_attributes(personality: str, media_handling: Optional[str] = None, n: int = 1,
+                             age: int = 25, is_regen: bool = False, plays_for_favourite: bool = False,
+                             rng=None) -> np.ndarray:
+    """
+    Mental attributes that classify as the requested personality (and media handling).
+
+    Args:
+        personality: Personality name (PERSONALITY_NAMES)
+        media_handling: Media handling name, or None for any
+        n: Number of players
+        age, is_regen, plays_for_favourite: As passed to calculate_personality
+        rng: numpy Generator (default: a fresh one)
+
+    Returns:
+        np.ndarray: (n, 9) int8 attributes in MENTAL_ATTRIBUTES order
+
+    Raises:
+        ValueError: Unknown name, or a combination these settings cannot produce
+    """
+    if personality not in PERSONALITY_CODES:
+        raise ValueError(f"Unknown personality: {personality}")
+    if media_handling is not None and media_handling not in MEDIA_HANDLING_CODES:
+        raise ValueError(f"Unknown media handling: {media_handling}")
+    rng = rng if rng is not None else np.random.default_rng()
+
+    lo = [1] * len(MENTAL_ATTRIBUTES)
+    hi = [20] * len(MENTAL_ATTRIBUTES)
+    if personality != DEFAULT_PERSONALITY:  # the default also covers "no rule matched"
+        rule, favourite_only = _find_rule(personality, PERSONALITY_RULES)
+        if rule.get('min_age', 0) > age:
+            raise ValueError(f"{personality} needs age {rule['min_age']}+")
+        if rule.get('regen_only') and not is_regen:
+            raise ValueError(f"{personality} is only possible for regens")
+        if favourite_only and not plays_for_favourite:
+            raise ValueError(f"{personality} needs plays_for_favourite")
+        _constrain(lo, hi, rule)
+    if media_handling is not None and media_handling != DEFAULT_MEDIA_HANDLING:
+        _constrain(lo, hi, _find_rule(media_handling, MEDIA_HANDLING_RULES)[0])
+    if any(l > h for l, h in zip(lo, hi)):
+        raise ValueError(f"{personality} / {media_handling}: the attribute ranges do not overlap")
+
+    want_personality = PERSONALITY_CODES[personality]
+    want_media = MEDIA_HANDLING_CODES[media_handling] if media_handling is not None else None
+    found = []
+    total = drawn = misses = 0
+    batch = BATCH_SIZE
+    while misses < MAX_BATCHES:
+        candidates = _sample_box(rng, lo, hi, batch)
+        ages = np.full(batch, age)
+        keep = classify_personalities(candidates, ages, is_regen, plays_for_favourite) == want_personality
+        if want_media is not None:
+            keep &= classify_media_handling(candidates) == want_media
+        hits = candidates[keep]
+        found.append(hits)
+        total += len(hits)
+        drawn += batch
+        if total >= n:
+            return np.concatenate(found)[:n]
+        misses = misses + 1 if not len(hits) else 0
+        if total:  # size the next round for the hits still needed at the observed rate
+            batch = min(MAX_BATCH_SIZE, max(BATCH_SIZE, math.ceil(1.2 * (n - total) * drawn / total)))
+    raise ValueError(f"{personality} / {media_handling} is unreachable: earlier rules claim every candidate")
+
+
+def personality_attributes(personality: str, media_handling: Optional[str] = None, age: int = 25,
+                           is_regen: bool = False, plays_for_favourite: bool = False, rng=None) -> Dict[str, int]:
+    """One player's mental attributes as {attribute: value} for the requested personality."""
+    row = sample_mental_attributes(personality, media_handling, 1, age, is_regen, plays_for_favourite, rng)[0]
+    return dict(zip(MENTAL_ATTRIBUTES, row.tolist()))
+
+
+def apply_personality(player, personality: str, media_handling: Optional[str] = None,
+                      is_regen: bool = False, plays_for_favourite: bool = False, rng=None):
+    """
+    Give a Player mental attributes for the requested personality and recalculate it.
+
+    Returns:
+        Player: The same player (personality and media_handling now as requested)
+    """
+    attrs = personality_attributes(personality, media_handling, player.age, is_regen, plays_for_favourite, rng)
+    player.set_concentration(attrs.pop('concentration'))
+    player.set_mental_attributes(**attrs)
+    player.update_personality(is_regen=is_regen, plays_for_favourite=plays_for_favourite)
+    return player
+
+
+# ========== FREQUENCY TABLE ==========
+
+def build_frequency_table(samples_per_rule: int = 20000, seed: int = 0) -> Dict:
+    """
+    How common each personality and media handling is under the default distribution.
+
+    P(name) = P(attributes in the rule's ranges) * P(no earlier rule claims them | in range);
+    the first factor is exact, the second is estimated by sampling inside the ranges, so rare
+    types get the same relative precision as common ones. The default ('Balanced') takes the rest.
+
+    Returns:
+        dict: {'personality': {group: {name: p}}, 'media_handling': {name: p}}
+    """
+    rng = np.random.default_rng(seed)
+
+    def table(rules, default, classify, codes):
+        result = {}
+        for rule in rules:
+            lo = [1] * len(MENTAL_ATTRIBUTES)
+            hi = [20] * len(MENTAL_ATTRIBUTES)
+            _constrain(lo, hi, rule)
+            candidates = _sample_box(rng, lo, hi, samples_per_rule)
+            accepted = np.mean(classify(candidates) == codes[rule['name']])
+            result[rule['name']] = result.get(rule['name'], 0.0) + _box_probability(lo, hi) * float(accepted)
+        result[default] = max(0.0, 1.0 - sum(p for name, p in result.items() if name != default))
+        return {name: float(f"{p:.6g}") for name, p in sorted(result.items(), key=lambda kv: -kv[1]) if p > 0}
+
+    personality = {}
+    for group, (age, is_regen) in AGE_GROUPS.items():
+        rules = [r for r in PERSONALITY_RULES
+                 if r.get('min_age', 0) <= age and (is_regen or not r.get('regen_only'))]
+        personality[group] = table(
+            rules, DEFAULT_PERSONALITY,
+            lambda m, age=age, is_regen=is_regen: classify_personalities(m, np.full(len(m), age), is_regen),
+            PERSONALITY_CODES)
+    media = table(MEDIA_HANDLING_RULES, DEFAULT_MEDIA_HANDLING, classify_media_handling, MEDIA_HANDLING_CODES)
+    return {'samples_per_rule': samples_per_rule, 'seed': seed, 'personality': personality, 'media_handling': media}
+
+
+@lru_cache(maxsize=1)
+def frequency_table() -> Dict:
+    """The precomputed table (data/personality_frequencies.json)."""
+    with open(FREQUENCY_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def personality_frequency(personality: str, age: int = 25, is_regen: bool = False) -> float:
+    """Share of default-generated players of this age group/regen flag with the personality."""
+    group = ('23_plus' if age >= ADULT_AGE else 'under_23') + ('_regen' if is_regen else '')
+    return frequency_table()['personality'][group].get(personality, 0.0)
+
+
+def media_handling_frequency(media_handling: str) -> float:
+    return frequency_table()['media_handling'].get(media_handling, 0.0)
+
+
+if __name__ == '__main__':
+    built = build_frequency_table()
+    with open(FREQUENCY_PATH, 'w', encoding='utf-8') as f:
+        json.dump(built, f, indent=2, ensure_ascii=False)
+    print(f"Frequency table written to {FREQUENCY_PATH}")
+    for name, p in list(built['personality']['23_plus'].items())[:10]:
+        print(f"  {name:22s} {p:.4%}")
@@ -3,12 +3,72 @@ Player module - Represents a football player with numeric attributes
 """
 
 import random
+from operator import mul
+
+from player_stats import PlayerAggregates
+from registry import next_id
+
+# Season-end development events (Player.start_new_season -> develop_potential)
+BREAKOUT_MAX_AGE = 21          # young players whose good seasons raise their ceiling
+BREAKOUT_MIN_APPEARANCES = 10
+BREAKOUT_AVG_RATING = 7.0      # season average match rating that counts as a good season
+BREAKOUT_GROWTH = (0.01, 0.04)
+DECLINE_AGE = 31               # from here the ceiling drops every season
+DECLINE_PER_SEASON = 0.02
+
+
+class _RatedAttribute:
+    """Technical attribute whose writes mark the player's ratings dirty (see Player.update_ratings)"""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = '_' + name
+
+    def __get__(self, player, owner=None):
+        if player is None:
+            return self
+        return player.__dict__[self.slot]
+
+    def __set__(self, player, value):
+        state = player.__dict__
+        state[self.slot] = value
+        state['_dirty_attributes'].add(self.name)
+
+
+def _weight_rows(position_weights, attributes):
+    """(position key, weights in `attributes` order) per position"""
+    return tuple((pos_key, tuple(weights[attr] for attr in attributes)) for pos_key, weights in position_weights.items())
+
+
+def _weight_columns(position_weights):
+    """attribute -> [(position key, weight)] for the positions where the attribute counts"""
+    columns = {}
+    for pos_key, weights in position_weights.items():
+        for attr, weight in weights.items():
+            if weight:
+                columns.setdefault(attr, []).append((pos_key, weight))
+    return columns
 
 
 class Player:
     """Represents a football player with numeric attributes (1-20 scale)"""
 
+    # Technical attributes: changes are tracked so ratings can be updated as deltas
+    defending = _RatedAttribute()
+    aerial = _RatedAttribute()
+    passing = _RatedAttribute()
+    technical = _RatedAttribute()
+    speed = _RatedAttribute()
+    physical = _RatedAttribute()
+    shooting = _RatedAttribute()
+    mental = _RatedAttribute()
+    intelligence = _RatedAttribute()
+
     def __init__(self, name, age, position, potential_level="Unknown"):
+        self._dirty_attributes = set()  # technical attributes changed since the last rating update
+        self._rated_values = None  # attribute values the ratings were computed from
+        self._raw_ratings = None  # unrounded rating per position key
+        self.uid = next_id()  # stable ID (names can repeat)
         self.name = name
         self.age = age
         self.position = position
@@ -59,17 +119,11 @@ class Player:
         self.trust_in_agent = "Neutral"
         self.development_stage = "Raw"
 
-        # Career stats
-        self.appearances = 0
-        self.goals = 0
-        self.assists = 0
+        # Match stats: running season/career aggregates (see record_match)
+        self.stats = PlayerAggregates()
         
         # Weekly statistics (season)
         self.weekly_stats = []  # List of dicts: {week, goals, assists, rating, opponent, club}
-        self.season_goals = 0
-        self.season_assists = 0
-        self.season_appearances = 0
-        self.season_avg_rating = 0.0
         
         # Contract management
         self.contract_accepted = False  # True after accepting an offer (blocks future offers)
@@ -79,6 +133,53 @@ class Player:
         self.interaction_history = []
         self.weeks_with_agent = 0
 
+        # Bumped whenever ratings or personality are recalculated (used by report caches)
+        self.version = 0
+
+    def bump_version(self):
+        """Mark derived data (reports, previews) as stale after a direct field edit"""
+        self.version += 1
+        return self.version
+
+    # ========== MATCH STATS ==========
+
+    def record_match(self, match):
+        """Log a match and update the running aggregates in O(1)"""
+        self.weekly_stats.append(match)
+        self.stats.record_match(match)
+
+    @property
+    def appearances(self):
+        return self.stats.career.appearances
+
+    @property
+    def goals(self):
+        return self.stats.career.goals
+
+    @property
+    def assists(self):
+        return self.stats.career.assists
+
+    @property
+    def season_appearances(self):
+        return self.stats.season.appearances
+
+    @property
+    def season_goals(self):
+        return self.stats.season.goals
+
+    @property
+    def season_assists(self):
+        return self.stats.season.assists
+
+    @property
+    def season_avg_rating(self):
+        return self.stats.season.avg_rating
+
+    @property
+    def season_goals_per_match(self):
+        return self.stats.season.goals_per_match
+
     # ========== POSITION WEIGHTS SYSTEM ==========
 
     POSITION_WEIGHTS = {
@@ -134,6 +235,11 @@ class Player:
         }
     }
 
+    RATED_ATTRIBUTES = tuple(POSITION_WEIGHTS['AVG'])
+    _ATTRIBUTE_SLOTS = tuple('_' + attr for attr in RATED_ATTRIBUTES)
+    WEIGHT_ROWS = _weight_rows(POSITION_WEIGHTS, RATED_ATTRIBUTES)
+    WEIGHT_COLUMNS = _weight_columns(POSITION_WEIGHTS)
+
     POSITION_MAP = {
         'Goalkeeper': 'CB', 'GK': 'CB',
         'Defender': 'CB', 'Centre Back': 'CB', 'Center Back': 'CB', 'CB': 'CB',
@@ -253,7 +359,7 @@ class Player:
         if intelligence is not None:
             self.intelligence = max(1, min(20, intelligence))
 
-        self.calculate_ratings()
+        self.update_ratings()
 
     def calculate_rating_for_position(self, position_key):
         """Calculate rating for a specific position using weights"""
@@ -277,26 +383,88 @@ class Player:
         return round(rating, 2)
 
     def calculate_ratings(self):
-        """Calculate current rating, potential rating, and all position ratings"""
-        position_key = self.POSITION_MAP.get(self.position, 'AVG')
-        self.current_rating = self.calculate_rating_for_position(position_key)
+        """
+        Calculate current rating and all position ratings from scratch.
 
-        # Potential rating
+        Potential is drawn the first time only; afterwards it changes through
+        develop_potential(). Use update_ratings() after small attribute changes.
+        """
+        state = self.__dict__
+        values = [state[slot] for slot in self._ATTRIBUTE_SLOTS]
+        self._raw_ratings = {pos_key: sum(map(mul, values, row)) for pos_key, row in self.WEIGHT_ROWS}
+        self._rated_values = dict(zip(self.RATED_ATTRIBUTES, values))
+        self._dirty_attributes.clear()
+        if not self.potential_rating:
+            self._draw_potential()
+        self._publish_ratings()
+
+    def update_ratings(self):
+        """
+        Bring ratings up to date after attribute changes.
+
+        Only the changed attributes' weight columns are applied, as deltas to
+        the stored position ratings.
+
+        Returns:
+            bool: True if anything changed
+        """
+        if self._raw_ratings is None:
+            self.calculate_ratings()
+            return True
+        dirty = self._dirty_attributes
+        if not dirty:
+            return False
+        state, raw, rated = self.__dict__, self._raw_ratings, self._rated_values
+        changed = False
+        for attr in dirty:
+            value = state['_' + attr]
+            delta = value - rated[attr]
+            if delta:
+                rated[attr] = value
+                for pos_key, weight in self.WEIGHT_COLUMNS[attr]:
+                    raw[pos_key] += delta * weight
+                changed = True
+        dirty.clear()
+        if changed:
+            self._publish_ratings()
+        return changed
+
+    def _draw_potential(self):
+        """Initial potential rating, between the current rating and 1.5x it (capped by the position maximum)"""
+        position_key = self.POSITION_MAP.get(self.position, 'AVG')
+        current = round(self._raw_ratings[position_key], 2)
         theoretical_max = sum(20 * weight for weight in self.POSITION_WEIGHTS[position_key].values())
-        potential_range_min = self.current_rating + 0.01
-        potential_range_max = min(theoretical_max, self.current_rating * 1.5 + random.uniform(0.05, 0.15))
+        potential_range_min = current + 0.01
+        potential_range_max = min(theoretical_max, current * 1.5 + random.uniform(0.05, 0.15))
         self.potential_rating = round(random.uniform(potential_range_min, potential_range_max), 2)
 
-        # Position ratings
-        self.position_rating = {}
-        for pos_key in self.POSITION_WEIGHTS.keys():
-            if pos_key != 'AVG':
-                self.position_rating[pos_key] = self.calculate_rating_for_position(pos_key)
+    def develop_potential(self, amount):
+        """
+        Development event: move potential by `amount` (never below the current rating).
+
+        Returns:
+            float: New potential rating
+        """
+        self.potential_rating = round(max(self.current_rating, self.potential_rating + amount), 2)
+        self.version += 1
+        return self.potential_rating
+
+    def outgrow_potential(self):
+        """Development event: the player outgrew the expected ceiling, which moves up to the current rating."""
+        return self.develop_potential(self.current_rating - self.potential_rating)
+
+    def _publish_ratings(self):
+        """Round the raw ratings into current_rating and position_rating"""
+        raw = self._raw_ratings
+        self.current_rating = round(raw[self.POSITION_MAP.get(self.position, 'AVG')], 2)
+        self.position_rating = {pos_key: round(value, 2) for pos_key, value in raw.items() if pos_key != 'AVG'}
+        if self.current_rating > self.potential_rating:
+            self.outgrow_potential()
+        self.version += 1
 
     def get_best_positions(self, top_n=3):
         """Get the top N positions for this player based on ratings"""
-        if not self.position_rating:
-            self.calculate_ratings()
+        self.update_ratings()
         sorted_positions = sorted(self.position_rating.items(), key=lambda x: x[1], reverse=True)
         return sorted_positions[:top_n]
 
@@ -349,10 +517,40 @@ class Player:
         """Set concentration attribute"""
         if concentration is not None:
             self.concentration = max(1, min(20, concentration))
+            self.version += 1
+
+    def start_new_season(self, season=None):
+        """
+        Age the player one year, apply the season-end development events and reset season stats.
+
+        Returns:
+            dict: The finished season's line
+        """
+        line = {
+            'name': self.name,
+            'age': self.age,
+            'club': self.club,
+            **self.stats.close_season(season),
+            'overall': self.current_overall_score,
+        }
+        self.age += 1
+        self.bump_version()  # reports and previews show the age
+        self.weekly_stats = []
+        # Development events: a strong young season raises the ceiling, age lowers it
+        if (self.age <= BREAKOUT_MAX_AGE and line['appearances'] >= BREAKOUT_MIN_APPEARANCES
+                and line['avg_rating'] >= BREAKOUT_AVG_RATING):
+            self.develop_potential(random.uniform(*BREAKOUT_GROWTH))
+        elif self.age >= DECLINE_AGE:
+            self.develop_potential(-DECLINE_PER_SEASON)
+        # Some personalities are only possible from age 23
+        if self.age == 23:
+            self.update_personality()
+        return line
 
     def update_personality(self, is_regen=False, plays_for_favourite=False):
         """Update the player's personality based on mental attributes"""
         self.personality = self.calculate_personality(is_regen, plays_for_favourite)
+        self.version += 1
         return self.personality
 
     def calculate_personality(self, is_regen=False, plays_for_favourite=False):
@@ -543,6 +741,7 @@ class Player:
     def update_media_handling(self, is_regen=False):
         """Update the player's media handling style"""
         self.media_handling = self.calculate_media_handling(is_regen)
+        self.version += 1
         return self.media_handling
 
     def calculate_media_handling(self, is_regen=False):
@@ -5,6 +5,67 @@ Player generator with rating system - Create players with realistic attributes
 import random
 from player import Player
 
+# Base ratings by quality
+QUALITY_BASES = {
+    'poor': (8, 3),        # base, variation
+    'average': (12, 3),
+    'good': (15, 2),
+    'excellent': (17, 2),
+    'world_class': (19, 1)
+}
+
+# Position-specific attribute priorities
+POSITION_PROFILES = {
+    'FB': {
+        'high': ['defending', 'speed', 'intelligence'],
+        'medium': ['passing', 'physical', 'mental'],
+        'low': ['aerial', 'technical', 'shooting']
+    },
+    'CB': {
+        'high': ['defending', 'aerial', 'intelligence'],
+        'medium': ['physical', 'mental'],
+        'low': ['passing', 'technical', 'speed', 'shooting']
+    },
+    'WB': {
+        'high': ['speed', 'intelligence'],
+        'medium': ['defending', 'passing', 'technical', 'physical', 'mental'],
+        'low': ['aerial', 'shooting']
+    },
+    'DM': {
+        'high': ['defending', 'mental', 'intelligence'],
+        'medium': ['passing', 'physical', 'technical'],
+        'low': ['aerial', 'speed', 'shooting']
+    },
+    'SM': {
+        'high': ['technical', 'speed', 'intelligence'],
+        'medium': ['passing', 'mental'],
+        'low': ['defending', 'aerial', 'physical', 'shooting']
+    },
+    'CM': {
+        'high': ['passing', 'technical', 'intelligence'],
+        'medium': ['mental', 'defending'],
+        'low': ['aerial', 'speed', 'physical', 'shooting']
+    },
+    'WF': {
+        'high': ['technical', 'speed'],
+        'medium': ['passing', 'shooting', 'mental', 'intelligence'],
+        'low': ['defending', 'aerial', 'physical']
+    },
+    'AM': {
+        'high': ['technical', 'intelligence'],
+        'medium': ['passing', 'shooting', 'mental', 'speed'],
+        'low': ['defending', 'aerial', 'physical']
+    },
+    'FW': {
+        'high': ['shooting', 'speed', 'intelligence'],
+        'medium': ['technical', 'aerial', 'mental', 'physical'],
+        'low': ['defending', 'passing']
+    }
+}
+
+TECHNICAL_ATTRIBUTES = ['defending', 'aerial', 'passing', 'technical', 'speed',
+                        'physical', 'shooting', 'mental', 'intelligence']
+
 def generate_random_attributes(base_rating=12, variation=4):
     """
     Generate random attributes based on a base rating with variation.
@@ -39,71 +100,12 @@ def generate_position_specialist(position, quality='good'):
     Returns:
         dict: Specialized attributes for the position
     """
-    # Base ratings by quality
-    quality_bases = {
-        'poor': (8, 3),        # base, variation
-        'average': (12, 3),
-        'good': (15, 2),
-        'excellent': (17, 2),
-        'world_class': (19, 1)
-    }
+    base, variation = QUALITY_BASES.get(quality, (12, 3))
     
-    base, variation = quality_bases.get(quality, (12, 3))
-    
-    # Position-specific attribute priorities
-    position_profiles = {
-        'FB': {
-            'high': ['defending', 'speed', 'intelligence'],
-            'medium': ['passing', 'physical', 'mental'],
-            'low': ['aerial', 'technical', 'shooting']
-        },
-        'CB': {
-            'high': ['defending', 'aerial', 'intelligence'],
-            'medium': ['physical', 'mental'],
-            'low': ['passing', 'technical', 'speed', 'shooting']
-        },
-        'WB': {
-            'high': ['speed', 'intelligence'],
-            'medium': ['defending', 'passing', 'technical', 'physical', 'mental'],
-            'low': ['aerial', 'shooting']
-        },
-        'DM': {
-            'high': ['defending', 'mental', 'intelligence'],
-            'medium': ['passing', 'physical', 'technical'],
-            'low': ['aerial', 'speed', 'shooting']
-        },
-        'SM': {
-            'high': ['technical', 'speed', 'intelligence'],
-            'medium': ['passing', 'mental'],
-            'low': ['defending', 'aerial', 'physical', 'shooting']
-        },
-        'CM': {
-            'high': ['passing', 'technical', 'intelligence'],
-            'medium': ['mental', 'defending'],
-            'low': ['aerial', 'speed', 'physical', 'shooting']
-        },
-        'WF': {
-            'high': ['technical', 'speed'],
-            'medium': ['passing', 'shooting', 'mental', 'intelligence'],
-            'low': ['defending', 'aerial', 'physical']
-        },
-        'AM': {
-            'high': ['technical', 'intelligence'],
-            'medium': ['passing', 'shooting', 'mental', 'speed'],
-            'low': ['defending', 'aerial', 'physical']
-        },
-        'FW': {
-            'high': ['shooting', 'speed', 'intelligence'],
-            'medium': ['technical', 'aerial', 'mental', 'physical'],
-            'low': ['defending', 'passing']
-        }
-    }
-    
-    profile = position_profiles.get(position, position_profiles['CM'])
+    profile = POSITION_PROFILES.get(position, POSITION_PROFILES['CM'])
     
     attrs = {}
-    for attr in ['defending', 'aerial', 'passing', 'technical', 'speed', 
-                 'physical', 'shooting', 'mental', 'intelligence']:
+    for attr in TECHNICAL_ATTRIBUTES:
         if attr in profile['high']:
             attr_base = base + 2
         elif attr in profile['medium']:
@@ -138,27 +140,13 @@ def generate_player(name, age, position, quality='average', specialist=True):
     if specialist:
         tech_attrs = generate_position_specialist(position_key, quality)
     else:
-        quality_bases = {
-            'poor': (8, 3),
-            'average': (12, 3),
-            'good': (15, 2),
-            'excellent': (17, 2),
-            'world_class': (19, 1)
-        }
-        base, variation = quality_bases.get(quality, (12, 3))
+        base, variation = QUALITY_BASES.get(quality, (12, 3))
         tech_attrs = generate_random_attributes(base, variation)
     
     player.set_technical_attributes(**tech_attrs)
     
     # Generate mental attributes
-    quality_bases = {
-        'poor': (8, 3),
-        'average': (12, 3),
-        'good': (15, 2),
-        'excellent': (17, 2),
-        'world_class': (19, 1)
-    }
-    base, variation = quality_bases.get(quality, (12, 3))
+    base, variation = QUALITY_BASES.get(quality, (12, 3))
     
     mental_attrs = {
         'determination': max(1, min(20, int(random.gauss(base, variation)))),
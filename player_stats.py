@@ -0,0 +1,95 @@
+"""
+Player stats module - Running match aggregates for a player.
+
+Every recorded match updates the sums and counts in O(1), so averages and
+goals per match are read without rescanning the match log. Aggregates are
+split into the current season, finished seasons and the career. Rolling form
+(ratings and goals over the last matches) is kept by form_tracker.
+"""
+
+from collections import deque
+from typing import Dict, List, Optional
+
+from form_tracker import FORM_WINDOW
+
+
+class StatLine:
+    """Sums and counts for a run of matches."""
+
+    __slots__ = ('appearances', 'goals', 'assists', 'rating_sum', 'yellow_cards', 'red_cards')
+
+    def __init__(self):
+        self.appearances = 0
+        self.goals = 0
+        self.assists = 0
+        self.rating_sum = 0.0
+        self.yellow_cards = 0
+        self.red_cards = 0
+
+    def add(self, match: Dict):
+        self.appearances += 1
+        self.goals += match.get('goals', 0)
+        self.assists += match.get('assists', 0)
+        self.rating_sum += match.get('rating', 0.0)
+        self.yellow_cards += bool(match.get('yellow_card'))
+        self.red_cards += bool(match.get('red_card'))
+
+    @property
+    def avg_rating(self) -> float:
+        return self.rating_sum / self.appearances if self.appearances else 0.0
+
+    @property
+    def goals_per_match(self) -> float:
+        return self.goals / self.appearances if self.appearances else 0.0
+
+    @property
+    def assists_per_match(self) -> float:
+        return self.assists / self.appearances if self.appearances else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'appearances': self.appearances,
+            'goals': self.goals,
+            'assists': self.assists,
+            'avg_rating': round(self.avg_rating, 2),
+            'yellow_cards': self.yellow_cards,
+            'red_cards': self.red_cards,
+        }
+
+    def __repr__(self):
+        return f"<StatLine {self.appearances} PJ {self.goals}G {self.assists}A {self.avg_rating:.2f}>"
+
+
+class PlayerAggregates:
+    """Season, per-season and career aggregates plus the last FORM_WINDOW match lines."""
+
+    __slots__ = ('season', 'career', 'seasons', 'recent')
+
+    def __init__(self):
+        self.season = StatLine()
+        self.career = StatLine()
+        self.seasons: List[Dict] = []  # finished seasons, oldest first (StatLine.to_dict() + 'season')
+        self.recent = deque(maxlen=FORM_WINDOW)  # last match lines, for the client card
+
+    def record_match(self, match: Dict):
+        """
+        Add one match in O(1).
+
+        Args:
+            match: {'week', 'goals', 'assists', 'rating', 'opponent', 'club', 'yellow_card', 'red_card'}
+        """
+        self.season.add(match)
+        self.career.add(match)
+        self.recent.append(match)
+
+    @property
+    def last_match(self) -> Optional[Dict]:
+        return self.recent[-1] if self.recent else None
+
+    def close_season(self, label=None) -> Dict:
+        """Archive the current season split and start a new one. Returns the archived split."""
+        line = self.season.to_dict()
+        line['season'] = label if label is not None else len(self.seasons) + 1
+        self.seasons.append(line)
+        self.season = StatLine()
+        return line
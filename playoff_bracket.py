@@ -0,0 +1,121 @@
+"""
+Playoff bracket module - Exact round-by-round odds for a knockout bracket.
+
+Clubs are listed in bracket order: slots 0-1 meet in the first round, their winner
+meets the winner of slots 2-3, and so on. A club's chance of winning round r is
+its chance of reaching round r times the sum, over every possible opponent in the
+other half of its block, of that opponent reaching round r times the tie probability.
+This is O(rounds * n^2) with no sampling.
+
+Tie probabilities are the ones the playoff simulation uses, so the odds shown
+to the agent are exact for the bracket that is actually played.
+"""
+
+import random
+from typing import Dict, List, Optional, Sequence
+
+ROUND_NAMES = ["Cuartos de Final", "Semifinal", "Final"]
+
+
+def knockout_win_probability(club, opponent) -> float:
+    """Probability that `club` wins a knockout tie against `opponent` (0-1)."""
+    p_club = club.get_win_probability(opponent)
+    p_opp = opponent.get_win_probability(club)
+    return p_club / (p_club + p_opp)
+
+
+def win_matrix(clubs: Sequence) -> List[List[float]]:
+    """matrix[i][j] = probability clubs[i] beats clubs[j]."""
+    n = len(clubs)
+    matrix = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            p = knockout_win_probability(clubs[i], clubs[j])
+            matrix[i][j] = p
+            matrix[j][i] = 1.0 - p
+    return matrix
+
+
+def _rounds_for(n: int) -> int:
+    rounds = n.bit_length() - 1
+    if n < 2 or 1 << rounds != n:
+        raise ValueError(f"bracket size must be a power of two, got {n}")
+    return rounds
+
+
+def bracket_odds(clubs: Sequence, matrix: Optional[List[List[float]]] = None) -> List[List[float]]:
+    """
+    Exact probabilities of each club winning each round.
+
+    Args:
+        clubs: Clubs in bracket order (length must be a power of two)
+        matrix: Optional precomputed win_matrix(clubs)
+
+    Returns:
+        list: odds[i][r] = probability clubs[i] wins round r
+              (odds[i][-1] is the probability of winning the title)
+    """
+    n = len(clubs)
+    rounds = _rounds_for(n)
+    matrix = matrix or win_matrix(clubs)
+
+    reach = [1.0] * n
+    odds = [[0.0] * rounds for _ in range(n)]
+    for r in range(rounds):
+        block = 2 << r    # clubs whose winners have met by the end of round r
+        half = block >> 1
+        wins = [0.0] * n
+        for i in range(n):
+            if reach[i] == 0.0:
+                continue
+            start = (i // block) * block
+            other = start + half if i - start < half else start
+            row = matrix[i]
+            wins[i] = reach[i] * sum(reach[j] * row[j] for j in range(other, other + half))
+        for i in range(n):
+            odds[i][r] = wins[i]
+        reach = wins
+    return odds
+
+
+def odds_table(clubs: Sequence, round_names: Sequence[str] = ROUND_NAMES) -> List[Dict]:
+    """
+    Odds as rows sorted by title chance.
+
+    Returns:
+        list: [{'club': name, 'reach': {round name: p}, 'champion': p}]
+              'reach' is the probability of playing in each round
+    """
+    odds = bracket_odds(clubs)
+    rows = []
+    for club, wins in zip(clubs, odds):
+        reach = {round_names[0]: 1.0}
+        for r in range(1, len(round_names)):
+            reach[round_names[r]] = wins[r - 1]
+        rows.append({'club': club.name, 'reach': reach, 'champion': wins[-1]})
+    rows.sort(key=lambda row: -row['champion'])
+    return rows
+
+
+def simulate_bracket(clubs: Sequence, rng=random) -> List[List[Dict]]:
+    """
+    Play the bracket once.
+
+    Returns:
+        list: One list per round of {'home', 'away', 'home_prob', 'away_prob', 'winner'}
+              (the champion is rounds[-1][0]['winner'])
+    """
+    _rounds_for(len(clubs))
+    current = list(clubs)
+    rounds = []
+    while len(current) > 1:
+        ties = []
+        for i in range(0, len(current), 2):
+            home, away = current[i], current[i + 1]
+            p_home = knockout_win_probability(home, away)
+            winner = home if rng.random() < p_home else away
+            ties.append({'home': home, 'away': away, 'home_prob': p_home,
+                         'away_prob': 1.0 - p_home, 'winner': winner})
+        rounds.append(ties)
+        current = [tie['winner'] for tie in ties]
+    return rounds
@@ -0,0 +1,195 @@
+"""
+Profiling module - Per-stage timing and call counters for the weekly simulation.
+
+A WeekProfiler records, for every simulated week:
+- wall time of each stage (fixtures, participation, growth, offers, events, ...)
+- call counts for hot functions (Club.get_quick_profile, Player.calculate_ratings, ...)
+- optionally, the top functions from cProfile and the peak memory from tracemalloc
+
+Counters are installed by wrapping the methods only while a profiler is active,
+so the game pays nothing when profiling is off.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from club import Club
+from player import Player
+
+# (class, method name) pairs counted while a profiler is installed
+COUNTED_METHODS = [
+    (Club, 'get_quick_profile'),
+    (Club, 'get_win_probability'),
+    (Player, 'calculate_ratings'),
+    (Player, 'update_ratings'),
+    (Player, 'calculate_personality'),
+]
+
+TOP_FUNCTIONS = 15
+
+
+class WeekProfiler:
+    """Collects stage timings and call counts per week. Use stage() as a context manager."""
+
+    def __init__(self, use_cprofile: bool = False, use_tracemalloc: bool = False):
+        self.use_cprofile = use_cprofile
+        self.use_tracemalloc = use_tracemalloc
+        self.weeks: List[Dict] = []
+        self.calls: Dict[str, int] = {}
+        self._current: Optional[Dict] = None
+        self._calls_at_start: Dict[str, int] = {}
+        self._cprofile = None
+        self._started_tracemalloc = False
+        self._originals = []
+
+    # ========== COUNTERS ==========
+
+    def install(self):
+        """Wrap the counted methods so every call is recorded."""
+        if self._originals:
+            return
+        for cls, name in COUNTED_METHODS:
+            original = cls.__dict__[name]
+            self._originals.append((cls, name, original))
+            setattr(cls, name, self._counting(f"{cls.__name__}.{name}", original))
+
+    def uninstall(self):
+        """Restore the original methods."""
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals = []
+
+    def _counting(self, key, func):
+        calls = self.calls
+        calls.setdefault(key, 0)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            calls[key] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    def count(self, key: str, n: int = 1):
+        """Add to a named counter (for code paths that are not wrapped methods)."""
+        self.calls[key] = self.calls.get(key, 0) + n
+
+    # ========== WEEKS AND STAGES ==========
+
+    def start_week(self, week: int):
+        """Open the record for a week (closing any open one)."""
+        if self._current is not None:
+            self.end_week()
+        self._current = {'week': week, 'stages': {}, 'calls': {}}
+        self._calls_at_start = dict(self.calls)
+        if self.use_tracemalloc:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+        if self.use_cprofile:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def end_week(self):
+        """Close the open week record."""
+        record = self._current
+        if record is None:
+            return
+        if self._cprofile is not None:
+            self._cprofile.disable()
+            record['top_functions'] = _top_functions(self._cprofile)
+            self._cprofile = None
+        if self.use_tracemalloc and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            record['memory_kb'] = {'current': round(current / 1024, 1), 'peak': round(peak / 1024, 1)}
+        record['calls'] = {
+            key: n - self._calls_at_start.get(key, 0)
+            for key, n in self.calls.items() if n != self._calls_at_start.get(key, 0)
+        }
+        record['total'] = round(sum(record['stages'].values()), 6)
+        self.weeks.append(record)
+        self._current = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as one stage. Outside a week, it is added to the last recorded week."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            record = self._current or (self.weeks[-1] if self.weeks else None)
+            if record is None:
+                self.start_week(0)
+                record = self._current
+            stages = record['stages']
+            stages[name] = round(stages.get(name, 0.0) + elapsed, 6)
+            if record is not self._current:
+                record['total'] = round(sum(stages.values()), 6)
+
+    def close(self):
+        """End the open week, restore methods and stop tracemalloc if this profiler started it."""
+        self.end_week()
+        self.uninstall()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # ========== REPORTING ==========
+
+    def summary(self) -> Dict:
+        """Totals and per-week averages over all recorded weeks."""
+        totals = {}
+        for record in self.weeks:
+            for name, seconds in record['stages'].items():
+                totals[name] = totals.get(name, 0.0) + seconds
+        n = max(1, len(self.weeks))
+        return {
+            'weeks': len(self.weeks),
+            'stage_totals': {k: round(v, 6) for k, v in totals.items()},
+            'stage_avg_per_week': {k: round(v / n, 6) for k, v in totals.items()},
+            'calls': dict(self.calls),
+        }
+
+    def to_dict(self) -> Dict:
+        return {'summary': self.summary(), 'weeks': self.weeks}
+
+    def export_json(self, path: str):
+        """Write the summary and every week record to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def format_report(self) -> str:
+        """Text table of stage totals and call counts."""
+        summary = self.summary()
+        lines = [f"WEEKLY PROFILE ({summary['weeks']} weeks)", "=" * 60]
+        for name, seconds in sorted(summary['stage_totals'].items(), key=lambda kv: -kv[1]):
+            avg = summary['stage_avg_per_week'][name]
+            lines.append(f"{name:<28} {seconds * 1000:10.1f} ms  ({avg * 1000:.2f} ms/week)")
+        if summary['calls']:
+            lines.append("-" * 60)
+            for key, n in sorted(summary['calls'].items(), key=lambda kv: -kv[1]):
+                lines.append(f"{key:<40} {n:>10,} calls")
+        return "\n".join(lines)
+
+
+def _top_functions(profile, limit: int = TOP_FUNCTIONS) -> List[Dict]:
+    """Top functions by cumulative time from a cProfile run."""
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    rows = []
+    for (filename, line, func), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append({
+            'function': f"{filename}:{line}({func})",
+            'calls': ncalls,
+            'tottime': round(tottime, 6),
+            'cumtime': round(cumtime, 6),
+        })
+    rows.sort(key=lambda r: -r['cumtime'])
+    return rows[:limit]
@@ -0,0 +1,139 @@
+"""
+Registry module - Stable integer IDs for players, roster players and clubs.
+
+Every Player and Club gets an integer `uid` when it is created (roster players,
+which are dicts, carry it under 'id'). Names collide easily ("Juan García"), so
+lookups, logs and UI selections use IDs:
+- Registry: O(1) map from ID to object
+- ClientList: the agent's clients in signing order, with O(1) membership,
+  add, remove and lookup by ID
+"""
+
+from itertools import count
+from typing import Dict, Iterator, Optional
+
+_ids = count(1)
+
+
+def next_id() -> int:
+    """A new process-wide unique ID."""
+    return next(_ids)
+
+
+def uid_of(obj) -> Optional[int]:
+    """ID of a Player/Club (`uid`) or roster dict ('id')."""
+    if isinstance(obj, dict):
+        return obj.get('id')
+    return getattr(obj, 'uid', None)
+
+
+class Registry:
+    """ID -> object for everything in the game world."""
+
+    def __init__(self):
+        self._objects: Dict[int, object] = {}
+
+    def __len__(self):
+        return len(self._objects)
+
+    def __contains__(self, uid):
+        return uid in self._objects
+
+    def register(self, obj) -> int:
+        uid = uid_of(obj)
+        if uid is None:
+            uid = next_id()
+            if isinstance(obj, dict):
+                obj['id'] = uid
+            else:
+                obj.uid = uid
+        self._objects[uid] = obj
+        return uid
+
+    def register_all(self, objects):
+        for obj in objects:
+            self.register(obj)
+
+    def get(self, uid, default=None):
+        return self._objects.get(uid, default)
+
+    def __getitem__(self, uid):
+        return self._objects[uid]
+
+    def remove(self, obj_or_uid):
+        uid = obj_or_uid if isinstance(obj_or_uid, int) else uid_of(obj_or_uid)
+        self._objects.pop(uid, None)
+
+    def clear(self):
+        self._objects.clear()
+
+
+class ClientList:
+    """
+    Ordered set of players keyed by ID.
+
+    Behaves like the list it replaces (iteration in signing order, len, indexing,
+    append/remove) but membership, add, remove and get(uid) are O(1).
+    """
+
+    def __init__(self, players=()):
+        self._players: Dict[int, object] = {}
+        for player in players:
+            self.append(player)
+
+    def __len__(self):
+        return len(self._players)
+
+    def __bool__(self):
+        return bool(self._players)
+
+    def __iter__(self) -> Iterator:
+        return iter(list(self._players.values()))  # safe against removal while iterating
+
+    def __contains__(self, player):
+        return self._players.get(uid_of(player)) is player
+
+    def __getitem__(self, index):
+        """Positional access (menus number clients 1..n); O(n), use get() for IDs."""
+        items = list(self._players.values())
+        return items[index]
+
+    def __eq__(self, other):
+        return list(self._players.values()) == list(other)
+
+    def __repr__(self):
+        return f"ClientList({list(self._players.values())!r})"
+
+    @property
+    def ids(self):
+        """Client IDs (a live set-like view)."""
+        return self._players.keys()
+
+    def get(self, uid, default=None):
+        return self._players.get(uid, default)
+
+    def append(self, player):
+        self._players.setdefault(player.uid, player)
+
+    def extend(self, players):
+        for player in players:
+            self.append(player)
+
+    def add(self, player) -> bool:
+        """Add a player; False if already a client."""
+        if player.uid in self._players:
+            return False
+        self._players[player.uid] = player
+        return True
+
+    def remove(self, player):
+        """Remove a player (ValueError if not a client, like list.remove)."""
+        if self._players.get(player.uid) is not player:
+            raise ValueError(f"{player.name} is not a client")
+        del self._players[player.uid]
+
+    def discard(self, player) -> bool:
+        return self._players.pop(player.uid, None) is not None
+
+    def clear(self):
+        self._players.clear()
@@ -0,0 +1,91 @@
+"""
+Season archive module - Compact per-season aggregates for multi-season careers.
+
+At the end of a season the week-by-week logs (growth, transfers, events,
+renewals, client weekly stats) are folded into one small summary dict and then
+cleared. Memory therefore depends on the number of seasons played, not on the
+number of weeks.
+"""
+
+from collections import Counter
+from typing import Dict, List
+
+
+def _league_rows(league_table: Dict) -> List[tuple]:
+    rows = sorted(
+        league_table.items(),
+        key=lambda kv: (kv[1]['points'], kv[1]['gd'], kv[1]['gf']),
+        reverse=True,
+    )
+    return [(name, s['points'], s['wins'], s['draws'], s['losses'], s['gf'], s['ga']) for name, s in rows]
+
+
+def _growth_summary(growth_log: List[Dict]) -> Dict:
+    by_personality = {}
+    for entry in growth_log:
+        count, total = by_personality.get(entry['personality'], (0, 0.0))
+        by_personality[entry['personality']] = (count + 1, round(total + entry['improvement'], 2))
+    return {'events': len(growth_log), 'by_personality': by_personality}
+
+
+def _transfer_summary(transfer_log: List[Dict]) -> Dict:
+    statuses = Counter(entry.get('status', 'unknown') for entry in transfer_log)
+    commission = sum(entry.get('commission', 0) for entry in transfer_log if entry.get('status') == 'accepted')
+    return {'by_status': dict(statuses), 'commission': commission}
+
+
+def _renewal_summary(renewals: List[Dict]) -> Dict:
+    renewed = sum(1 for r in renewals if r['wants_renewal'])
+    return {'candidates': len(renewals), 'renewed': renewed, 'released': len(renewals) - renewed}
+
+
+def summarize_season(season: int, league_table: Dict, client_lines: List[Dict],
+                     growth_log: List[Dict], transfer_log: List[Dict], event_log: List[Dict],
+                     renewals: List[Dict], promises: List[Dict], weeks: int) -> Dict:
+    """
+    Fold one season's logs into a compact summary.
+
+    Args:
+        season: Season number (1-based)
+        league_table: Final league table {club: stats}
+        client_lines: Player.start_new_season() lines for the agent's clients
+        growth_log, transfer_log, event_log: The season's logs
+        renewals: Candidates from the season-end renewal pass
+        promises: Promises resolved this season
+        weeks: Weeks in the season
+
+    Returns:
+        dict: Season summary (plain data, safe to keep for every season)
+    """
+    table = _league_rows(league_table)
+    return {
+        'season': season,
+        'weeks': weeks,
+        'champion': table[0][0] if table else None,
+        'table': table,
+        'clients': client_lines,
+        'growth': _growth_summary(growth_log),
+        'transfers': _transfer_summary(transfer_log),
+        'events': dict(Counter(e.get('event_type', 'unknown') for e in event_log)),
+        'renewals': _renewal_summary(renewals),
+        'promises': {
+            'kept': sum(1 for p in promises if p.get('cumplida')),
+            'failed': sum(1 for p in promises if p.get('fallida')),
+        },
+    }
+
+
+def format_season(summary: Dict) -> str:
+    """Short text report for a season summary."""
+    lines = [
+        f"TEMPORADA {summary['season']} - Campeón: {summary['champion']}",
+        f"  Crecimientos: {summary['growth']['events']} | Renovaciones: "
+        f"{summary['renewals']['renewed']}/{summary['renewals']['candidates']} | "
+        f"Comisiones por traspasos: ${summary['transfers']['commission']:,}",
+    ]
+    for c in summary['clients']:
+        lines.append(f"  {c['name']} ({c['age']}, {c['club'] or 'Libre'}): {c['appearances']} PJ, "
+                     f"{c['goals']} G, {c['assists']} A, rating {c['avg_rating']}")
+    if 'rollover_ms' in summary:
+        lines.append(f"  Cambio de temporada: {summary['rollover_ms']:.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,190 @@
+"""
+Team dynamics module - Weekly cohesion, morale and conflicts for every roster in one pass.
+
+Applies the personality models in personality_impact (weekly_cohesion_delta,
+weekly_conflict_probability, team_morale_delta, player_morale_delta) to all
+clubs at once. Roster players are compiled into NumPy columns (club index, XI
+flag, personality cohesion value, conflict probability, morale reactions), so
+a week is a handful of array operations whatever the number of clubs:
+- conflicts: rare per-player events, drawn ahead by an EventSampler
+- cohesion: every player of a club moves by the club's capped XI cohesion
+  delta; each conflict costs the instigator and, less, the teammates
+- morale: after a match, the club's result, objective and cohesion trend plus
+  each player's rating against the team average, and recent form (points
+  per game over the last matches, see form_tracker); conflicts cost morale too,
+  and each week morale recovers MORALE_REVERSION of its gap to neutral
+Cohesion and morale are kept in the columns and written through to the roster
+dicts ('cohesion_index', 'morale'), read by the renewals, and to each Club
+(cohesion, player_morale), read by match strength.
+"""
+
+import random
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from club import NEUTRAL_COHESION
+from event_sampler import EventSampler
+from form_tracker import NEUTRAL_PPG
+
+from impact_config import CONFIG_PATH, CompiledConfig, current_config
+from personality_impact import player_morale_delta, team_morale_delta, weekly_conflict_probability
+
+NEUTRAL_MORALE = 60.0          # starting morale of a roster player
+CLUB_MORALE_BASE = 75.0        # Club.player_morale for a squad at neutral morale
+COHESION_POINTS = 100.0        # cohesion deltas are fractions; cohesion_index is 0-100
+TREND_WEEKS = 4                # cohesion trend window for team_morale_delta (~a month)
+CONFLICT_COHESION_HIT = 3.0    # cohesion lost by a player who causes a conflict
+CONFLICT_TEAM_HIT = 0.5        # ... and by each teammate
+CONFLICT_MORALE_HIT = 4.0      # morale lost by the player who causes it
+FORM_MORALE_WEIGHT = 1.0       # morale per point per game above/below NEUTRAL_PPG, each match week
+MORALE_REVERSION = 0.05        # share of the gap to NEUTRAL_MORALE that morale recovers each week
+
+# Objective met if the club is in this top fraction of the table
+OBJECTIVE_POSITION = {
+    "Campeón / Top 3": 0.3,
+    "Clasificación Libertadores": 0.45,
+    "Clasificación Sudamericana": 0.6,
+    "Mitad de Tabla": 0.75,
+    "No Descender": 0.85,
+}
+
+
+def meets_objective(objective: str, position: int, n_clubs: int) -> bool:
+    """Whether a league position satisfies a club objective."""
+    return position <= max(1, round(OBJECTIVE_POSITION.get(objective, 0.5) * n_clubs))
+
+
+class TeamDynamics:
+    """Columnar view of all rosters and the weekly dynamics step."""
+
+    def __init__(self, clubs: Iterable, rosters: Dict[str, List[Dict]],
+                 config: Optional[CompiledConfig] = None, seed: Optional[int] = None):
+        """
+        Args:
+            clubs: Clubs with rosters (clubs without one are skipped)
+            rosters: {club name: [player dict]}
+            config: Impact config (default: current)
+            seed: Seed for the conflict draws
+        """
+        cfg = config or current_config(CONFIG_PATH)
+        self.config = cfg
+        self.clubs = [club for club in clubs if rosters.get(club.name)]
+        self.players: List[Dict] = []
+        club_idx, starter = [], []
+        for i, club in enumerate(self.clubs):
+            roster = rosters[club.name]
+            squad = getattr(club, 'squad', None)
+            starter_ids = {p['id'] for p in squad.starters()} if squad is not None else None
+            for player in roster:
+                self.players.append(player)
+                club_idx.append(i)
+                starter.append(starter_ids is None or player['id'] in starter_ids)
+
+        n = len(self.players)
+        self.club_idx = np.array(club_idx, dtype=np.intp)
+        self.starter = np.array(starter, dtype=float)
+        self.cohesion_value = np.array([cfg.profile(p['personality'], p.get('category'))['cohesion']['cohesion']
+                                        for p in self.players], dtype=float)
+        self.conflict_prob = np.array([weekly_conflict_probability(p['personality'], p.get('category'), cfg)
+                                       for p in self.players], dtype=float)
+        # player_morale_delta only depends on which side of +/-5 the rating gap is
+        self.morale_up = np.array([player_morale_delta(5.0, p['personality']) for p in self.players], dtype=float)
+        self.morale_down = np.array([player_morale_delta(-5.0, p['personality']) for p in self.players], dtype=float)
+        self.squad_size = np.bincount(self.club_idx, minlength=len(self.clubs)).astype(float)
+        self._xi_size = np.maximum(np.bincount(self.club_idx, weights=self.starter, minlength=len(self.clubs)), 1.0)
+        # The stage owns these two fields: state lives here and is written through to the dicts
+        self.cohesion = np.array([p['cohesion_index'] for p in self.players], dtype=float)
+        self.morale = np.array([p['morale'] for p in self.players], dtype=float)
+        self._trend = np.zeros((len(self.clubs), TREND_WEEKS))
+        self._week = 0
+        self._n = n
+        self._conflicts = EventSampler(random.Random(seed))  # player index -> next conflict week
+        for i, p in enumerate(self.conflict_prob.tolist()):
+            self._conflicts.set_probability(i, p)
+
+    def __len__(self):
+        return self._n
+
+    def set_conflict_probability(self, index: int, p: float):
+        """Change one player's weekly conflict probability (re-draws only that player)."""
+        self.conflict_prob[index] = p
+        self._conflicts.set_probability(index, p)
+
+    def cohesion_deltas(self) -> np.ndarray:
+        """weekly_cohesion_delta of each club's XI (fractions, capped)."""
+        totals = np.bincount(self.club_idx, weights=self.cohesion_value * self.starter, minlength=len(self.clubs))
+        cap = self.config.cohesion_weekly_cap
+        return np.clip(totals / self._xi_size, -cap, cap)
+
+    def step(self, results: Dict[str, Tuple[int, int]], objectives_met: Iterable[str] = (),
+             form: Optional[Dict[str, float]] = None) -> Dict:
+        """
+        Advance one week.
+
+        Args:
+            results: {club name: (goals for, goals against)} for clubs that played
+            objectives_met: Names of clubs currently meeting their objective
+            form: {club name: points per game over the last matches} (FormTracker.points_per_game)
+
+        Returns:
+            dict: {'conflicts': [(club name, player dict)], 'cohesion': per-club mean, 'morale': per-club mean}
+        """
+        n_clubs = len(self.clubs)
+        idx = self.club_idx
+        cohesion, morale = self.cohesion, self.morale
+        skill = np.fromiter((p['skill_rating'] for p in self.players), float, self._n)
+
+        # Conflicts: only the players whose conflict falls this week
+        fired = self._conflicts.advance()
+        conflict = np.zeros(self._n)
+        conflict[fired] = 1.0
+        club_conflicts = np.bincount(idx[fired], minlength=n_clubs)
+
+        # Cohesion
+        club_delta = self.cohesion_deltas()
+        self._trend[:, self._week % TREND_WEEKS] = club_delta
+        self._week += 1
+        cohesion += club_delta[idx] * COHESION_POINTS
+        cohesion -= club_conflicts[idx] * CONFLICT_TEAM_HIT
+        cohesion -= conflict * (CONFLICT_COHESION_HIT - CONFLICT_TEAM_HIT)
+        np.clip(cohesion, 0.0, 100.0, out=cohesion)
+
+        # Morale moves after a match: team result/objective/trend plus each player's standing
+        trend = self._trend.sum(axis=1)
+        objectives_met = set(objectives_met)
+        team = np.zeros(n_clubs)
+        played = np.zeros(n_clubs)
+        for i, club in enumerate(self.clubs):
+            score = results.get(club.name)
+            if score is None:
+                continue
+            gf, ga = score
+            result = 'win' if gf > ga else 'loss' if gf < ga else 'draw'
+            team[i] = team_morale_delta(result, club.name in objectives_met, trend[i])
+            if form:
+                team[i] += FORM_MORALE_WEIGHT * (form.get(club.name, NEUTRAL_PPG) - NEUTRAL_PPG)
+            played[i] = 1.0
+        averages = np.array([club.team_average for club in self.clubs], dtype=float)
+        gap = skill - averages[idx]
+        morale += (NEUTRAL_MORALE - morale) * MORALE_REVERSION  # results fade: morale drifts back to neutral
+        morale += team[idx]
+        morale += np.where(gap >= 5.0, self.morale_up, np.where(gap <= -5.0, self.morale_down, 0.0)) * played[idx]
+        morale -= conflict * CONFLICT_MORALE_HIT
+        np.clip(morale, 0.0, 100.0, out=morale)
+
+        for player, c, m in zip(self.players, cohesion.tolist(), morale.tolist()):
+            player['cohesion_index'] = c
+            player['morale'] = m
+
+        club_cohesion = np.bincount(idx, weights=cohesion, minlength=n_clubs) / np.maximum(self.squad_size, 1.0)
+        club_morale = np.bincount(idx, weights=morale, minlength=n_clubs) / np.maximum(self.squad_size, 1.0)
+        for club, c, m in zip(self.clubs, club_cohesion.tolist(), club_morale.tolist()):
+            club.cohesion = round(c, 2)
+            club.player_morale = round(max(0.0, min(100.0, CLUB_MORALE_BASE + m - NEUTRAL_MORALE)), 1)
+
+        return {
+            'conflicts': [(self.clubs[idx[i]].name, self.players[i]) for i in fired],
+            'cohesion': dict(zip((c.name for c in self.clubs), club_cohesion.tolist())),
+            'morale': dict(zip((c.name for c in self.clubs), club_morale.tolist())),
+        }
@@ -0,0 +1,48 @@
+"""
+Test script for the hot path benchmark suite
+"""
+
+import os
+import tempfile
+
+import bench_hotpaths
+
+
+def test_every_benchmark_runs():
+    """Each benchmark runs once and has a stored baseline"""
+    print("\n" + "="*80)
+    print("TESTING HOT PATH BENCHMARKS")
+    print("="*80)
+
+    data = bench_hotpaths.run(repeats=1)
+    baseline = bench_hotpaths.load_baseline()
+    for name, _, _ in bench_hotpaths.BENCHMARKS:
+        assert data['results'][name]['normalized'] > 0
+        assert name in baseline, f"{name} has no baseline in data/bench_baseline.json"
+        print(f"✅ {name}: {data['results'][name]['us_per_item']:.1f} µs/item")
+
+
+def test_regression_detection():
+    """A result slower than baseline x threshold is flagged"""
+    results = {'a': {'normalized': 1.5}, 'b': {'normalized': 1.0}, 'new': {'normalized': 9.0}}
+    baseline = {'a': {'normalized': 1.0}, 'b': {'normalized': 1.0}}
+    rows = {name: regressed for name, _, regressed in bench_hotpaths.compare(results, baseline, 1.3)}
+    assert rows == {'a': True, 'b': False}
+
+
+def test_update_and_exit_code():
+    """--update stores a baseline; a slowed-down baseline makes the run fail"""
+    path = os.path.join(tempfile.mkdtemp(), "baseline.json")
+    assert bench_hotpaths.main(['--only', 'personality', '--repeats', '1', '--update', '--baseline', path]) == 0
+    results = bench_hotpaths.load_baseline(path)
+    results['personality_impact']['normalized'] /= 10
+    bench_hotpaths.save_baseline(results, path)
+    assert bench_hotpaths.main(['--only', 'personality', '--repeats', '1', '--baseline', path]) == 1
+    os.remove(path)
+    print("✅ Regression makes the suite exit with status 1")
+
+
+if __name__ == "__main__":
+    test_every_benchmark_runs()
+    test_regression_detection()
+    test_update_and_exit_code()
@@ -0,0 +1,85 @@
+"""
+Test script for the vectorized bulk player generator
+"""
+
+import random
+import time
+
+import numpy as np
+
+from player import Player
+from bulk_generator import generate_player_batch, POSITION_KEYS
+from personality_rules import (
+    MENTAL_ATTRIBUTES,
+    PERSONALITY_NAMES,
+    MEDIA_HANDLING_NAMES,
+    classify_personalities,
+    classify_media_handling,
+)
+
+
+def test_vectorized_classifiers_match_player():
+    """The rule tables must give the same answer as the Player if-chains"""
+    print("\n" + "="*80)
+    print("TESTING VECTORIZED PERSONALITY CLASSIFIER")
+    print("="*80)
+
+    rng = np.random.default_rng(7)
+    n = 20000
+    mental = rng.integers(1, 21, (n, len(MENTAL_ATTRIBUTES)))
+    ages = rng.integers(17, 35, n)
+    is_regen = rng.random(n) < 0.5
+
+    personalities = classify_personalities(mental, ages, is_regen)
+    media = classify_media_handling(mental)
+
+    player = Player("Probe", 20, "Midfielder")
+    for i in range(n):
+        for attr, value in zip(MENTAL_ATTRIBUTES, mental[i].tolist()):
+            setattr(player, attr, value)
+        player.age = int(ages[i])
+        assert PERSONALITY_NAMES[personalities[i]] == player.calculate_personality(is_regen=bool(is_regen[i]))
+        assert MEDIA_HANDLING_NAMES[media[i]] == player.calculate_media_handling()
+
+    print(f"✅ {n} random attribute sets classified identically")
+
+
+def test_batch_matches_player_ratings():
+    """Materialized players carry the same ratings the Player class computes"""
+    print("\n" + "="*80)
+    print("TESTING BULK PLAYER GENERATION")
+    print("="*80)
+
+    batch = generate_player_batch(5000, quality=['poor', 'average', 'good'], regen_fraction=0.3, seed=42)
+    assert len(batch) == 5000
+    assert batch.technical.min() >= 1 and batch.technical.max() <= 20
+    assert batch.mental.min() >= 1 and batch.mental.max() <= 20
+
+    for i in random.Random(1).sample(range(len(batch)), 200):
+        player = batch.player(i)
+        assert batch.player(i) is player
+        for pos in POSITION_KEYS[:-1]:
+            assert abs(player.position_rating[pos] - player.calculate_rating_for_position(pos)) <= 0.011
+        assert player.current_rating < player.potential_rating or player.current_rating >= 0.99
+        assert player.personality == player.calculate_personality(is_regen=bool(batch.is_regen[i]))
+        assert player.media_handling == player.calculate_media_handling()
+        assert player.transfer_value == max(10000, player.current_overall_score * 500)
+
+    print(f"✅ 200 materialized players verified ({len(batch._materialized)} of {len(batch)} built)")
+    print(f"Personalities: {batch.personality_counts()}")
+
+
+def test_large_batch_speed():
+    """A large world should be generated in well under a few seconds"""
+    start = time.perf_counter()
+    batch = generate_player_batch(200_000, seed=3)
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ {len(batch):,} players generated in {elapsed:.2f}s")
+    assert not batch._materialized
+    assert elapsed < 5.0
+
+
+if __name__ == "__main__":
+    test_vectorized_classifiers_match_player()
+    test_batch_matches_player_ratings()
+    test_large_batch_speed()
@@ -0,0 +1,112 @@
+"""
+Test script for the compiled season calendar
+"""
+
+import contextlib
+import io
+import random
+import time
+
+from agent import Agent
+from calendar_index import CalendarIndex, Phase, phase_of
+from game import FootballAgentGame
+
+
+def _game():
+    random.seed(41)
+    game = FootballAgentGame()
+    game.agent = Agent("Calendar", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    return game
+
+
+class _Club:
+    def __init__(self, name):
+        self.name = name
+
+
+def test_calendar_matches_schedule():
+    """Phases, windows and per-club fixtures agree with the schedule they were compiled from"""
+    print("\n" + "="*80)
+    print("TESTING CALENDAR INDEX")
+    print("="*80)
+
+    game = _game()
+    calendar = game.calendar
+    assert len(calendar) == game.total_weeks
+
+    for week, entry in enumerate(game.schedule):
+        label = entry['phase']
+        in_window = label.startswith("Pretemporada") or label.startswith("Descanso")
+        assert game._is_transfer_window(week) == in_window
+        assert calendar.is_league_week(week) == label.startswith("Liga Nacional")
+        if in_window:
+            start = week
+            while start > 0 and (game.schedule[start - 1]['phase'].startswith(("Pretemporada", "Descanso"))):
+                start -= 1
+            assert calendar.window_start(week) == start
+
+        opponents = {}
+        for home, away in entry['fixtures']:
+            opponents[home] = (away, True)
+            opponents[away] = (home, False)
+        for club in game.clubs + game.international_clubs:
+            fixture = calendar.fixture_for(club.name, week)
+            expected = opponents.get(club.name)
+            got = (fixture[0].name, fixture[1]) if fixture else None
+            assert got == expected, (week, club.name, got, expected)
+
+    assert calendar.phase(-1) is None and calendar.phase(len(calendar)) is None
+    assert not game._is_transfer_window(len(calendar))
+    counts = {phase.name: len(calendar.weeks_in(phase)) for phase in Phase}
+    print(f"✅ {len(calendar)} weeks compiled: {counts}")
+
+
+def test_calendar_follows_schedule_replacement():
+    """Replacing the schedule (as the season rollover does) recompiles the index"""
+    game = _game()
+    first = game.calendar
+    assert game.calendar is first  # cached while the schedule is unchanged
+    game.schedule = [{"phase": "Pretemporada", "fixtures": []}]
+    assert game.calendar is not first and len(game.calendar) == 1
+    assert phase_of("Playoff Internacional - Final") == Phase.PLAYOFF and phase_of("???") is None
+
+    client_game = _game()
+    client = client_game.all_players[0]
+    client.club, client.signed = client_game.clubs[0].name, True
+    client_game.agent.clients.append(client)
+    league_week = client_game.calendar.weeks_in(Phase.LEAGUE)[0]
+    [(player, opponent, is_home)] = client_game.client_fixtures(league_week)
+    assert player is client and opponent.name in {name for fixture in client_game.schedule[league_week]['fixtures']
+                                                   for name in fixture}
+    print(f"✅ {client.name} plays {opponent.name} ({'local' if is_home else 'visitante'}) in week {league_week + 1}")
+
+
+def test_lookups_do_not_grow_with_league_size():
+    """A 400-club league compiles once; lookups stay array indexing"""
+    clubs = [_Club(f"Club {i}") for i in range(400)]
+    weeks = []
+    for round_index in range(40):
+        order = clubs[round_index:] + clubs[:round_index]
+        weeks.append({"phase": f"Liga Nacional - Jornada {round_index + 1}",
+                      "fixtures": [(order[i].name, order[-1 - i].name) for i in range(200)]})
+    start = time.perf_counter()
+    calendar = CalendarIndex([{"phase": "Pretemporada", "fixtures": []}] * 10 + weeks, clubs)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for week in range(50):
+        for club in clubs:
+            calendar.fixture_for(club.name, week)
+            calendar.is_transfer_window(week)
+    per_lookup = (time.perf_counter() - start) / (50 * 400)
+    assert calendar.fixture_for("Club 0", 10)[0].name == "Club 399"
+    assert per_lookup < 20e-6, f"{per_lookup * 1e6:.1f} µs per lookup"
+    print(f"✅ 400 clubs x 50 weeks compiled in {build * 1000:.1f} ms, {per_lookup * 1e6:.2f} µs per lookup")
+
+
+if __name__ == "__main__":
+    test_calendar_matches_schedule()
+    test_calendar_follows_schedule_replacement()
+    test_lookups_do_not_grow_with_league_size()
@@ -0,0 +1,109 @@
+"""
+Test script for batched club-interest evaluation
+"""
+
+import random
+import time
+
+from club import Club, FORMATION_SLOTS
+from club_interest import (
+    evaluate_interest, NOT_GOOD_ENOUGH, LOW_BUDGET, POSITION_MISMATCH, PERSONALITY, OWN_CLUB,
+)
+from game_data import get_default_clubs, get_international_clubs
+from player import Player
+from transfer_market import position_key
+
+POSITIONS = ['Goalkeeper', 'Defender', 'Full Back', 'Wing Back', 'Defensive Midfielder', 'Midfielder',
+             'Side Midfielder', 'Winger', 'Attacking Midfielder', 'Forward']
+PERSONALITIES = ['Model Citizen', 'Professional', 'Slack', 'Temperamental', 'Mercenary', 'Neutral']
+
+
+def _reference(club, player, overall):
+    """One pair, checked one rule at a time"""
+    reasons = []
+    if overall < 50:
+        reasons.append("not good enough")
+    if (club.budget or 500000) < overall * 150 * 2:
+        reasons.append("insufficient budget")
+    if position_key(player) not in club.formation_positions:
+        reasons.append("position mismatch")
+    if player.personality in ('Slack', 'Temperamental', 'Spineless', 'Mercenary'):
+        reasons.append("personality concerns")
+    return len(reasons) < 2, len(reasons)
+
+
+def _players(n, clubs, seed):
+    rng = random.Random(seed)
+    players = []
+    for i in range(n):
+        player = Player(f"Interest {i}", 24, rng.choice(POSITIONS))
+        player.current_overall_score = rng.uniform(40, 90)
+        player.personality = rng.choice(PERSONALITIES)
+        player.club = rng.choice(clubs).name if rng.random() < 0.5 else None
+        players.append(player)
+    return players
+
+
+def test_matrix_matches_pairwise_rules():
+    """Every cell agrees with evaluating the pair on its own"""
+    print("\n" + "="*80)
+    print("TESTING CLUB INTEREST MATRIX")
+    print("="*80)
+
+    random.seed(3)
+    clubs = get_default_clubs() + get_international_clubs()
+    clubs[0].budget = 20000   # a club that cannot afford anyone good
+    players = _players(200, clubs, seed=3)
+    interest = evaluate_interest(clubs, players)
+    assert interest.shape == (len(clubs), len(players))
+
+    for i, club in enumerate(clubs):
+        for j, player in enumerate(players):
+            interested, count = _reference(club, player, player.current_overall_score)
+            flags = int(interest.flags[i, j])
+            assert bin(flags & 15).count('1') == count
+            if player.club == club.name:
+                assert flags & OWN_CLUB and not interest.interested[i, j]
+            else:
+                assert bool(interest.interested[i, j]) == interested
+    print(f"✅ {len(clubs)} clubs x {len(players)} players agree with the pairwise rules "
+          f"({int(interest.interested.sum())} interested pairs)")
+
+
+def test_reason_flags_and_text():
+    """Flags decode to the same reasons the single-offer evaluation reports"""
+    club = Club("Flags FC", "Mitad de Tabla", "3-5-2", "Posesion", "DT")
+    club.budget = 10000
+    player = Player("Flags Player", 22, "Winger")
+    player.current_overall_score = 45
+    player.personality = "Slack"
+
+    interest = evaluate_interest([club], [player])
+    flags = int(interest.flags[0, 0])
+    assert flags == NOT_GOOD_ENOUGH | LOW_BUDGET | POSITION_MISMATCH | PERSONALITY
+    assert "WF" not in FORMATION_SLOTS["3-5-2"]
+    decision = interest.decision(club, player)
+    assert not decision["interested"]
+    assert decision["reason"] == ("not good enough + insufficient budget + "
+                                  "position mismatch (Winger not in 3-5-2) + personality concerns (Slack)")
+    assert interest.interested_clubs(player) == []
+    print(f"✅ {decision['reason']}")
+
+
+def test_window_scan_is_one_call():
+    """A whole market (all clubs x 1000 players) evaluates in one fast call"""
+    random.seed(4)
+    clubs = get_default_clubs() + get_international_clubs()
+    players = _players(1000, clubs, seed=4)
+    start = time.perf_counter()
+    interest = evaluate_interest(clubs, players)
+    elapsed = time.perf_counter() - start
+    assert interest.shape == (len(clubs), 1000)
+    assert elapsed < 0.5, f"interest scan took {elapsed:.3f}s"
+    print(f"✅ {len(clubs)} x 1000 interest matrix in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    test_matrix_matches_pairwise_rules()
+    test_reason_flags_and_text()
+    test_window_scan_is_one_call()
@@ -0,0 +1,118 @@
+"""
+Test script for roster-driven club strength
+"""
+
+import contextlib
+import io
+import random
+
+from agent import Agent
+from club_strength import SquadStrength
+from game import FootballAgentGame
+from personality_impact import expected_performance_multiplier
+
+
+def _game():
+    random.seed(43)
+    game = FootballAgentGame()
+    game.agent = Agent("Strength", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    return game
+
+
+def _best_xi_average(roster, slots):
+    """Reference: full recomputation of the best-XI mean effective rating"""
+    slots = {'GK': 1, **slots}
+    total, size = 0.0, 0
+    for position, n in slots.items():
+        ratings = sorted((p['skill_rating'] * expected_performance_multiplier(p['personality'], p['category'])
+                          for p in roster if p['position'] == position), reverse=True)[:n]
+        total += sum(ratings)
+        size += len(ratings)
+    return total / size
+
+
+def _player(uid, position, rating, personality='Professional', category='Good'):
+    return {'id': uid, 'name': f"P{uid}", 'position': position, 'skill_rating': rating,
+            'personality': personality, 'category': category}
+
+
+def test_incremental_updates_match_full_recompute():
+    """Growth, drops and replacements (bench players included) agree with a full best-XI recompute"""
+    print("\n" + "="*80)
+    print("TESTING CLUB STRENGTH")
+    print("="*80)
+
+    rng = random.Random(7)
+    slots = {'CB': 2, 'FB': 2, 'CM': 2, 'SM': 2, 'FW': 2}
+    positions = ['GK', 'GK'] + [pos for pos, n in slots.items() for _ in range(n + 1)]
+    personalities = [('Leader', 'Good'), ('Lazy', 'Bad'), ('Temperamental', 'Bad'), ('Ambitious', 'Best')]
+    roster = [_player(i, pos, round(rng.uniform(55, 85), 1), *personalities[i % 4]) for i, pos in enumerate(positions)]
+    squad = SquadStrength(roster, slots)
+    assert squad.size == 11 and len(squad.starters()) == 11
+    assert abs(squad.average - _best_xi_average(roster, slots)) < 1e-9
+
+    next_id = len(roster)
+    for step in range(500):
+        i = rng.randrange(len(roster))
+        player = roster[i]
+        if step % 10 == 9:
+            new = _player(next_id, player['position'], round(rng.uniform(50, 90), 1), *personalities[next_id % 4])
+            next_id += 1
+            roster[i] = new
+            squad.replace(player, new)
+        else:
+            old = player['skill_rating']
+            player['skill_rating'] = round(old + rng.choice((0.3, 0.2, -0.4, 5.0, -6.0)), 1)
+            squad.rating_changed(player, old)
+        assert abs(squad.average - _best_xi_average(roster, slots)) < 1e-6, step
+    print(f"✅ 500 updates on a {len(roster)}-player roster, XI average {squad.average:.2f}")
+
+
+def test_strength_follows_squad_development():
+    """team_average comes from the roster; growth raises strength, win odds and xG"""
+    game = _game()
+    club = game.clubs[0]
+    roster = game.club_rosters[club.name]
+    assert club.team_average == round(_best_xi_average(roster, club.formation_slots()), 1)
+    assert abs(club.team_average - club.base_average) < 10  # rosters are drawn around the club's level
+
+    opponent = game.clubs[1]
+    before = (club.strength, club.get_win_probability(opponent), club.get_quick_profile())
+    for player in roster:
+        old = player['skill_rating']
+        player['skill_rating'] = old + 3.0
+        club.squad.rating_changed(player, old)
+    after = club.get_quick_profile()
+    assert club.strength > before[0]
+    assert club.get_win_probability(opponent) >= before[1]
+    assert after is not before[2] and after['xg'] >= before[2]['xg']
+    assert club.get_quick_profile() is after  # cached until something changes
+
+    foreign = game.international_clubs[0]
+    assert foreign.squad is None and foreign.strength == foreign.reputation
+    print(f"✅ {club.name}: strength {before[0]:.1f} → {club.strength:.1f}, xG {before[2]['xg']} → {after['xg']}")
+
+
+def test_game_growth_and_renewals_update_strength():
+    """Weekly growth and season renewals keep each club's XI average current"""
+    game = _game()
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']][:4]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game._process_weekly_player_growth(week_index)
+    assert game.growth_log
+    club = game.clubs[0]
+    leaving = game.club_rosters[club.name][0]
+    game._apply_season_renewals([{'player_id': leaving['id'], 'player': leaving['name'], 'wants_renewal': False}])
+    for club in game.clubs:
+        roster = game.club_rosters[club.name]
+        assert abs(club.squad.average - _best_xi_average(roster, club.formation_slots())) < 1e-6, club.name
+    print(f"✅ {len(game.growth_log)} improvements and a replacement reflected in {len(game.clubs)} clubs")
+
+
+if __name__ == "__main__":
+    test_incremental_updates_match_full_recompute()
+    test_strength_follows_squad_development()
+    test_game_growth_and_renewals_update_strength()
@@ -0,0 +1,104 @@
+"""
+Test script for skip-ahead sampling of rare weekly events
+"""
+
+import contextlib
+import io
+import random
+
+import game as game_module
+from agent import Agent
+from event_sampler import EventSampler, geometric_wait
+from game import FootballAgentGame
+
+
+class _CountingRandom(random.Random):
+    """random.Random that counts random() calls"""
+
+    calls = 0
+
+    def random(self):
+        self.calls += 1
+        return super().random()
+
+
+def test_event_rate_matches_probability():
+    """Events happen at the weekly probability, and each week costs one draw per event"""
+    print("\n" + "="*80)
+    print("TESTING EVENT SAMPLER")
+    print("="*80)
+
+    rng = _CountingRandom(5)
+    sampler = EventSampler(rng)
+    for key in range(20000):
+        sampler.set_probability(key, 0.02)
+    setup_draws = rng.calls
+    assert setup_draws == 20000
+
+    events = 0
+    for _ in range(50):
+        events += len(sampler.advance())
+    expected = 20000 * 0.02 * 50
+    assert abs(events - expected) < 0.05 * expected, (events, expected)
+    assert rng.calls - setup_draws == events  # one draw per event, none for the quiet players
+    print(f"✅ {events} events in 50 weeks (expected {expected:.0f}), {rng.calls - setup_draws} draws")
+
+
+def test_resample_only_on_change():
+    """Same probability keeps the drawn week; a new one re-draws; removed and p=0 keys never fire"""
+    sampler = EventSampler(random.Random(1))
+    sampler.set_probability('a', 0.01)
+    due = sampler.due_week('a')
+    sampler.set_probability('a', 0.01)
+    assert sampler.due_week('a') == due
+    sampler.set_probability('a', 1.0)
+    assert sampler.due_week('a') == 1
+    sampler.set_probability('b', 0.0)
+    sampler.set_probability('c', 1.0)
+    sampler.remove('c')
+    assert sampler.advance() == ['a'] and sampler.advance(2) == ['a', 'a']
+    assert sampler.due_week('b') is None and 'c' not in sampler and len(sampler) == 1
+
+    for _ in range(1000):  # stale entries are compacted
+        sampler.set_probability('a', random.random() * 0.5 + 0.1)
+    assert len(sampler._heap) <= 2 * len(sampler) + 64
+    assert geometric_wait(0.0) == float('inf') and geometric_wait(1.0) == 1
+    print("✅ Re-draws only on change; stale heap entries compacted")
+
+
+def test_game_growth_skips_quiet_players():
+    """After the first league week, growth chances are re-computed only for clubs whose form band moved"""
+    random.seed(45)
+    game = FootballAgentGame()
+    game.agent = Agent("Sampler", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    roster_players = sum(len(r) for r in game.club_rosters.values())
+
+    calls = []
+    original = game_module.skill_growth_chance
+    game_module.skill_growth_chance = lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs)
+    try:
+        league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']]
+        per_week = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for week_index in league_weeks:
+                game.agent.week = week_index + 1
+                game._simulate_week_fixtures(week_index)
+                before = len(calls)
+                game._process_weekly_player_growth(week_index)
+                per_week.append(len(calls) - before)
+    finally:
+        game_module.skill_growth_chance = original
+
+    assert per_week[0] == roster_players
+    assert sum(per_week[1:]) < roster_players * (len(per_week) - 1) / 2
+    assert game.growth_log and all(e['growth_prob'] > 0 for e in game.growth_log)
+    print(f"✅ {roster_players} chances in week 1, {sum(per_week[1:])} over the next {len(per_week) - 1} weeks; "
+          f"{len(game.growth_log)} growth events")
+
+
+if __name__ == "__main__":
+    test_event_rate_matches_probability()
+    test_resample_only_on_change()
+    test_game_growth_skips_quiet_players()
@@ -0,0 +1,139 @@
+"""
+Test script for the rolling-form tracker (ring buffers of the last matches)
+"""
+
+import contextlib
+import io
+import random
+
+from agent import Agent
+from form_tracker import FORM_WINDOW, NEUTRAL_PPG, FormTracker, RingBuffer
+from game import FootballAgentGame
+
+
+def test_ring_buffers_match_last_window():
+    """Running sums and trends equal a recomputation over the last FORM_WINDOW values"""
+    print("\n" + "="*80)
+    print("TESTING FORM TRACKER")
+    print("="*80)
+
+    rng = random.Random(48)
+    buffer = RingBuffer()
+    history = []
+    for _ in range(200):
+        value = rng.uniform(4, 9)
+        buffer.push(value)
+        history.append(value)
+        window = history[-FORM_WINDOW:]
+        assert buffer.values() == window
+        assert abs(buffer.mean() - sum(window) / len(window)) < 1e-9
+    half = FORM_WINDOW // 2
+    assert abs(buffer.trend() - (sum(window[-half:]) - sum(window[:half])) / half) < 1e-9
+
+    one_by_one, bulk = FormTracker(), FormTracker()
+    for _ in range(12):
+        ids = list(range(11))
+        ratings = [rng.uniform(5, 9) for _ in ids]
+        goals = [0] * 11
+        goals[rng.randrange(11)] = 1
+        for i in ids:
+            one_by_one.record_player(i, ratings[i], goals[i])
+        bulk.record_lineup(ids, ratings, goals)
+    for i in range(11):
+        a, b = one_by_one.player(i), bulk.player(i)
+        assert a.recent_ratings() == b.recent_ratings() and a.matches == b.matches == FORM_WINDOW
+        assert abs(a.goals_per_match - b.goals_per_match) < 1e-9
+        assert abs(a.average_rating - b.average_rating) < 1e-9
+    print(f"✅ 200 pushes match the last-{FORM_WINDOW} window; bulk lineup recording matches per-player")
+
+
+def test_club_form_metrics():
+    """Points per game, form band and xG trend reflect only the recent run"""
+    tracker = FormTracker()
+    assert tracker.points_per_game() == {}
+    for _ in range(10):
+        tracker.record_club("Rachas FC", 0, 2, 0.8, 1.6)  # a long bad run...
+    for gf, xg in [(2, 1.2), (3, 1.5), (1, 1.9), (2, 2.2), (4, 2.6)]:
+        tracker.record_club("Rachas FC", gf, 0, xg, 0.9)  # ...then five straight wins
+    form = tracker.club("Rachas FC")
+    assert form.points_per_game == 3.0 and form.rating_diff() == 5
+    assert form.goal_diff_per_game == 2.4
+    assert form.xg_trend > 0
+    tracker.record_club("Rachas FC", 0, 1)
+    tracker.record_club("Rachas FC", 0, 1)
+    tracker.record_club("Rachas FC", 0, 1)
+    assert form.points_per_game == 1.2 and form.rating_diff() == 0
+    assert tracker.club("Otro FC") is None
+    print(f"✅ Good run: 3.0 ppg (+5 band); three losses later {form.points_per_game} ppg (neutral band)")
+
+
+def test_game_uses_recent_form():
+    """League weeks fill club/roster/client form; offers follow the client's recent scoring"""
+    random.seed(48)
+    game = FootballAgentGame()
+    game.agent = Agent("Forma", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    client = game.all_players[0]
+    client.club, client.signed = game.clubs[0].name, True
+    game.agent.clients.append(client)
+
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']][:8]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game.agent.week = week_index + 1
+            game.simulate_week(week_index)
+    for club in game.clubs:
+        form = game.form.club(club.name)
+        assert form is not None and form.matches == min(FORM_WINDOW, game.league_table[club.name]['played'])
+    roster_player = game.club_rosters[game.clubs[1].name][0]
+    assert game.form.player(roster_player['id']).matches == FORM_WINDOW
+    assert set(game.form.points_per_game()) == {c.name for c in game.clubs}
+    assert game._growth_bands[game.clubs[1].name][0] == game.form.club(game.clubs[1].name).rating_diff()
+    # The client card lists the same matches whose ratings make up the tracked form
+    assert [m['rating'] for m in client.stats.recent] == game.form.player(client.uid).recent_ratings()
+
+    rival = game.clubs[1]
+    offers = {}
+    for label, goals in (("hot", 2), ("cold", 0)):
+        for _ in range(FORM_WINDOW):
+            game.form.record_player(client.uid, 7.0, goals)
+        random.seed(1)
+        offers[label] = game._create_transfer_offer(client, rival)
+    assert offers["hot"]["wage"] > offers["cold"]["wage"]
+    average = sum(game.form.points_per_game().values()) / len(game.clubs)
+    print(f"✅ {len(game.clubs)} clubs tracked (avg {average:.2f} ppg vs neutral {NEUTRAL_PPG}); "
+          f"wage offer hot {offers['hot']['wage']} vs cold {offers['cold']['wage']}")
+
+
+def test_free_agent_offers_follow_recent_form():
+    """Guaranteed free-agent offers read the same recent form as transfer offers"""
+    random.seed(49)
+    game = FootballAgentGame()
+    game.agent = Agent("Libre", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    client = game.all_players[0]
+    client.club, client.signed = None, False
+    game.agent.clients.append(client)
+
+    wages = {}
+    for label, goals in (("hot", 2), ("cold", 0)):
+        for _ in range(FORM_WINDOW):
+            game.form.record_player(client.uid, 7.0, goals)
+        game.agent.pending_offers = []
+        random.seed(2)
+        with contextlib.redirect_stdout(io.StringIO()):
+            game._generate_transfer_offers_for_clients(0)
+        offer, = [o for o in game.agent.pending_offers if o["player"] is client]
+        assert offer["fee"] == 0
+        wages[label] = offer["wage"]
+    assert client.season_appearances == 0 and wages["hot"] > wages["cold"]
+    print(f"✅ Free-agent wage offer hot {wages['hot']} vs cold {wages['cold']}")
+
+
+if __name__ == "__main__":
+    test_ring_buffers_match_last_window()
+    test_club_form_metrics()
+    test_game_uses_recent_form()
+    test_free_agent_offers_follow_recent_form()
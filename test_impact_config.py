@@ -0,0 +1,124 @@
+"""
+Test script for the personality impact config service
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import impact_config
+import personality_impact
+
+
+def test_import_does_not_read_config():
+    """Importing the game must not parse the impact config"""
+    print("\n" + "="*80)
+    print("TESTING LAZY IMPACT CONFIG")
+    print("="*80)
+
+    code = "import game, impact_config; print(len(impact_config._services))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert out.stdout.strip() == "0"
+    print("✅ game imported without loading the config")
+
+
+def _temp_config():
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "impacts.json")
+    shutil.copy(impact_config.CONFIG_PATH, path)
+    return tmp, path
+
+
+def _rewrite(path, mutate):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    mutate(data)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+
+
+def test_compiled_artifact_tracks_json():
+    """The precompiled artifact is reused, and rebuilt when the JSON changes"""
+    tmp, path = _temp_config()
+    try:
+        compiled = impact_config.current_config(path)
+        assert os.path.exists(impact_config.compiled_path(path))
+        stamp = impact_config._source_stamp(path)
+        assert impact_config._read_compiled(path, stamp).profiles == compiled.profiles
+
+        _rewrite(path, lambda d: d["caps"].update(conflict_base_weekly=0.5))
+        assert impact_config._read_compiled(path, impact_config._source_stamp(path)) is None
+        impact_config.clear_cache()
+        assert impact_config.load_config(path)["caps"]["conflict_base_weekly"] == 0.5
+    finally:
+        impact_config.clear_cache()
+        shutil.rmtree(tmp)
+    print("✅ Artifact rebuilt after the JSON changed")
+
+
+def test_schema_validation():
+    """Broken configs are rejected with a message per problem"""
+    raw = json.loads(json.dumps(impact_config.load_config()))
+    impact_config.validate_config(raw)
+
+    raw["personalities"]["Leader"]["cohesion_level"] = "Sky High"
+    raw["caps"]["performance_min"] = 1.0
+    del raw["renewal"]["weights"]["player_morale"]
+    try:
+        impact_config.validate_config(raw)
+    except impact_config.ConfigError as e:
+        assert len(e.errors) == 3
+        print(f"✅ Invalid config rejected:\n{e}")
+    else:
+        raise AssertionError("invalid config was accepted")
+
+
+def test_hot_reload_swaps_and_pins():
+    """File changes swap in a new version; pinned versions keep their values"""
+    tmp, path = _temp_config()
+    try:
+        service = impact_config.get_service(path)
+        pinned = service.current
+        assert service.reload_if_changed() is False
+
+        _rewrite(path, lambda d: d["renewal"]["base_by_personality"].update(Ambitious=0.2))
+        assert service.reload_if_changed() is True
+        assert service.current.version == pinned.version + 1
+        assert service.current.renew_base_personality["Ambitious"] == 0.2
+        assert pinned.renew_base_personality["Ambitious"] == 0.10
+
+        # Same inputs, different pinned versions
+        old = personality_impact.renewal_intent_probability("Ambitious", config=pinned)
+        new = personality_impact.renewal_intent_probability("Ambitious", config=service.current)
+        assert abs((new - old) - 0.10) < 1e-9
+
+        # An invalid file keeps the running version
+        current = service.current
+        _rewrite(path, lambda d: d.pop("levels"))
+        assert service.reload_if_changed() is False
+        assert service.current is current
+        assert isinstance(service.last_error, impact_config.ConfigError)
+    finally:
+        impact_config.clear_cache()
+        shutil.rmtree(tmp)
+    print("✅ Config hot-reloaded, invalid change ignored")
+
+
+def test_legacy_names_still_available():
+    """Old module-level tables are resolved on first access"""
+    assert personality_impact._PERSONALITIES is personality_impact._CONFIG["personalities"]
+    assert "caps" in personality_impact._CONFIG
+    assert 0.0005 <= personality_impact.weekly_conflict_probability("Leader", "Good") <= 0.010
+    print("✅ Legacy config names resolve lazily")
+
+
+if __name__ == "__main__":
+    test_import_does_not_read_config()
+    test_compiled_artifact_tracks_json()
+    test_schema_validation()
+    test_hot_reload_swaps_and_pins()
+    test_legacy_names_still_available()
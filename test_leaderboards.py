@@ -0,0 +1,113 @@
+"""
+Test script for league-wide leaderboards
+"""
+
+import contextlib
+import io
+import random
+
+from agent import Agent
+from game import FootballAgentGame
+from leaderboards import Leaderboards, RankedIndex
+
+
+def test_ranked_index():
+    """Updates keep the order; top(k) and rank agree with a full sort"""
+    print("\n" + "="*80)
+    print("TESTING LEADERBOARDS")
+    print("="*80)
+
+    random.seed(1)
+    index = RankedIndex()
+    values = {}
+    for _ in range(2000):
+        name = f"P{random.randrange(300)}"
+        delta = random.randint(-3, 5)
+        values[name] = values.get(name, 0) + delta
+        index.add(name, delta)
+    for name in random.sample(sorted(values), 20):
+        index.remove(name)
+        del values[name]
+
+    expected = sorted(values.items(), key=lambda kv: (-kv[1], kv[0]))
+    assert index.top(20) == expected[:20]
+    assert len(index) == len(values)
+    for pos, (name, _) in enumerate(expected, 1):
+        assert index.rank(name) == pos
+    print(f"✅ {len(index)} entries ordered, top 20 matches a full sort")
+
+
+def test_rating_board_needs_minimum_matches():
+    boards = Leaderboards(min_rated_appearances=2)
+    boards.record_averages(["A"], ["Club A"], [9.0], [1], {"A": 1})
+    assert boards.top('rating') == []
+    boards.record_averages(["A"], ["Club A"], [8.0], [2])
+    assert boards.top('rating')[0]['value'] == 8.0
+    assert boards.top('goals') == [{'rank': 1, 'id': "A", 'name': "A", 'club': "Club A", 'value': 1}]
+    print("✅ Rating board waits for the minimum matches")
+
+
+def test_batched_averages_rank_like_a_full_sort():
+    """Matchday batches of season averages rank like sorting the final averages"""
+    random.seed(2)
+    boards = Leaderboards()
+    keys = list(range(40))
+    sums, matches, goals = [0.0] * 40, [0] * 40, [0] * 40
+    for _ in range(6):
+        played = [k for k in keys if random.random() < 0.9]
+        scored = {random.choice(played): 1}
+        for k in played:
+            sums[k] += round(random.uniform(5, 9), 1)
+            matches[k] += 1
+        for k, n in scored.items():
+            goals[k] += n
+        boards.record_averages(played, ["Club"] * len(played), [sums[k] / matches[k] for k in played],
+                               [matches[k] for k in played], scored)
+
+    ranked = [k for k in keys if matches[k] >= boards.min_rated_appearances]
+    expected = sorted(((k, sums[k] / matches[k]) for k in ranked), key=lambda kv: (-kv[1], kv[0]))
+    assert [(r['id'], r['value']) for r in boards.top('rating', 40)] == [(k, round(v, 2)) for k, v in expected]
+    expected = sorted(((k, n) for k, n in enumerate(goals) if n), key=lambda kv: (-kv[1], kv[0]))
+    assert [(r['id'], r['value']) for r in boards.top('goals', 40)] == expected
+    print("✅ Batched matchday averages rank like a full sort")
+
+
+def test_game_boards_follow_the_league():
+    """Roster goals add up to the league table; boards reset at season rollover"""
+    random.seed(9)
+    game = FootballAgentGame()
+    game.agent = Agent("Boards", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+        client = game.all_players[0]
+        client.club, client.signed = game.clubs[0].name, True
+        game.agent.clients.append(client)
+        first = next(i for i, w in enumerate(game.schedule) if w['fixtures'])
+        for week_index in range(first, first + 10):
+            game.simulate_week(week_index)
+            game.agent.advance_week()
+
+    roster_ids = {p['id'] for r in game.club_rosters.values() for p in r}
+    roster_goals = sum(v for key, v in game.leaderboards.boards['goals'].top(10**6) if key in roster_ids)
+    assert roster_goals == sum(s['gf'] for s in game.league_table.values())
+    top = game.leaderboards.top('goals', 20)
+    assert len(top) == 20 and top[0]['value'] >= top[-1]['value']
+    assert game.leaderboards.top('rating', 5) and game.leaderboards.top('growth', 5)
+    ratings = game.leaderboards.boards['rating']
+    assert client.uid in ratings
+    for key in (client.uid, *[row['id'] for row in game.leaderboards.top('rating', 20)]):
+        # roster and client averages both come from the match stats columns
+        assert abs(ratings.get(key) - game.match_stats.player(key)['avg_rating']) < 0.01
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = game.rollover_season()
+    assert summary['leaders']['goals'][0]['name'] == top[0]['name']
+    assert game.leaderboards.top('goals') == []
+    print(f"✅ Top scorer {top[0]['name']} ({top[0]['value']}) archived with the season")
+
+
+if __name__ == "__main__":
+    test_ranked_index()
+    test_rating_board_needs_minimum_matches()
+    test_batched_averages_rank_like_a_full_sort()
+    test_game_boards_follow_the_league()
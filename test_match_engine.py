@@ -0,0 +1,98 @@
+"""
+Test script for the tiered-fidelity match engine
+"""
+
+import contextlib
+import io
+import random
+
+import numpy as np
+
+from agent import Agent
+from game import FootballAgentGame
+from match_engine import fast_scorelines, plan_fixtures, player_match_line
+from match_model import expected_goals
+from player import Player
+
+
+def _game(fidelity, seed=4):
+    random.seed(seed)
+    game = FootballAgentGame()
+    game.agent = Agent("Engine", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    game.set_sim_fidelity(fidelity)
+    client = game.all_players[0]
+    client.sign_with_club(game.clubs[0].name, 5000, 100)
+    game.agent.clients.append(client)
+    return game, client
+
+
+def test_plan_fixtures():
+    """Only fixtures with a client's club get the detailed tier in 'clients' mode"""
+    print("\n" + "="*80)
+    print("TESTING MATCH ENGINE")
+    print("="*80)
+
+    fixtures = [("A", "B"), ("C", "D"), ("E", "A")]
+    assert plan_fixtures(fixtures, {"A"}) == ([("A", "B"), ("E", "A")], [("C", "D")])
+    assert plan_fixtures(fixtures, {"A"}, 'fast') == ([], fixtures)
+    assert plan_fixtures(fixtures, set(), 'detailed') == (fixtures, [])
+    try:
+        plan_fixtures(fixtures, set(), 'turbo')
+        assert False, "unknown mode accepted"
+    except ValueError:
+        pass
+    print("✅ Fixtures split by fidelity mode")
+
+
+def test_fast_scorelines_follow_expected_goals():
+    home, away = {'xg': 1.8, 'xga': 1.0}, {'xg': 1.1, 'xga': 1.4}
+    lam_home, lam_away = expected_goals(home, away)
+    goals = np.array(fast_scorelines([(home, away)] * 20000, np.random.default_rng(1)))
+    assert abs(goals[:, 0].mean() - lam_home) < 0.05
+    assert abs(goals[:, 1].mean() - lam_away) < 0.05
+    print(f"✅ Fast tier means {goals.mean(axis=0).round(2)} vs λ ({lam_home}, {lam_away})")
+
+
+def test_player_line():
+    """Detailed lines draw minutes and cards; quick lines are 90 minutes without cards"""
+    rng = random.Random(3)
+    player = Player("Striker", 25, "Forward")
+    player.current_overall_score = 80
+    lines = [player_match_line(player, 70, 2, 1, rng) for _ in range(3000)]
+    played = [l for l in lines if l]
+    assert all(0 < l['minutes'] <= 90 and 1.0 <= l['rating'] <= 10.0 for l in played)
+    assert all(l['goals'] + l['assists'] <= 2 for l in played)
+    assert any(l['yellow_card'] for l in played) and any(l['minutes'] < 90 for l in played)
+
+    quick = [player_match_line(player, 70, 2, 1, rng, detailed=False) for _ in range(500)]
+    assert all(l['minutes'] == 90 and not l['yellow_card'] and not l['red_card'] for l in quick)
+    print(f"✅ {len(played)}/3000 appearances, {sum(l['goals'] for l in played)} goals")
+
+
+def test_game_tiers():
+    """Client lines match the club's scoreline in both tiers; fast mode skips roster crediting"""
+    for fidelity in ('clients', 'fast'):
+        game, client = _game(fidelity)
+        first = next(i for i, w in enumerate(game.schedule) if w['fixtures'])
+        with contextlib.redirect_stdout(io.StringIO()):
+            for week_index in range(first, first + 8):
+                game.agent.week = week_index + 1
+                game.simulate_week(week_index)
+                match = game.week_client_matches.get(client.uid)
+                if match:
+                    gf, ga = map(int, match['score'].split('-'))
+                    assert match['goals'] + match['assists'] <= gf
+                    assert client.weekly_stats[-1] is match
+        assert client.season_appearances > 0
+        for board in ('goals', 'rating', 'growth'):
+            assert bool(game.leaderboards.top(board)) == (fidelity != 'fast'), board
+        print(f"✅ {fidelity}: {client.season_appearances} appearances in 8 weeks")
+
+
+if __name__ == "__main__":
+    test_plan_fixtures()
+    test_fast_scorelines_follow_expected_goals()
+    test_player_line()
+    test_game_tiers()
@@ -0,0 +1,78 @@
+"""
+Test script for the Poisson scoreline match model
+"""
+
+import random
+
+import match_model
+from match_model import ScoreGrid, score_grid, expected_goals, MAX_GOALS
+from game_data import get_default_clubs
+
+
+def test_grid_is_a_distribution():
+    """Grid cells sum to 1 and summaries match the cells"""
+    print("\n" + "="*80)
+    print("TESTING POISSON MATCH MODEL")
+    print("="*80)
+
+    grid = ScoreGrid(1.6, 1.1)
+    assert abs(sum(grid.probs) - 1.0) < 1e-9
+    home, draw, away = grid.outcome_probs()
+    assert abs(home + draw + away - 1.0) < 1e-9
+    assert home > away
+    hp, ap = grid.expected_points()
+    assert abs(hp - (3 * home + draw)) < 1e-12 and abs(ap - (3 * away + draw)) < 1e-12
+    assert abs(grid.summary['home_goals'] - 1.6) < 0.01
+    print(f"✅ {grid} | most likely {grid.summary['most_likely']}")
+
+
+def test_dixon_coles_adjustment():
+    """A negative rho moves probability into 0-0 and 1-1"""
+    independent = ScoreGrid(1.3, 1.2, rho=0.0)
+    adjusted = ScoreGrid(1.3, 1.2)
+    assert adjusted.prob(0, 0) > independent.prob(0, 0)
+    assert adjusted.prob(1, 1) > independent.prob(1, 1)
+    assert adjusted.prob(1, 0) < independent.prob(1, 0)
+    assert adjusted.prob(MAX_GOALS + 1, 0) == 0.0
+    print(f"✅ 0-0: {independent.prob(0, 0):.4f} → {adjusted.prob(0, 0):.4f}")
+
+
+def test_sampling_matches_grid():
+    """Alias sampling reproduces the grid frequencies"""
+    grid = ScoreGrid(1.4, 0.9)
+    rng = random.Random(11)
+    n = 200_000
+    counts = {}
+    for _ in range(n):
+        score = grid.sample(rng)
+        counts[score] = counts.get(score, 0) + 1
+    for score in [(0, 0), (1, 0), (1, 1), (2, 1), (0, 2)]:
+        expected = grid.prob(*score)
+        assert abs(counts.get(score, 0) / n - expected) < 0.005, score
+    home_wins = sum(c for (h, a), c in counts.items() if h > a) / n
+    assert abs(home_wins - grid.outcome_probs()[0]) < 0.005
+    print(f"✅ {n:,} samples match the grid")
+
+
+def test_grids_cached_by_matchup():
+    """Clubs' quick profiles map to cached grids"""
+    score_grid.cache_clear()
+    random.seed(5)
+    clubs = get_default_clubs()
+    home, away = clubs[0].get_quick_profile(), clubs[1].get_quick_profile()
+    first = match_model.matchup_grid(home, away)
+    assert match_model.matchup_grid(home, away) is first
+    assert score_grid.cache_info().hits == 1
+    lam_home, lam_away = expected_goals(home, away)
+    assert (first.lam_home, first.lam_away) == (lam_home, lam_away)
+
+    fc = match_model.forecast(clubs[0], clubs[1])
+    assert abs(fc['home_win'] + fc['draw'] + fc['away_win'] - 1.0) < 1e-9
+    print(f"✅ {clubs[0].name} vs {clubs[1].name}: 1 {fc['home_win']:.0%} X {fc['draw']:.0%} 2 {fc['away_win']:.0%}")
+
+
+if __name__ == "__main__":
+    test_grid_is_a_distribution()
+    test_dixon_coles_adjustment()
+    test_sampling_matches_grid()
+    test_grids_cached_by_matchup()
@@ -0,0 +1,144 @@
+"""
+Test script for league-wide vectorized per-player match statistics
+"""
+
+import contextlib
+import io
+import random
+
+import numpy as np
+
+from agent import Agent
+from game import FootballAgentGame
+from match_stats import MatchStatsStore, MatchdayLineups, draw_matchday
+
+
+def _game(seed=49):
+    random.seed(seed)
+    game = FootballAgentGame()
+    game.agent = Agent("Stats", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    return game
+
+
+def test_matchday_draw_is_consistent_with_scorelines():
+    """Goals add up to each scoreline, nobody assists their own goal, idle clubs get nothing"""
+    print("\n" + "="*80)
+    print("TESTING MATCH STATS")
+    print("="*80)
+
+    game = _game()
+    lineups = MatchdayLineups(game.clubs, game.club_rosters, MatchStatsStore())
+    rng = np.random.default_rng(49)
+    clubs = [c.name for c in lineups.clubs]
+    idle = clubs[-1]
+    for _ in range(300):
+        scores = {name: (int(rng.integers(0, 5)), int(rng.integers(0, 5))) for name in clubs[:-1]}
+        lines = draw_matchday(lineups, scores, rng)
+        for name, (gf, ga) in scores.items():
+            lineup = lineups.club_slice(name)
+            assert lines['goals'][lineup].sum() == gf
+            assert lines['assists'][lineup].sum() <= gf
+            if gf == 1:
+                assert not (lines['goals'][lineup] & lines['assists'][lineup]).any()
+        ratings = lines['ratings'][lines['played']]
+        assert ratings.min() >= 1.0 and ratings.max() <= 10.0
+        assert not lines['played'][lineups.club_slice(idle)].any()
+        assert lines['ratings'][lineups.club_slice(idle)].sum() == 0
+    assert lines['goals'].sum() == sum(gf for gf, _ in scores.values())
+    print(f"✅ 300 matchdays for {len(lineups)} roster players: scorelines, assists and idle clubs consistent")
+
+
+def test_position_and_temper_shape_the_lines():
+    """Forwards outscore defenders, goalkeepers never score, volatile categories see more cards"""
+    game = _game()
+    lineups = MatchdayLineups(game.clubs, game.club_rosters, MatchStatsStore())
+    rng = np.random.default_rng(7)
+    scores = {c.name: (2, 1) for c in lineups.clubs}
+    totals = {'goals': np.zeros(len(lineups)), 'yellow_cards': np.zeros(len(lineups))}
+    for _ in range(400):
+        lines = draw_matchday(lineups, scores, rng)
+        for name in totals:
+            totals[name] += lines[name]
+    positions = np.array([p['position'] for p in lineups.players])
+    categories = np.array([p['category'] for p in lineups.players])
+    assert totals['goals'][positions == 'GK'].sum() == 0
+    forwards, defenders = totals['goals'][positions == 'FW'].mean(), totals['goals'][positions == 'CB'].mean()
+    assert forwards > 3 * defenders
+    assert totals['yellow_cards'][categories == 'Bad'].mean() > totals['yellow_cards'][categories == 'Good'].mean()
+    print(f"✅ Goals per FW {forwards / 400:.2f}/match vs CB {defenders / 400:.2f}; GK 0")
+
+
+def test_store_rows_rankings_and_reset():
+    """The store grows past its capacity, ranks league-wide and keeps rows across a reset"""
+    store = MatchStatsStore(capacity=4)
+    rows = store.rows(range(100, 110))
+    assert list(rows) == list(range(10)) and list(store.rows([105])) == [5]
+    store.add(rows, 90, np.arange(10), 0, 0, 0, np.full(10, 7.0))
+    store.add(rows[:3], 90, 1, 1, 1, 0, 8.0)
+    store.record_line(200, {'minutes': 70, 'goals': 3, 'assists': 0, 'yellow_card': True,
+                            'red_card': False, 'rating': 9.0})
+    assert store.player(109) == {'appearances': 1, 'minutes': 90, 'goals': 9, 'assists': 0,
+                                 'yellow_cards': 0, 'red_cards': 0, 'avg_rating': 7.0}
+    assert store.player(100)['avg_rating'] == 7.5 and store.player(999) is None
+    assert [pid for pid, _ in store.top('goals', 3)] == [109, 108, 107]
+    assert store.top('avg_rating') == []  # nobody has enough appearances yet
+    store.reset()
+    assert 105 in store and store.player(105)['appearances'] == 0 and store.top('goals') == []
+    store.reset(keep=[200, 105])
+    assert store.ids == [200, 105] and 100 not in store and store.player(105)['goals'] == 0
+    print(f"✅ {len(store)} rows in a store created for 4; rankings and reset work")
+
+
+def test_game_records_every_roster_player():
+    """League weeks give every roster player a stats line that adds up to the league table"""
+    game = _game()
+    client = game.all_players[0]
+    client.club, client.signed = game.clubs[0].name, True
+    game.agent.clients.append(client)
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']][:6]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game.agent.week = week_index + 1
+            game.simulate_week(week_index)
+
+    stats = game.match_stats
+    for club in game.clubs:
+        row = game.league_table[club.name]
+        lines = [stats.player(p['id']) for p in game.club_rosters[club.name]]
+        assert all(line['appearances'] == row['played'] for line in lines), club.name
+        assert sum(line['goals'] for line in lines) == row['gf'], club.name
+    client_line = stats.player(client.uid)
+    assert client_line is None or client_line['appearances'] == client.season_appearances
+    top = stats.top('goals', 3)
+    scorer = game.registry[top[0][0]]
+    print(f"✅ {len(stats)} players tracked; top scorer {scorer['name']} ({scorer['position']}) with {top[0][1]:.0f}")
+
+
+def test_store_stays_bounded_over_seasons():
+    """Season rollovers drop the rows of departed roster players"""
+    game = _game(seed=7)
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']][:2]
+    seen = set()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(8):
+            for week_index in league_weeks:
+                game.simulate_week(week_index)
+            seen.update(game.match_stats.ids)
+            game.rollover_season()
+    current = {p['id'] for roster in game.club_rosters.values() for p in roster}
+    assert set(game.match_stats.ids) == current and len(seen) > len(current)
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.simulate_week(league_weeks[0])
+    club = game.clubs[0]
+    assert all(game.match_stats.player(p['id'])['appearances'] == 1 for p in game.club_rosters[club.name])
+    print(f"✅ 8 seasons: {len(seen)} roster players seen, {len(game.match_stats)} rows kept")
+
+
+if __name__ == "__main__":
+    test_matchday_draw_is_consistent_with_scorelines()
+    test_position_and_temper_shape_the_lines()
+    test_store_rows_rankings_and_reset()
+    test_game_records_every_roster_player()
+    test_store_stays_bounded_over_seasons()
@@ -0,0 +1,102 @@
+"""
+Test script for constructive personality sampling and the frequency table
+"""
+
+import random
+import time
+
+import numpy as np
+
+from game_data import MENTAL_ATTRIBUTE_PROFILE
+from personality_generator import generate_player_with_personality
+from personality_rules import MENTAL_ATTRIBUTES, MENTAL_INDEX, PERSONALITY_NAMES, classify_personalities
+from personality_sampler import (
+    DEFAULT_DISTRIBUTION,
+    apply_personality,
+    frequency_table,
+    media_handling_frequency,
+    personality_frequency,
+    sample_mental_attributes,
+)
+from player import Player
+
+
+def test_requested_personality_and_media():
+    """Players classify as requested, rare types included, in well under a millisecond each"""
+    print("\n" + "="*80)
+    print("TESTING PERSONALITY SAMPLER")
+    print("="*80)
+
+    rng = np.random.default_rng(47)
+    start = time.perf_counter()
+    leaders = sample_mental_attributes('Born Leader', n=200, age=27, rng=rng)
+    elapsed = time.perf_counter() - start
+    assert leaders.shape == (200, 9)
+    assert (classify_personalities(leaders, np.full(200, 27)) == PERSONALITY_NAMES.index('Born Leader')).all()
+    assert elapsed < 0.1, f"{elapsed * 1000:.1f} ms"
+
+    for name, media, is_regen in [('Model Citizen', 'Media-Friendly', False), ('Sporting', None, False),
+                                  ('Slack', 'Volatile', True), ('Balanced', None, False)]:
+        player = Player("Sampled", 25, "Midfielder")
+        apply_personality(player, name, media, is_regen=is_regen, rng=rng)
+        assert player.personality == name, (name, player.personality)
+        assert media is None or player.media_handling == media, (media, player.media_handling)
+    devoted = generate_player_with_personality("Fiel", 29, "Defender", personality='Very Loyal')
+    assert devoted.personality == 'Very Loyal'
+    print(f"✅ 200 Born Leaders in {elapsed * 1000:.1f} ms (≈1 in {1 / personality_frequency('Born Leader'):,.0f} at random)")
+
+
+def test_if_chain_precedence():
+    """Impossible requests fail: age/regen limits and rules fully shadowed by earlier ones"""
+    rng = np.random.default_rng(1)
+    for name, age, is_regen in [('Born Leader', 20, False), ('Mercenary', 25, False),
+                                ('Resolute', 25, False), ('Low Determination', 25, True)]:
+        try:
+            sample_mental_attributes(name, age=age, is_regen=is_regen, rng=rng)
+        except ValueError:
+            continue
+        raise AssertionError(f"{name} should be impossible")
+
+    # Professional's box (professionalism 18-19) lies inside Perfectionist's, so those with temperament <= 9 are lost
+    professionals = sample_mental_attributes('Professional', n=500, rng=rng)
+    assert (professionals[:, MENTAL_INDEX['temperament']] >= 10).all()
+    print("✅ Age, regen and shadowed rules respected")
+
+
+def test_large_requests_for_reachable_types():
+    """Large n only needs more candidates: the round budget counts rounds without any hit"""
+    rng = np.random.default_rng(2)
+    for name, n in [('Sporting', 600), ('Balanced', 20000), ('Professional', 5000)]:
+        rows = sample_mental_attributes(name, n=n, rng=rng)
+        assert rows.shape == (n, 9)
+        assert (classify_personalities(rows, np.full(n, 25)) == PERSONALITY_NAMES.index(name)).all()
+    print("✅ 600 Sporting, 20,000 Balanced and 5,000 Professional sampled in one call each")
+
+
+def test_frequencies_match_default_generation():
+    """The table sums to 1 and agrees with plain Monte Carlo of the default distribution for common types"""
+    table = frequency_table()
+    for group in table['personality'].values():
+        assert abs(sum(group.values()) - 1.0) < 1e-3
+    assert abs(sum(table['media_handling'].values()) - 1.0) < 1e-3
+    assert personality_frequency('Born Leader', age=20) == 0.0
+    assert personality_frequency('Slack', is_regen=True) > 0.0 == personality_frequency('Slack')
+
+    rng = random.Random(3)
+    n = 40000
+    mental = np.array([[max(1, min(20, int(rng.gauss(*MENTAL_ATTRIBUTE_PROFILE[attr])))) for attr in MENTAL_ATTRIBUTES]
+                       for _ in range(n)])
+    names = np.array(PERSONALITY_NAMES)[classify_personalities(mental, np.full(n, 25))]
+    for name in ('Balanced', 'Fairly Ambitious', 'Fairly Professional', 'Driven'):
+        observed = np.mean(names == name)
+        expected = personality_frequency(name)
+        assert abs(observed - expected) < 4 * np.sqrt(expected * (1 - expected) / n) + 1e-3, (name, observed, expected)
+    assert np.allclose(DEFAULT_DISTRIBUTION.sum(axis=1), 1.0)
+    print(f"✅ Frequencies match {n} random players; media 'Level-Headed' {media_handling_frequency('Level-Headed'):.1%}")
+
+
+if __name__ == "__main__":
+    test_requested_personality_and_media()
+    test_if_chain_precedence()
+    test_large_requests_for_reachable_types()
+    test_frequencies_match_default_generation()
@@ -0,0 +1,71 @@
+"""
+Test script for running per-player match aggregates
+"""
+
+import random
+
+from player import Player
+from form_tracker import FORM_WINDOW
+from player_stats import PlayerAggregates
+
+
+def _match(week, goals=0, assists=0, rating=6.0, yellow=False):
+    return {"week": week, "goals": goals, "assists": assists, "rating": rating,
+            "opponent": "Rival", "club": "Club", "yellow_card": yellow, "red_card": False}
+
+
+def test_aggregates_match_rescan():
+    """Running sums give the same numbers as rescanning the match log"""
+    print("\n" + "="*80)
+    print("TESTING PLAYER AGGREGATES")
+    print("="*80)
+
+    random.seed(5)
+    player = Player("Stats Test", 21, "Forward")
+    for week in range(1, 31):
+        player.record_match(_match(week, random.randint(0, 2), random.randint(0, 1),
+                                   round(random.uniform(5.0, 9.0), 1), random.random() < 0.1))
+
+    log = player.weekly_stats
+    assert player.season_appearances == len(log) == 30
+    assert player.season_goals == sum(m['goals'] for m in log)
+    assert player.season_assists == sum(m['assists'] for m in log)
+    assert abs(player.season_avg_rating - sum(m['rating'] for m in log) / 30) < 1e-9
+    assert abs(player.season_goals_per_match - player.season_goals / 30) < 1e-12
+    assert player.stats.season.yellow_cards == sum(m['yellow_card'] for m in log)
+
+    # The card lists only the last FORM_WINDOW matches
+    assert list(player.stats.recent) == log[-FORM_WINDOW:]
+    assert player.stats.last_match is log[-1]
+    print(f"✅ {player.stats.season} | last {len(player.stats.recent)} matches kept")
+
+
+def test_season_and_career_splits():
+    """Closing a season archives its split while the career totals keep growing"""
+    player = Player("Career Test", 22, "Midfielder")
+    player.record_match(_match(1, goals=2, rating=8.0))
+    player.record_match(_match(2, assists=1, rating=7.0))
+    line = player.start_new_season(season=1)
+
+    assert line['goals'] == 2 and line['appearances'] == 2 and line['avg_rating'] == 7.5
+    assert player.season_appearances == 0 and player.season_avg_rating == 0.0
+    assert player.age == 23
+
+    player.record_match(_match(1, goals=1, rating=6.0))
+    assert player.goals == 3 and player.appearances == 3 and player.assists == 1
+    assert player.stats.seasons[0]['season'] == 1
+    assert player.stats.recent[-1]['rating'] == 6.0  # last matches carry over between seasons
+    print(f"✅ Seasons {player.stats.seasons} | career {player.stats.career}")
+
+
+def test_empty_aggregates():
+    stats = PlayerAggregates()
+    assert not stats.recent and stats.last_match is None
+    assert stats.season.avg_rating == 0.0 and stats.season.goals_per_match == 0.0
+    print("✅ Empty aggregates are zero")
+
+
+if __name__ == "__main__":
+    test_aggregates_match_rescan()
+    test_season_and_career_splits()
+    test_empty_aggregates()
@@ -0,0 +1,88 @@
+"""
+Test script for exact international playoff odds
+"""
+
+import random
+
+from agent import Agent
+from game import FootballAgentGame
+from game_data import get_international_clubs
+from playoff_bracket import bracket_odds, odds_table, simulate_bracket, win_matrix, knockout_win_probability
+
+
+def _clubs(n=8, seed=3):
+    random.seed(seed)
+    return get_international_clubs()[:n]
+
+
+def test_odds_are_consistent():
+    """Every round has the right total probability and the title sums to 1"""
+    print("\n" + "="*80)
+    print("TESTING PLAYOFF BRACKET ODDS")
+    print("="*80)
+
+    clubs = _clubs()
+    odds = bracket_odds(clubs)
+    for r in range(3):
+        assert abs(sum(o[r] for o in odds) - len(clubs) / 2 ** (r + 1)) < 1e-9
+    # Winning a round requires winning the previous one
+    assert all(o[0] >= o[1] >= o[2] for o in odds)
+    # First round is just the tie probability
+    assert abs(odds[0][0] - knockout_win_probability(clubs[0], clubs[1])) < 1e-12
+
+    for row in odds_table(clubs):
+        print(f"{row['club']:<30} SF {row['reach']['Semifinal']:.1%}  F {row['reach']['Final']:.1%}  🏆 {row['champion']:.1%}")
+    print("✅ Round totals consistent")
+
+
+def test_odds_match_simulation():
+    """Monte Carlo over the real simulation agrees with the exact odds"""
+    clubs = _clubs()
+    exact = [o[-1] for o in bracket_odds(clubs, win_matrix(clubs))]
+    rng = random.Random(21)
+    n = 40_000
+    titles = {c.name: 0 for c in clubs}
+    for _ in range(n):
+        titles[simulate_bracket(clubs, rng)[-1][0]['winner'].name] += 1
+    for club, p in zip(clubs, exact):
+        assert abs(titles[club.name] / n - p) < 0.01, club.name
+    print(f"✅ {n:,} simulated brackets match the exact title odds")
+
+
+def test_invalid_bracket_size():
+    try:
+        bracket_odds(_clubs(6))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("6-club bracket should be rejected")
+
+
+def test_game_stores_bracket_with_client_clubs():
+    """The odds shown are for the bracket that will be played, including client clubs"""
+    random.seed(8)
+    game = FootballAgentGame()
+    game.agent = Agent("Odds", "Balanced")
+    game.init_world()
+    weakest = min(game.international_clubs, key=lambda c: c.reputation)
+    client = game.all_players[0]
+    client.club = weakest.name
+    game.agent.clients.append(client)
+
+    bracket = game.prepare_international_playoff()
+    assert len(bracket) == 8 and weakest in bracket
+    assert game.prepare_international_playoff() is bracket
+    rows = game.international_playoff_odds()
+    assert abs(sum(r['champion'] for r in rows) - 1.0) < 1e-9
+
+    season = game.season_playoff_odds()
+    assert len(season) == 16
+    assert abs(sum(r['champion'] for r in season) - 1.0) < 1e-9
+    print(f"✅ Stored bracket includes {weakest.name} ({next(r['champion'] for r in rows if r['club'] == weakest.name):.1%} title odds)")
+
+
+if __name__ == "__main__":
+    test_odds_are_consistent()
+    test_odds_match_simulation()
+    test_invalid_bracket_size()
+    test_game_stores_bracket_with_client_clubs()
@@ -0,0 +1,91 @@
+"""
+Test script for weekly step profiling
+"""
+
+import json
+import os
+import tempfile
+
+from agent import Agent
+from club import Club
+from game import FootballAgentGame
+
+
+def _new_game():
+    game = FootballAgentGame()
+    game.agent = Agent("Profiler", "Balanced")
+    game.init_world()
+    game.agent.clients.extend(game.all_players[:2])
+    # Start at the first week with league fixtures (preseason has none)
+    game.agent.week = next(i for i, w in enumerate(game.schedule) if w['fixtures']) + 1
+    return game
+
+
+def _play_weeks(game, weeks):
+    for _ in range(weeks):
+        with game.profile_week():
+            game.simulate_week(game.agent.week - 1, generate_offers=True)
+            game.agent.advance_week()
+
+
+def test_stage_timings_and_counters():
+    """Every weekly stage is timed and hot calls are counted"""
+    print("\n" + "="*80)
+    print("TESTING WEEKLY PROFILER")
+    print("="*80)
+
+    original = Club.__dict__['get_quick_profile']
+    game = _new_game()
+    for client, club in zip(game.agent.clients, game.clubs):
+        client.club, client.signed = club.name, True  # clients who play grow via update_ratings
+    profiler = game.enable_profiling(use_cprofile=True, use_tracemalloc=True)
+    _play_weeks(game, 3)
+
+    assert len(profiler.weeks) == 3
+    week = profiler.weeks[0]
+    for stage in ('config', 'fixtures', 'client_participation', 'player_growth', 'transfer_offers'):
+        assert stage in week['stages']
+    assert week['calls'].get('Club.get_quick_profile', 0) > 0
+    assert sum(w['calls'].get('Player.update_ratings', 0) for w in profiler.weeks) > 0
+    assert week['top_functions'] and 'cumtime' in week['top_functions'][0]
+    assert week['memory_kb']['peak'] > 0
+
+    print(profiler.format_report())
+
+    # Switching off restores the original methods
+    assert game.disable_profiling() is profiler
+    assert Club.__dict__['get_quick_profile'] is original
+    print("✅ Stages timed, calls counted, methods restored")
+
+
+def test_export_json():
+    """The profile is exported as JSON with a summary and per-week records"""
+    game = _new_game()
+    profiler = game.enable_profiling()
+    _play_weeks(game, 2)
+    game.disable_profiling()
+
+    path = os.path.join(tempfile.mkdtemp(), "profile.json")
+    profiler.export_json(path)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data['summary']['weeks'] == 2
+    assert set(data['summary']['stage_totals']) >= {'fixtures', 'player_growth'}
+    assert data['weeks'][1]['week'] == data['weeks'][0]['week'] + 1
+    os.remove(path)
+    print("✅ Profile exported to JSON")
+
+
+def test_profiling_off_is_noop():
+    """Without a profiler the stage helpers do nothing"""
+    game = _new_game()
+    week = game.agent.week
+    _play_weeks(game, 1)
+    assert game.profiler is None
+    assert game.agent.week == week + 1
+
+
+if __name__ == "__main__":
+    test_stage_timings_and_counters()
+    test_export_json()
+    test_profiling_off_is_noop()
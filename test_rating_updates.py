@@ -0,0 +1,120 @@
+"""
+Test script for dirty-tracked rating updates and stable potential
+"""
+
+import contextlib
+import io
+import random
+from unittest import mock
+
+from agent import Agent
+from game import FootballAgentGame
+from player import BREAKOUT_AVG_RATING, BREAKOUT_MIN_APPEARANCES, DECLINE_PER_SEASON, Player
+
+
+def _fresh_copy(player):
+    """Same technical attributes, ratings computed from scratch"""
+    copy = Player(player.name, player.age, player.position)
+    for attr in Player.RATED_ATTRIBUTES:
+        setattr(copy, attr, getattr(player, attr))
+    copy.calculate_ratings()
+    return copy
+
+
+def test_incremental_matches_full_recompute():
+    """Hundreds of small attribute nudges give the same ratings as a full recompute"""
+    print("\n" + "="*80)
+    print("TESTING INCREMENTAL RATINGS")
+    print("="*80)
+
+    rng = random.Random(46)
+    player = Player("Delta", 21, "Winger")
+    player.set_technical_attributes(*[rng.randint(5, 18) for _ in Player.RATED_ATTRIBUTES])
+    potential = player.potential_rating
+    for _ in range(300):
+        for attr in rng.sample(Player.RATED_ATTRIBUTES, rng.randint(1, 4)):
+            setattr(player, attr, getattr(player, attr) + rng.uniform(-0.05, 0.08))
+        player.update_ratings()
+        fresh = _fresh_copy(player)
+        assert player.position_rating == fresh.position_rating
+        assert player.current_rating == fresh.current_rating
+    assert player.potential_rating == max(potential, player.potential_rating)
+    print(f"✅ 300 updates: current {player.current_rating}, potential {potential} → {player.potential_rating}")
+
+
+def test_dirty_flags_and_stable_potential():
+    """No change, no work; recalculation never re-rolls potential; only development events move it"""
+    player = Player("Stable", 19, "Forward")
+    player.set_technical_attributes(10, 12, 9, 13, 15, 11, 14, 10, 12)
+    potential, version = player.potential_rating, player.version
+    assert player.current_rating < potential
+
+    assert player.update_ratings() is False and player.version == version
+    player.speed = player.speed  # same value: nothing to apply
+    assert player.update_ratings() is False
+    for _ in range(20):
+        player.calculate_ratings()
+    assert player.potential_rating == potential
+
+    player.shooting += 1
+    assert player.update_ratings() is True and player.version > version
+    assert player.develop_potential(0.05) == round(potential + 0.05, 2)
+    assert player.develop_potential(-5) == player.current_rating  # never below the current rating
+
+    # Outgrowing the ceiling is a development event too, not a silent overwrite
+    with mock.patch.object(player, 'develop_potential', wraps=player.develop_potential) as develop:
+        player.shooting += 3
+        player.update_ratings()
+    assert develop.call_count == 1 and player.potential_rating == player.current_rating
+    print(f"✅ Potential {potential} kept through 20 recalculations; moved only by development events")
+
+
+def test_client_matches_do_not_jitter_potential():
+    """A run of league weeks changes a client's potential only if the client outgrows it"""
+    random.seed(46)
+    game = FootballAgentGame()
+    game.agent = Agent("Ratings", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    clients = game.all_players[:3]
+    for client, club in zip(clients, game.clubs):
+        client.club, client.signed = club.name, True
+        game.agent.clients.append(client)
+    start = {client.uid: client.potential_rating for client in clients}
+
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['phase'].startswith("Liga Nacional")][:10]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game.agent.week = week_index + 1
+            game._simulate_week_fixtures(week_index)
+            game._simulate_client_match_participation(week_index)
+    for client in clients:
+        assert client.potential_rating in (start[client.uid], client.current_rating), client.name
+        assert client.position_rating == _fresh_copy(client).position_rating
+    print(f"✅ {len(clients)} clients, {len(league_weeks)} weeks: potentials {[c.potential_rating for c in clients]}")
+
+
+def test_season_rollover_is_a_development_event():
+    """A strong season at 20 raises potential; a season at 31+ lowers it; an average one leaves it alone"""
+    random.seed(3)
+    prospect, veteran, regular = (Player(name, age, "Forward") for name, age in
+                                  (("Joven", 20), ("Veterano", 32), ("Normal", 25)))
+    for player in (prospect, veteran, regular):
+        player.calculate_ratings()
+        for _ in range(BREAKOUT_MIN_APPEARANCES):
+            player.record_match({'goals': 1, 'rating': BREAKOUT_AVG_RATING + 0.5})
+    before = {p.name: p.potential_rating for p in (prospect, veteran, regular)}
+    for player in (prospect, veteran, regular):
+        player.start_new_season(1)
+    assert prospect.potential_rating > before["Joven"]
+    assert veteran.potential_rating == max(veteran.current_rating, round(before["Veterano"] - DECLINE_PER_SEASON, 2))
+    assert regular.potential_rating == before["Normal"]
+    print(f"✅ Rollover: prospect {before['Joven']} → {prospect.potential_rating}, "
+          f"veteran {before['Veterano']} → {veteran.potential_rating}")
+
+
+if __name__ == "__main__":
+    test_incremental_matches_full_recompute()
+    test_dirty_flags_and_stable_potential()
+    test_client_matches_do_not_jitter_potential()
+    test_season_rollover_is_a_development_event()
@@ -0,0 +1,100 @@
+"""
+Test script for stable IDs, the registry and the set-backed client list
+"""
+
+import contextlib
+import io
+import random
+import time
+
+from agent import Agent
+from game import FootballAgentGame
+from leaderboards import Leaderboards
+from player import Player
+from registry import ClientList
+
+
+def _game():
+    random.seed(42)
+    game = FootballAgentGame()
+    game.agent = Agent("Registry", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    return game
+
+
+def test_same_names_stay_apart():
+    """Two 'Juan García' are different clients, leaderboard rows and log entries"""
+    print("\n" + "="*80)
+    print("TESTING REGISTRY")
+    print("="*80)
+
+    agent = Agent("Ids", "Balanced")
+    first, second = Player("Juan García", 20, "Forward"), Player("Juan García", 24, "Forward")
+    assert first.uid != second.uid
+    assert agent.add_client(first) and agent.add_client(second) and not agent.add_client(first)
+    assert len(agent.clients) == 2 and list(agent.clients) == [first, second]
+    assert agent.clients.get(second.uid) is second and agent.clients[1] is second
+
+    boards = Leaderboards()
+    boards.record_averages([first.uid, second.uid], ["Club A", "Club B"], [7.0, 6.5], [1, 1],
+                           {first.uid: 2, second.uid: 1}, names=[first.name, second.name])
+    rows = boards.top('goals')
+    assert [(r['id'], r['name'], r['value']) for r in rows] == [(first.uid, "Juan García", 2), (second.uid, "Juan García", 1)]
+
+    assert agent.remove_client(first) and first not in agent.clients and second in agent.clients
+    assert not agent.remove_client(first)
+    print(f"✅ Same name, IDs {first.uid} and {second.uid}, kept apart")
+
+
+def test_client_list_operations_are_constant_time():
+    """Membership, add and remove do not slow down with the number of clients"""
+    players = [Player(f"Client {i}", 22, "Midfielder") for i in range(20000)]
+    clients = ClientList(players)
+    start = time.perf_counter()
+    for player in players[::-1]:
+        assert player in clients
+    for player in players[:10000]:
+        clients.remove(player)
+    elapsed = time.perf_counter() - start
+    assert len(clients) == 10000 and clients[0] is players[10000]
+    assert elapsed < 0.5, f"{elapsed:.3f}s"
+    try:
+        clients.remove(players[0])
+        assert False, "removing a non-client should fail like list.remove"
+    except ValueError:
+        pass
+    print(f"✅ 20000 lookups + 10000 removals in {elapsed * 1000:.1f} ms")
+
+
+def test_game_registers_world_and_logs_ids():
+    """Every player, club and roster player is registered; renewals swap IDs; logs carry IDs"""
+    game = _game()
+    roster_players = [p for roster in game.club_rosters.values() for p in roster]
+    for obj in game.all_players + game.clubs + game.international_clubs:
+        assert game.registry[obj.uid] is obj
+    for player in roster_players:
+        assert game.registry[player['id']] is player
+    assert len(game.registry) == len(game.all_players) + len(game.clubs) + len(game.international_clubs) + len(roster_players)
+
+    leaving = game.club_rosters[game.clubs[0].name][0]
+    game._apply_season_renewals([{'player_id': leaving['id'], 'player': leaving['name'], 'wants_renewal': False}])
+    replacement = game.club_rosters[game.clubs[0].name][0]
+    assert leaving['id'] not in game.registry and game.registry[replacement['id']] is replacement
+
+    client = game.all_players[0]
+    game.agent.add_client(client)
+    game._log_event(client, "test", "ok", {})
+    assert game.weekly_event_log[-1]['player_id'] == client.uid
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']][:6]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game._process_weekly_player_growth(week_index)
+    assert game.growth_log and all(game.registry[e['player_id']]['name'] == e['player'] for e in game.growth_log)
+    print(f"✅ {len(game.registry)} objects registered; logs reference IDs")
+
+
+if __name__ == "__main__":
+    test_same_names_stay_apart()
+    test_client_list_operations_are_constant_time()
+    test_game_registers_world_and_logs_ids()
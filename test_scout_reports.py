@@ -0,0 +1,121 @@
+"""
+Test script for lazy, cached scouting reports
+"""
+
+import contextlib
+import io
+import random
+
+from agent import Agent
+from game import FootballAgentGame
+from player import Player
+from game_data import ScoutReport, create_player_reports, _render_report
+
+
+def _sample_players(n=5):
+    players = []
+    for i in range(n):
+        player = Player(f"Scout Target {i}", 19 + i, "Central Midfielder")
+        player.calculate_ratings()
+        players.append(player)
+    return players
+
+
+def test_reports_render_lazily():
+    """Creating reports must not format any text"""
+    print("\n" + "="*80)
+    print("TESTING LAZY SCOUTING REPORTS")
+    print("="*80)
+
+    _render_report.cache_clear()
+    reports = create_player_reports(_sample_players(50))
+    assert len(reports) == 50
+    assert all(isinstance(r, ScoutReport) for r in reports)
+    assert _render_report.cache_info().currsize == 0
+
+    # Previews come straight from the player fields
+    assert reports[0].preview.startswith("Scout Target 0 |")
+    assert _render_report.cache_info().currsize == 0
+
+    text = reports[3].full_report
+    assert "Scout Target 3" in text
+    assert _render_report.cache_info().misses == 1
+
+    # A second read is a cache hit
+    assert reports[3].full_report is text
+    assert _render_report.cache_info().hits == 1
+    print(f"✅ 50 reports created, {_render_report.cache_info().currsize} rendered")
+
+
+def test_report_invalidated_when_player_changes():
+    """Recalculating ratings bumps the player version and re-renders the report"""
+    _render_report.cache_clear()
+    player = _sample_players(1)[0]
+    report = ScoutReport(player)
+
+    before = report.full_report
+    version = player.version
+    player.passing = 20
+    player.calculate_ratings()
+    assert player.version > version
+
+    after = report.full_report
+    assert _render_report.cache_info().misses == 2
+    assert after is not before
+    print("✅ Report re-rendered after player update")
+
+
+def test_report_shows_new_age_after_rollover():
+    """Ageing at season rollover bumps the version, so the cached report is re-rendered"""
+    player = _sample_players(1)[0]
+    report = ScoutReport(player)
+    assert f"Age: {player.age} " in report.full_report
+    player.start_new_season(1)
+    assert f"Age: {player.age} " in report.full_report
+    print(f"✅ Report shows age {player.age} after rollover")
+
+
+def test_dict_style_access():
+    """Older callers index reports like dicts"""
+    report = ScoutReport(_sample_players(1)[0])
+    assert report['player_name'] == report.player.name
+    assert report['preview'] == report.preview
+    assert report.get('missing') is None
+    try:
+        report['missing']
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("unknown keys must raise KeyError")
+    print("✅ Dict-style access works")
+
+
+def test_report_renders_after_match_growth():
+    """Match growth leaves fractional attributes; the report still renders them"""
+    random.seed(27)
+    game = FootballAgentGame()
+    game.agent = Agent("Informes", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    client = game.all_players[0]
+    client.club, client.signed = game.clubs[0].name, True
+    game.agent.clients.append(client)
+    report = ScoutReport(client)
+
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']][:3]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game.agent.week = week_index + 1
+            game.simulate_week(week_index)
+    assert isinstance(client.defending, float)
+    text = report.full_report
+    assert f"DEF {client.defending:2.0f}" in text and client.name in text
+    print(f"✅ Report renders after match growth (DEF {client.defending:.2f})")
+
+
+if __name__ == "__main__":
+    test_reports_render_lazily()
+    test_report_invalidated_when_player_changes()
+    test_report_shows_new_age_after_rollover()
+    test_dict_style_access()
+    test_report_renders_after_match_growth()
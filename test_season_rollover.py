@@ -0,0 +1,121 @@
+"""
+Test script for multi-season careers and season rollover
+"""
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import tracemalloc
+
+from agent import Agent
+from game import FootballAgentGame
+from world_db import create_world_db
+
+
+def _new_game(seed=7):
+    random.seed(seed)
+    game = FootballAgentGame()
+    game.agent = Agent("Career", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    game.agent.clients.extend(game.all_players[:3])
+    return game
+
+
+def _play_weeks(game):
+    while game.agent.week <= game.total_weeks:
+        game.simulate_week(game.agent.week - 1, generate_offers=True)
+        game.agent.advance_week()
+
+
+def _play_season(game):
+    with contextlib.redirect_stdout(io.StringIO()):
+        _play_weeks(game)
+        return game.rollover_season()
+
+
+def test_rollover_resets_season():
+    """Players age, season stats reset and a fresh calendar starts at week 1"""
+    print("\n" + "="*80)
+    print("TESTING SEASON ROLLOVER")
+    print("="*80)
+
+    game = _new_game()
+    client = game.agent.clients[0]
+    age = client.age
+    summary = _play_season(game)
+
+    assert game.season == 2
+    assert game.agent.week == 1
+    assert client.age == age + 1
+    assert client.season_appearances == 0 and client.weekly_stats == []
+    assert all(s['played'] == 0 for s in game.league_table.values())
+    assert all(c.current_season_points == 0 for c in game.clubs)
+    assert game.growth_log == [] and game.transfer_log == [] and game.weekly_event_log == []
+    assert game.season_archive == [summary]
+    assert summary['champion'] == summary['table'][0][0]
+    assert summary['clients'][0]['age'] == age
+    assert summary['rollover_ms'] >= 0
+    print(f"✅ Season 1 champion {summary['champion']}, rollover {summary['rollover_ms']:.1f} ms")
+
+
+def test_renewals_applied():
+    """Players who decline renewal leave the roster, the rest get a longer contract"""
+    game = _new_game(seed=11)
+    with contextlib.redirect_stdout(io.StringIO()):
+        _play_weeks(game)
+        renewals = game._process_season_end_renewals()
+        game.rollover_season(renewals)
+    assert renewals
+    names = {p['name'] for roster in game.club_rosters.values() for p in roster}
+    for candidate in renewals:
+        assert (candidate['player'] in names) == candidate['wants_renewal']
+    assert all(len(roster) == 11 for roster in game.club_rosters.values())
+    print(f"✅ {len(renewals)} renewal decisions applied")
+
+
+def test_every_listed_player_ages():
+    """Rollover ages every player in all_players, not just clients, including adopted world DB players"""
+    game = _new_game(seed=5)
+    path = os.path.join(tempfile.mkdtemp(), "world.db")
+    create_world_db(path, 500, seed=5)
+    game.load_world_db(path)
+    adopted = game.adopt_world_player(game.world_db.search(limit=1)[0])
+    others = [p for p in game.all_players if p not in game.agent.clients]
+    assert others == [adopted]
+    before = {p.uid: (p.age, p.version) for p in game.all_players}
+    _play_season(game)
+    for player in game.all_players:
+        age, version = before[player.uid]
+        assert player.age == age + 1 and player.version > version, player.name
+    print(f"✅ {len(game.all_players)} listed players aged one year ({len(others)} not clients)")
+
+
+def test_memory_flat_over_30_seasons():
+    """Thirty seasons run headless and memory does not grow with the weeks played"""
+    game = _new_game(seed=3)
+    tracemalloc.start()
+    try:
+        sizes = []
+        for _ in range(30):
+            _play_season(game)
+            sizes.append(tracemalloc.get_traced_memory()[0])
+    finally:
+        tracemalloc.stop()
+
+    assert game.season == 31
+    assert len(game.season_archive) == 30
+    # Only the archive grows: a few KB per season at most
+    growth_per_season = (sizes[-1] - sizes[4]) / 25
+    assert growth_per_season < 20 * 1024, growth_per_season
+    ms = [s['rollover_ms'] for s in game.season_archive]
+    print(f"✅ 30 seasons, {growth_per_season / 1024:.1f} KB/season, rollover max {max(ms):.1f} ms")
+
+
+if __name__ == "__main__":
+    test_rollover_resets_season()
+    test_renewals_applied()
+    test_every_listed_player_ages()
+    test_memory_flat_over_30_seasons()
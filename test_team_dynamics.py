@@ -0,0 +1,159 @@
+"""
+Test script for the weekly team-dynamics stage (cohesion, morale, conflicts)
+"""
+
+import contextlib
+import io
+import random
+import time
+
+from agent import Agent
+from club import Club
+from club_strength import SquadStrength
+from game import FootballAgentGame
+from personality_impact import (
+    player_morale_delta,
+    team_morale_delta,
+    weekly_cohesion_delta,
+)
+from team_dynamics import (
+    CLUB_MORALE_BASE,
+    MORALE_REVERSION,
+    NEUTRAL_COHESION,
+    NEUTRAL_MORALE,
+    TeamDynamics,
+    meets_objective,
+)
+
+
+def _game():
+    random.seed(44)
+    game = FootballAgentGame()
+    game.agent = Agent("Dynamics", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    return game
+
+
+def test_step_matches_scalar_models():
+    """Without conflicts, one step equals the personality_impact formulas applied player by player"""
+    print("\n" + "="*80)
+    print("TESTING TEAM DYNAMICS")
+    print("="*80)
+
+    game = _game()
+    dynamics = TeamDynamics(game.clubs, game.club_rosters)
+    for i in range(len(dynamics)):
+        dynamics.set_conflict_probability(i, 0.0)
+    before = {p['id']: (p['cohesion_index'], p['morale']) for p in dynamics.players}
+    home, away = game.clubs[0], game.clubs[1]
+    results = {home.name: (2, 0), away.name: (0, 2)}
+    summary = dynamics.step(results, objectives_met=[home.name])
+    assert summary['conflicts'] == []
+
+    for club in dynamics.clubs:
+        roster = game.club_rosters[club.name]
+        starters = [{'personality_name': p['personality'], 'category': p['category']} for p in club.squad.starters()]
+        cohesion_step = weekly_cohesion_delta(starters) * 100
+        score = results.get(club.name)
+        team = 0.0
+        if score:
+            result = 'win' if score[0] > score[1] else 'loss'
+            team = team_morale_delta(result, club.name == home.name, cohesion_step / 100)
+        for player in roster:
+            old_cohesion, old_morale = before[player['id']]
+            expected_morale = old_morale
+            if score:
+                expected_morale += team + player_morale_delta(player['skill_rating'] - club.team_average, player['personality'])
+            assert abs(player['cohesion_index'] - (old_cohesion + cohesion_step)) < 1e-9
+            assert abs(player['morale'] - expected_morale) < 1e-9, (club.name, player['name'])
+    assert home.player_morale > away.player_morale
+    print(f"✅ {len(dynamics)} players: {home.name} morale {home.player_morale}, {away.name} {away.player_morale}")
+
+
+def test_conflicts_and_feedback_into_strength():
+    """Conflicts cost cohesion and morale; cohesion moves club strength"""
+    game = _game()
+    dynamics = TeamDynamics(game.clubs, game.club_rosters, seed=3)
+    for i in range(len(dynamics)):
+        dynamics.set_conflict_probability(i, 0.0)
+    dynamics.set_conflict_probability(0, 1.0)  # first player of the first club always causes trouble
+    dynamics.cohesion_value[:] = 0.0
+    troublemaker, teammate = dynamics.players[0], dynamics.players[1]
+    summary = dynamics.step({})
+    assert [(club, p['id']) for club, p in summary['conflicts']] == [(dynamics.clubs[0].name, troublemaker['id'])]
+    assert troublemaker['cohesion_index'] < teammate['cohesion_index'] < NEUTRAL_COHESION
+    assert troublemaker['morale'] < teammate['morale']
+    assert dynamics.players[11]['cohesion_index'] == NEUTRAL_COHESION  # other clubs untouched
+
+    club = Club("Cohesion FC", "Mitad de Tabla", "4-4-2", "Posesion", "DT", reputation=60)
+    strength = club.strength
+    club.cohesion = NEUTRAL_COHESION + 10
+    assert club.strength > strength
+    assert meets_objective("Campeón / Top 3", 3, 10) and not meets_objective("Campeón / Top 3", 4, 10)
+    assert meets_objective("No Descender", 8, 10) and not meets_objective("No Descender", 10, 10)
+    print(f"✅ Conflict logged; cohesion +10 → strength {strength} → {club.strength}")
+
+
+def test_game_stage_feeds_renewals_and_is_fast():
+    """A played season moves roster cohesion/morale away from 60; a 20-club step costs < 1 ms"""
+    game = _game()
+    league_weeks = [i for i, w in enumerate(game.schedule) if w['fixtures']]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for week_index in league_weeks:
+            game.agent.week = week_index + 1
+            game.simulate_week(week_index)
+        renewals = game._process_season_end_renewals()
+    players = [p for roster in game.club_rosters.values() for p in roster]
+    assert len({round(p['morale'], 3) for p in players}) > 1
+    assert any(p['cohesion_index'] != NEUTRAL_COHESION for p in players)
+    assert any(c['morale'] != 60.0 for c in renewals) or not renewals
+    assert any(club.player_morale != CLUB_MORALE_BASE for club in game.clubs)
+
+    clubs, rosters = [], {}
+    for i in range(20):
+        club = Club(f"Club {i}", "Mitad de Tabla", "4-4-2", "Posesion", "DT", reputation=60)
+        roster = [game._new_roster_player(f"C{i}P{j}", p['personality'], p['category'], p['position'], level=70)
+                  for j, p in enumerate(game.club_rosters[game.clubs[0].name])]
+        club.attach_squad(SquadStrength(roster, club.formation_slots()))
+        clubs.append(club)
+        rosters[club.name] = roster
+    dynamics = TeamDynamics(clubs, rosters, seed=1)
+    results = {clubs[i].name: (i % 3, 1) for i in range(20)}
+    start = time.perf_counter()
+    for _ in range(100):
+        dynamics.step(results, objectives_met=[c.name for c in clubs[:5]])
+    per_week = (time.perf_counter() - start) / 100
+    assert per_week < 1e-3, f"{per_week * 1000:.2f} ms"
+    print(f"✅ {len(renewals)} renewals read live values; 20 clubs: {per_week * 1e6:.0f} µs per week")
+
+
+def test_morale_reverts_to_neutral_over_seasons():
+    """Two played seasons keep roster morale in a band around neutral instead of random-walking to the bounds"""
+    game = _game()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(2):
+            for week_index in range(game.total_weeks):
+                game.simulate_week(week_index)
+            game.rollover_season()
+    morale = [p['morale'] for roster in game.club_rosters.values() for p in roster]
+    assert 35.0 < min(morale) and max(morale) < 85.0, (min(morale), max(morale))
+    assert abs(sum(morale) / len(morale) - NEUTRAL_MORALE) < 5.0
+    assert max(club.player_morale for club in game.clubs) < 95.0
+
+    dynamics = TeamDynamics(game.clubs[:1], game.club_rosters)
+    for i in range(len(dynamics)):
+        dynamics.set_conflict_probability(i, 0.0)
+    dynamics.morale[:] = 100.0
+    for _ in range(40):
+        dynamics.step({})  # no matches: nothing moves morale but the reversion
+    assert abs(dynamics.morale - NEUTRAL_MORALE).max() < 100.0 * (1 - MORALE_REVERSION) ** 40
+    print(f"✅ Two seasons: roster morale {min(morale):.1f}-{max(morale):.1f}, "
+          f"clubs up to {max(c.player_morale for c in game.clubs)}")
+
+
+if __name__ == "__main__":
+    test_step_matches_scalar_models()
+    test_conflicts_and_feedback_into_strength()
+    test_game_stage_feeds_renewals_and_is_fast()
+    test_morale_reverts_to_neutral_over_seasons()
@@ -0,0 +1,126 @@
+"""
+Test script for the week-keyed timer wheel and the deadlines it drives
+"""
+
+import contextlib
+import io
+import random
+
+from agent import Agent
+from game import FootballAgentGame, CONTRACT_WARNING_WEEKS
+from player import Player
+from timers import TimerWheel
+
+
+def _game():
+    random.seed(21)
+    game = FootballAgentGame()
+    game.agent = Agent("Timers", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    return game
+
+
+def _advance(game, weeks=1):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(weeks):
+            game.agent.advance_week()
+
+
+def _offer(player, club="Club Test", weeks=2):
+    return {"club": club, "player": player, "player_name": player.name, "fee": 0, "wage": 2000,
+            "contract_weeks": 10, "expires_in_weeks": weeks, "status": "pending", "role": "🟢 Regular"}
+
+
+def test_wheel_fires_only_due_timers():
+    """Timers fire once, in week order; cancelled ones never fire"""
+    print("\n" + "="*80)
+    print("TESTING TIMER WHEEL")
+    print("="*80)
+
+    wheel = TimerWheel()
+    fired = []
+    for week in (5, 3, 3, 9):
+        wheel.schedule(week, fired.append, week)
+    cancelled = wheel.schedule(4, fired.append, 'cancelled')
+    cancelled.cancel()
+    assert len(wheel) == 4
+
+    assert wheel.advance(2) == 0 and fired == []
+    assert wheel.advance(5) == 3 and fired == [3, 3, 5]
+    # A callback may schedule more work for a week already reached
+    wheel.schedule(6, lambda: wheel.schedule(6, fired.append, 'chained'))
+    assert wheel.advance(6) == 2 and fired[-1] == 'chained'
+
+    wheel.shift(-5)  # week counter restarts
+    assert [t.week for t in wheel.pending()] == [4]
+    wheel.advance(4)
+    assert fired[-1] == 9 and len(wheel) == 0
+    print(f"✅ Fired in order: {fired}")
+
+
+def test_advance_touches_only_due_items():
+    """Advancing a week runs the due timers, not everything scheduled"""
+    wheel = TimerWheel()
+    calls = []
+    for i in range(20000):
+        wheel.schedule(1 + i % 100, calls.append, i)
+    assert wheel.advance(1) == 200
+    assert len(calls) == 200 and len(wheel) == 19800
+    print("✅ 200 of 20000 timers due in week 1")
+
+
+def test_offer_deadlines():
+    """Offers expire on their week; accepted ones are never expired"""
+    game = _game()
+    client = Player("Offer Client", 22, "Forward")
+    game.agent.clients.append(client)
+    kept, dropped = _offer(client), _offer(client, club="Otro Club")
+    game._post_offer(kept)
+    game._post_offer(dropped)
+    assert game.offer_weeks_left(kept) == 2
+
+    _advance(game)
+    assert game.offer_weeks_left(kept) == 1 and len(game.agent.pending_offers) == 2
+    with contextlib.redirect_stdout(io.StringIO()):
+        game._accept_transfer_offer(kept)
+    _advance(game)
+    assert game.agent.pending_offers == []
+    statuses = [(e['club'], e['status']) for e in game.transfer_log]
+    assert statuses == [("Club Test", "accepted"), ("Otro Club", "expired")]
+    print(f"✅ {statuses}")
+
+
+def test_promise_deadline_and_contract_warnings():
+    """Promise deadlines fail through the timers; contract warnings only in the last weeks"""
+    game = _game()
+    client = Player("Promise Client", 23, "Midfielder")
+    game.agent.clients.append(client)
+    promesa = {"jugador": client, "nombre": client.name, "tipo": "seleccion_nacional",
+               "semana_hecha": game.agent.week, "plazo": 3, "cumplida": False, "fallida": False}
+    game.register_promise(promesa)
+
+    _advance(game, 3)
+    assert not promesa["fallida"]
+    _advance(game)
+    assert promesa["fallida"] and client.trust_in_agent == "Low"
+    assert game._open_promises == []
+
+    contract = _offer(client)
+    contract["contract_weeks"] = 8
+    with contextlib.redirect_stdout(io.StringIO()):
+        game._accept_transfer_offer(contract)
+    warned = []
+    for _ in range(9):
+        _advance(game)
+        warned.append(client.contract_length if client in game.expiring_clients() else None)
+    expected = [None] * (8 - CONTRACT_WARNING_WEEKS - 1) + list(range(CONTRACT_WARNING_WEEKS, 0, -1)) + [None, None]
+    assert warned == expected, warned
+    print(f"✅ Promise failed on its deadline; contract warnings {warned}")
+
+
+if __name__ == "__main__":
+    test_wheel_fires_only_due_timers()
+    test_advance_touches_only_due_items()
+    test_offer_deadlines()
+    test_promise_deadline_and_contract_warnings()
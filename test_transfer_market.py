@@ -0,0 +1,145 @@
+"""
+Test script for the indexed transfer market
+"""
+
+import contextlib
+import io
+import random
+import time
+
+from agent import Agent
+from club import Club, FORMATION_SLOTS
+from game import FootballAgentGame
+from player import Player
+from transfer_market import MIN_OVERALL, TransferMarket, club_needs, position_key
+
+
+def _player(name, position, overall, club=None):
+    player = Player(name, 24, position)
+    player.current_overall_score = overall
+    player.club = club
+    return player
+
+
+def _club(name, formation, team_average):
+    club = Club(name, "Mitad de Tabla", formation, "Posesion", "DT")
+    club.team_average = team_average
+    return club
+
+
+def test_needs_follow_formation_and_roster():
+    """Needs cover the formation's positions; missing starters rank first"""
+    print("\n" + "="*80)
+    print("TESTING TRANSFER MARKET")
+    print("="*80)
+
+    club = _club("Tres Cinco Dos", "3-5-2", 70)
+    roster = [{'position': 'CB', 'skill_rating': 75.0}] * 3 + [{'position': 'FW', 'skill_rating': 62.0}]
+    needs = {n.position: n for n in club_needs(club, roster)}
+    assert set(needs) == set(FORMATION_SLOTS["3-5-2"])
+    assert needs['CB'].min_overall == 75.0          # only better than the weakest starter
+    assert needs['WB'].priority > needs['FW'].priority > needs['CB'].priority
+    print(f"✅ {len(needs)} needs, top priority {max(needs.values(), key=lambda n: n.priority).position}")
+
+
+def test_matching_rules():
+    """Players match only needs for their position and range, capped per player"""
+    a, b, c = _club("A", "4-4-2", 70), _club("B", "4-4-2", 70), _club("C", "4-3-3", 70)
+    striker = _player("Nueve", "Forward", 72, club="A")
+    winger = _player("Extremo", "Winger", 74)
+    weak = _player("Suplente", "Forward", 45)
+
+    market = TransferMarket(max_offers_per_player=1)
+    market.publish_needs([a, b, c])
+    market.list_players([striker, winger, weak])
+    matches = market.match()
+
+    pairs = {(need.club.name, player.name) for need, player in matches}
+    assert ("A", "Nueve") not in pairs                      # never from the player's own club
+    assert sum(1 for _, p in matches if p is striker) == 1  # capped
+    assert ("C", "Extremo") in pairs                         # only 4-3-3 plays wingers
+    assert all(p is not weak for _, p in matches)
+    for need, player in matches:
+        assert need.position == position_key(player)
+    print(f"✅ Matches: {sorted(pairs)}")
+
+
+def test_scales_to_large_markets():
+    """Thousands of clubs and players are matched in one pass"""
+    random.seed(2)
+    formations = list(FORMATION_SLOTS)
+    clubs = [_club(f"Club {i}", random.choice(formations), random.randint(50, 85)) for i in range(1000)]
+    positions = ["Forward", "Attacking Midfielder", "Winger", "Central Midfielder",
+                 "Defensive Midfielder", "Center Back", "Full Back", "Wing Back"]
+    players = [_player(f"P{i}", random.choice(positions), random.randint(40, 95), club=f"Club {i % 1000}")
+               for i in range(5000)]
+
+    start = time.perf_counter()
+    market = TransferMarket()
+    market.publish_needs(clubs)
+    market.list_players(players)
+    matches = market.match()
+    elapsed = time.perf_counter() - start
+
+    assert len(matches) > 1000
+    assert elapsed < 2.0, elapsed
+    for need, player in matches[:500]:
+        assert need.min_overall <= player.current_overall_score <= need.max_overall
+    print(f"✅ {len(market.needs)} needs x {len(players)} players -> {len(matches)} bids in {elapsed * 1000:.0f} ms")
+
+
+def test_game_offers_come_from_needing_clubs():
+    random.seed(8)
+    game = FootballAgentGame()
+    game.agent = Agent("Market", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    for player in game.all_players[:8]:
+        player.current_overall_score = 75
+        game.agent.clients.append(player)
+    window = next(i for i in range(len(game.schedule)) if game._is_transfer_window(i))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(4):
+            game._generate_transfer_offers_for_clients(window)
+
+    offers = [o for o in game.agent.pending_offers]
+    assert offers
+    for offer in offers:
+        club = game.club_index[offer['club']]
+        assert position_key(offer['player']) in club.formation_positions
+    print(f"✅ {len(offers)} offers, all from clubs whose formation uses the position")
+
+
+def test_clients_below_market_floor_still_get_offers():
+    """Prospects under MIN_OVERALL are not indexed, but interested clubs still bid for them"""
+    random.seed(38)
+    game = FootballAgentGame()
+    game.agent = Agent("Promesas", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    prospects = game.all_players[:8]
+    for player in prospects:
+        player.club, player.signed = game.clubs[0].name, True
+        player.current_overall_score = MIN_OVERALL - 8
+        player.personality = 'Professional'
+        game.agent.clients.append(player)
+    window = next(i for i in range(len(game.schedule)) if game._is_transfer_window(i))
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(6):
+            game._generate_transfer_offers_for_clients(window)
+
+    offers = game.agent.pending_offers
+    assert offers and {o['player'] for o in offers} <= set(prospects)
+    for offer in offers:
+        club = game.club_index[offer['club']]
+        assert offer['player'].club != club.name
+        assert position_key(offer['player']) in club.formation_positions
+    print(f"✅ {len(offers)} offers for {len(prospects)} prospects rated {MIN_OVERALL - 8}")
+
+
+if __name__ == "__main__":
+    test_needs_follow_formation_and_roster()
+    test_matching_rules()
+    test_scales_to_large_markets()
+    test_game_offers_come_from_needing_clubs()
+    test_clients_below_market_floor_still_get_offers()
@@ -0,0 +1,125 @@
+"""
+Test script for the memory-mapped world player database
+"""
+
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+from unittest import mock
+
+import numpy as np
+
+from agent import Agent
+from bulk_generator import generate_player_batch
+from game import FootballAgentGame
+from player import Player
+from world_db import PlayerProxy, WorldDB, create_world_db, open_world_db, potential_level, write_world_db
+
+
+def test_round_trip_matches_batch():
+    """A written batch reads back identically through zero-copy views; hydrated players match"""
+    print("\n" + "="*80)
+    print("TESTING WORLD DB")
+    print("="*80)
+
+    path = os.path.join(tempfile.mkdtemp(), "world.db")
+    batch = generate_player_batch(5000, quality=['poor', 'good', 'world_class'], regen_fraction=0.3, seed=50)
+    assert write_world_db(path, [batch]) == 5000
+    db = open_world_db(path)
+    assert len(db) == 5000
+    for name in ('technical', 'mental', 'ratings', 'current_rating', 'potential_rating', 'current_overall',
+                 'potential_overall', 'transfer_value', 'personality_codes', 'media_handling_codes'):
+        column = getattr(db, name)
+        assert isinstance(column, np.memmap) and not column.flags['OWNDATA'], name
+        assert np.array_equal(column, getattr(batch, name)), name
+    assert np.array_equal(db.ages, batch.ages) and np.array_equal(db.is_regen, batch.is_regen)
+    assert db.technical.dtype == np.int8 and db.ratings.dtype == np.float32
+    assert all(db.name(i) == batch.name(i) for i in range(0, 5000, 97))
+
+    for i in (0, 1234, 4999):
+        proxy, reference = db.proxy(i), batch.player(i)
+        assert (proxy.name, proxy.age, proxy.position, proxy.personality) == \
+               (reference.name, reference.age, reference.position, reference.personality)
+        assert proxy.current_overall_score == reference.current_overall_score and not proxy.hydrated
+        player = proxy.hydrate()
+        assert isinstance(player, Player) and proxy.hydrated and db.hydrate(i) is player
+        assert player.position_rating == reference.position_rating
+        assert player.current_rating == reference.current_rating
+        assert player.potential_level == potential_level(reference.potential_overall_score)
+    assert db.personality_counts() == batch.personality_counts()
+    print(f"✅ 5000 players round-trip through {os.path.getsize(path) / 1e3:.0f} kB; 3 hydrated on demand")
+
+
+def test_search_filters_and_ranks():
+    """Vectorized search equals a brute-force filter + sort, and skips signed rows"""
+    path = os.path.join(tempfile.mkdtemp(), "world.db")
+    create_world_db(path, 20000, quality=['average', 'excellent', 'world_class'], seed=7, chunk_size=6000)
+    db = open_world_db(path)
+    rows = db.search(position='Winger', potential='High', max_age=22, sort_by='overall', limit=15)
+    expected = [i for i in range(len(db))
+                if db.proxy(i).position == 'Winger' and db.proxy(i).potential_level == 'High' and db.ages[i] <= 22]
+    expected.sort(key=lambda i: -int(db.current_overall[i]))
+    assert [int(db.current_overall[i]) for i in rows] == [int(db.current_overall[i]) for i in expected[:15]]
+    assert set(rows) <= set(expected)
+
+    youngest = db.search(sort_by='age', limit=5)
+    assert [db.ages[i] for i in youngest] == sorted(db.ages)[:5]
+    best = db.search(limit=1)[0]
+    db.mark_taken(best)
+    assert best not in db.search(limit=50) and best in db.search(limit=50, include_taken=True)
+    assert len(db.search(position='Portero')) == 0
+    print(f"✅ {len(expected)} young High-potential wingers in 20,000; top 15 ranked as brute force")
+
+
+def test_large_pool_opens_instantly():
+    """200,000 players: opening maps the file in milliseconds and a search scans it in one pass"""
+    path = os.path.join(tempfile.mkdtemp(), "world.db")
+    start = time.perf_counter()
+    create_world_db(path, 200_000, quality=['poor', 'average', 'good', 'excellent'], regen_fraction=0.2, seed=1)
+    built = time.perf_counter() - start
+    start = time.perf_counter()
+    db = WorldDB(path)
+    opened = time.perf_counter() - start
+    start = time.perf_counter()
+    rows = db.search(position='Forward', sort_by='potential')
+    searched = time.perf_counter() - start
+    assert len(db) == 200_000 and len(rows) == 20
+    assert opened < 0.05, f"{opened * 1000:.1f} ms"
+    assert searched < 0.2, f"{searched * 1000:.1f} ms"
+    db.close()
+    print(f"✅ 200,000 players: built {built:.2f}s, opened {opened * 1000:.1f} ms, searched {searched * 1000:.1f} ms")
+
+
+def test_sign_player_hydrates_only_the_chosen_row():
+    """Signing from the world database hydrates one Player and makes it a normal client"""
+    path = os.path.join(tempfile.mkdtemp(), "world.db")
+    create_world_db(path, 3000, seed=3)
+    random.seed(50)
+    game = FootballAgentGame()
+    game.agent = Agent("World", "Balanced")
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.init_world()
+    db = game.load_world_db(path)
+    game.agent.money = 10_000_000
+    listed = db.search(limit=20)
+    with mock.patch('builtins.input', side_effect=['2', '3', 'yes', '']), \
+            contextlib.redirect_stdout(io.StringIO()):
+        game.sign_player()
+
+    client = game.agent.clients[-1]
+    assert isinstance(client, Player) and not isinstance(client, PlayerProxy)
+    assert client is db.hydrate(listed[2]) and list(db._hydrated) == [int(listed[2])]
+    assert db.taken[listed[2]] and client in game.all_players and game.registry[client.uid] is client
+    assert listed[2] not in db.search(limit=20)
+    assert game.load_world_db(os.path.join(tempfile.mkdtemp(), "missing.db")) is None
+    print(f"✅ Signed {client.name} ({client.position}, overall {client.current_overall_score}); 1 of 3000 hydrated")
+
+
+if __name__ == "__main__":
+    test_round_trip_matches_batch()
+    test_search_filters_and_ranks()
+    test_large_pool_opens_instantly()
+    test_sign_player_hydrates_only_the_chosen_row()
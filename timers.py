@@ -0,0 +1,111 @@
+"""
+Timers module - Week-keyed timer wheel for deadlines.
+
+Anything that happens "in N weeks" (offer deadlines, promise deadlines,
+contract end warnings) registers a callback for the week it is due instead of
+being found by scanning every list every week. Timers are kept in per-week
+buckets plus a heap of the weeks that have any, so advancing a week touches
+only the timers that are due.
+"""
+
+import heapq
+from typing import Callable, Dict, List
+
+
+class Timer:
+    """Handle for a scheduled callback (cancel() before it is due to drop it)."""
+
+    __slots__ = ('week', 'callback', 'args', 'active', '_wheel')
+
+    def __init__(self, week: int, callback: Callable, args: tuple, wheel):
+        self.week = week
+        self.callback = callback
+        self.args = args
+        self.active = True
+        self._wheel = wheel
+
+    def cancel(self):
+        if self.active:
+            self.active = False
+            self._wheel._live -= 1
+
+    def __repr__(self):
+        state = "active" if self.active else "done"
+        return f"<Timer week {self.week} {getattr(self.callback, '__name__', self.callback)} {state}>"
+
+
+class TimerWheel:
+    """Callbacks bucketed by the week they are due."""
+
+    def __init__(self):
+        self._buckets: Dict[int, List[Timer]] = {}
+        self._weeks: List[int] = []  # heap of weeks with a bucket
+        self._live = 0
+
+    def __len__(self):
+        """Timers still waiting to fire."""
+        return self._live
+
+    def schedule(self, week: int, callback: Callable, *args) -> Timer:
+        """
+        Call callback(*args) when the wheel reaches `week`.
+
+        Args:
+            week: Week the timer is due (a week already reached fires on the next advance)
+            callback: Function to call
+
+        Returns:
+            Timer: handle that can be cancelled
+        """
+        timer = Timer(week, callback, args, self)
+        bucket = self._buckets.get(week)
+        if bucket is None:
+            bucket = self._buckets[week] = []
+            heapq.heappush(self._weeks, week)
+        bucket.append(timer)
+        self._live += 1
+        return timer
+
+    def advance(self, week: int) -> int:
+        """
+        Fire every timer due at or before `week`, in due order.
+
+        Timers scheduled by a callback for a week already reached fire in the same call.
+
+        Returns:
+            int: Number of callbacks run
+        """
+        fired = 0
+        while self._weeks and self._weeks[0] <= week:
+            due = heapq.heappop(self._weeks)
+            for timer in self._buckets.pop(due):
+                if not timer.active:
+                    continue
+                timer.active = False
+                self._live -= 1
+                timer.callback(*timer.args)
+                fired += 1
+        return fired
+
+    def shift(self, delta: int):
+        """Move every pending timer by `delta` weeks (e.g. when the week counter restarts)."""
+        buckets = {}
+        for week, bucket in self._buckets.items():
+            for timer in bucket:
+                timer.week = week + delta
+            buckets[week + delta] = bucket
+        self._buckets = buckets
+        self._weeks = list(buckets)
+        heapq.heapify(self._weeks)
+
+    def pending(self) -> List[Timer]:
+        """Active timers, earliest first."""
+        return sorted((t for bucket in self._buckets.values() for t in bucket if t.active), key=lambda t: t.week)
+
+    def clear(self):
+        for bucket in self._buckets.values():
+            for timer in bucket:
+                timer.active = False
+        self._buckets.clear()
+        self._weeks.clear()
+        self._live = 0
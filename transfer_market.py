@@ -0,0 +1,227 @@
+"""
+Transfer market module - Club needs matched against an index of available players.
+
+Each window:
+1. Clubs publish needs: one per position in their formation, with the quality
+   range they are looking for and a priority from how weak or thin the roster is there
+2. Available players are indexed by (position key, quality band)
+3. Needs are served in priority order, each looking only at the index buckets for its
+   position and quality range
+
+Matching is a single pass over the needs of the positions that have listed players;
+a need never looks at players outside its buckets, so cost grows with the number of
+needs and matches, not clubs x players.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Tuple
+
+from player import Player
+
+BAND_WIDTH = 5               # overall points per quality band
+MIN_OVERALL = 50             # clubs publish no needs below this (club_interest objects to it too)
+NEED_FLOOR_MARGIN = 10       # clubs accept players down to team_average - margin
+NEED_CEILING_MARGIN = 25     # ... and up to team_average + margin (better players look elsewhere)
+SHORTAGE_WEIGHT = 10.0       # priority per missing starter at a position
+MAX_OFFERS_PER_PLAYER = 2
+
+
+def quality_band(overall: float) -> int:
+    return int(overall) // BAND_WIDTH
+
+
+def position_key(player) -> str:
+    """Position key used by formations (see Player.POSITION_MAP)."""
+    return Player.POSITION_MAP.get(player.position, 'CM')
+
+
+def player_overall(player) -> float:
+    return player.current_overall_score or player.current_rating * 100
+
+
+class ClubNeed(NamedTuple):
+    club: object
+    position: str
+    min_overall: float
+    max_overall: float
+    priority: float
+    slots: int = 1
+
+
+def club_needs(club, roster: Iterable[Dict] = ()) -> List[ClubNeed]:
+    """
+    Needs for one club: one per formation position.
+
+    Args:
+        club: Club
+        roster: Roster dicts with 'position' and 'skill_rating' (empty: every slot is open)
+
+    Returns:
+        list: ClubNeed per position, priority = shortage + gap between the team level
+              and the weakest starter there
+    """
+    by_position = defaultdict(list)
+    for player in roster:
+        by_position[player.get('position')].append(player['skill_rating'])
+
+    floor = max(MIN_OVERALL, club.team_average - NEED_FLOOR_MARGIN)
+    ceiling = club.team_average + NEED_CEILING_MARGIN
+    needs = []
+    for position, slots in club.formation_slots().items():
+        ratings = sorted(by_position.get(position, ()), reverse=True)[:slots]
+        shortage = slots - len(ratings)
+        weakest = ratings[-1] if ratings else 0.0
+        priority = SHORTAGE_WEIGHT * shortage + max(0.0, club.team_average - weakest)
+        min_overall = max(floor, weakest) if not shortage else floor
+        if min_overall > ceiling:
+            continue
+        needs.append(ClubNeed(club, position, min_overall, ceiling, priority))
+    return needs
+
+
+def group_needs(needs: Iterable[ClubNeed]) -> Dict[str, List[ClubNeed]]:
+    """Needs by position, highest priority first (the layout TransferMarket matches on)."""
+    grouped = defaultdict(list)
+    for need in needs:
+        grouped[need.position].append(need)
+    for position_needs in grouped.values():
+        position_needs.sort(key=lambda n: -n.priority)
+    return dict(grouped)
+
+
+class PlayerIndex:
+    """Available players bucketed by (position key, quality band), best first in each bucket."""
+
+    def __init__(self, players: Iterable = ()):
+        self._buckets: Dict[Tuple[str, int], List[Tuple[float, object]]] = defaultdict(list)
+        self._bands: Dict[str, List[int]] = defaultdict(list)  # position -> occupied bands, best first
+        self._sorted = True
+        for player in players:
+            self.add(player)
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def add(self, player, overall: float = None):
+        overall = player_overall(player) if overall is None else overall
+        if overall < MIN_OVERALL:
+            return
+        position, band = position_key(player), quality_band(overall)
+        bucket = self._buckets[(position, band)]
+        if not bucket and band not in self._bands[position]:
+            self._bands[position].append(band)
+        bucket.append((overall, player))
+        self._sorted = False
+
+    @property
+    def positions(self):
+        """Position keys with at least one listed player."""
+        return self._bands.keys()
+
+    def remove(self, player):
+        key = (position_key(player), quality_band(player_overall(player)))
+        bucket = self._buckets.get(key, [])
+        for i, (_, p) in enumerate(bucket):
+            if p is player:
+                del bucket[i]
+                return
+
+    def _sort(self):
+        if not self._sorted:
+            for bucket in self._buckets.values():
+                bucket.sort(key=lambda item: -item[0])
+            for bands in self._bands.values():
+                bands.sort(reverse=True)
+            self._sorted = True
+
+    def buckets(self, position: str, min_overall: float, max_overall: float):
+        """Buckets for a position within an overall range, best band first."""
+        self._sort()
+        low, high = quality_band(min_overall), quality_band(max_overall)
+        for band in self._bands.get(position, ()):
+            if band > high:
+                continue
+            if band < low:
+                break
+            bucket = self._buckets[(position, band)]
+            if bucket:
+                yield bucket
+
+
+class TransferMarket:
+    """One window's needs and player index, matched in a single pass."""
+
+    def __init__(self, max_offers_per_player: int = MAX_OFFERS_PER_PLAYER,
+                 needs: Dict[str, List[ClubNeed]] = None):
+        """
+        Args:
+            max_offers_per_player: Cap on bids per player in one match
+            needs: Needs already grouped by group_needs (shared, not copied; e.g. cached per window)
+        """
+        self.max_offers_per_player = max_offers_per_player
+        self._needs: Dict[str, List[ClubNeed]] = defaultdict(list)  # position -> needs, best priority first
+        if needs:
+            self._needs.update(needs)
+        self._needs_sorted = True
+        self.index = PlayerIndex()
+
+    @property
+    def needs(self) -> List[ClubNeed]:
+        return [need for needs in self._needs.values() for need in needs]
+
+    def publish_needs(self, clubs: Iterable, rosters: Dict[str, List[Dict]] = None):
+        rosters = rosters or {}
+        for club in clubs:
+            self.add_needs(club_needs(club, rosters.get(club.name, ())))
+
+    def add_needs(self, needs: Iterable[ClubNeed]):
+        for need in needs:
+            self._needs[need.position] = self._needs[need.position] + [need]  # never mutate shared lists
+        self._needs_sorted = False
+
+    def list_players(self, players: Iterable):
+        for player in players:
+            self.index.add(player)
+
+    def match(self) -> List[Tuple[ClubNeed, object]]:
+        """
+        Serve needs by priority; each takes the best indexed players in range.
+
+        Needs for different positions never compete for the same players, so only
+        positions with listed players are visited.
+
+        Returns:
+            list: (need, player) pairs; a player gets at most max_offers_per_player
+                  and never one from their own club or twice from the same club
+        """
+        if not self._needs_sorted:
+            self._needs.update(group_needs(self.needs))
+            self._needs_sorted = True
+        offers = defaultdict(int)
+        bidders = defaultdict(set)
+        matches = []
+        for position in list(self.index.positions):
+            for need in self._needs.get(position, ()):
+                filled = 0
+                for bucket in self.index.buckets(position, need.min_overall, need.max_overall):
+                    full = []
+                    for overall, player in bucket:
+                        if overall > need.max_overall:
+                            continue
+                        if overall < need.min_overall:
+                            break  # buckets are sorted best first
+                        if player.club == need.club.name or need.club.name in bidders[id(player)]:
+                            continue
+                        matches.append((need, player))
+                        bidders[id(player)].add(need.club.name)
+                        offers[id(player)] += 1
+                        if offers[id(player)] >= self.max_offers_per_player:
+                            full.append(player)
+                        filled += 1
+                        if filled >= need.slots:
+                            break
+                    for player in full:  # capped players leave the index
+                        bucket[:] = [item for item in bucket if item[1] is not player]
+                    if filled >= need.slots:
+                        break
+        return matches
@@ -0,0 +1,366 @@
+"""
+World DB module - Memory-mapped columnar database of generated players for scouting at scale.
+
+One binary file holds hundreds of thousands of players in fixed-size records
+(the bulk_generator columns), followed by a string table with their names:
+
+    header   magic, version, record size, player count, string table position
+    records  RECORD_DTYPE x count: int8 technical/mental attributes (Player
+             schema order), float32 ratings per POSITION_WEIGHTS key,
+             personality/media codes, name offset and length
+    strings  UTF-8 names, each distinct name stored once
+
+Opening maps the file read-only and exposes every field as a zero-copy NumPy
+view (no parsing, no Player objects), so searches are array operations over
+the whole pool. Rows are returned as PlayerProxy objects that read the views;
+a full Player is built (hydrated) only when one is picked to be signed.
+"""
+
+import os
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+from bulk_generator import POSITION_KEYS, generate_player_batch, player_from_columns
+from game_data import PLAYER_POSITIONS
+from personality_rules import MENTAL_ATTRIBUTES, PERSONALITY_NAMES
+from player_generator import TECHNICAL_ATTRIBUTES
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), 'data', 'world_players.db')
+DEFAULT_SIZE = 250_000  # players in a database built by `python world_db.py`
+MAGIC = b'FAWORLD1'
+VERSION = 1
+HEADER_SIZE = 64  # records start here
+DEFAULT_CHUNK = 100_000  # players generated and written per batch by create_world_db
+
+HEADER_DTYPE = np.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('record_size', '<u4'),
+    ('count', '<u8'),
+    ('strings_offset', '<u8'),
+    ('strings_size', '<u8'),
+])
+
+# Widest fields first so the float32 columns stay aligned inside each record
+RECORD_DTYPE = np.dtype([
+    ('ratings', '<f4', (len(POSITION_KEYS),)),
+    ('current_rating', '<f4'),
+    ('potential_rating', '<f4'),
+    ('transfer_value', '<i4'),
+    ('name_offset', '<u4'),
+    ('current_overall', '<i2'),
+    ('potential_overall', '<i2'),
+    ('name_length', '<u2'),
+    ('technical', 'i1', (len(TECHNICAL_ATTRIBUTES),)),
+    ('mental', 'i1', (len(MENTAL_ATTRIBUTES),)),
+    ('age', 'i1'),
+    ('position', 'u1'),
+    ('personality', 'u1'),
+    ('media_handling', 'u1'),
+    ('is_regen', '?'),
+], align=True)
+
+# Potential level label (app filter, Player.potential_level) from the potential overall score
+POTENTIAL_LEVELS = [(95, "Elite"), (88, "World Class"), (78, "High"), (0, "Medium")]
+SORT_KEYS = {'overall': 'current_overall', 'potential': 'potential_overall', 'value': 'transfer_value'}
+
+
+def potential_level(potential_overall: int) -> str:
+    for threshold, label in POTENTIAL_LEVELS:
+        if potential_overall >= threshold:
+            return label
+    return POTENTIAL_LEVELS[-1][1]
+
+
+# ========== WRITING ==========
+
+def write_world_db(path: str, batches: Iterable) -> int:
+    """
+    Write PlayerBatch objects into a world database file.
+
+    Args:
+        path: Output file (overwritten)
+        batches: PlayerBatch objects, written in order
+
+    Returns:
+        int: Number of players written
+    """
+    names: Dict[str, int] = {}  # name -> offset in the string table
+    strings = []
+    strings_size = 0
+    count = 0
+    with open(path, 'wb') as f:
+        f.write(b'\0' * HEADER_SIZE)
+        for batch in batches:
+            n = len(batch)
+            records = np.zeros(n, dtype=RECORD_DTYPE)
+            for field, column in (('ratings', batch.ratings), ('current_rating', batch.current_rating),
+                                  ('potential_rating', batch.potential_rating),
+                                  ('transfer_value', batch.transfer_value),
+                                  ('current_overall', batch.current_overall),
+                                  ('potential_overall', batch.potential_overall),
+                                  ('technical', batch.technical), ('mental', batch.mental),
+                                  ('age', batch.ages), ('position', batch.position_codes),
+                                  ('personality', batch.personality_codes),
+                                  ('media_handling', batch.media_handling_codes), ('is_regen', batch.is_regen)):
+                records[field] = column
+            # Batches name players by (first, last) code pairs: encode each distinct pair once
+            pair_codes = batch.first_name_codes.astype(np.int32) * 256 + batch.last_name_codes
+            _, first_rows, inverse = np.unique(pair_codes, return_index=True, return_inverse=True)
+            offsets = np.empty(len(first_rows), dtype=np.uint32)
+            lengths = np.empty(len(first_rows), dtype=np.uint16)
+            for k, row in enumerate(first_rows.tolist()):
+                name = batch.name(row)
+                encoded = name.encode('utf-8')
+                offset = names.get(name)
+                if offset is None:
+                    offset = names[name] = strings_size
+                    strings.append(encoded)
+                    strings_size += len(encoded)
+                offsets[k], lengths[k] = offset, len(encoded)
+            records['name_offset'] = offsets[inverse]
+            records['name_length'] = lengths[inverse]
+            f.write(records.tobytes())
+            count += n
+        strings_offset = HEADER_SIZE + count * RECORD_DTYPE.itemsize
+        f.write(b''.join(strings))
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header[0] = (MAGIC, VERSION, RECORD_DTYPE.itemsize, count, strings_offset, strings_size)
+        f.seek(0)
+        f.write(header.tobytes())
+    return count
+
+
+def create_world_db(path: str, n: int, quality='average', regen_fraction: float = 0.0,
+                    seed: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK) -> int:
+    """
+    Generate n players (bulk_generator) chunk by chunk straight into a world database file.
+
+    Returns:
+        int: Number of players written
+    """
+    chunks = [min(chunk_size, n - start) for start in range(0, n, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    return write_world_db(path, (generate_player_batch(size, quality, regen_fraction, chunk_seed)
+                                 for size, chunk_seed in zip(chunks, seeds)))
+
+
+# ========== READING ==========
+
+class WorldDB:
+    """A world database file opened as read-only NumPy views."""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: File written by write_world_db / create_world_db
+
+        Raises:
+            ValueError: Not a world database, or written by an incompatible version
+        """
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if len(header) != 1 or header[0]['magic'] != MAGIC:
+            raise ValueError(f"{path} is not a world database")
+        header = header[0]
+        if header['version'] != VERSION or header['record_size'] != RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path}: unsupported world database version {int(header['version'])}")
+        self.path = path
+        count = int(header['count'])
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        strings_size = int(header['strings_size'])
+        if strings_size:
+            self._strings = np.memmap(path, dtype=np.uint8, mode='r', offset=int(header['strings_offset']),
+                                      shape=(strings_size,))
+        else:
+            self._strings = np.zeros(0, dtype=np.uint8)
+
+        # Zero-copy column views, named like PlayerBatch (bulk_generator.player_from_columns reads them)
+        records = self.records
+        self.technical = records['technical']
+        self.mental = records['mental']
+        self.ages = records['age']
+        self.position_codes = records['position']
+        self.personality_codes = records['personality']
+        self.media_handling_codes = records['media_handling']
+        self.is_regen = records['is_regen']
+        self.ratings = records['ratings']
+        self.current_rating = records['current_rating']
+        self.potential_rating = records['potential_rating']
+        self.current_overall = records['current_overall']
+        self.potential_overall = records['potential_overall']
+        self.transfer_value = records['transfer_value']
+
+        self.taken = np.zeros(count, dtype=bool)  # rows already signed in this game (not written back)
+        self._hydrated: Dict[int, object] = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def name(self, i) -> str:
+        record = self.records[int(i)]
+        offset = int(record['name_offset'])
+        return self._strings[offset:offset + int(record['name_length'])].tobytes().decode('utf-8')
+
+    def search(self, position: Optional[str] = None, potential: Optional[str] = None, max_age: Optional[int] = None,
+               sort_by: str = 'overall', limit: int = 20, include_taken: bool = False) -> np.ndarray:
+        """
+        Best matching rows, filtered and ranked over the whole pool in array operations.
+
+        Args:
+            position: PLAYER_POSITIONS name, or None for all
+            potential: POTENTIAL_LEVELS label, or None for all
+            max_age: Oldest age to include
+            sort_by: 'overall', 'potential', 'value' (highest first) or 'age' (youngest first)
+            limit: Rows to return
+            include_taken: Include rows already signed
+
+        Returns:
+            np.ndarray: Row indices, best first
+        """
+        mask = np.ones(len(self), dtype=bool) if include_taken else ~self.taken
+        if position is not None:
+            if position not in PLAYER_POSITIONS:
+                return np.zeros(0, dtype=np.intp)
+            mask &= self.position_codes == PLAYER_POSITIONS.index(position)
+        if potential is not None:
+            bounds = [threshold for threshold, _ in POTENTIAL_LEVELS]
+            level = [label for _, label in POTENTIAL_LEVELS].index(potential)
+            mask &= self.potential_overall >= bounds[level]
+            if level:
+                mask &= self.potential_overall < bounds[level - 1]
+        if max_age is not None:
+            mask &= self.ages <= max_age
+        rows = np.flatnonzero(mask)
+        if sort_by == 'age':
+            key = self.ages[rows].astype(np.int32)
+        else:
+            key = -self.records[SORT_KEYS[sort_by]][rows].astype(np.int64)
+        if limit < len(rows):
+            top = np.argpartition(key, limit)[:limit]
+            rows, key = rows[top], key[top]
+        return rows[np.argsort(key, kind='stable')]
+
+    def proxy(self, i) -> 'PlayerProxy':
+        return PlayerProxy(self, int(i))
+
+    def proxies(self, rows) -> list:
+        return [PlayerProxy(self, int(i)) for i in rows]
+
+    def hydrate(self, i):
+        """The Player for row i, built on first request (the same object afterwards)."""
+        i = int(i)
+        player = self._hydrated.get(i)
+        if player is None:
+            player = player_from_columns(self, i)
+            player.potential_level = potential_level(int(self.potential_overall[i]))
+            self._hydrated[i] = player
+        return player
+
+    def mark_taken(self, i):
+        self.taken[int(i)] = True
+
+    def personality_counts(self) -> Dict[str, int]:
+        counts = np.bincount(self.personality_codes, minlength=len(PERSONALITY_NAMES))
+        return {PERSONALITY_NAMES[code]: int(c) for code, c in enumerate(counts) if c}
+
+    def close(self):
+        """Release the file mapping (views taken from this DB become invalid)."""
+        for mapped in (self.records, self._strings):
+            mmap = getattr(mapped, '_mmap', None)
+            if mmap is not None:
+                mmap.close()
+
+
+def open_world_db(path: str = DEFAULT_PATH) -> WorldDB:
+    """Open a world database (instant: only the header is read, the rest is mapped)."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(path)
+    return WorldDB(path)
+
+
+class PlayerProxy:
+    """A world database row with the fields the search lists show; hydrate() gives the Player."""
+
+    __slots__ = ('db', 'row')
+
+    agent_signed = False
+
+    def __init__(self, db: WorldDB, row: int):
+        self.db = db
+        self.row = row
+
+    @property
+    def key(self) -> str:
+        """Stable key for UI widgets (world rows have no Player uid until hydrated)."""
+        return f"world_{self.row}"
+
+    @property
+    def name(self) -> str:
+        return self.db.name(self.row)
+
+    @property
+    def age(self) -> int:
+        return int(self.db.ages[self.row])
+
+    @property
+    def position(self) -> str:
+        return PLAYER_POSITIONS[self.db.position_codes[self.row]]
+
+    @property
+    def personality(self) -> str:
+        return PERSONALITY_NAMES[self.db.personality_codes[self.row]]
+
+    @property
+    def current_rating(self) -> float:
+        return round(float(self.db.current_rating[self.row]), 2)
+
+    @property
+    def potential_rating(self) -> float:
+        return round(float(self.db.potential_rating[self.row]), 2)
+
+    @property
+    def current_overall_score(self) -> int:
+        return int(self.db.current_overall[self.row])
+
+    @property
+    def potential_overall_score(self) -> int:
+        return int(self.db.potential_overall[self.row])
+
+    @property
+    def potential_level(self) -> str:
+        return potential_level(self.potential_overall_score)
+
+    @property
+    def transfer_value(self) -> int:
+        return int(self.db.transfer_value[self.row])
+
+    @property
+    def hydrated(self) -> bool:
+        return self.row in self.db._hydrated
+
+    def short_description(self) -> str:
+        return f"{self.name} ({self.age}) - {self.position} - {self.potential_level} potential - Available"
+
+    def hydrate(self):
+        return self.db.hydrate(self.row)
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SIZE
+    start = time.perf_counter()
+    written = create_world_db(DEFAULT_PATH, size, quality=['poor', 'average', 'good', 'excellent', 'world_class'],
+                              regen_fraction=0.2, seed=1)
+    print(f"{written:,} players written to {DEFAULT_PATH} in {time.perf_counter() - start:.2f}s "
+          f"({os.path.getsize(DEFAULT_PATH) / 1e6:.1f} MB)")
+    start = time.perf_counter()
+    db = open_world_db()
+    print(f"Opened in {(time.perf_counter() - start) * 1000:.1f} ms")
+    for proxy in db.proxies(db.search(limit=5)):
+        print(f"  {proxy.short_description()} - Overall {proxy.current_overall_score}")